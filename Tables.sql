@@ -159,6 +159,10 @@ CREATE TABLE punting (
 -- ===========================
 -- PLAYER-LEVEL TABLES
 -- ===========================
+-- On Postgres the eight *_stats tables below are PARTITION BY LIST (season)
+-- (Alembic revision 008): one <table>_<season> partition per season plus a
+-- <table>_default partition, with PRIMARY KEY (id, season).
+
 
 CREATE TABLE passing_stats (
     id              serial PRIMARY KEY,   -- unique row identifier
@@ -484,6 +488,33 @@ CREATE TABLE scraped_data_metadata (
     source_type     varchar(50)            -- 'visible' or 'comment'
 );
 
+-- Per-table content hashes used to skip re-ingesting unchanged pages
+CREATE TABLE scraped_table_fingerprints (
+    id              serial PRIMARY KEY,
+    source_url      text NOT NULL,         -- URL the table was scraped from
+    table_id        varchar(255) NOT NULL, -- HTML id of the table
+    content_hash    varchar(64) NOT NULL,  -- SHA-256 of the normalized fragment
+    season          integer,               -- season year (optional)
+    rows_ingested   integer,               -- rows stored at the last change
+    last_checked_at timestamptz NOT NULL,  -- last fetch (changed or not)
+    last_changed_at timestamptz NOT NULL,  -- last fetch that changed the hash
+    UNIQUE (source_url, table_id)
+);
+
+-- Row-level change log written by diff ingestion (every stat table also
+-- carries a row_hash varchar(64) column; see Alembic revision 005)
+CREATE TABLE stat_changes (
+    id              bigserial PRIMARY KEY, -- change cursor, strictly increasing
+    table_name      varchar(64) NOT NULL,  -- stat table the row belongs to
+    season          integer,               -- season of the changed row
+    row_key         text NOT NULL,         -- JSON of the row's natural key
+    old_hash        varchar(64),           -- NULL for inserts
+    new_hash        varchar(64),           -- NULL for deletes
+    scrape_run      varchar(32) NOT NULL,  -- ingest run that made the change
+    changed_at      timestamptz NOT NULL
+);
+CREATE INDEX idx_stat_changes_table_id ON stat_changes (table_name, id);
+
 -- ===========================
 -- SCRAPED DATA STAGING TABLES
 -- ===========================
@@ -0,0 +1,125 @@
+"""
+Benchmark: vectorized games_from_frame vs. the previous iterrows parser.
+
+Builds a synthetic PFR-style schedule frame covering many team-seasons,
+verifies both implementations produce the same records, and reports the
+per-implementation wall time.
+
+Run with:
+    python -m benchmarks.bench_gamelog_parse --seasons 50
+"""
+
+import argparse
+import os
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import numpy as np  # noqa: E402
+import pandas as pd  # noqa: E402
+
+from src.services.scrape_service import (  # noqa: E402
+    clean_value,
+    games_from_frame,
+    map_scraped_to_model,
+)
+
+MONTHS = ["September", "October", "November", "December", "January"]
+
+
+def build_schedule_frame(seasons: int, teams: int = 32, weeks: int = 18):
+    rng = np.random.default_rng(42)
+    n = seasons * teams * weeks
+    week = np.tile(np.arange(1, weeks + 1), seasons * teams).astype(object)
+    # Sprinkle in a bye week per team-season
+    week[::weeks] = np.nan
+    return pd.DataFrame(
+        {
+            "Week": week,
+            "Day": rng.choice(["Sun", "Mon", "Thu"], n),
+            "Date": [f"{MONTHS[i % len(MONTHS)]} {1 + i % 28}" for i in range(n)],
+            "Unnamed: 3_level_1": "1:00PM ET",
+            "Unnamed: 5_level_1": rng.choice(["W", "L"], n),
+            "Opp": rng.choice(["KAN", "DET", "BUF", "SFO"], n),
+            "Tm": rng.integers(0, 50, n).astype(float),
+            "Opp.1": rng.integers(0, 50, n).astype(float),
+            "TotYd": rng.integers(150, 550, n).astype(float),
+            "TotYd.1": rng.integers(150, 550, n).astype(float),
+            "PassY": rng.integers(50, 450, n).astype(float),
+            "RushY": rng.integers(20, 250, n).astype(float),
+            "TO": rng.integers(0, 5, n).astype(float),
+        }
+    )
+
+
+def legacy_games(df: pd.DataFrame, team: str) -> list[dict]:
+    """The pre-vectorization parser, kept here as the benchmark baseline."""
+    games = []
+    for _, row in df.iterrows():
+        raw_week = row.get("Week", row.get("Week_", None))
+        if raw_week is None or pd.isna(raw_week):
+            week_val = None
+        else:
+            try:
+                week_val = int(raw_week)
+            except (TypeError, ValueError):
+                week_val = None
+
+        game = {
+            "team": team.upper(),
+            "week": week_val,
+            "day": row.get("Day", row.get("Day_", None)),
+            "date": row.get("Date", row.get("Date_", None)),
+            "time": row.get("Unnamed: 3_level_1"),
+            "result": row.get("Unnamed: 5_level_1"),
+            "opponent": row.get("Opp", row.get("Opp_", None)),
+            "location": "",
+            "team_score": row.get("Tm", row.get("Tm_", None)),
+            "opp_score": row.get("Opp.1", row.get("Opp.1_", None)),
+            "tot_yards_for": row.get("TotYd", row.get("TotYd_", None)),
+            "tot_yards_against": row.get("TotYd.1", row.get("TotYd.1_", None)),
+            "pass_yards": row.get("PassY", row.get("PassY_", None)),
+            "rush_yards": row.get("RushY", row.get("RushY_", None)),
+            "turnovers": row.get("TO", row.get("TO_", None)),
+        }
+        games.append({k: clean_value(v) for k, v in game.items()})
+    return games
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=50)
+    parser.add_argument("--season-year", type=int, default=2023)
+    args = parser.parse_args()
+
+    df = build_schedule_frame(args.seasons)
+    year = args.season_year
+
+    legacy, legacy_parse = _timed(lambda: legacy_games(df, "kan"))
+    legacy_dtos, legacy_map = _timed(
+        lambda: [map_scraped_to_model(g, year) for g in legacy]
+    )
+
+    fast, fast_parse = _timed(lambda: games_from_frame(df, "kan", year))
+    fast_dtos, fast_map = _timed(lambda: [map_scraped_to_model(g, year) for g in fast])
+
+    assert fast_dtos == legacy_dtos, "vectorized output diverged from baseline"
+
+    print(f"rows: {len(df)}")
+    print(f"legacy   parse {legacy_parse:8.3f}s  map {legacy_map:8.3f}s")
+    print(f"vector   parse {fast_parse:8.3f}s  map {fast_map:8.3f}s")
+    print(f"parse speedup: {legacy_parse / fast_parse:.1f}x")
+    print(
+        "end-to-end speedup: "
+        f"{(legacy_parse + legacy_map) / (fast_parse + fast_map):.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark: archive parse throughput vs. number of parse worker processes.
+
+Writes synthetic PFR passing pages (one per season) into a temporary page
+archive, then runs the parse stage of ``parse_pipeline`` with increasing
+worker counts and reports pages/s and speedup over a single worker. Scaling
+should be near-linear up to the number of physical cores.
+
+Run with:
+    python -m benchmarks.bench_parse_pool --seasons 64 --players 120
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+os.environ.setdefault("DATABASE_URL", "sqlite:///:memory:")
+
+import numpy as np  # noqa: E402
+
+from src.core.page_archive import PageArchive  # noqa: E402
+from src.services.parse_pipeline import parse_pages, plan_tasks  # noqa: E402
+from src.services.stat_registry import StatType, page_url  # noqa: E402
+
+STATS = ["pass_cmp", "pass_att", "pass_yds", "pass_td", "pass_int", "pass_long"]
+
+
+def build_passing_page(players: int, rng: np.random.Generator) -> str:
+    rows = []
+    for i in range(players):
+        cells = "".join(
+            f'<td data-stat="{stat}">{rng.integers(0, 500)}</td>' for stat in STATS
+        )
+        rows.append(
+            f'<tr><th data-stat="ranker">{i + 1}</th>'
+            f'<td data-stat="player">Player {i}*</td>'
+            f'<td data-stat="team">KAN</td><td data-stat="age">{rng.integers(21, 40)}'
+            f'</td><td data-stat="pos">QB</td>{cells}</tr>'
+        )
+    table = f'<table id="passing"><tbody>{"".join(rows)}</tbody></table>'
+    return f"<html><body><!-- {table} --></body></html>"
+
+
+def _timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=64)
+    parser.add_argument("--players", type=int, default=120)
+    parser.add_argument("--chunk-size", type=int, default=4)
+    parser.add_argument(
+        "--max-workers", type=int, default=os.cpu_count() or 1, help="Upper bound"
+    )
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(42)
+    seasons = list(range(2024 - args.seasons + 1, 2025))
+
+    with tempfile.TemporaryDirectory() as root:
+        archive = PageArchive(root)
+        for season in seasons:
+            html = build_passing_page(args.players, rng)
+            archive.put(page_url(StatType.passing_stats, season), html)
+        tasks, _ = plan_tasks(archive, [StatType.passing_stats], seasons)
+
+        worker_counts = [1]
+        while worker_counts[-1] * 2 <= args.max_workers:
+            worker_counts.append(worker_counts[-1] * 2)
+        if worker_counts[-1] != args.max_workers:
+            worker_counts.append(args.max_workers)
+
+        print(f"pages: {len(tasks)}  rows/page: {args.players}")
+        baseline = None
+        for workers in worker_counts:
+            tables, elapsed = _timed(
+                lambda w=workers: list(
+                    parse_pages(archive, tasks, workers=w, chunk_size=args.chunk_size)
+                )
+            )
+            assert all(t.error is None for t in tables), "parse failed"
+            assert sum(len(t) for t in tables) == len(tasks) * args.players
+
+            baseline = baseline or elapsed
+            print(
+                f"workers {workers:3d}  {elapsed:8.3f}s  "
+                f"{len(tasks) / elapsed:8.1f} pages/s  "
+                f"speedup {baseline / elapsed:5.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
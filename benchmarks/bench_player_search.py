@@ -0,0 +1,157 @@
+"""
+Benchmark: player name search, ILIKE on the raw name vs. the trigram index.
+
+Generates a passing_stats-shaped dataset (``--seasons`` seasons of
+``--players`` rows with synthetic names) into a scratch schema, indexed
+the way migrations 002 and 010 index the player tables: a btree on
+``player_name`` and a ``pg_trgm`` GIN index on ``name_normalized``. It
+then runs substring searches of real names both ways and reports:
+
+- ``player_name ILIKE '%q%'`` (the old repository query; the btree cannot
+  serve a leading wildcard, so it scans every season),
+- ``name_normalized LIKE '%q%'`` (the current query, served by the GIN
+  index),
+
+with p50/p95 latency and the plan's top scan node for each.
+
+Requires DATABASE_URL to point at a Postgres database with the pg_trgm
+extension available; the scratch schema is dropped afterwards. Run with:
+    python -m benchmarks.bench_player_search --seasons 100 --players 2000
+"""
+
+import argparse
+import math
+import random
+import time
+
+from sqlalchemy import create_engine, text
+
+from src.core.config import settings
+from src.core.names import name_pattern
+
+SCHEMA = "bench_player_search"
+TABLE = f"{SCHEMA}.players"
+GENERATE = f"""
+    INSERT INTO {TABLE} (season, player_name, tm, yds)
+    SELECT s,
+           initcap(substr(md5(p::text), 1, 6)) || ' '
+               || initcap(substr(md5((p * 7919)::text), 1, 9)),
+           'T' || (p % 32), (random() * 5000)::int
+    FROM generate_series(:first, :last) AS s, generate_series(1, :players) AS p
+"""
+QUERIES = {
+    "ilike player_name": (
+        f"SELECT * FROM {TABLE} WHERE player_name ILIKE :q",
+        lambda q: f"%{q}%",
+    ),
+    "like name_normalized": (
+        f"SELECT * FROM {TABLE} WHERE name_normalized LIKE :q ESCAPE '\\'",
+        name_pattern,
+    ),
+}
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1]
+
+
+def build(conn, seasons: list[int], players: int) -> None:
+    conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+    conn.execute(
+        text(
+            f"CREATE TABLE {TABLE} (id bigserial PRIMARY KEY, season integer, "
+            "player_name varchar(128), name_normalized varchar(128), "
+            "tm varchar(64), yds integer)"
+        )
+    )
+    conn.execute(
+        text(GENERATE),
+        {"first": seasons[0], "last": seasons[-1], "players": players},
+    )
+    # Synthetic names are plain ASCII, so lower() is their normalized form
+    conn.execute(text(f"UPDATE {TABLE} SET name_normalized = lower(player_name)"))
+    conn.execute(text(f"CREATE INDEX ON {TABLE} (player_name)"))
+    conn.execute(
+        text(f"CREATE INDEX ON {TABLE} USING gin (name_normalized gin_trgm_ops)")
+    )
+    conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+def sample_queries(conn, count: int) -> list[str]:
+    """Substrings (4-7 chars) of the surname of randomly chosen players."""
+    names = conn.execute(
+        text(f"SELECT player_name FROM {TABLE} ORDER BY random() LIMIT :n"),
+        {"n": count},
+    ).scalars()
+    queries = []
+    for name in names:
+        surname = name.split()[-1]
+        size = random.randint(4, 7)
+        start = random.randint(0, len(surname) - size)
+        queries.append(surname[start : start + size])
+    return queries
+
+
+def time_search(conn, sql: str, pattern, queries: list[str]) -> list[float]:
+    timings = []
+    for query in queries:
+        started = time.perf_counter()
+        conn.execute(text(sql), {"q": pattern(query)}).fetchall()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def scan_type(conn, sql: str, pattern, query: str) -> str:
+    plan = conn.execute(
+        text(f"EXPLAIN (FORMAT JSON) {sql}"), {"q": pattern(query)}
+    ).scalar()
+
+    def scans(node) -> list[str]:
+        own = [node["Node Type"]] if "Relation Name" in node else []
+        return own + [s for child in node.get("Plans", []) for s in scans(child)]
+
+    return ", ".join(scans(plan[0]["Plan"]))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=100)
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--searches", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("DATABASE_URL must point at Postgres for this benchmark")
+
+    seasons = list(range(2024 - args.seasons + 1, 2025))
+    random.seed(42)
+    try:
+        with engine.begin() as conn:
+            started = time.perf_counter()
+            build(conn, seasons, args.players)
+            print(
+                f"rows: {len(seasons) * args.players}  "
+                f"build: {time.perf_counter() - started:.1f}s"
+            )
+
+        with engine.connect() as conn:
+            queries = sample_queries(conn, args.searches)
+            for name, (sql, pattern) in QUERIES.items():
+                time_search(conn, sql, pattern, queries[:10])  # warm up
+                timings = time_search(conn, sql, pattern, queries)
+                print(
+                    f"{name:22s}  p50 {_percentile(timings, 50) * 1000:8.2f}ms  "
+                    f"p95 {_percentile(timings, 95) * 1000:8.2f}ms  "
+                    f"scan {scan_type(conn, sql, pattern, queries[0])}"
+                )
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
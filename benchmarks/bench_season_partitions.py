@@ -0,0 +1,206 @@
+"""
+Benchmark: season-partitioned vs. plain player stat tables on Postgres.
+
+Generates a passing_stats-shaped dataset (``--seasons`` seasons of
+``--players`` rows) into two tables in a scratch schema: a plain table
+with a season index, and one list-partitioned by season the way migration
+008 lays out the player stat tables. It then reports:
+
+- season-scoped read latency (p50/p95) and partitions scanned per read,
+- season reload time via DELETE + INSERT on both tables, and via building
+  a replacement table and detach/attach on the partitioned one.
+
+Requires DATABASE_URL to point at a Postgres database; the scratch schema
+is dropped afterwards. Run with:
+    python -m benchmarks.bench_season_partitions --seasons 100 --players 2000
+"""
+
+import argparse
+import math
+import random
+import time
+
+from sqlalchemy import create_engine, text
+
+from src.core.config import settings
+
+SCHEMA = "bench_season_partitions"
+COLUMNS = """
+    id          bigserial,
+    season      integer NOT NULL,
+    player_name varchar(128),
+    tm          varchar(64),
+    age         integer,
+    att         integer,
+    yds         integer,
+    td          integer,
+    rate        numeric(6, 2)
+"""
+GENERATE = """
+    INSERT INTO {table} (season, player_name, tm, age, att, yds, td, rate)
+    SELECT s, 'Player ' || p, 'T' || (p % 32), 21 + p % 18,
+           (random() * 600)::int, (random() * 5000)::int, (random() * 50)::int,
+           (random() * 158.3)::numeric(6, 2)
+    FROM generate_series(:first, :last) AS s, generate_series(1, :players) AS p
+"""
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1]
+
+
+def build(conn, seasons: list[int], players: int) -> None:
+    conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+    conn.execute(text(f"CREATE SCHEMA {SCHEMA}"))
+
+    conn.execute(text(f"CREATE TABLE {SCHEMA}.plain ({COLUMNS}, PRIMARY KEY (id))"))
+    conn.execute(text(f"CREATE INDEX ON {SCHEMA}.plain (season)"))
+
+    conn.execute(
+        text(
+            f"CREATE TABLE {SCHEMA}.part ({COLUMNS}, PRIMARY KEY (id, season)) "
+            "PARTITION BY LIST (season)"
+        )
+    )
+    conn.execute(
+        text(f"CREATE TABLE {SCHEMA}.part_default PARTITION OF {SCHEMA}.part DEFAULT")
+    )
+    for season in seasons:
+        conn.execute(
+            text(
+                f"CREATE TABLE {SCHEMA}.part_{season} PARTITION OF {SCHEMA}.part "
+                f"FOR VALUES IN ({season})"
+            )
+        )
+
+    for table in ("plain", "part"):
+        conn.execute(
+            text(
+                f"ALTER TABLE {SCHEMA}.{table} ADD CONSTRAINT {table}_uq "
+                "UNIQUE (player_name, season, tm)"
+            )
+        )
+        conn.execute(
+            text(GENERATE.format(table=f"{SCHEMA}.{table}")),
+            {"first": seasons[0], "last": seasons[-1], "players": players},
+        )
+        conn.execute(text(f"ANALYZE {SCHEMA}.{table}"))
+
+
+def time_reads(conn, table: str, seasons: list[int], reads: int) -> list[float]:
+    timings = []
+    for _ in range(reads):
+        season = random.choice(seasons)
+        started = time.perf_counter()
+        conn.execute(
+            text(f"SELECT * FROM {SCHEMA}.{table} WHERE season = :s"), {"s": season}
+        ).fetchall()
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+def partitions_scanned(conn, table: str, season: int) -> int:
+    plan = conn.execute(
+        text(f"EXPLAIN (FORMAT JSON) SELECT * FROM {SCHEMA}.{table} WHERE season = :s"),
+        {"s": season},
+    ).scalar()
+
+    def scans(node) -> int:
+        own = 1 if "Relation Name" in node else 0
+        return own + sum(scans(child) for child in node.get("Plans", []))
+
+    return scans(plan[0]["Plan"])
+
+
+def reload_delete_insert(engine, table: str, season: int, players: int) -> float:
+    started = time.perf_counter()
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"DELETE FROM {SCHEMA}.{table} WHERE season = :s"), {"s": season}
+        )
+        conn.execute(
+            text(GENERATE.format(table=f"{SCHEMA}.{table}")),
+            {"first": season, "last": season, "players": players},
+        )
+    return time.perf_counter() - started
+
+
+def reload_detach_attach(engine, season: int, players: int) -> float:
+    started = time.perf_counter()
+    partition, replacement = f"{SCHEMA}.part_{season}", f"{SCHEMA}.part_{season}_new"
+    with engine.begin() as conn:
+        # Build the replacement outside the partitioned table, then exchange
+        conn.execute(
+            text(f"CREATE TABLE {replacement} (LIKE {SCHEMA}.part INCLUDING DEFAULTS)")
+        )
+        conn.execute(
+            text(GENERATE.format(table=replacement)),
+            {"first": season, "last": season, "players": players},
+        )
+        conn.execute(text(f"ALTER TABLE {SCHEMA}.part DETACH PARTITION {partition}"))
+        conn.execute(text(f"DROP TABLE {partition}"))
+        conn.execute(
+            text(
+                f"ALTER TABLE {SCHEMA}.part ATTACH PARTITION {replacement} "
+                f"FOR VALUES IN ({season})"
+            )
+        )
+        conn.execute(text(f"ALTER TABLE {replacement} RENAME TO part_{season}"))
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seasons", type=int, default=100)
+    parser.add_argument("--players", type=int, default=2000)
+    parser.add_argument("--reads", type=int, default=200)
+    parser.add_argument("--reloads", type=int, default=5)
+    args = parser.parse_args()
+
+    engine = create_engine(settings.DATABASE_URL)
+    if engine.dialect.name != "postgresql":
+        raise SystemExit("DATABASE_URL must point at Postgres for this benchmark")
+
+    seasons = list(range(2024 - args.seasons + 1, 2025))
+    random.seed(42)
+    try:
+        with engine.begin() as conn:
+            started = time.perf_counter()
+            build(conn, seasons, args.players)
+            print(
+                f"rows/table: {len(seasons) * args.players}  "
+                f"build: {time.perf_counter() - started:.1f}s"
+            )
+
+        with engine.connect() as conn:
+            for table in ("plain", "part"):
+                time_reads(conn, table, seasons, 10)  # warm up
+                timings = time_reads(conn, table, seasons, args.reads)
+                print(
+                    f"read   {table:6s}  p50 {_percentile(timings, 50) * 1000:7.2f}ms  "
+                    f"p95 {_percentile(timings, 95) * 1000:7.2f}ms  "
+                    f"relations scanned {partitions_scanned(conn, table, seasons[0])}"
+                )
+
+        targets = random.sample(seasons, args.reloads)
+        reloads = {
+            "plain delete+insert": [
+                reload_delete_insert(engine, "plain", s, args.players) for s in targets
+            ],
+            "part  delete+insert": [
+                reload_delete_insert(engine, "part", s, args.players) for s in targets
+            ],
+            "part  detach/attach": [
+                reload_detach_attach(engine, s, args.players) for s in targets
+            ],
+        }
+        for name, timings in reloads.items():
+            print(f"reload {name}  p50 {_percentile(timings, 50) * 1000:8.1f}ms")
+    finally:
+        with engine.begin() as conn:
+            conn.execute(text(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE"))
+
+
+if __name__ == "__main__":
+    main()
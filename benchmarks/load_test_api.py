@@ -0,0 +1,100 @@
+"""
+Load test: latency of the HTTP read routes at a target request rate.
+
+Sends an open-loop stream of GET requests (one every 1/--rps seconds,
+regardless of how fast earlier ones return) rotating over /teams,
+/teams/{team}, /players/search, /standings and /games for one season, and
+reports p50/p99 latency per route and overall, measured from each
+request's scheduled start so queueing delay is not hidden.
+
+Start the API first, e.g.:
+    uvicorn src.main:app --workers 4
+Then run:
+    python -m benchmarks.load_test_api --url http://127.0.0.1:8000 --rps 200
+"""
+
+import argparse
+import asyncio
+import math
+import time
+from collections import defaultdict
+
+import httpx
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q / 100 * len(ordered))) - 1]
+
+
+def routes(season: int, team: str, query: str) -> list[tuple[str, str, dict]]:
+    return [
+        ("teams", f"/teams/{season}", {}),
+        ("team", f"/teams/{season}/{team}", {}),
+        ("players/search", "/players/search", {"q": query, "season": season}),
+        ("standings", f"/standings/{season}", {}),
+        ("games", f"/games/{season}", {"week": 1}),
+    ]
+
+
+async def run(args: argparse.Namespace) -> None:
+    targets = routes(args.season, args.team, args.query)
+    latencies: dict[str, list[float]] = defaultdict(list)
+    errors: dict[str, int] = defaultdict(int)
+    limits = httpx.Limits(max_connections=args.connections)
+
+    async with httpx.AsyncClient(
+        base_url=args.url, limits=limits, timeout=args.timeout
+    ) as client:
+
+        async def one(name: str, path: str, params: dict, scheduled: float) -> None:
+            try:
+                response = await client.get(path, params=params)
+                ok = response.status_code < 500
+            except httpx.HTTPError:
+                ok = False
+            latencies[name].append(time.perf_counter() - scheduled)
+            if not ok:
+                errors[name] += 1
+
+        total = int(args.rps * args.duration)
+        interval = 1 / args.rps
+        started = time.perf_counter()
+        tasks = []
+        for i in range(total):
+            scheduled = started + i * interval
+            delay = scheduled - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            name, path, params = targets[i % len(targets)]
+            tasks.append(asyncio.create_task(one(name, path, params, scheduled)))
+        await asyncio.gather(*tasks)
+        elapsed = time.perf_counter() - started
+
+    print(f"target {args.rps:.0f} rps  achieved {total / elapsed:.0f} rps")
+    every = [v for values in latencies.values() for v in values]
+    for name, values in [*sorted(latencies.items()), ("all", every)]:
+        failed = errors[name] if name != "all" else sum(errors.values())
+        print(
+            f"{name:16s} n={len(values):6d}  "
+            f"p50 {_percentile(values, 50) * 1000:8.2f}ms  "
+            f"p99 {_percentile(values, 99) * 1000:8.2f}ms  errors {failed}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--url", default="http://127.0.0.1:8000")
+    parser.add_argument("--rps", type=float, default=100)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds")
+    parser.add_argument("--connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--season", type=int, default=2023)
+    parser.add_argument("--team", default="Kansas City Chiefs")
+    parser.add_argument("--query", default="mahomes")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
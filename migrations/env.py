@@ -35,6 +35,14 @@ from src.entities.games import Games
 from src.entities.standings import Standings
 from src.entities.team_game import TeamGame
 from src.entities.odds import Odds
+from src.entities.scrape_task import ScrapeTask
+from src.entities.scraped_table_fingerprint import ScrapedTableFingerprint
+from src.entities.stat_change import StatChange
+from src.entities.data_version import DataVersion
+from src.entities.scrape_run import ScrapeRun
+from src.entities.player import Player
+from src.entities.team import Team, TeamAlias
+from src.entities.host_rate_slot import HostRateSlot
 
 logger = logging.getLogger("alembic.env")
 
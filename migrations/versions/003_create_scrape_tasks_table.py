@@ -0,0 +1,68 @@
+"""create scrape_tasks work queue table
+
+This migration creates the `scrape_tasks` table, a work queue shared by
+scraper nodes running against the same Postgres database. Each row is one
+(page url, season) scrape, parsed for every stat type in `stat_types`
+(comma-separated), so stat types sharing a page are fetched once; workers
+lease rows with
+`SELECT ... FOR UPDATE SKIP LOCKED`, renew the lease with heartbeats, and
+expired leases are re-queued.
+
+Index strategy:
+  - (status, priority, id): The lease query filters on status and orders
+    by priority then age.
+  - (lease_expires_at): The re-queue sweep scans for expired leases.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'scrape_tasks',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('url', sa.Text(), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=False),
+        sa.Column('stat_types', sa.String(length=255), nullable=False),
+        sa.Column('priority', sa.Integer(), server_default='0', nullable=False),
+        sa.Column(
+            'status', sa.String(length=16), server_default='pending', nullable=False
+        ),
+        sa.Column('attempts', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('max_attempts', sa.Integer(), server_default='3', nullable=False),
+        sa.Column('leased_by', sa.String(length=128), nullable=True),
+        sa.Column('lease_expires_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('completed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('url', 'season', name='uq_scrape_tasks_url_season'),
+    )
+
+    # Lease query: WHERE status = 'pending' ORDER BY priority DESC, id
+    op.create_index(
+        'idx_scrape_tasks_status_priority', 'scrape_tasks', ['status', 'priority', 'id']
+    )
+
+    # Re-queue sweep of expired leases
+    op.create_index(
+        'idx_scrape_tasks_lease_expires', 'scrape_tasks', ['lease_expires_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_scrape_tasks_lease_expires', table_name='scrape_tasks')
+    op.drop_index('idx_scrape_tasks_status_priority', table_name='scrape_tasks')
+    op.drop_table('scrape_tasks')
@@ -0,0 +1,49 @@
+"""create scraped_table_fingerprints table for change detection
+
+Stores a SHA-256 of the normalized HTML fragment of every scraped PFR
+table, keyed by (source_url, stat_type, table_id). When a re-scrape
+produces the same fingerprint as the last successful ingest, parsing and
+writes are skipped. The stat type is part of the key because team and
+player stat types parse the same table of one page (kicking.htm feeds
+both kicking and kicking_stats).
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The unique constraint doubles as the lookup index for (url, stat_type)
+    op.create_table(
+        'scraped_table_fingerprints',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('source_url', sa.Text(), nullable=False),
+        sa.Column('stat_type', sa.String(length=32), nullable=False),
+        sa.Column('table_id', sa.String(length=255), nullable=False),
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=True),
+        sa.Column('rows_ingested', sa.Integer(), nullable=True),
+        sa.Column('last_checked_at', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('last_changed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint(
+            'source_url',
+            'stat_type',
+            'table_id',
+            name='uq_scraped_table_fingerprints_url_stat_table',
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('scraped_table_fingerprints')
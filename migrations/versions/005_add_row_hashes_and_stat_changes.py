@@ -0,0 +1,75 @@
+"""add row_hash to stat tables and create the stat_changes log
+
+Every season-scoped stat table gets a ``row_hash`` column (SHA-256 of the
+row's ingested values). Ingestion compares incoming hashes with stored
+ones, writes only changed rows, and appends each insert/update/delete to
+``stat_changes``, whose id doubles as the consumer change cursor.
+
+Existing rows keep a NULL hash, so their first re-ingest logs them as
+updated once.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+STAT_TABLES = (
+    'team_offense',
+    'team_defense',
+    'standings',
+    'games',
+    'kicking',
+    'punting',
+    'returns',
+    'passing_stats',
+    'rushing_stats',
+    'receiving_stats',
+    'defense_stats',
+    'kicking_stats',
+    'punting_stats',
+    'return_stats',
+    'scoring_stats',
+)
+
+
+def upgrade() -> None:
+    for table in STAT_TABLES:
+        op.add_column(table, sa.Column('row_hash', sa.String(length=64), nullable=True))
+
+    op.create_table(
+        'stat_changes',
+        sa.Column(
+            'id',
+            sa.BigInteger().with_variant(sa.Integer(), 'sqlite'),
+            autoincrement=True,
+            nullable=False,
+        ),
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=True),
+        sa.Column('row_key', sa.Text(), nullable=False),
+        sa.Column('old_hash', sa.String(length=64), nullable=True),
+        sa.Column('new_hash', sa.String(length=64), nullable=True),
+        sa.Column('scrape_run', sa.String(length=32), nullable=False),
+        sa.Column('changed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    # Cursor pulls filtered by table: WHERE table_name IN (...) AND id > :cursor
+    op.create_index(
+        'idx_stat_changes_table_id', 'stat_changes', ['table_name', 'id']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_stat_changes_table_id', table_name='stat_changes')
+    op.drop_table('stat_changes')
+    for table in STAT_TABLES:
+        op.drop_column(table, 'row_hash')
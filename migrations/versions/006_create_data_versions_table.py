@@ -0,0 +1,35 @@
+"""create data_versions table for cross-node cache invalidation
+
+One row per (stat table, season) with a counter that ingestion bumps in
+the same transaction as the rows it changes (followed by a NOTIFY on
+the ``data_version`` channel). API processes LISTEN for it, or poll the
+table, and evict cached entries for that season.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'data_versions',
+        sa.Column('table_name', sa.String(length=64), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False, server_default='0'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('table_name', 'season'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('data_versions')
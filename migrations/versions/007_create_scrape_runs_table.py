@@ -0,0 +1,56 @@
+"""create scrape_runs ledger with per-stage timings
+
+One row per stat scrape: fetch, rate-limit wait, parse, validate and
+write durations, attempts, bytes, rows in/changed and outcome. Feeds the
+/metrics/scrape-runs p50/p95 summary.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'scrape_runs',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('run_id', sa.String(length=32), nullable=False),
+        sa.Column('stat_type', sa.String(length=32), nullable=False),
+        sa.Column('season', sa.Integer(), nullable=True),
+        sa.Column('url', sa.Text(), nullable=True),
+        sa.Column('backend', sa.String(length=16), nullable=True),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('fetch_seconds', sa.Float(), nullable=False),
+        sa.Column('rate_limit_wait_seconds', sa.Float(), nullable=False),
+        sa.Column('parse_seconds', sa.Float(), nullable=False),
+        sa.Column('validate_seconds', sa.Float(), nullable=False),
+        sa.Column('write_seconds', sa.Float(), nullable=False),
+        sa.Column('total_seconds', sa.Float(), nullable=False),
+        sa.Column('bytes_fetched', sa.Integer(), nullable=False),
+        sa.Column('rows_in', sa.Integer(), nullable=True),
+        sa.Column('rows_changed', sa.Integer(), nullable=True),
+        sa.Column('outcome', sa.String(length=16), nullable=False),
+        sa.Column('error', sa.Text(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('run_id', 'stat_type', name='uq_scrape_runs_run_stat_type'),
+    )
+    op.create_index(
+        'idx_scrape_runs_stat_type_started', 'scrape_runs', ['stat_type', 'started_at']
+    )
+    op.create_index('idx_scrape_runs_started', 'scrape_runs', ['started_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('idx_scrape_runs_started', table_name='scrape_runs')
+    op.drop_index('idx_scrape_runs_stat_type_started', table_name='scrape_runs')
+    op.drop_table('scrape_runs')
@@ -0,0 +1,108 @@
+"""list-partition the player stat tables by season (Postgres)
+
+The eight player stat tables are read and reloaded almost only by season.
+On Postgres each becomes ``PARTITION BY LIST (season)`` with one
+``<table>_<season>`` partition per existing season plus a
+``<table>_default`` partition; new seasons get their own partition on
+first write (``SeasonPartitionRepository.ensure``). The primary key
+becomes ``(id, season)`` since Postgres requires it to contain the
+partition key; the unique constraints already do. Other dialects are
+left unchanged.
+
+Each table is rebuilt (rename, create partitioned copy, copy rows, drop
+the old table), so run it in a maintenance window on large databases.
+Rows with a NULL season cannot satisfy the new primary key and make the
+upgrade fail; delete or fix them first.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+PARTITIONED_TABLES = (
+    'passing_stats',
+    'rushing_stats',
+    'receiving_stats',
+    'defense_stats',
+    'kicking_stats',
+    'punting_stats',
+    'return_stats',
+    'scoring_stats',
+)
+
+
+def _secondary_schema(bind, table):
+    """Unique constraints and plain indexes of a table, to recreate by name."""
+    inspector = sa.inspect(bind)
+    uniques = inspector.get_unique_constraints(table)
+    indexes = [
+        ix for ix in inspector.get_indexes(table)
+        if not ix.get('duplicates_constraint')
+    ]
+    return uniques, indexes
+
+
+def _rebuild(table, *, partitioned):
+    """Recreate ``table`` (partitioned or not) and copy its rows across."""
+    bind = op.get_bind()
+    old = f'{table}_partitioned' if not partitioned else f'{table}_unpartitioned'
+    uniques, indexes = _secondary_schema(bind, table)
+    sequence = bind.execute(
+        sa.text("SELECT pg_get_serial_sequence(:table, 'id')"), {'table': table}
+    ).scalar()
+
+    op.execute(f'ALTER TABLE {table} RENAME TO {old}')
+    partition_by = ' PARTITION BY LIST (season)' if partitioned else ''
+    op.execute(
+        f'CREATE TABLE {table} (LIKE {old} INCLUDING DEFAULTS){partition_by}'
+    )
+    if partitioned:
+        op.execute(f'CREATE TABLE {table}_default PARTITION OF {table} DEFAULT')
+        seasons = bind.execute(
+            sa.text(f'SELECT DISTINCT season FROM {old} WHERE season IS NOT NULL')
+        ).scalars()
+        for season in sorted(seasons):
+            op.execute(
+                f'CREATE TABLE {table}_{season} PARTITION OF {table} '
+                f'FOR VALUES IN ({int(season)})'
+            )
+    op.execute(f'INSERT INTO {table} SELECT * FROM {old}')
+    if sequence:
+        op.execute(f'ALTER SEQUENCE {sequence} OWNED BY {table}.id')
+    op.execute(f'DROP TABLE {old}')
+
+    primary_key = 'id, season' if partitioned else 'id'
+    op.execute(
+        f'ALTER TABLE {table} ADD CONSTRAINT {table}_pkey PRIMARY KEY ({primary_key})'
+    )
+    for unique in uniques:
+        op.create_unique_constraint(
+            unique['name'], table, unique['column_names']
+        )
+    for index in indexes:
+        op.create_index(
+            index['name'], table, index['column_names'], unique=index['unique']
+        )
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in PARTITIONED_TABLES:
+        _rebuild(table, partitioned=True)
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    for table in PARTITIONED_TABLES:
+        _rebuild(table, partitioned=False)
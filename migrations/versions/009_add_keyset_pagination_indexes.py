@@ -0,0 +1,48 @@
+"""add (sort column, id) indexes for keyset pagination
+
+Keyset pages continue from ``WHERE (col, id) > (value, id)`` ordered by
+``(col, id)``; these indexes let the default player listings seek to the
+cursor instead of scanning and skipping rows:
+
+- player search on passing/rushing/receiving (``player_name, id``)
+- passing by season, yds descending (``season, yds DESC NULLS LAST, id
+  DESC``, the default listing order; backward pages scan it in reverse)
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+INDEXES = [
+    ('idx_passing_stats_player_id', 'passing_stats', ['player_name', 'id']),
+    ('idx_rushing_stats_player_id', 'rushing_stats', ['player_name', 'id']),
+    ('idx_receiving_stats_player_id', 'receiving_stats', ['player_name', 'id']),
+]
+
+
+def upgrade() -> None:
+    for name, table, columns in INDEXES:
+        op.create_index(name, table, columns, unique=False)
+    # Only Postgres takes NULLS LAST in an index definition
+    nulls_last = ' NULLS LAST' if op.get_bind().dialect.name == 'postgresql' else ''
+    op.create_index(
+        'idx_passing_stats_season_yds_id',
+        'passing_stats',
+        ['season', sa.text(f'yds DESC{nulls_last}'), sa.text('id DESC')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_passing_stats_season_yds_id', table_name='passing_stats')
+    for name, table, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
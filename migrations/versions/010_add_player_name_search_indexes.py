@@ -0,0 +1,94 @@
+"""add normalized player names with trigram indexes for player search
+
+Player search matched ``player_name ILIKE '%query%'``. With a leading
+wildcard no btree index applies, so every search scanned each player
+table across all seasons. Each player table gets a ``name_normalized``
+column (diacritics stripped, case-folded, see ``src.core.names``) that
+searches match with a plain ``LIKE`` on the normalized query.
+
+On Postgres the column carries a ``pg_trgm`` GIN index, which serves
+``LIKE '%query%'`` from the index. On a partitioned table the index
+cascades to every partition, including ones added later. Other dialects
+(SQLite in tests) get the column only and run the same query as a scan.
+
+Existing rows are backfilled in Python, one UPDATE per distinct name.
+New rows get the column from the entities' insert default.
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.core.names import normalize_name
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+PLAYER_TABLES = (
+    'passing_stats',
+    'rushing_stats',
+    'receiving_stats',
+    'defense_stats',
+    'kicking_stats',
+    'punting_stats',
+    'return_stats',
+    'scoring_stats',
+)
+
+
+def _index_name(table: str) -> str:
+    return f'idx_{table}_name_trgm'
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    postgres = bind.dialect.name == 'postgresql'
+    if postgres:
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    for table_name in PLAYER_TABLES:
+        op.add_column(
+            table_name,
+            sa.Column('name_normalized', sa.String(length=128), nullable=True),
+        )
+
+        table = sa.table(
+            table_name, sa.column('player_name'), sa.column('name_normalized')
+        )
+        names = bind.execute(
+            sa.select(table.c.player_name)
+            .where(table.c.player_name.is_not(None))
+            .distinct()
+        ).scalars()
+        updates = [{'p': name, 'n': normalize_name(name)} for name in names]
+        if updates:
+            bind.execute(
+                table.update()
+                .where(table.c.player_name == sa.bindparam('p'))
+                .values(name_normalized=sa.bindparam('n')),
+                updates,
+            )
+
+        if postgres:
+            op.create_index(
+                _index_name(table_name),
+                table_name,
+                ['name_normalized'],
+                unique=False,
+                postgresql_using='gin',
+                postgresql_ops={'name_normalized': 'gin_trgm_ops'},
+            )
+
+
+def downgrade() -> None:
+    postgres = op.get_bind().dialect.name == 'postgresql'
+    for table_name in reversed(PLAYER_TABLES):
+        if postgres:
+            op.drop_index(_index_name(table_name), table_name=table_name)
+        op.drop_column(table_name, 'name_normalized')
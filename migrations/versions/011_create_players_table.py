@@ -0,0 +1,83 @@
+"""create the players dimension and player_id on every player stat table
+
+Player identity was only ``player_name`` text, repeated per table and
+season, and the ``(player_name, season, tm)`` keys conflated people who
+share a name. ``players`` holds one row per Pro-Football-Reference player
+id (``data-append-csv`` on the stat tables' player cells). Every player
+stat table gets an indexed ``player_id`` foreign key to it.
+
+Parsing fills both going forward. Existing rows keep a NULL
+``player_id`` until their season is next ingested (``force=true`` for
+unchanged pages) or reparsed from the page archive with
+``python -m src.reparse players --seasons ...``; ``player_id`` is not part
+of ``row_hash``, so either fills it without logging the rows as changed.
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+PLAYER_TABLES = (
+    'passing_stats',
+    'rushing_stats',
+    'receiving_stats',
+    'defense_stats',
+    'kicking_stats',
+    'punting_stats',
+    'return_stats',
+    'scoring_stats',
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'players',
+        sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column('pfr_id', sa.String(length=16), nullable=False),
+        sa.Column('player_name', sa.String(length=128), nullable=True),
+        sa.Column('name_normalized', sa.String(length=128), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('pfr_id', name='uq_players_pfr_id'),
+    )
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        op.create_index(
+            'idx_players_name_trgm',
+            'players',
+            ['name_normalized'],
+            unique=False,
+            postgresql_using='gin',
+            postgresql_ops={'name_normalized': 'gin_trgm_ops'},
+        )
+
+    for table in PLAYER_TABLES:
+        op.add_column(table, sa.Column('player_id', sa.Integer(), nullable=True))
+        # SQLite cannot add a constraint to an existing table
+        if dialect != 'sqlite':
+            op.create_foreign_key(
+                f'fk_{table}_player_id', table, 'players', ['player_id'], ['id']
+            )
+        op.create_index(f'idx_{table}_player_id', table, ['player_id', 'season'])
+
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table in reversed(PLAYER_TABLES):
+        op.drop_index(f'idx_{table}_player_id', table_name=table)
+        if dialect != 'sqlite':
+            op.drop_constraint(f'fk_{table}_player_id', table, type_='foreignkey')
+        op.drop_column(table, 'player_id')
+    if dialect == 'postgresql':
+        op.drop_index('idx_players_name_trgm', table_name='players')
+    op.drop_table('players')
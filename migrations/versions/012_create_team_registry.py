@@ -0,0 +1,120 @@
+"""create the team registry and integer team ids on every team column
+
+Teams were only text, spelled differently per table: PFR display names
+on the team tables, PFR abbreviations on player tables and team game
+logs, common abbreviations on odds, historical names in old seasons.
+``teams`` and ``team_aliases`` hold the registry in ``src.core.teams``
+(one stable id per franchise, every known spelling as an alias), and
+each text team column gets an indexed integer foreign key next to it.
+
+Existing rows are backfilled in Python, one UPDATE per distinct
+spelling. New rows get the ids from the entities' insert default, which
+resolves the same way; the ids are not part of ``row_hash``, so the next
+ingest does not see backfilled rows as changed.
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from src.core.teams import alias_rows, team_id, team_rows
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+# (table, text column, id column)
+TEAM_COLUMNS = (
+    ('team_offense', 'tm', 'team_id'),
+    ('team_defense', 'tm', 'team_id'),
+    ('standings', 'tm', 'team_id'),
+    ('kicking', 'tm', 'team_id'),
+    ('punting', 'tm', 'team_id'),
+    ('returns', 'tm', 'team_id'),
+    ('passing_stats', 'tm', 'team_id'),
+    ('rushing_stats', 'tm', 'team_id'),
+    ('receiving_stats', 'tm', 'team_id'),
+    ('defense_stats', 'tm', 'team_id'),
+    ('kicking_stats', 'tm', 'team_id'),
+    ('punting_stats', 'tm', 'team_id'),
+    ('return_stats', 'tm', 'team_id'),
+    ('scoring_stats', 'tm', 'team_id'),
+    ('games', 'winner', 'winner_id'),
+    ('games', 'loser', 'loser_id'),
+    ('team_games', 'team_abbr', 'team_id'),
+    ('odds', 'home_team', 'home_team_id'),
+    ('odds', 'away_team', 'away_team_id'),
+)
+
+
+def upgrade() -> None:
+    teams = op.create_table(
+        'teams',
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('abbr', sa.String(length=8), nullable=False),
+        sa.Column('name', sa.String(length=64), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+        sa.UniqueConstraint('abbr', name='uq_teams_abbr'),
+    )
+    aliases = op.create_table(
+        'team_aliases',
+        sa.Column('alias', sa.String(length=64), nullable=False),
+        sa.Column('team_id', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ['team_id'], ['teams.id'], name='fk_team_aliases_team_id'
+        ),
+        sa.PrimaryKeyConstraint('alias'),
+    )
+    op.bulk_insert(teams, team_rows())
+    op.bulk_insert(aliases, alias_rows())
+
+    bind = op.get_bind()
+    for table_name, source, id_column in TEAM_COLUMNS:
+        op.add_column(table_name, sa.Column(id_column, sa.Integer(), nullable=True))
+        # SQLite cannot add a constraint to an existing table
+        if bind.dialect.name != 'sqlite':
+            op.create_foreign_key(
+                f'fk_{table_name}_{id_column}',
+                table_name,
+                'teams',
+                [id_column],
+                ['id'],
+            )
+        op.create_index(
+            f'idx_{table_name}_{id_column}', table_name, [id_column, 'season']
+        )
+
+        table = sa.table(table_name, sa.column(source), sa.column(id_column))
+        spellings = bind.execute(
+            sa.select(table.c[source]).where(table.c[source].is_not(None)).distinct()
+        ).scalars()
+        updates = [
+            {'s': spelling, 'id': team_id(spelling)}
+            for spelling in spellings
+            if team_id(spelling) is not None
+        ]
+        if updates:
+            bind.execute(
+                table.update()
+                .where(table.c[source] == sa.bindparam('s'))
+                .values({id_column: sa.bindparam('id')}),
+                updates,
+            )
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table_name, _source, id_column in reversed(TEAM_COLUMNS):
+        op.drop_index(f'idx_{table_name}_{id_column}', table_name=table_name)
+        if dialect != 'sqlite':
+            op.drop_constraint(
+                f'fk_{table_name}_{id_column}', table_name, type_='foreignkey'
+            )
+        op.drop_column(table_name, id_column)
+    op.drop_table('team_aliases')
+    op.drop_table('teams')
@@ -0,0 +1,33 @@
+"""create host_rate_slots table for the cross-process scrape rate limit
+
+One row per scraped host holding the next free request slot (epoch
+seconds on the database clock). Every scraping process (API, workers,
+backfill CLI, scheduler) claims slots from it, so together they stay
+within one host's request rate instead of one rate per process.
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'host_rate_slots',
+        sa.Column('host', sa.String(length=255), nullable=False),
+        sa.Column('next_slot', sa.Float(), nullable=False),
+        sa.PrimaryKeyConstraint('host'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('host_rate_slots')
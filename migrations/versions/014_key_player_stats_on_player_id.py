@@ -0,0 +1,83 @@
+"""key the player stat tables on player_id instead of player_name
+
+The ``(player_name, season, tm)`` unique key of each player stat table
+made two players who share a name on one team-season collide. Rows are
+now unique by ``(player_id, season, tm)``; rows without a PFR id (NULL
+``player_id``) stay unique by name through a partial unique index over
+just those rows. Revision 001 left the old constraint unnamed, so it is
+found by its columns.
+
+Downgrading restores the name key and fails while two rows of one
+table share a (player_name, season, tm); delete one of each pair first.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+PLAYER_TABLES = (
+    'passing_stats',
+    'rushing_stats',
+    'receiving_stats',
+    'defense_stats',
+    'kicking_stats',
+    'punting_stats',
+    'return_stats',
+    'scoring_stats',
+)
+
+NAME_KEY = ['player_name', 'season', 'tm']
+
+# Names reflected unnamed constraints get, so SQLite's batch copy can drop them
+NAMING_CONVENTION = {'uq': 'uq_%(table_name)s_%(column_0_name)s'}
+
+
+def _name_key_constraint(table):
+    """Name of the unique constraint on ``(player_name, season, tm)``."""
+    for unique in sa.inspect(op.get_bind()).get_unique_constraints(table):
+        if unique['column_names'] == NAME_KEY:
+            return unique['name'] or f'uq_{table}_player_name'
+    return None
+
+
+def upgrade() -> None:
+    no_player = sa.text('player_id IS NULL')
+    for table in PLAYER_TABLES:
+        name_key = _name_key_constraint(table)
+        with op.batch_alter_table(
+            table, naming_convention=NAMING_CONVENTION
+        ) as batch:
+            if name_key is not None:
+                batch.drop_constraint(name_key, type_='unique')
+            batch.create_unique_constraint(
+                f'uq_{table}_player_id_season_tm', ['player_id', 'season', 'tm']
+            )
+        op.create_index(
+            f'uq_{table}_name_season_tm',
+            table,
+            NAME_KEY,
+            unique=True,
+            postgresql_where=no_player,
+            sqlite_where=no_player,
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(PLAYER_TABLES):
+        op.drop_index(f'uq_{table}_name_season_tm', table_name=table)
+        with op.batch_alter_table(table) as batch:
+            batch.drop_constraint(
+                f'uq_{table}_player_id_season_tm', type_='unique'
+            )
+            batch.create_unique_constraint(
+                f'uq_{table}_player_season_tm', NAME_KEY
+            )
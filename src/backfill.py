@@ -0,0 +1,81 @@
+"""
+Backfill stat tables from PFR across many seasons, resumably.
+
+Usage:
+    python -m src.backfill all --seasons 1970-2024
+    python -m src.backfill passing_stats rushing_stats --seasons 2000-2024 --plan
+
+Each distinct page is fetched once and parsed for every stat type it feeds.
+Completed (url, stat type) units are checkpointed in BACKFILL_LEDGER_PATH,
+so re-running the same command resumes where the last run stopped.
+"""
+
+import argparse
+import json
+import logging
+import sys
+
+from src.core.config import settings
+from src.reparse import parse_seasons, parse_stat_types
+from src.services.backfill_service import BackfillLedger, backfill, plan_backfill
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.backfill", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument("stat_types", nargs="+", help='Stat types, or "all"')
+    parser.add_argument("--seasons", type=parse_seasons, required=True)
+    parser.add_argument(
+        "--ledger",
+        default=settings.BACKFILL_LEDGER_PATH,
+        help="Checkpoint ledger path (default: BACKFILL_LEDGER_PATH)",
+    )
+    parser.add_argument(
+        "--plan", action="store_true", help="Print the pending pages and exit"
+    )
+    parser.add_argument(
+        "--reset", action="store_true", help="Discard checkpoints and start over"
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    stat_types = parse_stat_types(args.stat_types)
+    ledger = BackfillLedger(args.ledger)
+    if args.reset:
+        ledger.reset()
+
+    if args.plan:
+        units = plan_backfill(stat_types, args.seasons, ledger.completed())
+        for unit in units:
+            print(
+                json.dumps(
+                    {
+                        "url": unit.url,
+                        "season": unit.season,
+                        "stat_types": [str(st) for st in unit.stat_types],
+                    }
+                )
+            )
+        logging.info("%d page(s) pending", len(units))
+        return 0
+
+    failures = 0
+    for progress in backfill(stat_types, args.seasons, ledger=ledger):
+        failures += sum(r["status"] == "failed" for r in progress["results"])
+        print(json.dumps(progress), flush=True)
+        logging.info(
+            "%d/%d pages, ETA %.0fs",
+            progress["pages_done"],
+            progress["pages_total"],
+            progress["eta_seconds"],
+        )
+
+    if failures:
+        logging.warning("%d unit(s) failed; re-run to retry them", failures)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,6 +12,14 @@ class Settings(BaseSettings):
 
     # Database (required — app won't start without it)
     DATABASE_URL: str
+    # Connection pool (per process). The API serves sync handlers from a
+    # threadpool of API_THREADPOOL_SIZE threads, so DB_POOL_SIZE should be at
+    # least that; the overflow covers the watcher and background scrapes.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 10.0  # seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # seconds; drop connections older than this
+    API_THREADPOOL_SIZE: int = 20
     # Scraping — backend selection
     SCRAPE_BACKEND: Literal["selenium", "scrapling"] = "selenium"
 
@@ -24,6 +32,15 @@ class Settings(BaseSettings):
         60,
         120,
     ]  # exponential backoff delays in seconds
+    # Share of the host rate limit each priority class gets while contended
+    SCRAPE_PRIORITY_WEIGHTS: dict[str, int] = {
+        "interactive": 8,
+        "in_season": 4,
+        "backfill": 1,
+    }
+    # Space requests across all scraping processes via host_rate_slots;
+    # off, each process gets the full rate on its own
+    SCRAPE_RATE_LIMIT_SHARED: bool = True
 
     # Scraping — browser interaction timing
     SCRAPE_PAGE_LOAD_WAIT: float = 1.0  # seconds after page load / interactions
@@ -31,6 +48,9 @@ class Settings(BaseSettings):
     SCRAPE_CLOUDFLARE_INITIAL_WAIT: float = 10.0  # seconds for Cloudflare challenge
     SCRAPE_CLOUDFLARE_EXTENDED_WAIT: float = 15.0  # if "Just a moment" still present
 
+    # Scraping — batch gamelog (one Chrome driver per worker, shared rate limit)
+    SCRAPE_GAMELOG_WORKERS: int = 2
+
     # User-Agent rotation pool (10+ browser-like user agents)
     SCRAPE_USER_AGENTS: list[str] = [
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",  # noqa: E501
@@ -46,6 +66,48 @@ class Settings(BaseSettings):
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36",  # noqa: E501
     ]
 
+    # Raw page archive (content-addressed, compressed; disabled when unset)
+    PAGE_ARCHIVE_DIR: str = ""
+    PAGE_ARCHIVE_CODEC: Literal["gzip", "zstd"] = "gzip"
+
+    # Archive reparse pipeline (PARSE_WORKERS=None: one process per core)
+    PARSE_WORKERS: int | None = None
+    PARSE_CHUNK_SIZE: int = 4  # pages per worker task
+    PARSE_WRITE_BATCH_ROWS: int = 20000  # rows per write transaction
+    # "diff" updates changed rows in place; "swap" stages, validates and swaps
+    # each season in (see season_swap_service)
+    PARSE_WRITE_MODE: Literal["diff", "swap"] = "diff"
+    SWAP_MIN_ROW_RATIO: float = 0.5  # refuse swaps that shrink a season more
+
+    # Season backfills (`python -m src.backfill`) checkpoint progress here
+    BACKFILL_LEDGER_PATH: str = "./data/backfill_ledger.sqlite3"
+
+    # Scrape work queue (`python -m src.worker`)
+    SCRAPE_TASK_LEASE_SECONDS: int = 600  # re-queued if not renewed in time
+    SCRAPE_TASK_HEARTBEAT_SECONDS: int = 60
+    SCRAPE_TASK_POLL_SECONDS: float = 5.0  # idle wait when the queue is empty
+    SCRAPE_TASK_MAX_ATTEMPTS: int = 3
+
+    # In-season scheduler (`python -m src.scheduler`)
+    SCHEDULER_TRIGGER_HOUR_UTC: int = 10  # morning after each game day
+    SCHEDULER_POLL_SECONDS: int = 900
+
+    # Cache invalidation: max seconds a cached season can outlive an ingest
+    # (LISTEN/NOTIFY on Postgres is immediate; this is the polling fallback)
+    CACHE_INVALIDATION_POLL_SECONDS: float = 5.0
+
+    # Read-through cache for the read API (per process; see cached_stats_service)
+    READ_CACHE_ENABLED: bool = True
+    READ_CACHE_MAX_ENTRIES: int = 10000
+    READ_CACHE_FROZEN_TTL_SECONDS: float = 86400.0  # completed seasons
+    READ_CACHE_CURRENT_TTL_SECONDS: float = 60.0  # current season / all seasons
+
+    # Host-wide cache shared by all workers, under the per-process caches
+    # (see shared_cache); empty dir disables it
+    SHARED_CACHE_DIR: str = ""
+    SHARED_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    SHARED_CACHE_PAGE_TTL_SECONDS: float = 600.0  # raw pages; 0 = don't cache
+
     # Scrapling-specific (only used when SCRAPE_BACKEND=scrapling)
     SCRAPLING_FETCHER_TYPE: Literal["fetcher", "stealthy"] = "fetcher"
     SCRAPLING_TIMEOUT: int = 30
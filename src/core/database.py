@@ -1,8 +1,35 @@
 # core/database.py
+from collections.abc import Iterator
+from typing import Any
+
 from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session, sessionmaker
 
 from src.core.config import settings
 
-engine = create_engine(settings.DATABASE_URL)
+
+def _pool_options(url: str) -> dict[str, Any]:
+    # SQLite (tests, local dev) keeps SQLAlchemy's default pool for its driver
+    if make_url(url).get_backend_name() == "sqlite":
+        return {}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": True,
+    }
+
+
+engine = create_engine(settings.DATABASE_URL, **_pool_options(settings.DATABASE_URL))
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+
+def get_db() -> Iterator[Session]:
+    """FastAPI dependency: one session per request, closed when it finishes."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
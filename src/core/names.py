@@ -0,0 +1,28 @@
+"""
+Player name normalization for search.
+
+Names are stored alongside a normalized form (diacritics stripped,
+case-folded, whitespace collapsed) and searched by the same normalization
+of the query, so "Jose" finds "José" and the match is a plain ``LIKE`` a
+trigram index can serve instead of ``ILIKE`` over the raw name.
+"""
+
+from __future__ import annotations
+
+import unicodedata
+
+
+def normalize_name(name: str | None) -> str | None:
+    """``name`` without diacritics, case-folded, with single spaces."""
+    if name is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return " ".join(stripped.casefold().split())
+
+
+def name_pattern(query: str) -> str:
+    """``LIKE`` pattern (escape ``\\``) matching names that contain ``query``."""
+    normalized = normalize_name(query) or ""
+    escaped = normalized.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
@@ -0,0 +1,66 @@
+"""
+NFL calendar arithmetic used to schedule in-season scrapes.
+
+All dates are computed from rules rather than a published schedule:
+
+- Kickoff is the Thursday after Labor Day (first Monday in September).
+- The regular season runs 18 weeks (17 before 2021, 16 before 1978).
+- The Super Bowl is the second Sunday in February (first Sunday for
+  seasons before 2021).
+
+That is precise enough to decide *which* tables can have changed; the
+exact game times only matter to the hour, via ``SCHEDULER_TRIGGER_HOUR_UTC``.
+"""
+
+from datetime import date, timedelta
+
+MONDAY, THURSDAY, SATURDAY, SUNDAY = 0, 3, 5, 6
+
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date:
+    first = date(year, month, 1)
+    offset = (weekday - first.weekday()) % 7
+    return first + timedelta(days=offset + 7 * (n - 1))
+
+
+def season_for(day: date) -> int:
+    """The season a date belongs to (January-February belong to the prior year)."""
+    return day.year if day.month >= 3 else day.year - 1
+
+
+def kickoff(season: int) -> date:
+    """Opening Thursday of the regular season."""
+    labor_day = _nth_weekday(season, 9, MONDAY, 1)
+    return labor_day + timedelta(days=3)
+
+
+def regular_season_weeks(season: int) -> int:
+    if season >= 2021:
+        return 18
+    if season >= 1978:
+        return 17
+    return 16
+
+
+def regular_season_end(season: int) -> date:
+    """The Tuesday after the final regular-season weekend."""
+    return kickoff(season) + timedelta(weeks=regular_season_weeks(season), days=-2)
+
+
+def super_bowl(season: int) -> date:
+    return _nth_weekday(season + 1, 2, SUNDAY, 2 if season >= 2021 else 1)
+
+
+def is_season_complete(season: int, today: date) -> bool:
+    """True once the Super Bowl is in the past; the season's data is frozen."""
+    return today > super_bowl(season)
+
+
+def is_regular_season(day: date) -> bool:
+    season = season_for(day)
+    return kickoff(season) <= day <= regular_season_end(season)
+
+
+def is_postseason(day: date) -> bool:
+    season = season_for(day)
+    return regular_season_end(season) < day <= super_bowl(season)
@@ -0,0 +1,199 @@
+"""
+Content-addressed, compressed archive of every fetched PFR page.
+
+Pages are stored once per unique body under
+``<PAGE_ARCHIVE_DIR>/objects/<hh>/<sha256>.html.<gz|zst>`` and indexed in a
+local SQLite file by URL, fetch time and content hash. Parser fixes can then
+be replayed over the archive (see ``src/reparse.py``) without re-scraping.
+
+Archiving is disabled unless PAGE_ARCHIVE_DIR is set. zstd compression
+requires the optional ``zstandard`` package; gzip is always available.
+"""
+
+import gzip
+import hashlib
+import logging
+import os
+import sqlite3
+import tempfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+CODEC_EXTENSIONS = {"gzip": "gz", "zstd": "zst"}
+
+
+@dataclass(frozen=True)
+class ArchivedPage:
+    url: str
+    fetched_at: datetime
+    content_hash: str
+    size: int
+    codec: str
+
+
+def _compress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        import zstandard
+
+        compressed: bytes = zstandard.ZstdCompressor(level=10).compress(data)
+        return compressed
+    return gzip.compress(data, compresslevel=6)
+
+
+def _decompress(data: bytes, codec: str) -> bytes:
+    if codec == "zstd":
+        import zstandard
+
+        decompressed: bytes = zstandard.ZstdDecompressor().decompress(data)
+        return decompressed
+    return gzip.decompress(data)
+
+
+class PageArchive:
+    """On-disk page store with a SQLite (url, fetched_at, content_hash) index."""
+
+    def __init__(self, root: str | Path, codec: str = "gzip") -> None:
+        if codec not in CODEC_EXTENSIONS:
+            raise ValueError(f"Unknown archive codec: {codec!r}")
+        self.root = Path(root)
+        self.codec = codec
+        (self.root / "objects").mkdir(parents=True, exist_ok=True)
+        self._index_path = self.root / "index.sqlite3"
+
+        with self._index() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS pages (
+                    id           INTEGER PRIMARY KEY,
+                    url          TEXT NOT NULL,
+                    fetched_at   TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    size         INTEGER NOT NULL,
+                    codec        TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_pages_url_fetched "
+                "ON pages (url, fetched_at)"
+            )
+
+    @contextmanager
+    def _index(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self._index_path, timeout=30)
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _object_path(self, content_hash: str, codec: str) -> Path:
+        ext = CODEC_EXTENSIONS[codec]
+        return self.root / "objects" / content_hash[:2] / f"{content_hash}.html.{ext}"
+
+    def put(self, url: str, html: str, fetched_at: datetime | None = None) -> str:
+        """
+        Archive a fetched page.
+
+        The body is written once per unique content hash; every call still
+        records an index entry so fetch history per URL is preserved.
+
+        Args:
+            url: URL the page was fetched from
+            html: Raw page source
+            fetched_at: Fetch time (defaults to now, UTC)
+
+        Returns:
+            SHA-256 hex digest of the page body
+        """
+        data = html.encode("utf-8")
+        content_hash = hashlib.sha256(data).hexdigest()
+        path = self._object_path(content_hash, self.codec)
+
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(_compress(data, self.codec))
+                os.replace(tmp, path)
+            except BaseException:
+                Path(tmp).unlink(missing_ok=True)
+                raise
+
+        fetched_at = fetched_at or datetime.now(UTC)
+        with self._index() as conn:
+            conn.execute(
+                "INSERT INTO pages (url, fetched_at, content_hash, size, codec) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, fetched_at.isoformat(), content_hash, len(data), self.codec),
+            )
+        return content_hash
+
+    def latest(self, url: str) -> ArchivedPage | None:
+        """Return the index entry of the most recent fetch of a URL."""
+        with self._index() as conn:
+            row = conn.execute(
+                "SELECT url, fetched_at, content_hash, size, codec FROM pages "
+                "WHERE url = ? ORDER BY fetched_at DESC, id DESC LIMIT 1",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return ArchivedPage(
+            url=row[0],
+            fetched_at=datetime.fromisoformat(row[1]),
+            content_hash=row[2],
+            size=row[3],
+            codec=row[4],
+        )
+
+    def read(self, page: ArchivedPage) -> str:
+        """Load and decompress an archived page body."""
+        data = self._object_path(page.content_hash, page.codec).read_bytes()
+        return _decompress(data, page.codec).decode("utf-8")
+
+    def read_latest(self, url: str) -> str | None:
+        """Return the most recently archived body for a URL, if any."""
+        page = self.latest(url)
+        return self.read(page) if page is not None else None
+
+
+_archives: dict[tuple[str, str], PageArchive] = {}
+
+
+def get_archive() -> PageArchive | None:
+    """Return the configured archive, or None when archiving is disabled."""
+    if not settings.PAGE_ARCHIVE_DIR:
+        return None
+    key = (settings.PAGE_ARCHIVE_DIR, settings.PAGE_ARCHIVE_CODEC)
+    if key not in _archives:
+        _archives[key] = PageArchive(*key)
+    return _archives[key]
+
+
+def archive_page(url: str, html: str) -> str | None:
+    """
+    Archive a fetched page if archiving is enabled.
+
+    Never raises: a failing archive must not fail the scrape that fed it.
+
+    Returns:
+        Content hash of the archived page, or None if not archived
+    """
+    archive = get_archive()
+    if archive is None:
+        return None
+    try:
+        return archive.put(url, html)
+    except Exception:
+        logger.warning("Failed to archive page", extra={"url": url}, exc_info=True)
+        return None
@@ -0,0 +1,121 @@
+"""
+Opaque cursors for keyset pagination.
+
+A ``Cursor`` marks a position in a listing ordered by ``(sort_by, id)``:
+the key ``(value, id)`` of a row plus the ordering it was issued for.
+Following it fetches the rows after that key (``backward=False``) or
+before it (``backward=True``); ``inclusive`` also returns the row at the
+key itself, which is how an empty page hands back a cursor to the rows
+just before or after it.
+
+Cursors travel as url-safe base64 of a small JSON object, so values must
+survive JSON (Decimals and dates are sent as strings and coerced back by
+the repository against the sort column's type).
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from dataclasses import dataclass, replace
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+
+def _encode(payload: Any) -> str:
+    raw = json.dumps(payload, default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def _decode(token: str) -> Any:
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+        return json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+
+
+@dataclass(frozen=True)
+class Cursor:
+    sort_by: str
+    order: str
+    value: Any
+    id: int
+    backward: bool = False
+    inclusive: bool = False
+
+    def flipped(self) -> Cursor:
+        """The same key, followed the other way and including the key's row."""
+        return replace(self, backward=not self.backward, inclusive=True)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "s": self.sort_by,
+            "o": self.order,
+            "v": self.value,
+            "i": self.id,
+            "b": self.backward,
+            "n": self.inclusive,
+        }
+
+    @classmethod
+    def from_dict(cls, payload: Any) -> Cursor:
+        try:
+            cursor = cls(
+                sort_by=payload["s"],
+                order=payload["o"],
+                value=payload["v"],
+                id=payload["i"],
+                backward=bool(payload.get("b", False)),
+                inclusive=bool(payload.get("n", False)),
+            )
+        except (KeyError, TypeError) as e:
+            raise ValueError("Invalid cursor") from e
+        if not isinstance(cursor.sort_by, str) or not isinstance(cursor.id, int):
+            raise ValueError("Invalid cursor")
+        return cursor
+
+    def encode(self) -> str:
+        return _encode(self.to_dict())
+
+    @classmethod
+    def decode(cls, token: str) -> Cursor:
+        """Parse a token from ``encode``; raises ValueError if malformed."""
+        return cls.from_dict(_decode(token))
+
+
+def encode_cursors(cursors: dict[str, Cursor | None]) -> str:
+    """One token for several listings paged together (e.g. per stat category)."""
+    return _encode(
+        {name: c.to_dict() if c is not None else None for name, c in cursors.items()}
+    )
+
+
+def decode_cursors(token: str) -> dict[str, Cursor | None]:
+    payload = _decode(token)
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return {
+        name: Cursor.from_dict(c) if c is not None else None
+        for name, c in payload.items()
+    }
+
+
+@dataclass
+class KeysetPage(Generic[T]):
+    """One page of a keyset listing with cursors to either side of it."""
+
+    items: list[T]
+    next_cursor: Cursor | None
+    prev_cursor: Cursor | None
+    has_next: bool
+    has_prev: bool
+    total: int | None = None  # rows in the whole listing, when requested
+
+    def next_token(self) -> str | None:
+        return self.next_cursor.encode() if self.has_next and self.next_cursor else None
+
+    def prev_token(self) -> str | None:
+        return self.prev_cursor.encode() if self.has_prev and self.prev_cursor else None
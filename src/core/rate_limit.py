@@ -0,0 +1,261 @@
+"""
+Per-host rate limiting shared by every fetch path.
+
+All scrapers hit the same host (Pro-Football-Reference), so the politeness
+delay has to be enforced across everything that scrapes rather than as a
+fixed sleep inside each fetch. Concurrent fetchers (threads or asyncio
+tasks running blocking code via ``asyncio.to_thread``) call ``acquire``
+before each request and are spaced at least ``min_interval`` seconds apart
+per host.
+
+The API, the backfill CLI, the scheduler and each scrape worker are
+separate processes, so the spacing is also enforced between them: the
+process-wide limiter (``host_rate_limiter``) claims every granted slot from
+the ``host_rate_slots`` table (``reserve_shared_slot``) and waits for it,
+keeping all processes together at one request per ``min_interval``. With
+``SCRAPE_RATE_LIMIT_SHARED`` off, or if the table cannot be reached, the
+limit is per process and running N scraping processes fetches at N times
+the rate.
+
+Request slots are shared between priority classes by weighted fair
+queuing (stride scheduling): while several classes are waiting, each gets
+slots in proportion to its weight (``SCRAPE_PRIORITY_WEIGHTS``), so an
+interactive "refresh this week" scrape is served within a slot or two even
+while a backfill has thousands of pages queued. Because every page fetch
+acquires its own slot, long-running work yields at page boundaries.
+
+The class of a fetch comes from the ``scrape_priority`` context (which
+``asyncio.to_thread`` propagates into worker threads) and defaults to
+``interactive``. Priorities order requests within a process only; between
+processes, slots go first come first served. A process claims its next
+shared slot only once the previous one has passed, so an interactive
+fetch in the API waits behind at most one slot per other scraping process.
+"""
+
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import StrEnum
+from urllib.parse import urlparse
+
+from src.core.config import settings
+from src.core.run_metrics import record_wait
+
+logger = logging.getLogger(__name__)
+
+
+class ScrapePriority(StrEnum):
+    interactive = "interactive"
+    in_season = "in_season"
+    backfill = "backfill"
+
+
+_current_priority: ContextVar[ScrapePriority] = ContextVar(
+    "scrape_priority", default=ScrapePriority.interactive
+)
+
+
+@contextmanager
+def scrape_priority(priority: ScrapePriority | str) -> Iterator[None]:
+    """Run the enclosed fetches in the given priority class."""
+    token = _current_priority.set(ScrapePriority(priority))
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+def current_priority() -> ScrapePriority:
+    return _current_priority.get()
+
+
+def reserve_shared_slot(host: str, interval: float) -> float:
+    """
+    Claim the next cross-process request slot for a host.
+
+    Never raises: if the slot table cannot be reached the caller falls back
+    to its per-process spacing.
+
+    Returns:
+        Seconds to wait before issuing the request
+    """
+    if not settings.SCRAPE_RATE_LIMIT_SHARED:
+        return 0.0
+    # Imported here: core modules do not depend on the data layer at import
+    from src.core.database import SessionLocal
+    from src.repositories.host_rate_slot_repo import HostRateSlotRepository
+
+    db = SessionLocal()
+    try:
+        return HostRateSlotRepository(db).reserve(host, interval)
+    except Exception:
+        db.rollback()
+        logger.warning(
+            "Shared rate limit unavailable, limiting per process",
+            extra={"host": host},
+            exc_info=True,
+        )
+        return 0.0
+    finally:
+        db.close()
+
+
+@dataclass
+class _HostQueue:
+    next_slot: float = 0.0
+    # Stride-scheduling state: virtual time of the last grant and each
+    # class's pass value (advanced by 1/weight per granted slot)
+    vtime: float = 0.0
+    passes: dict[ScrapePriority, float] = field(
+        default_factory=lambda: dict.fromkeys(ScrapePriority, 0.0)
+    )
+    waiting: dict[ScrapePriority, deque[object]] = field(
+        default_factory=lambda: {p: deque() for p in ScrapePriority}
+    )
+
+
+@dataclass
+class _WaitStats:
+    requests: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class HostRateLimiter:
+    """
+    Thread-safe minimum-interval limiter keyed by URL host.
+
+    ``reserve(host, interval)`` claims each granted slot from state shared
+    with other processes and returns how long to wait for it (see
+    ``reserve_shared_slot``); without it the limit is per instance.
+    """
+
+    def __init__(
+        self,
+        min_interval: float | None = None,
+        weights: dict[str, int] | None = None,
+        reserve: Callable[[str, float], float] | None = None,
+    ) -> None:
+        self._min_interval = min_interval
+        self._weights = weights
+        self._reserve = reserve
+        self._cond = threading.Condition()
+        self._hosts: dict[str, _HostQueue] = {}
+        self._stats = {p: _WaitStats() for p in ScrapePriority}
+
+    @property
+    def min_interval(self) -> float:
+        if self._min_interval is None:
+            return float(settings.SCRAPE_DELAY_SECONDS)
+        return self._min_interval
+
+    def weight(self, priority: ScrapePriority) -> int:
+        weights = self._weights or settings.SCRAPE_PRIORITY_WEIGHTS
+        return max(1, int(weights.get(priority, 1)))
+
+    def _next_class(self, host: _HostQueue) -> ScrapePriority:
+        # Ties go to the more urgent class (enum declaration order)
+        order = list(ScrapePriority)
+        return min(
+            (p for p, q in host.waiting.items() if q),
+            key=lambda p: (host.passes[p], order.index(p)),
+        )
+
+    def acquire(self, url: str, priority: ScrapePriority | str | None = None) -> float:
+        """
+        Block until the caller may issue a request to the URL's host.
+
+        Args:
+            url: URL about to be fetched
+            priority: Priority class (defaults to the ``scrape_priority``
+                context, else interactive)
+
+        Returns:
+            Seconds spent waiting
+        """
+        priority = ScrapePriority(priority or current_priority())
+        name = urlparse(url).netloc
+        ticket = object()
+        started = time.monotonic()
+
+        with self._cond:
+            host = self._hosts.setdefault(name, _HostQueue())
+            queue = host.waiting[priority]
+            if not queue:
+                # A class returning from idle must not cash in credit for
+                # the time it was not competing
+                host.passes[priority] = max(host.passes[priority], host.vtime)
+            queue.append(ticket)
+            self._cond.notify_all()
+
+            while True:
+                chosen = self._next_class(host)
+                if host.waiting[chosen][0] is not ticket:
+                    self._cond.wait()
+                    continue
+                now = time.monotonic()
+                if now < host.next_slot:
+                    self._cond.wait(host.next_slot - now)
+                    continue
+                queue.popleft()
+                host.vtime = host.passes[priority]
+                host.passes[priority] += 1 / self.weight(priority)
+                delay = self._reserve(name, self.min_interval) if self._reserve else 0
+                host.next_slot = now + delay + self.min_interval
+                self._cond.notify_all()
+                # Wait for the shared slot; the next local grant is after it
+                slot = now + delay
+                while (remaining := slot - time.monotonic()) > 0:
+                    self._cond.wait(remaining)
+                break
+
+            waited = time.monotonic() - started
+            stats = self._stats[priority]
+            stats.requests += 1
+            stats.total_wait += waited
+            stats.max_wait = max(stats.max_wait, waited)
+
+        record_wait(waited)
+        if waited > 0.01:
+            logger.debug(
+                "Rate limit wait",
+                extra={
+                    "url": url,
+                    "priority": str(priority),
+                    "wait_seconds": round(waited, 2),
+                },
+            )
+        return waited
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """Per-class queue wait metrics since startup (or the last reset)."""
+        with self._cond:
+            waiting = {
+                p: sum(len(h.waiting[p]) for h in self._hosts.values())
+                for p in ScrapePriority
+            }
+            return {
+                str(p): {
+                    "requests": s.requests,
+                    "waiting": waiting[p],
+                    "avg_wait_seconds": round(s.total_wait / s.requests, 3)
+                    if s.requests
+                    else 0.0,
+                    "max_wait_seconds": round(s.max_wait, 3),
+                    "total_wait_seconds": round(s.total_wait, 3),
+                    "weight": self.weight(p),
+                }
+                for p, s in self._stats.items()
+            }
+
+    def reset_stats(self) -> None:
+        with self._cond:
+            self._stats = {p: _WaitStats() for p in ScrapePriority}
+
+
+host_rate_limiter = HostRateLimiter(reserve=reserve_shared_slot)
@@ -0,0 +1,209 @@
+"""
+In-process read-through cache with single-flight loads and tag invalidation.
+
+Entries are keyed by any hashable key and tagged with the (table, season)
+pairs they were computed from; ``invalidate(table, season)`` evicts every
+entry tagged with that pair or with ``(table, None)`` ("any season of
+table"). It has the ``cache_invalidation_service`` callback
+signature, so the cache is subscribed there once per process.
+
+Concurrent misses for the same key are coalesced: one thread runs the
+loader and the others wait for its result. A load that overlaps an
+invalidation of one of its tags is returned to its callers but not stored,
+so a value read before a write never outlives it.
+
+With a ``shared`` tier (a ``SharedCache`` used by every worker on the
+host), a miss is looked up there before running the loader, and loaded
+values are written through to it; values must then be JSON-serializable.
+Invalidations are forwarded to the shared tier too.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from dataclasses import dataclass, field
+from typing import Any
+
+from src.core.shared_cache import SharedCache, Tag
+
+
+@dataclass
+class _Entry:
+    value: Any
+    expires_at: float
+    tags: tuple[Tag, ...]
+
+
+@dataclass
+class _Flight:
+    done: threading.Event = field(default_factory=threading.Event)
+    value: Any = None
+    error: BaseException | None = None
+
+
+class ReadCache:
+    """Size-bounded LRU of loader results with per-entry TTLs."""
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        clock: Callable[[], float] = time.monotonic,
+        shared: SharedCache | None = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.shared = shared
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._by_tag: dict[Tag, set[Hashable]] = {}
+        self._generations: dict[str, int] = {}  # per table, bumped on invalidate
+        self._flights: dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            (
+                "hits",
+                "misses",
+                "shared_hits",
+                "coalesced",
+                "evictions",
+                "invalidations",
+            ),
+            0,
+        )
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        *,
+        ttl: float,
+        tags: Iterable[Tag] = (),
+    ) -> Any:
+        """Return the cached value for ``key``, running ``loader`` once on a miss."""
+        tags = tuple(tags)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > self._clock():
+                self._entries.move_to_end(key)
+                self._stats["hits"] += 1
+                return entry.value
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                self._stats["misses"] += 1
+                flight = self._flights[key] = _Flight()
+                generations = self._generations_of(tags)
+            else:
+                self._stats["coalesced"] += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value, ttl = self._load(key, loader, ttl, tags)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+                fresh = generations == self._generations_of(tags)
+                if flight.error is None and fresh and ttl > 0:
+                    self._store(key, _Entry(flight.value, self._clock() + ttl, tags))
+            flight.done.set()
+        return flight.value
+
+    def _load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        ttl: float,
+        tags: tuple[Tag, ...],
+    ) -> tuple[Any, float]:
+        """Value and remaining TTL, from the shared tier or else the loader."""
+        if self.shared is None:
+            return loader(), ttl
+        shared_key = f"read:{key!r}"
+        generations = self.shared.generations(table for table, _ in tags)
+        found = self.shared.get_with_ttl(shared_key)
+        if found is not None:
+            with self._lock:
+                self._stats["shared_hits"] += 1
+            data, remaining = found
+            return json.loads(data), min(ttl, remaining)
+        value = loader()
+        if generations is not None:
+            self.shared.set(
+                shared_key,
+                json.dumps(value).encode("utf-8"),
+                ttl=ttl,
+                tags=tags,
+                generations=generations,
+            )
+        return value, ttl
+
+    def _generations_of(self, tags: tuple[Tag, ...]) -> list[int]:
+        return [self._generations.get(table, 0) for table, _ in tags]
+
+    def _store(self, key: Hashable, entry: _Entry) -> None:
+        self._discard(key)
+        self._entries[key] = entry
+        for tag in entry.tags:
+            self._by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            oldest = next(iter(self._entries))
+            self._discard(oldest)
+            self._stats["evictions"] += 1
+
+    def _discard(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        for tag in entry.tags:
+            keys = self._by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._by_tag[tag]
+
+    def invalidate(self, table_name: str, season: int | None) -> None:
+        """
+        Evict entries computed from a (table, season).
+
+        ``season=None`` evicts every season of the table.
+        """
+        with self._lock:
+            self._generations[table_name] = self._generations.get(table_name, 0) + 1
+            keys = {
+                key
+                for (table, tag_season), tagged in self._by_tag.items()
+                if table == table_name
+                and None in (season, tag_season)
+                or (table, tag_season) == (table_name, season)
+                for key in tagged
+            }
+            for key in keys:
+                self._discard(key)
+            self._stats["invalidations"] += len(keys)
+        if self.shared is not None:
+            self.shared.invalidate(table_name, season)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._by_tag.clear()
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            stats: dict[str, Any] = {
+                **self._stats,
+                "entries": len(self._entries),
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+            }
+        stats["shared"] = self.shared.stats() if self.shared is not None else None
+        return stats
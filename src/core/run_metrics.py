@@ -0,0 +1,110 @@
+"""
+Per-scrape-run stage timings, collected wherever the time is spent.
+
+A scrape run (one stat type and season, or one gamelog team-season) is
+tracked with ``track_run``; code deeper in the stack reports into the
+current run through the context without having it passed around:
+
+- ``stage("parse")`` etc. time a block,
+- ``HostRateLimiter.acquire`` reports its queue wait,
+- ``retry_with_backoff`` counts attempts,
+- fetchers report page bytes.
+
+Like ``scrape_priority``, the context is copied into worker threads by
+``asyncio.to_thread``. Everything is a no-op outside a tracked run.
+"""
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+
+STAGES = ("fetch", "rate_limit_wait", "parse", "validate", "write")
+
+
+@dataclass
+class RunMetrics:
+    run_id: str
+    stat_type: str
+    season: int | None = None
+    url: str | None = None
+    backend: str | None = None
+    started_at: datetime = field(default_factory=lambda: datetime.now(UTC))
+    durations: dict[str, float] = field(
+        default_factory=lambda: dict.fromkeys(STAGES, 0.0)
+    )
+    attempts: int = 0
+    bytes_fetched: int = 0
+    rows_in: int | None = None
+    rows_changed: int | None = None
+    outcome: str | None = None
+    error: str | None = None
+    total_seconds: float = 0.0
+
+    def stage_seconds(self) -> dict[str, float]:
+        """Durations per stage; fetch excludes the rate-limit wait it contains."""
+        seconds = dict(self.durations)
+        seconds["fetch"] = max(0.0, seconds["fetch"] - seconds["rate_limit_wait"])
+        return seconds
+
+
+_current_run: ContextVar[RunMetrics | None] = ContextVar("scrape_run", default=None)
+
+
+def current_run() -> RunMetrics | None:
+    return _current_run.get()
+
+
+@contextmanager
+def track_run(run: RunMetrics) -> Iterator[RunMetrics]:
+    """
+    Collect metrics for the enclosed scrape into ``run``.
+
+    Adds the block's wall time to ``total_seconds`` on exit and sets
+    ``outcome``/``error`` if it raised (the exception still propagates).
+    """
+    token = _current_run.set(run)
+    started = time.perf_counter()
+    try:
+        yield run
+    except Exception as e:
+        run.outcome = "failed"
+        run.error = str(e) or type(e).__name__
+        raise
+    finally:
+        run.total_seconds += time.perf_counter() - started
+        _current_run.reset(token)
+
+
+@contextmanager
+def stage(name: str) -> Iterator[None]:
+    """Add the enclosed block's wall time to a stage of the current run."""
+    run = _current_run.get()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        if run is not None:
+            run.durations[name] = run.durations.get(name, 0.0) + (
+                time.perf_counter() - started
+            )
+
+
+def record_wait(seconds: float) -> None:
+    run = _current_run.get()
+    if run is not None:
+        run.durations["rate_limit_wait"] += seconds
+
+
+def record_attempt() -> None:
+    run = _current_run.get()
+    if run is not None:
+        run.attempts += 1
+
+
+def record_bytes(count: int) -> None:
+    run = _current_run.get()
+    if run is not None:
+        run.bytes_fetched += count
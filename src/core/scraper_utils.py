@@ -3,8 +3,10 @@ Utility functions for web scraping with retry logic, user-agent rotation,
 and error handling.
 """
 
+import hashlib
 import logging
 import random
+import re
 import time
 from collections.abc import Callable
 from typing import Any, cast
@@ -20,6 +22,10 @@ from selenium_stealth import stealth  # noqa: F401
 from webdriver_manager.chrome import ChromeDriverManager
 
 from src.core.config import settings
+from src.core.page_archive import archive_page
+from src.core.rate_limit import host_rate_limiter
+from src.core.run_metrics import record_attempt, record_bytes
+from src.core.shared_cache import get_shared_cache
 
 logger = logging.getLogger(__name__)
 
@@ -149,7 +155,7 @@ def fetch_page_with_selenium(url: str) -> str:
 
     Includes: headless Chrome, anti-automation flags, random user-agent,
     optional proxy, Cloudflare wait, selenium_stealth integration,
-    rate limiting via SCRAPE_DELAY_SECONDS.
+    per-host rate limiting via SCRAPE_DELAY_SECONDS.
 
     Args:
         url: URL to fetch
@@ -162,7 +168,7 @@ def fetch_page_with_selenium(url: str) -> str:
         logger.info(f"Stripped hash fragment from URL: {url} -> {clean_url}")
         url = clean_url
 
-    time.sleep(settings.SCRAPE_DELAY_SECONDS)
+    host_rate_limiter.acquire(url)
 
     driver = create_chrome_driver()
 
@@ -178,37 +184,54 @@ def fetch_page_with_selenium(url: str) -> str:
         logger.info(
             f"Page loaded - Title: {driver.title}, Length: {len(page_source)} chars"
         )
+        archive_page(url, page_source)
         return page_source
     finally:
         driver.quit()
 
 
-def fetch_page(url: str) -> str:
+def fetch_page(url: str, *, use_cache: bool = True) -> str:
     """
     Unified page fetcher — delegates to the backend selected by SCRAPE_BACKEND.
 
     Returns raw HTML string regardless of backend. Downstream parsing
     (find_pfr_table, BeautifulSoup, COLUMN_MAP) is completely unaffected.
 
+    With the shared cache enabled, a page any process on the host fetched
+    within SHARED_CACHE_PAGE_TTL_SECONDS is returned without a request.
+
     Args:
         url: URL to fetch
+        use_cache: Serve a cached copy if there is one; with False the page
+            is always fetched (and the fresh copy still cached)
 
     Returns:
         Page source HTML string
     """
+    cache = get_shared_cache() if settings.SHARED_CACHE_PAGE_TTL_SECONDS > 0 else None
+    if cache is not None and use_cache:
+        cached = cache.get(f"page:{url}")
+        if cached is not None:
+            return cached.decode("utf-8")
+
     backend = settings.SCRAPE_BACKEND
 
     if backend == "scrapling":
         from src.core.scrapling_fetcher import fetch_page_with_scrapling
 
-        return fetch_page_with_scrapling(url)
-
-    if backend == "selenium":
-        return fetch_page_with_selenium(url)
+        page_source = fetch_page_with_scrapling(url)
+    elif backend == "selenium":
+        page_source = fetch_page_with_selenium(url)
+    else:
+        raise ValueError(
+            f"Unknown SCRAPE_BACKEND: {backend!r}. Use 'selenium' or 'scrapling'."
+        )
 
-    raise ValueError(
-        f"Unknown SCRAPE_BACKEND: {backend!r}. Use 'selenium' or 'scrapling'."
-    )
+    encoded = page_source.encode("utf-8")
+    record_bytes(len(encoded))
+    if cache is not None:
+        cache.set(f"page:{url}", encoded, ttl=settings.SHARED_CACHE_PAGE_TTL_SECONDS)
+    return page_source
 
 
 def find_pfr_table(page_source: str, table_id: str) -> Tag | None:
@@ -244,6 +267,42 @@ def find_pfr_table(page_source: str, table_id: str) -> Tag | None:
     return None
 
 
+def pfr_player_id(cell: Tag) -> str | None:
+    """PFR's player id (e.g. ``MahoPa00``) from a player cell, if it has one."""
+    value = cell.get("data-append-csv")
+    return str(value) if value else None
+
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def table_fingerprint(page_source: str, table_id: str) -> str | None:
+    """
+    Hash a PFR table's HTML fragment for change detection.
+
+    Works on the raw page source (visible or commented-out tables alike)
+    without building a DOM, so it is much cheaper than parsing. Whitespace
+    is normalized so re-indented but otherwise identical markup hashes the
+    same.
+
+    Args:
+        page_source: Raw HTML page source
+        table_id: The ID attribute of the target table
+
+    Returns:
+        SHA-256 hex digest of the normalized fragment, or None if not found
+    """
+    match = re.search(rf'<table\b[^>]*\bid="{re.escape(table_id)}"', page_source)
+    if match is None:
+        return None
+    end = page_source.find("</table>", match.end())
+    if end == -1:
+        return None
+    fragment = page_source[match.start() : end + len("</table>")]
+    normalized = _WHITESPACE.sub(" ", fragment).replace("> <", "><")
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
 def retry_with_backoff(
     func: Callable,
     *args,
@@ -284,6 +343,7 @@ def retry_with_backoff(
 
     for attempt in range(max_retries):
         start_time = time.time()
+        record_attempt()
 
         try:
             logger.info(
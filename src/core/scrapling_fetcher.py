@@ -10,7 +10,6 @@ Activated only when SCRAPE_BACKEND=scrapling.
 
 import logging
 import random
-import time
 from typing import Literal, cast
 
 from src.core.config import settings
@@ -59,7 +58,7 @@ def fetch_page_with_scrapling(url: str) -> str:
     Fetch a page using Scrapling and return the raw HTML string.
 
     Mirrors the contract of fetch_page_with_selenium():
-      - Applies SCRAPE_DELAY_SECONDS rate-limit sleep
+      - Applies the SCRAPE_DELAY_SECONDS per-host rate limit
       - Strips URL hash fragments
       - Returns page source as str
 
@@ -75,6 +74,8 @@ def fetch_page_with_scrapling(url: str) -> str:
     """
     from scrapling.fetchers import Fetcher, StealthyFetcher
 
+    from src.core.page_archive import archive_page
+    from src.core.rate_limit import host_rate_limiter
     from src.core.scraper_utils import strip_url_hash
 
     clean_url = strip_url_hash(url)
@@ -82,7 +83,7 @@ def fetch_page_with_scrapling(url: str) -> str:
         logger.info("Stripped hash fragment from URL: %s -> %s", url, clean_url)
         url = clean_url
 
-    time.sleep(settings.SCRAPE_DELAY_SECONDS)
+    host_rate_limiter.acquire(url)
 
     proxy = _get_proxy()
     fetcher_type = settings.SCRAPLING_FETCHER_TYPE
@@ -138,4 +139,5 @@ def fetch_page_with_scrapling(url: str) -> str:
         },
     )
 
+    archive_page(url, page_source)
     return page_source
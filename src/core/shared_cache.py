@@ -0,0 +1,324 @@
+"""
+Host-wide cache shared by every worker process, in one SQLite file.
+
+Several uvicorn workers on a host each hold their own ``ReadCache``; this
+tier sits under them so a result one worker computed is served to its
+siblings from disk instead of the database, and a page one process fetched
+is not fetched again by another within its TTL.
+
+The database runs in WAL mode (readers never block the single writer) with
+reads served through ``mmap``. Entries are bytes with an absolute expiry
+and a last-access time; when the stored bytes exceed ``max_bytes`` the
+least recently used entries are evicted, expired ones first. Access times
+are refreshed at most every ``touch_interval`` seconds so hot reads do not
+turn into writes.
+
+Entries can be tagged with (table, season) pairs and are evicted by
+``invalidate(table, season)`` with the same matching as ``ReadCache``.
+Each invalidation bumps a per-table generation; ``set`` with the
+generations read before a load refuses to store it if any moved, so a
+value read before a write never lands in the cache after it.
+
+A failing cache never fails the caller: SQLite errors are logged and
+counted, and degrade to a miss or a skipped write.
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections.abc import Callable, Iterable
+from pathlib import Path
+from typing import Any
+
+from src.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+Tag = tuple[str, int | None]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    value BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    expires_at REAL NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    key TEXT NOT NULL,
+    table_name TEXT NOT NULL,
+    season INTEGER
+);
+CREATE INDEX IF NOT EXISTS ix_entry_tags_tag ON entry_tags (table_name, season);
+CREATE INDEX IF NOT EXISTS ix_entry_tags_key ON entry_tags (key);
+CREATE TABLE IF NOT EXISTS generations (
+    table_name TEXT PRIMARY KEY,
+    generation INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS counters (
+    name TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO counters VALUES ('bytes', 0);
+CREATE TRIGGER IF NOT EXISTS entries_insert AFTER INSERT ON entries BEGIN
+    UPDATE counters SET value = value + NEW.size WHERE name = 'bytes';
+END;
+CREATE TRIGGER IF NOT EXISTS entries_delete AFTER DELETE ON entries BEGIN
+    UPDATE counters SET value = value - OLD.size WHERE name = 'bytes';
+    DELETE FROM entry_tags WHERE key = OLD.key;
+END;
+"""
+
+
+class SharedCache:
+    """Size-bounded LRU of bytes values in a SQLite file shared across processes."""
+
+    def __init__(
+        self,
+        directory: str | Path,
+        max_bytes: int = 256 * 1024 * 1024,
+        *,
+        touch_interval: float = 5.0,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.path = self.directory / "cache.sqlite3"
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._clock = clock
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._stats = dict.fromkeys(
+            ("hits", "misses", "writes", "evictions", "invalidations", "errors"), 0
+        )
+        self._connect().executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per thread and process; a forked worker reconnects
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA mmap_size={self.max_bytes}")
+        self._local.conn, self._local.pid = conn, os.getpid()
+        return conn
+
+    def _transaction(self) -> "_Transaction":
+        return _Transaction(self._connect())
+
+    def _count(self, stat: str, n: int = 1) -> None:
+        with self._lock:
+            self._stats[stat] += n
+
+    def _failed(self, action: str, error: sqlite3.Error) -> None:
+        logger.warning(f"Shared cache {action} failed ({self.path}): {error}")
+        self._count("errors")
+
+    def get(self, key: str) -> bytes | None:
+        """Return the value for ``key``, or None on a miss or expiry."""
+        found = self.get_with_ttl(key)
+        return found[0] if found is not None else None
+
+    def get_with_ttl(self, key: str) -> tuple[bytes, float] | None:
+        """Return ``(value, seconds left)`` for ``key``, or None on a miss."""
+        now = self._clock()
+        try:
+            conn = self._connect()
+            row = conn.execute(
+                "SELECT value, expires_at, last_access FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self._count("misses")
+                return None
+            if now - row[2] >= self.touch_interval:
+                conn.execute(
+                    "UPDATE entries SET last_access = ? WHERE key = ?", (now, key)
+                )
+        except sqlite3.Error as e:
+            self._failed("read", e)
+            return None
+        self._count("hits")
+        return bytes(row[0]), row[1] - now
+
+    def generations(self, tables: Iterable[str]) -> dict[str, int] | None:
+        """Current generation of each table, to pass back to ``set``."""
+        tables = sorted(set(tables))
+        if not tables:
+            return {}
+        try:
+            rows = (
+                self._connect()
+                .execute(
+                    "SELECT table_name, generation FROM generations "
+                    f"WHERE table_name IN ({', '.join('?' * len(tables))})",
+                    tables,
+                )
+                .fetchall()
+            )
+        except sqlite3.Error as e:
+            self._failed("read", e)
+            return None
+        return dict.fromkeys(tables, 0) | dict(rows)
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        *,
+        ttl: float,
+        tags: Iterable[Tag] = (),
+        generations: dict[str, int] | None = None,
+    ) -> bool:
+        """
+        Store ``value`` for ``ttl`` seconds, evicting LRU entries over budget.
+
+        With ``generations`` (from ``generations()`` before the value was
+        computed), the write is skipped if any of those tables was
+        invalidated since. Returns whether the value was stored.
+        """
+        size = len(value)
+        if ttl <= 0 or size > self.max_bytes:
+            return False
+        tags = tuple(tags)
+        now = self._clock()
+        try:
+            with self._transaction() as conn:
+                if generations and self._moved(conn, generations):
+                    return False
+                conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+                conn.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?)",
+                    (key, value, size, now + ttl, now),
+                )
+                conn.executemany(
+                    "INSERT INTO entry_tags VALUES (?, ?, ?)",
+                    [(key, table, season) for table, season in tags],
+                )
+                evicted = self._evict(conn, now)
+        except sqlite3.Error as e:
+            self._failed("write", e)
+            return False
+        self._count("writes")
+        self._count("evictions", evicted)
+        return True
+
+    @staticmethod
+    def _moved(conn: sqlite3.Connection, generations: dict[str, int]) -> bool:
+        for table, generation in generations.items():
+            row = conn.execute(
+                "SELECT generation FROM generations WHERE table_name = ?", (table,)
+            ).fetchone()
+            if (row[0] if row else 0) != generation:
+                return True
+        return False
+
+    def _evict(self, conn: sqlite3.Connection, now: float) -> int:
+        if self._bytes(conn) <= self.max_bytes:
+            return 0
+        expired = conn.execute("DELETE FROM entries WHERE expires_at <= ?", (now,))
+        excess = self._bytes(conn) - self.max_bytes
+        victims = []
+        for key, size in conn.execute(
+            "SELECT key, size FROM entries ORDER BY last_access"
+        ):
+            if excess <= 0:
+                break
+            victims.append((key,))
+            excess -= size
+        conn.executemany("DELETE FROM entries WHERE key = ?", victims)
+        return expired.rowcount + len(victims)
+
+    @staticmethod
+    def _bytes(conn: sqlite3.Connection) -> int:
+        row = conn.execute("SELECT value FROM counters WHERE name = 'bytes'").fetchone()
+        return int(row[0])
+
+    def invalidate(self, table_name: str, season: int | None) -> None:
+        """
+        Evict entries computed from a (table, season).
+
+        ``season=None`` evicts every season of the table; entries tagged
+        ``(table, None)`` are evicted by any season.
+        """
+        try:
+            with self._transaction() as conn:
+                conn.execute(
+                    "INSERT INTO generations VALUES (?, 1) ON CONFLICT (table_name) "
+                    "DO UPDATE SET generation = generation + 1",
+                    (table_name,),
+                )
+                deleted = conn.execute(
+                    "DELETE FROM entries WHERE key IN (SELECT key FROM entry_tags "
+                    "WHERE table_name = ? "
+                    "AND (? IS NULL OR season IS NULL OR season = ?))",
+                    (table_name, season, season),
+                ).rowcount
+        except sqlite3.Error as e:
+            self._failed("invalidate", e)
+            return
+        self._count("invalidations", deleted)
+
+    def clear(self) -> None:
+        try:
+            with self._transaction() as conn:
+                conn.execute("DELETE FROM entries")
+        except sqlite3.Error as e:
+            self._failed("clear", e)
+
+    def stats(self) -> dict[str, Any]:
+        """This process's hits/misses/writes plus the shared size and entry count."""
+        with self._lock:
+            local = dict(self._stats)
+        lookups = local["hits"] + local["misses"]
+        try:
+            conn = self._connect()
+            entries = conn.execute("SELECT count(*) FROM entries").fetchone()[0]
+            size = self._bytes(conn)
+        except sqlite3.Error as e:
+            self._failed("read", e)
+            entries = size = None
+        return {
+            **local,
+            "hit_rate": round(local["hits"] / lookups, 4) if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "max_bytes": self.max_bytes,
+        }
+
+
+class _Transaction:
+    """``BEGIN IMMEDIATE`` ... ``COMMIT`` (rollback on error) on a connection."""
+
+    def __init__(self, conn: sqlite3.Connection) -> None:
+        self.conn = conn
+
+    def __enter__(self) -> sqlite3.Connection:
+        self.conn.execute("BEGIN IMMEDIATE")
+        return self.conn
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.conn.execute("ROLLBACK" if exc_type else "COMMIT")
+
+
+_caches: dict[tuple[str, int], SharedCache] = {}
+
+
+def get_shared_cache() -> SharedCache | None:
+    """Return the configured shared cache, or None when it is disabled."""
+    if not settings.SHARED_CACHE_DIR:
+        return None
+    key = (settings.SHARED_CACHE_DIR, settings.SHARED_CACHE_MAX_BYTES)
+    if key not in _caches:
+        try:
+            _caches[key] = SharedCache(*key)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Shared cache disabled, cannot open {key[0]}: {e}")
+            return None
+    return _caches[key]
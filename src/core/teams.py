@@ -0,0 +1,137 @@
+"""
+Canonical NFL team registry.
+
+Team identity arrives in several spellings: team tables hold PFR display
+names ("Kansas City Chiefs", standings add "*"/"+" playoff markers),
+player tables and team game logs hold PFR abbreviations ("KAN"), odds use
+the common abbreviations ("KC"), and old seasons use historical names
+("Oakland Raiders"). Every franchise has one stable integer id here and
+every spelling seen for it is an alias, so writes can store an integer
+``team_id`` next to the text column and team-level joins run on integers.
+
+Aliases are matched case-insensitively, ignoring playoff markers and
+extra whitespace. Abbreviations two franchises have used (``BAL``,
+``HOU``, ``STL``) resolve to the franchise that used them in the
+seasons this project scrapes (Ravens, Texans, Rams). Multi-team player
+rows ("2TM") and league total rows resolve to no team.
+
+The ``teams`` and ``team_aliases`` tables mirror this module (see
+``src.entities.team``); add aliases here and in a migration together.
+"""
+
+from __future__ import annotations
+
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+
+@dataclass(frozen=True)
+class Franchise:
+    id: int
+    abbr: str
+    name: str
+    aliases: tuple[str, ...] = ()
+
+    @property
+    def spellings(self) -> tuple[str, ...]:
+        """Every spelling that resolves to this franchise."""
+        return (self.abbr, self.name, *self.aliases)
+
+
+FRANCHISES: tuple[Franchise, ...] = (
+    Franchise(
+        1,
+        "ARI",
+        "Arizona Cardinals",
+        ("CRD", "PHO", "Phoenix Cardinals", "St. Louis Cardinals", "Chicago Cardinals"),
+    ),
+    Franchise(2, "ATL", "Atlanta Falcons"),
+    Franchise(3, "BAL", "Baltimore Ravens", ("RAV",)),
+    Franchise(4, "BUF", "Buffalo Bills"),
+    Franchise(5, "CAR", "Carolina Panthers"),
+    Franchise(6, "CHI", "Chicago Bears"),
+    Franchise(7, "CIN", "Cincinnati Bengals"),
+    Franchise(8, "CLE", "Cleveland Browns"),
+    Franchise(9, "DAL", "Dallas Cowboys"),
+    Franchise(10, "DEN", "Denver Broncos"),
+    Franchise(11, "DET", "Detroit Lions"),
+    Franchise(12, "GB", "Green Bay Packers", ("GNB",)),
+    Franchise(13, "HOU", "Houston Texans", ("HTX",)),
+    Franchise(14, "IND", "Indianapolis Colts", ("CLT", "Baltimore Colts")),
+    Franchise(15, "JAX", "Jacksonville Jaguars", ("JAC",)),
+    Franchise(16, "KC", "Kansas City Chiefs", ("KAN", "Dallas Texans")),
+    Franchise(
+        17,
+        "LV",
+        "Las Vegas Raiders",
+        ("LVR", "RAI", "OAK", "Oakland Raiders", "Los Angeles Raiders"),
+    ),
+    Franchise(18, "LAC", "Los Angeles Chargers", ("SDG", "SD", "San Diego Chargers")),
+    Franchise(19, "LAR", "Los Angeles Rams", ("LA", "RAM", "STL", "St. Louis Rams")),
+    Franchise(20, "MIA", "Miami Dolphins"),
+    Franchise(21, "MIN", "Minnesota Vikings"),
+    Franchise(22, "NE", "New England Patriots", ("NWE", "Boston Patriots")),
+    Franchise(23, "NO", "New Orleans Saints", ("NOR",)),
+    Franchise(24, "NYG", "New York Giants"),
+    Franchise(25, "NYJ", "New York Jets", ("New York Titans",)),
+    Franchise(26, "PHI", "Philadelphia Eagles"),
+    Franchise(27, "PIT", "Pittsburgh Steelers"),
+    Franchise(28, "SF", "San Francisco 49ers", ("SFO",)),
+    Franchise(29, "SEA", "Seattle Seahawks"),
+    Franchise(30, "TB", "Tampa Bay Buccaneers", ("TAM",)),
+    Franchise(
+        31,
+        "TEN",
+        "Tennessee Titans",
+        ("OTI", "Houston Oilers", "Tennessee Oilers"),
+    ),
+    Franchise(
+        32,
+        "WAS",
+        "Washington Commanders",
+        ("WSH", "Washington Redskins", "Washington Football Team"),
+    ),
+)
+
+
+def alias_key(spelling: str) -> str:
+    """The form aliases are matched in: case-folded, markers and spacing dropped."""
+    return " ".join(spelling.strip().rstrip("*+").casefold().split())
+
+
+def _index(franchises: tuple[Franchise, ...]) -> dict[str, Franchise]:
+    index: dict[str, Franchise] = {}
+    for franchise in franchises:
+        for spelling in franchise.spellings:
+            key = sys.intern(alias_key(spelling))
+            if index.setdefault(key, franchise) is not franchise:
+                raise ValueError(f"Team alias {spelling!r} is used twice")
+    return index
+
+
+ALIASES: dict[str, Franchise] = _index(FRANCHISES)
+
+
+@lru_cache(maxsize=1024)
+def lookup(spelling: str | None) -> Franchise | None:
+    """The franchise ``spelling`` names, or None if it names no single team."""
+    if not spelling:
+        return None
+    return ALIASES.get(alias_key(spelling))
+
+
+def team_id(spelling: str | None) -> int | None:
+    franchise = lookup(spelling)
+    return franchise.id if franchise else None
+
+
+def team_rows() -> list[dict[str, Any]]:
+    """``teams`` table rows."""
+    return [{"id": f.id, "abbr": f.abbr, "name": f.name} for f in FRANCHISES]
+
+
+def alias_rows() -> list[dict[str, Any]]:
+    """``team_aliases`` table rows."""
+    return [{"alias": key, "team_id": f.id} for key, f in ALIASES.items()]
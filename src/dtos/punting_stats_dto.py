@@ -16,6 +16,7 @@ class PuntingStatsCreate(BaseModel):
     player_name: str = Field(
         ..., min_length=1, max_length=128, description="Player name"
     )
+    pfr_id: str | None = Field(None, max_length=16, description="PFR player id")
     age: int | None = Field(None, ge=0, description="Player age")
     tm: str = Field(..., min_length=1, max_length=64, description="Team name")
     pos: str | None = Field(None, max_length=16, description="Position")
@@ -0,0 +1,27 @@
+"""Per-(table, season) data version, bumped by every ingest that changes rows."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class DataVersion(Base):
+    """
+    Monotonic counter of committed changes to one season of a stat table.
+
+    Readers cache season data against it: a bump (announced with NOTIFY on
+    Postgres, or noticed by polling) means cached entries for that
+    (table, season) are stale.
+    """
+
+    __tablename__ = "data_versions"
+
+    table_name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    season: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import Date, Integer, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .team import team_id_column
 
 
 class Games(Base):
@@ -21,6 +22,7 @@ class Games(Base):
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    row_hash: Mapped[str | None] = mapped_column(String(64))
     season: Mapped[int | None] = mapped_column(Integer)
 
     week: Mapped[int | None] = mapped_column(Integer)
@@ -28,7 +30,9 @@ class Games(Base):
     game_date: Mapped[date | None] = mapped_column(Date)
     kickoff_time: Mapped[str | None] = mapped_column(String(16))
     winner: Mapped[str | None] = mapped_column(String(64))
+    winner_id: Mapped[int | None] = team_id_column("winner", name="fk_games_winner_id")
     loser: Mapped[str | None] = mapped_column(String(64))
+    loser_id: Mapped[int | None] = team_id_column("loser", name="fk_games_loser_id")
     boxscore: Mapped[str | None] = mapped_column(String(128))
     pts_w: Mapped[int | None] = mapped_column(Integer)
     pts_l: Mapped[int | None] = mapped_column(Integer)
@@ -0,0 +1,21 @@
+"""Next free request slot per scraped host, shared by every scraping process."""
+
+from sqlalchemy import Float, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class HostRateSlot(Base):
+    """
+    When the next request to a host may be issued, across all processes.
+
+    ``next_slot`` is seconds since the epoch on the database clock, so
+    processes on different machines agree on it. See
+    ``src.core.rate_limit``.
+    """
+
+    __tablename__ = "host_rate_slots"
+
+    host: Mapped[str] = mapped_column(String(255), primary_key=True)
+    next_slot: Mapped[float] = mapped_column(Float, nullable=False)
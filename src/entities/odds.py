@@ -12,6 +12,7 @@ from sqlalchemy import (
 )
 
 from src.entities.base import Base
+from src.entities.team import team_id_column
 
 
 class Odds(Base):
@@ -28,7 +29,9 @@ class Odds(Base):
     game_date = Column(Date, nullable=False)
 
     home_team = Column(String(64), nullable=False)
+    home_team_id = team_id_column("home_team", name="fk_odds_home_team_id")
     away_team = Column(String(64), nullable=False)
+    away_team_id = team_id_column("away_team", name="fk_odds_away_team_id")
     sportsbook = Column(String(64), nullable=False)
 
     # Spread (e.g., -7.5 for home team, +7.5 for away team)
@@ -0,0 +1,70 @@
+"""
+Declarative season partitioning for the player stat tables.
+
+On Postgres a table declared with ``season_partitioned`` is created as
+``PARTITION BY LIST (season)`` with a ``<table>_default`` partition, and
+``SeasonPartitionRepository`` adds one ``<table>_<season>`` partition per
+season as seasons are written. Season-scoped reads and reloads then touch
+a single partition.
+
+Postgres requires the primary key of a partitioned table to contain the
+partition key, so its primary key is rendered as ``(id, season)``. The ORM
+identity stays ``id`` (ids still come from one sequence), and on every
+other dialect (SQLite in tests) the table is created unchanged.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import DDL, PrimaryKeyConstraint, Table, event
+from sqlalchemy.ext.compiler import compiles
+
+PARTITION_KEY = "season"
+PARTITION_BY = f"LIST ({PARTITION_KEY})"
+
+
+def season_partitioned(*table_args: Any) -> tuple[Any, ...]:
+    """``__table_args__`` for a table list-partitioned by season on Postgres."""
+    return (*table_args, {"postgresql_partition_by": PARTITION_BY})
+
+
+def is_season_partitioned(table: Table) -> bool:
+    return table.dialect_options["postgresql"].get("partition_by") == PARTITION_BY
+
+
+def default_partition(table_name: str) -> str:
+    return f"{table_name}_default"
+
+
+def season_partition(table_name: str, season: int) -> str:
+    return f"{table_name}_{season}"
+
+
+@compiles(PrimaryKeyConstraint, "postgresql")
+def _primary_key_with_partition_key(
+    element: PrimaryKeyConstraint, compiler: Any, **kw: Any
+) -> str:
+    table = element.table
+    if not is_season_partitioned(table) or PARTITION_KEY in element.columns:
+        return str(compiler.visit_primary_key_constraint(element, **kw))
+    names = [c.name for c in element.columns] + [PARTITION_KEY]
+    columns = ", ".join(compiler.preparer.quote(n) for n in names)
+    ddl = f"PRIMARY KEY ({columns})"
+    if element.name is not None:
+        name = compiler.preparer.format_constraint(element)
+        ddl = f"CONSTRAINT {name} {ddl}"
+    return ddl
+
+
+@event.listens_for(Table, "after_create")
+def _create_default_partition(target: Table, connection: Any, **kw: Any) -> None:
+    if connection.dialect.name != "postgresql" or not is_season_partitioned(target):
+        return
+    quote = connection.dialect.identifier_preparer.quote
+    connection.execute(
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS {quote(default_partition(target.name))} "
+            f"PARTITION OF {quote(target.name)} DEFAULT"
+        )
+    )
@@ -2,27 +2,33 @@ from __future__ import annotations
 
 from decimal import Decimal
 
-from sqlalchemy import Integer, Numeric, String, UniqueConstraint
+from sqlalchemy import ForeignKey, Integer, Numeric, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .partitioning import season_partitioned
+from .player import Player, player_keys
+from .player_name import normalized_name_column
+from .team import team_id_column
 
 
 class PassingStats(Base):
     __tablename__ = "passing_stats"
-    __table_args__ = (
-        UniqueConstraint(
-            "player_name", "season", "tm", name="uq_passing_stats_player_season_tm"
-        ),
-    )
+    __table_args__ = season_partitioned(*player_keys("passing_stats"))
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    row_hash: Mapped[str | None] = mapped_column(String(64))
     season: Mapped[int | None] = mapped_column(Integer)
 
     rk: Mapped[int | None] = mapped_column(Integer)
     player_name: Mapped[str | None] = mapped_column(String(128))
+    name_normalized: Mapped[str | None] = normalized_name_column()
+    player_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey(Player.id, name="fk_passing_stats_player_id")
+    )
     age: Mapped[int | None] = mapped_column(Integer)
     tm: Mapped[str | None] = mapped_column(String(64))
+    team_id: Mapped[int | None] = team_id_column("tm", name="fk_passing_stats_team_id")
     pos: Mapped[str | None] = mapped_column(String(16))
 
     g: Mapped[int | None] = mapped_column(Integer)
@@ -0,0 +1,56 @@
+"""Canonical player identities, keyed by Pro-Football-Reference player id."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Index, Integer, String, UniqueConstraint, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+from .player_name import normalized_name_column
+
+
+class Player(Base):
+    """
+    One person across every player stat table and season.
+
+    ``pfr_id`` is PFR's id for the player (e.g. ``MahoPa00``, from the
+    ``data-append-csv`` attribute of a stat table's player cell). Stat rows
+    reference ``players.id`` through their ``player_id`` column, so two
+    players sharing a name stay apart and career queries join on integers.
+    ``player_name`` is the name the player was first seen under.
+    """
+
+    __tablename__ = "players"
+    __table_args__ = (UniqueConstraint("pfr_id", name="uq_players_pfr_id"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    pfr_id: Mapped[str] = mapped_column(String(16), nullable=False)
+    player_name: Mapped[str | None] = mapped_column(String(128))
+    name_normalized: Mapped[str | None] = normalized_name_column()
+
+
+def player_keys(table_name: str) -> tuple[Any, ...]:
+    """
+    Unique keys of a player stat table.
+
+    A row is one player's line for a (season, team). Rows without a PFR id
+    (so no ``player_id``) cannot be told apart that way and are unique by
+    ``player_name`` instead, through a partial index over just those rows.
+    """
+    no_player = text("player_id IS NULL")
+    return (
+        UniqueConstraint(
+            "player_id", "season", "tm", name=f"uq_{table_name}_player_id_season_tm"
+        ),
+        Index(
+            f"uq_{table_name}_name_season_tm",
+            "player_name",
+            "season",
+            "tm",
+            unique=True,
+            postgresql_where=no_player,
+            sqlite_where=no_player,
+        ),
+    )
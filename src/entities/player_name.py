@@ -0,0 +1,29 @@
+"""
+The ``name_normalized`` search column of the player stat tables.
+
+It holds ``normalize_name(player_name)`` and is filled by Python-side
+insert and update defaults, so ORM writes and bulk ``insert()``/``update()``
+executemany batches all set it without callers knowing about it. Rows
+are keyed by ``player_id``, so a player's row can be renamed in place;
+every update of a player table must therefore carry ``player_name``.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import String
+from sqlalchemy.orm import MappedColumn, mapped_column
+
+from src.core.names import normalize_name
+
+
+def _from_player_name(context: Any) -> str | None:
+    return normalize_name(context.get_current_parameters().get("player_name"))
+
+
+def normalized_name_column() -> MappedColumn[Any]:
+    """``mapped_column`` for ``name_normalized``, derived from ``player_name``."""
+    return mapped_column(
+        String(128), default=_from_player_name, onupdate=_from_player_name
+    )
@@ -0,0 +1,55 @@
+"""Scrape run ledger — one row per stat scrape, with per-stage timings."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Float, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ScrapeRun(Base):
+    """
+    Where one scrape spent its time, and what it produced.
+
+    ``run_id`` is the same id recorded on the ``stat_changes`` rows the run
+    wrote; a backfill page parsed for several stat types records one row per
+    stat type under one run id. Stage durations are seconds;
+    ``fetch_seconds`` excludes the rate-limit wait, reported separately.
+    """
+
+    __tablename__ = "scrape_runs"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(32), nullable=False)
+    stat_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    season: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    url: Mapped[str | None] = mapped_column(Text, nullable=True)
+    backend: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    fetch_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    rate_limit_wait_seconds: Mapped[float] = mapped_column(
+        Float, nullable=False, default=0.0
+    )
+    parse_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    validate_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    write_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+    total_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
+
+    bytes_fetched: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    rows_in: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rows_changed: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # stored | unchanged | failed
+    outcome: Mapped[str] = mapped_column(String(16), nullable=False)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    started_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint("run_id", "stat_type", name="uq_scrape_runs_run_stat_type"),
+        Index("idx_scrape_runs_stat_type_started", "stat_type", "started_at"),
+        Index("idx_scrape_runs_started", "started_at"),
+    )
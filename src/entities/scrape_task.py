@@ -0,0 +1,62 @@
+"""Scrape work queue entity — one leasable (page, season) unit of work."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ScrapeTask(Base):
+    """
+    A queued scrape shared by every scraper node.
+
+    Workers lease pending tasks (``FOR UPDATE SKIP LOCKED`` on Postgres),
+    renew the lease with heartbeats while scraping, and mark the task done
+    or failed. Leases that expire (dead worker) are re-queued.
+
+    A task is one PFR page for one season; ``stat_types`` lists every stat
+    type to parse from it (comma-separated, sorted), so a page that feeds
+    several tables (``kicking.htm``: ``kicking`` and ``kicking_stats``) is
+    fetched once by one worker.
+    """
+
+    __tablename__ = "scrape_tasks"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    url: Mapped[str] = mapped_column(Text, nullable=False)
+    season: Mapped[int] = mapped_column(Integer, nullable=False)
+    stat_types: Mapped[str] = mapped_column(String(255), nullable=False)
+    priority: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    # pending -> leased -> done | failed (leased -> pending on retry/expiry)
+    status: Mapped[str] = mapped_column(String(16), nullable=False, default="pending")
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+
+    leased_by: Mapped[str | None] = mapped_column(String(128), nullable=True)
+    lease_expires_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    completed_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+
+    __table_args__ = (
+        UniqueConstraint("url", "season", name="uq_scrape_tasks_url_season"),
+        Index("idx_scrape_tasks_status_priority", "status", "priority", "id"),
+        Index("idx_scrape_tasks_lease_expires", "lease_expires_at"),
+    )
+
+    @property
+    def stat_type_names(self) -> list[str]:
+        return self.stat_types.split(",")
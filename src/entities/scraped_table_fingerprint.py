@@ -0,0 +1,49 @@
+"""Per-(url, stat type, table) content fingerprints to skip unchanged re-scrapes."""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, Text, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class ScrapedTableFingerprint(Base):
+    """
+    Hash of the last successfully ingested fragment of a scraped table.
+
+    Sits alongside ``scraped_data_metadata`` (see Tables.sql): that table
+    logs every scrape, this one keeps only the latest ingested state per
+    (source_url, stat_type, table_id) so a re-scrape can tell whether
+    anything changed. The stat type is part of the key because team and
+    player stat types parse the same table of one page (``kicking.htm``
+    feeds both ``kicking`` and ``kicking_stats``); each has its own ingest
+    state.
+    """
+
+    __tablename__ = "scraped_table_fingerprints"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source_url: Mapped[str] = mapped_column(Text, nullable=False)
+    stat_type: Mapped[str] = mapped_column(String(32), nullable=False)
+    table_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    season: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    rows_ingested: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+    # last_checked_at moves on every scrape; last_changed_at only on ingest
+    last_checked_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+    last_changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "source_url",
+            "stat_type",
+            "table_id",
+            name="uq_scraped_table_fingerprints_url_stat_table",
+        ),
+    )
@@ -6,6 +6,7 @@ from sqlalchemy import Integer, Numeric, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .team import team_id_column
 
 
 class Standings(Base):
@@ -13,9 +14,11 @@ class Standings(Base):
     __table_args__ = (UniqueConstraint("tm", "season", name="uq_standings_tm_season"),)
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    row_hash: Mapped[str | None] = mapped_column(String(64))
     season: Mapped[int | None] = mapped_column(Integer)
 
     tm: Mapped[str | None] = mapped_column(String(64))
+    team_id: Mapped[int | None] = team_id_column("tm", name="fk_standings_team_id")
     w: Mapped[int | None] = mapped_column(Integer)
     losses: Mapped[int | None] = mapped_column("l", Integer)
     t: Mapped[int | None] = mapped_column(Integer)
@@ -0,0 +1,47 @@
+"""Append-only log of row-level changes to the stat tables."""
+
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from .base import Base
+
+
+class StatChange(Base):
+    """
+    One inserted, updated or deleted stat row.
+
+    ``id`` is the change cursor: it only ever increases, so a consumer
+    that remembers the last id it saw can pull exactly what changed since.
+    An insert has no ``old_hash`` and a delete has no ``new_hash``.
+    """
+
+    __tablename__ = "stat_changes"
+
+    # SQLite only autoincrements INTEGER PRIMARY KEY columns
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"),
+        primary_key=True,
+        autoincrement=True,
+    )
+    table_name: Mapped[str] = mapped_column(String(64), nullable=False)
+    season: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # JSON object of the row's natural key, e.g. {"season": 2023, "tm": "KAN"}
+    row_key: Mapped[str] = mapped_column(Text, nullable=False)
+    old_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    new_hash: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    scrape_run: Mapped[str] = mapped_column(String(32), nullable=False)
+    changed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
+
+    __table_args__ = (Index("idx_stat_changes_table_id", "table_name", "id"),)
+
+    @property
+    def change_type(self) -> str:
+        if self.old_hash is None:
+            return "inserted"
+        if self.new_hash is None:
+            return "deleted"
+        return "updated"
@@ -0,0 +1,71 @@
+"""
+The teams dimension and the ``team_id`` columns that reference it.
+
+``teams`` and ``team_aliases`` mirror the registry in ``src.core.teams``
+and are seeded from it when created. Tables that name a team in text
+(``tm``, ``winner``, ``home_team``, ...) carry an integer id column next
+to it, filled by a Python-side insert default that resolves the text
+through the registry, so ORM inserts, bulk ``insert()`` batches and
+staging loads all set it without callers knowing about it. The text
+column is part of each table's natural key, so rows are never re-teamed
+in place and the id needs no update hook. It is also not part of
+``row_hash``: resolving ids never makes a stored row look changed.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import ForeignKey, Integer, String, UniqueConstraint, event
+from sqlalchemy.orm import Mapped, MappedColumn, mapped_column
+
+from src.core.teams import alias_rows, team_id, team_rows
+
+from .base import Base
+
+
+class Team(Base):
+    """One franchise; ``id`` is the registry's stable id, not generated."""
+
+    __tablename__ = "teams"
+    __table_args__ = (UniqueConstraint("abbr", name="uq_teams_abbr"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    abbr: Mapped[str] = mapped_column(String(8), nullable=False)
+    name: Mapped[str] = mapped_column(String(64), nullable=False)
+
+
+class TeamAlias(Base):
+    """A spelling (in ``alias_key`` form) that names a franchise."""
+
+    __tablename__ = "team_aliases"
+
+    alias: Mapped[str] = mapped_column(String(64), primary_key=True)
+    team_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey(Team.id, name="fk_team_aliases_team_id"), nullable=False
+    )
+
+
+@event.listens_for(Team.__table__, "after_create")
+def _seed_teams(target: Any, connection: Any, **kw: Any) -> None:
+    connection.execute(target.insert(), team_rows())
+
+
+@event.listens_for(TeamAlias.__table__, "after_create")
+def _seed_aliases(target: Any, connection: Any, **kw: Any) -> None:
+    connection.execute(target.insert(), alias_rows())
+
+
+def team_id_column(source: str, *, name: str) -> MappedColumn[Any]:
+    """
+    ``mapped_column`` for a team id derived from the ``source`` text column.
+
+    Args:
+        source: Column holding the team's name or abbreviation
+        name: Name of the foreign key constraint
+    """
+
+    def resolve(context: Any) -> int | None:
+        return team_id(context.get_current_parameters().get(source))
+
+    return mapped_column(Integer, ForeignKey(Team.id, name=name), default=resolve)
@@ -6,6 +6,7 @@ from sqlalchemy import Date, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .team import team_id_column
 
 
 class TeamGame(Base):
@@ -13,6 +14,9 @@ class TeamGame(Base):
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     team_abbr: Mapped[str] = mapped_column(String(8), nullable=False)
+    team_id: Mapped[int | None] = team_id_column(
+        "team_abbr", name="fk_team_games_team_id"
+    )
     season: Mapped[int] = mapped_column(Integer, nullable=False)
     week: Mapped[int] = mapped_column(Integer, nullable=False)
 
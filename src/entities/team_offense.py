@@ -6,6 +6,7 @@ from sqlalchemy import Integer, Numeric, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
+from .team import team_id_column
 
 
 class TeamOffense(Base):
@@ -15,10 +16,12 @@ class TeamOffense(Base):
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    row_hash: Mapped[str | None] = mapped_column(String(64))
     season: Mapped[int | None] = mapped_column(Integer)
 
     rk: Mapped[int | None] = mapped_column(Integer)
     tm: Mapped[str | None] = mapped_column(String(64))
+    team_id: Mapped[int | None] = team_id_column("tm", name="fk_team_offense_team_id")
     g: Mapped[int | None] = mapped_column(Integer)
     pf: Mapped[int | None] = mapped_column(Integer)
     yds: Mapped[int | None] = mapped_column(Integer)
@@ -1,27 +1,45 @@
-from enum import StrEnum
-
-from fastapi import FastAPI, HTTPException
-
-from src.services import (
-    defense_stats_service,
-    games_service,
-    kicking_stats_service,
-    kicking_team_service,
-    passing_stats_service,
-    punting_stats_service,
-    punting_team_service,
-    receiving_stats_service,
-    return_stats_service,
-    returns_team_service,
-    rushing_stats_service,
-    scoring_stats_service,
-    scrape_service,
-    standings_service,
-    team_defense_service,
-    team_offense_service,
+import json
+from contextlib import asynccontextmanager
+from typing import Annotated, Literal
+
+from anyio import to_thread
+from fastapi import Depends, FastAPI, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import get_db
+from src.core.rate_limit import ScrapePriority, host_rate_limiter
+from src.services import scrape_run_service, scrape_service
+from src.services.cache_invalidation_service import (
+    VersionWatcher,
+    subscribe,
+    unsubscribe,
 )
+from src.services.cached_stats_service import CachedStatsRetrievalService, read_cache
+from src.services.change_feed_service import changes_since
+from src.services.ingest_service import SCRAPE_DISPATCH
+from src.services.stat_registry import StatType
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Sync handlers run on this threadpool; DB_POOL_SIZE is sized to match
+    to_thread.current_default_thread_limiter().total_tokens = (
+        settings.API_THREADPOOL_SIZE
+    )
+    # Evicts this process's cached reads when any node ingests new data
+    subscribe(read_cache.invalidate)
+    watcher = VersionWatcher()
+    watcher.start()
+    try:
+        yield
+    finally:
+        watcher.stop()
+        unsubscribe(read_cache.invalidate)
 
-app = FastAPI(title="beat-books-data", version="0.1.0")
+
+app = FastAPI(title="beat-books-data", version="0.1.0", lifespan=lifespan)
 
 
 @app.get("/health")
@@ -29,41 +47,284 @@ async def health():
     return {"status": "healthy", "service": "beat-books-data", "version": "0.1.0"}
 
 
-class StatType(StrEnum):
-    team_offense = "team_offense"
-    team_defense = "team_defense"
-    standings = "standings"
-    games = "games"
-    kicking = "kicking"
-    punting = "punting"
-    returns = "returns"
-    passing_stats = "passing_stats"
-    rushing_stats = "rushing_stats"
-    receiving_stats = "receiving_stats"
-    defense_stats = "defense_stats"
-    kicking_stats = "kicking_stats"
-    punting_stats = "punting_stats"
-    return_stats = "return_stats"
-    scoring_stats = "scoring_stats"
-
-
-SCRAPE_DISPATCH = {
-    StatType.team_offense: team_offense_service.scrape_and_store_team_offense,
-    StatType.team_defense: team_defense_service.scrape_and_store,
-    StatType.standings: standings_service.scrape_and_store,
-    StatType.games: games_service.scrape_and_store,
-    StatType.kicking: kicking_team_service.scrape_and_store,
-    StatType.punting: punting_team_service.scrape_and_store,
-    StatType.returns: returns_team_service.scrape_and_store,
-    StatType.passing_stats: passing_stats_service.scrape_and_store,
-    StatType.rushing_stats: rushing_stats_service.scrape_and_store,
-    StatType.receiving_stats: receiving_stats_service.scrape_and_store,
-    StatType.defense_stats: defense_stats_service.scrape_and_store,
-    StatType.kicking_stats: kicking_stats_service.scrape_and_store,
-    StatType.punting_stats: punting_stats_service.scrape_and_store,
-    StatType.return_stats: return_stats_service.scrape_and_store,
-    StatType.scoring_stats: scoring_stats_service.scrape_and_store,
-}
+@app.get("/metrics/rate-limit")
+async def rate_limit_metrics():
+    """
+    Per-priority-class queue wait for the shared host rate limit.
+
+    Returns:
+        Requests served, currently waiting, and average/max/total wait
+        seconds for each class (interactive, in_season, backfill).
+    """
+    return host_rate_limiter.stats()
+
+
+@app.get("/metrics/read-cache")
+async def read_cache_metrics():
+    """
+    This process's read-through cache for the read routes.
+
+    Returns:
+        Hits, misses (and how many of those the shared tier served),
+        coalesced concurrent misses, evictions, invalidated entries,
+        current entry count and hit rate; under ``shared``, the host-wide
+        cache's stats (null when SHARED_CACHE_DIR is unset).
+    """
+    return read_cache.stats()
+
+
+@app.get("/metrics/scrape-runs")
+def scrape_run_metrics(
+    days: float = Query(7, gt=0, le=365), stat_type: str | None = None
+):
+    """
+    Where scrape time goes, from the scrape_runs ledger.
+
+    Args:
+        days: Window of runs to summarize, counted back from now.
+        stat_type: Restrict to one stat type (default: all).
+
+    Returns:
+        Per stat type: run count, outcomes, and p50/p95 seconds for the
+        fetch, rate_limit_wait, parse, validate, write and total stages.
+    """
+    return scrape_run_service.summary(days, stat_type)
+
+
+@app.get("/changes")
+def list_changes(
+    db: Annotated[Session, Depends(get_db)],
+    since: int = Query(0, ge=0),
+    tables: str | None = None,
+    limit: int = Query(1000, ge=1, le=10000),
+    payloads: bool = False,
+):
+    """
+    Page through row changes to the stat tables after a cursor.
+
+    Args:
+        since: Cursor returned by the previous page (0 = from the start).
+        tables: Comma-separated stat table names (default: all).
+        limit: Maximum changes per page.
+        payloads: Include each changed row's current values.
+
+    Returns:
+        {"changes": [...], "cursor": int, "has_more": bool}; keep calling
+        with since=cursor while has_more is true.
+    """
+    names = [t.strip() for t in tables.split(",") if t.strip()] if tables else None
+    try:
+        return changes_since(db, since, tables=names, limit=limit, payloads=payloads)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+def get_stats_service(
+    db: Annotated[Session, Depends(get_db)],
+) -> CachedStatsRetrievalService:
+    return CachedStatsRetrievalService(db)
+
+
+StatsService = Annotated[CachedStatsRetrievalService, Depends(get_stats_service)]
+Limit = Annotated[int, Query(ge=1, le=200)]
+Offset = Annotated[int, Query(ge=0)]
+Order = Literal["asc", "desc"]
+Cursor = Annotated[str | None, Query(max_length=512)]
+
+
+# Read routes are sync: FastAPI runs them on the threadpool (sized with
+# API_THREADPOOL_SIZE), each with its own session from get_db. Results come
+# from the read-through cache (see cached_stats_service).
+
+
+@app.get("/teams/{season}")
+def list_teams(
+    season: int,
+    service: StatsService,
+    offset: Offset = 0,
+    limit: Limit = 50,
+    sort_by: str = "pf",
+    order: Order = "desc",
+    cursor: Cursor = None,
+    include_total: bool = True,
+):
+    """
+    Team offense rows for a season.
+
+    Pass ``next_cursor``/``prev_cursor`` from a response as ``cursor`` to
+    page by key instead of offset; 400 if the cursor is invalid.
+    ``include_total=false`` skips counting the season (total is null).
+
+    Returns:
+        {"data": [...], "total", "offset", "limit", "next_cursor",
+        "prev_cursor"}
+    """
+    try:
+        return service.get_all_teams(
+            season,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@app.get("/teams/{season}/{team}")
+def get_team(season: int, team: str, service: StatsService):
+    """Offense stats for one team and season; 404 if not stored."""
+    stats = service.get_team_stats(team, season)
+    if stats is None:
+        raise HTTPException(status_code=404, detail=f"No stats for {team} {season}")
+    return stats
+
+
+@app.get("/players/search")
+def search_players(
+    service: StatsService,
+    q: Annotated[str, Query(min_length=2, max_length=128)],
+    season: int | None = None,
+    position: str | None = None,
+    offset: Offset = 0,
+    limit: Limit = 50,
+    cursor: Cursor = None,
+):
+    """
+    Players whose name contains ``q`` (case- and accent-insensitive).
+
+    Returns:
+        Matching rows of every player stat category, each paged separately,
+        with one next/prev cursor covering all of them; 400 if the cursor is
+        invalid.
+    """
+    try:
+        return service.search_players(
+            q, season, position, offset=offset, limit=limit, cursor=cursor
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@app.get("/players/{player_id}")
+def get_player(player_id: int, service: StatsService, season: int | None = None):
+    """One player's rows in every stat category (by id); 404 if unknown."""
+    stats = service.get_player(player_id, season)
+    if stats is None:
+        raise HTTPException(status_code=404, detail=f"No player {player_id}")
+    return stats
+
+
+@app.get("/standings/{season}")
+def list_standings(
+    season: int,
+    service: StatsService,
+    offset: Offset = 0,
+    limit: Limit = 50,
+    sort_by: str = "win_pct",
+    order: Order = "desc",
+    cursor: Cursor = None,
+    include_total: bool = True,
+):
+    """
+    Standings for a season.
+
+    Returns:
+        {"data": [...], "total", "offset", "limit", "next_cursor",
+        "prev_cursor"}; 400 if the cursor is invalid.
+    """
+    try:
+        return service.get_standings(
+            season,
+            offset=offset,
+            limit=limit,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+            include_total=include_total,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+
+@app.get("/games/{season}")
+def list_games(
+    season: int,
+    service: StatsService,
+    week: Annotated[int | None, Query(ge=0, le=30)] = None,
+    offset: Offset = 0,
+    limit: Limit = 50,
+    sort_by: str = "week",
+    order: Order = "asc",
+    include_total: bool = True,
+):
+    """
+    Team game log rows for a season, optionally one week.
+
+    Returns:
+        {"data": [...], "total", "offset", "limit", "week"}
+    """
+    return service.get_games(
+        season,
+        week,
+        offset=offset,
+        limit=limit,
+        sort_by=sort_by,
+        order=order,
+        include_total=include_total,
+    )
+
+
+MAX_FEATURE_SEASONS = 200
+
+
+def _parse_seasons(text: str) -> list[int]:
+    """Seasons in a ``2019,2021-2023`` list, ascending and de-duplicated."""
+    seasons: set[int] = set()
+    for part in text.split(","):
+        first, _, last = part.strip().partition("-")
+        try:
+            start, end = int(first), int(last or first)
+        except ValueError:
+            raise ValueError(f"Invalid season {part.strip()!r}") from None
+        if start > end:
+            raise ValueError(f"Invalid season range {part.strip()!r}")
+        if len(seasons) + end - start + 1 > MAX_FEATURE_SEASONS:
+            raise ValueError(f"At most {MAX_FEATURE_SEASONS} seasons per request")
+        seasons.update(range(start, end + 1))
+    return sorted(seasons)
+
+
+@app.get("/features/team-season")
+def team_season_features(
+    service: StatsService,
+    seasons: Annotated[str, Query(min_length=1, max_length=512)],
+):
+    """
+    Wide feature rows of every team-season in ``seasons`` (e.g.
+    ``2019,2021-2023``): team offense, defense, standings, kicking, punting
+    and returns joined on (team, season), columns prefixed by table.
+
+    Each season is one joined query, cached per season, and the rows are
+    streamed as they are serialized; 400 if ``seasons`` is invalid.
+
+    Returns:
+        Newline-delimited JSON, one flat row per team-season, by season
+        then team.
+    """
+    try:
+        wanted = _parse_seasons(seasons)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e)) from e
+
+    def rows():
+        for season in wanted:
+            for row in service.get_team_season_features(season):
+                yield json.dumps(row) + "\n"
+
+    return StreamingResponse(rows(), media_type="application/x-ndjson")
 
 
 @app.get("/")
@@ -71,6 +332,57 @@ async def read_root():
     return {"Hello": "World"}
 
 
+def _stream_gamelog_progress(
+    years: range, priority: ScrapePriority = ScrapePriority.interactive
+) -> StreamingResponse:
+    async def events():
+        async for event in scrape_service.scrape_all_teams(years, priority=priority):
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.get("/scrape/team-gamelog/all/{year}")
+async def scrape_all_team_gamelogs(year: int):
+    """
+    Scrape gamelogs for every team in a season.
+
+    Teams are scheduled across a pool of shared drivers under the host rate
+    limit and persisted as each one finishes. Teams whose write completed on an
+    earlier run are skipped, so re-running after an interruption resumes the
+    batch.
+
+    Args:
+        year: The season year to scrape data for.
+
+    Returns:
+        Newline-delimited JSON stream with one progress event per team.
+    """
+    return _stream_gamelog_progress(range(year, year + 1))
+
+
+@app.get("/scrape/team-gamelog/all/{start_year}/{end_year}")
+async def scrape_all_team_gamelogs_range(start_year: int, end_year: int):
+    """
+    Scrape gamelogs for every team across an inclusive range of seasons.
+
+    Runs in the ``backfill`` rate-limit class, so interactive and in-season
+    scrapes are served ahead of it.
+
+    Args:
+        start_year: First season year to scrape.
+        end_year: Last season year to scrape.
+
+    Returns:
+        Newline-delimited JSON stream with one progress event per team-season.
+    """
+    if end_year < start_year:
+        raise HTTPException(status_code=400, detail="end_year must be >= start_year")
+    return _stream_gamelog_progress(
+        range(start_year, end_year + 1), ScrapePriority.backfill
+    )
+
+
 @app.get("/scrape/team-gamelog/{team}/{year}")
 async def scrape_team_gamelog(team: str, year: int):
     """
@@ -88,19 +400,21 @@ async def scrape_team_gamelog(team: str, year: int):
 
 
 @app.get("/scrape/{stat_type}/{season}")
-async def scrape_stat(stat_type: StatType, season: int):
+async def scrape_stat(stat_type: StatType, season: int, force: bool = False):
     """
     Scrape and store NFL stats from Pro-Football-Reference.
 
     Args:
         stat_type: Type of stat to scrape (see StatType enum for valid values).
         season: The NFL season year.
+        force: Re-ingest even if the page's tables are unchanged.
 
     Returns:
-        List of saved records.
+        List of saved records, or {"status": "unchanged", ...} when every
+        table matches the last successful ingest.
     """
     scrape_fn = SCRAPE_DISPATCH.get(stat_type)
     if scrape_fn is None:
         raise HTTPException(status_code=400, detail=f"Unknown stat type: {stat_type}")
-    data = await scrape_fn(season)
+    data = await scrape_fn(season, force=force)
     return data
@@ -0,0 +1,119 @@
+"""
+Rebuild stat tables from the raw page archive (no network).
+
+Usage:
+    python -m src.reparse passing_stats rushing_stats --seasons 2000-2024
+    python -m src.reparse all --seasons 2023 --workers 8 --chunk-size 2
+    python -m src.reparse players --seasons 2000-2024
+
+Requires PAGE_ARCHIVE_DIR to point at an archive populated by earlier
+scrapes. Each (stat type, season) is replaced atomically. "players"
+reparses every player stat table, which also fills ``player_id`` on rows
+stored before player ids were parsed.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+
+from src.services.reparse_service import reparse
+from src.services.stat_registry import STAT_ENTITIES, StatType
+
+
+def parse_seasons(value: str) -> list[int]:
+    """Parse "2023", "2000-2024" or "1999,2001,2005-2007" into season years."""
+    seasons: list[int] = []
+    for part in value.split(","):
+        start, _, end = part.strip().partition("-")
+        first = int(start)
+        last = int(end) if end else first
+        if last < first:
+            raise argparse.ArgumentTypeError(f"Invalid season range: {part!r}")
+        seasons.extend(range(first, last + 1))
+    return seasons
+
+
+def player_stat_types() -> list[StatType]:
+    """Stat types whose rows reference a player by ``player_id``."""
+    return [
+        t for t, entity in STAT_ENTITIES.items() if "player_id" in entity.__table__.c
+    ]
+
+
+def parse_stat_types(values: list[str]) -> list[StatType]:
+    """Expand "all" and "players" and validate stat type names."""
+    if "all" in values:
+        return list(StatType)
+    stat_types: list[StatType] = []
+    for value in values:
+        if value == "players":
+            stat_types.extend(t for t in player_stat_types() if t not in stat_types)
+            continue
+        try:
+            stat_type = StatType(value)
+        except ValueError as e:
+            raise SystemExit(f"{e}. Valid: all, players, {', '.join(StatType)}") from e
+        if stat_type not in stat_types:
+            stat_types.append(stat_type)
+    return stat_types
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.reparse", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument("stat_types", nargs="+", help='Stat types, "all" or "players"')
+    parser.add_argument("--seasons", type=parse_seasons, required=True)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Parse processes (default: PARSE_WORKERS or one per core, 0: inline)",
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=None, help="Archived pages per worker task"
+    )
+    parser.add_argument(
+        "--batch-rows", type=int, default=None, help="Rows per write transaction"
+    )
+    parser.add_argument(
+        "--write-mode",
+        choices=("diff", "swap"),
+        default=None,
+        help="diff: update changed rows; swap: stage, validate and swap seasons in "
+        "(default: PARSE_WRITE_MODE)",
+    )
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    started = time.monotonic()
+    failures = 0
+    results = reparse(
+        parse_stat_types(args.stat_types),
+        args.seasons,
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        batch_rows=args.batch_rows,
+        write_mode=args.write_mode,
+    )
+    try:
+        for result in results:
+            failures += result["status"] == "failed"
+            print(json.dumps(result), flush=True)
+    except RuntimeError as e:
+        logging.error("%s", e)
+        return 2
+
+    logging.info(
+        "Reparse finished in %.1fs with %d failure(s)",
+        time.monotonic() - started,
+        failures,
+    )
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
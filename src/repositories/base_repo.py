@@ -1,10 +1,26 @@
 from __future__ import annotations
 
+import operator
+from collections.abc import Sequence
+from datetime import date, datetime
 from typing import Any, Generic, TypeVar
 
-from sqlalchemy import select
+from sqlalchemy import (
+    Select,
+    and_,
+    delete,
+    func,
+    insert,
+    inspect,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
 
+from src.core.pagination import Cursor, KeysetPage
+
 T = TypeVar("T")
 
 
@@ -38,3 +54,262 @@ class BaseRepository(Generic[T]):
         self.session.delete(obj)
         if commit:
             self.session.commit()
+
+    def delete_by_season(self, season: int, *, commit: bool = True) -> int:
+        """Delete every row for a season; returns the number of rows removed."""
+        season_col = self.model.season  # type: ignore[attr-defined]
+        stmt = delete(self.model).where(season_col == season)
+        result = self.session.execute(stmt)
+        if commit:
+            self.session.commit()
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    def bulk_insert(
+        self, rows: Sequence[dict[str, Any]], *, commit: bool = True
+    ) -> int:
+        """Insert many rows (keyed by attribute name) in one executemany."""
+        if not rows:
+            return 0
+        self.session.execute(insert(self.model), list(rows))
+        if commit:
+            self.session.commit()
+        return len(rows)
+
+    def bulk_update(
+        self, rows: Sequence[dict[str, Any]], *, commit: bool = True
+    ) -> int:
+        """Update many rows by primary key (each dict carries ``id``)."""
+        if not rows:
+            return 0
+        self.session.execute(update(self.model), list(rows))
+        if commit:
+            self.session.commit()
+        return len(rows)
+
+    def delete_by_ids(self, ids: Sequence[Any], *, commit: bool = True) -> int:
+        if not ids:
+            return 0
+        id_col = self.model.id  # type: ignore[attr-defined]
+        result = self.session.execute(delete(self.model).where(id_col.in_(ids)))
+        if commit:
+            self.session.commit()
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    def row_hashes(
+        self, season: int, key: Sequence[str]
+    ) -> dict[tuple[Any, ...], tuple[int, str | None]]:
+        """Map each stored row's natural key to its (id, row_hash) for a season."""
+        model: Any = self.model
+        stmt = select(
+            *(getattr(model, attr) for attr in key), model.id, model.row_hash
+        ).where(model.season == season)
+        return {
+            tuple(row[: len(key)]): (row[-2], row[-1])
+            for row in self.session.execute(stmt)
+        }
+
+    def find_by_keys(
+        self, key: Sequence[str], values: Sequence[tuple[Any, ...]]
+    ) -> Sequence[T]:
+        """Rows whose natural key (attribute names ``key``) is in ``values``."""
+        if not values:
+            return []
+        columns = tuple_(*(getattr(self.model, attr) for attr in key))
+        stmt = select(self.model).where(columns.in_(list(values)))
+        return list(self.session.execute(stmt).scalars().all())
+
+    def count(self, stmt: Select[Any]) -> int:
+        """Number of rows ``stmt`` (a filtered select) matches."""
+        count = select(func.count()).select_from(stmt.order_by(None).subquery())
+        return int(self.session.execute(count).scalar() or 0)
+
+    def fetch_with_total(
+        self, stmt: Select[Any], *, limit: int, offset: int
+    ) -> tuple[Sequence[T], int]:
+        """
+        One page of ``stmt`` plus the number of rows it matches, in one query.
+
+        The total rides along on every row as ``count(*) OVER ()``, which is
+        evaluated before LIMIT/OFFSET. A page past the end has no row to
+        carry it, so that case falls back to a separate count.
+        """
+        paged = stmt.add_columns(func.count().over().label("total"))
+        rows = self.session.execute(paged.limit(limit).offset(offset)).all()
+        if rows:
+            return [row[0] for row in rows], int(rows[0].total)
+        return [], self.count(stmt) if offset > 0 else 0
+
+    # -- keyset pagination -------------------------------------------------
+    #
+    # Listings page over the total order (sort_by NULLS LAST, id), both in
+    # the requested direction, so every row has a unique, stable position
+    # and a page continues from ``WHERE (col, id) > (value, id)`` instead
+    # of skipping OFFSET rows.
+
+    def _sort_column(self, sort_by: str) -> Any:
+        """The mapped column for ``sort_by``, or ``id`` if it is not a column."""
+        columns = inspect(self.model).column_attrs  # type: ignore[union-attr]
+        key = sort_by if sort_by in columns else "id"
+        return getattr(self.model, key)
+
+    def keyset_order(self, sort_by: str, order: str, *, reverse: bool = False) -> Any:
+        """ORDER BY clauses for the keyset order (reversed to page backward)."""
+        column = self._sort_column(sort_by)
+        id_col = self.model.id  # type: ignore[attr-defined]
+        desc = (order.lower() != "asc") != reverse
+        if reverse:
+            sort = (column.desc() if desc else column.asc()).nulls_first()
+        else:
+            sort = (column.desc() if desc else column.asc()).nulls_last()
+        return sort, id_col.desc() if desc else id_col.asc()
+
+    def cursor_for(
+        self, row: T, sort_by: str, order: str, *, backward: bool = False
+    ) -> Cursor:
+        """Cursor at ``row``'s position in the ``(sort_by, order)`` listing."""
+        column = self._sort_column(sort_by)
+        return Cursor(
+            sort_by=column.key,
+            order=order.lower(),
+            value=getattr(row, column.key),
+            id=row.id,  # type: ignore[attr-defined]
+            backward=backward,
+        )
+
+    @staticmethod
+    def _coerce(column: Any, value: Any) -> Any:
+        """A cursor value from JSON back to the sort column's Python type."""
+        if not isinstance(value, str):
+            return value
+        python_type = column.type.python_type
+        if python_type in (date, datetime):
+            return python_type.fromisoformat(value)
+        return python_type(value)
+
+    def _keyset_filter(self, column: Any, cursor: Cursor) -> Any:
+        id_col = self.model.id  # type: ignore[attr-defined]
+        forward = not cursor.backward
+        # Moving toward larger values: ascending forward, or descending back
+        upward = forward == (cursor.order == "asc")
+        op = {
+            (True, False): operator.gt,
+            (True, True): operator.ge,
+            (False, False): operator.lt,
+            (False, True): operator.le,
+        }[(upward, cursor.inclusive)]
+        try:
+            value = self._coerce(column, cursor.value)
+        except (TypeError, ValueError, ArithmeticError) as e:
+            raise ValueError("Invalid cursor") from e
+        if value is None:
+            # NULLs sort last: after a NULL key only NULLs remain, and every
+            # non-NULL value comes before it
+            nulls = and_(column.is_(None), op(id_col, cursor.id))
+            return nulls if forward else or_(column.is_not(None), nulls)
+        key = op(tuple_(column, id_col), tuple_(value, cursor.id))
+        return or_(key, column.is_(None)) if forward else key
+
+    def keyset_select(
+        self,
+        stmt: Select[Any],
+        *,
+        sort_by: str,
+        order: str,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+    ) -> Select[Any]:
+        """
+        ``stmt`` (already filtered) narrowed to one page of a keyset listing.
+
+        Selects ``limit + 1`` rows so ``keyset_result`` can tell whether
+        more follow. Raises ValueError if the cursor was issued for a
+        different ordering.
+        """
+        column = self._sort_column(sort_by)
+        order = order.lower()
+        if cursor is not None:
+            if (cursor.sort_by, cursor.order) != (column.key, order):
+                raise ValueError(
+                    f"Cursor is for sort_by={cursor.sort_by!r} order={cursor.order!r}"
+                )
+            stmt = stmt.where(self._keyset_filter(column, cursor))
+        backward = cursor is not None and cursor.backward
+        return stmt.order_by(
+            *self.keyset_order(column.key, order, reverse=backward)
+        ).limit(limit + 1)
+
+    def keyset_result(
+        self,
+        rows: Sequence[T],
+        *,
+        sort_by: str,
+        order: str,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+        total: int | None = None,
+    ) -> KeysetPage[T]:
+        """The page for ``rows`` fetched by ``keyset_select`` with the same args."""
+        column = self._sort_column(sort_by)
+        order = order.lower()
+        backward = cursor is not None and cursor.backward
+        more = len(rows) > limit
+        rows = list(rows[:limit])
+        if backward:
+            rows.reverse()
+
+        # Following a cursor, the rows on its far side exist unless the
+        # cursor itself came from an empty page (inclusive)
+        beyond = cursor is not None and not cursor.inclusive
+        next_cursor: Cursor | None
+        prev_cursor: Cursor | None
+        if rows:
+            next_cursor = self.cursor_for(rows[-1], column.key, order)
+            prev_cursor = self.cursor_for(rows[0], column.key, order, backward=True)
+        elif cursor is not None:
+            next_cursor = cursor if not backward else cursor.flipped()
+            prev_cursor = cursor if backward else cursor.flipped()
+        else:
+            next_cursor = prev_cursor = None
+        return KeysetPage(
+            items=rows,
+            next_cursor=next_cursor,
+            prev_cursor=prev_cursor,
+            has_next=more if not backward else beyond,
+            has_prev=more if backward else beyond,
+            total=total,
+        )
+
+    def keyset_page(
+        self,
+        stmt: Select[Any],
+        *,
+        sort_by: str,
+        order: str,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+        with_total: bool = False,
+    ) -> KeysetPage[T]:
+        """
+        Run ``stmt`` (already filtered) as one page of a keyset listing.
+
+        Without a cursor this is the first page. ``with_total`` also counts
+        every row ``stmt`` matches, in the same query as a scalar subquery
+        (the window count would only see rows past the cursor). Raises
+        ValueError if the cursor was issued for a different ordering.
+        """
+        total_of = stmt
+        stmt = self.keyset_select(
+            stmt, sort_by=sort_by, order=order, cursor=cursor, limit=limit
+        )
+        total = None
+        if with_total:
+            counted = select(func.count()).select_from(total_of.subquery())
+            stmt = stmt.add_columns(counted.scalar_subquery().label("total"))
+            result = self.session.execute(stmt).all()
+            rows = [row[0] for row in result]
+            total = int(result[0].total) if result else self.count(total_of)
+        else:
+            rows = list(self.session.execute(stmt).scalars().all())
+        return self.keyset_result(
+            rows, sort_by=sort_by, order=order, cursor=cursor, limit=limit, total=total
+        )
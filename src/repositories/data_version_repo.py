@@ -0,0 +1,81 @@
+"""Repository for per-(table, season) data versions."""
+
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager, suppress
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import Engine, func, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.entities.data_version import DataVersion
+from src.repositories.base_repo import BaseRepository
+
+NOTIFY_CHANNEL = "data_version"
+
+
+@contextmanager
+def version_listener(engine: Engine) -> Iterator[Any]:
+    """
+    A psycopg2 connection LISTENing on ``NOTIFY_CHANNEL``, kept out of the pool.
+
+    The connection is detached from the engine's pool before it is switched
+    to autocommit, so closing it closes it for real and no session is ever
+    handed a non-transactional connection that still receives notifications.
+    Notifications arrive on ``.notifies`` after ``.poll()``.
+    """
+    conn = engine.raw_connection()
+    conn.detach()
+    dbapi_conn: Any = conn.driver_connection
+    try:
+        dbapi_conn.autocommit = True
+        with dbapi_conn.cursor() as cursor:
+            cursor.execute(f"LISTEN {NOTIFY_CHANNEL}")
+        yield dbapi_conn
+    finally:
+        # The connection may already be broken (the usual reason to get here)
+        with suppress(Exception), dbapi_conn.cursor() as cursor:
+            cursor.execute("UNLISTEN *")
+        conn.close()
+
+
+class DataVersionRepository(BaseRepository[DataVersion]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=DataVersion)
+
+    def bump(self, table_name: str, season: int, *, commit: bool = True) -> int:
+        """
+        Increment a (table, season) version; returns the new version.
+
+        On Postgres this also queues ``NOTIFY data_version,
+        '<table>:<season>:<version>'``, which is delivered to listeners
+        only when (and if) the surrounding transaction commits.
+        """
+        dialect = self.session.get_bind().dialect.name
+        insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+        now = datetime.now(UTC)
+        stmt = (
+            insert(DataVersion)
+            .values(table_name=table_name, season=season, version=1, updated_at=now)
+            .on_conflict_do_update(
+                index_elements=[DataVersion.table_name, DataVersion.season],
+                set_={"version": DataVersion.version + 1, "updated_at": now},
+            )
+            .returning(DataVersion.version)
+        )
+        version = int(self.session.execute(stmt).scalar_one())
+
+        if dialect == "postgresql":
+            payload = f"{table_name}:{season}:{version}"
+            self.session.execute(select(func.pg_notify(NOTIFY_CHANNEL, payload)))
+        if commit:
+            self.session.commit()
+        return version
+
+    def current(self) -> dict[tuple[str, int], int]:
+        """Every (table, season) version (a few thousand rows at most)."""
+        stmt = select(DataVersion.table_name, DataVersion.season, DataVersion.version)
+        return {(t, s): v for t, s, v in self.session.execute(stmt)}
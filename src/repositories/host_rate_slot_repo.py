@@ -0,0 +1,49 @@
+"""Repository for the shared per-host request slots."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from sqlalchemy import Float, cast, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.entities.host_rate_slot import HostRateSlot
+from src.repositories.base_repo import BaseRepository
+
+
+class HostRateSlotRepository(BaseRepository[HostRateSlot]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=HostRateSlot)
+
+    def reserve(self, host: str, interval: float, *, commit: bool = True) -> float:
+        """
+        Claim the next request slot for a host and push it ``interval`` on.
+
+        One atomic upsert, so concurrent callers in any process get
+        distinct slots ``interval`` seconds apart.
+
+        Returns:
+            Seconds from now (database clock) until the claimed slot
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            insert: Any = postgresql.insert
+            now: Any = cast(func.extract("epoch", func.now()), Float)
+            later: Any = func.greatest
+        else:
+            insert = sqlite.insert
+            now = (func.julianday("now") - 2440587.5) * 86400.0
+            later = func.max
+        stmt = (
+            insert(HostRateSlot)
+            .values(host=host, next_slot=now + interval)
+            .on_conflict_do_update(
+                index_elements=[HostRateSlot.host],
+                set_={"next_slot": later(HostRateSlot.next_slot, now) + interval},
+            )
+            .returning(HostRateSlot.next_slot - interval - now)
+        )
+        wait = float(self.session.execute(stmt).scalar_one())
+        if commit:
+            self.session.commit()
+        return max(0.0, wait)
@@ -5,6 +5,7 @@ from datetime import datetime
 from sqlalchemy import and_
 from sqlalchemy.orm import Session
 
+from src.core import teams
 from src.dtos.odds_dto import OddsCreate
 from src.entities.odds import Odds
 
@@ -111,9 +112,12 @@ class OddsRepository:
         week: int | None = None,
         is_closing: bool | None = None,
     ) -> list[Odds]:
-        """Get all odds records for a specific team."""
+        """Get all odds records for a team, by any of its names or abbreviations."""
+        team_id = teams.team_id(team)
+        if team_id is None:
+            return []
         query = db.query(Odds).filter(
-            (Odds.home_team == team) | (Odds.away_team == team)
+            (Odds.home_team_id == team_id) | (Odds.away_team_id == team_id)
         )
 
         if season is not None:
@@ -3,6 +3,8 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.core.names import name_pattern
+from src.core.pagination import Cursor, KeysetPage
 from src.entities.passing_stats import PassingStats
 from src.repositories.base_repo import BaseRepository
 
@@ -21,7 +23,7 @@ class PassingStatsRepository(BaseRepository[PassingStats]):
     ) -> list[PassingStats]:
         """Find passing stats for a specific player, optionally filtered by season."""
         stmt = select(self.model).where(
-            self.model.player_name.ilike(f"%{player_name}%")
+            self.model.name_normalized.like(name_pattern(player_name), escape="\\")
         )
 
         if season is not None:
@@ -46,14 +48,8 @@ class PassingStatsRepository(BaseRepository[PassingStats]):
         if position is not None:
             stmt = stmt.where(self.model.pos == position)
 
-        # Apply sorting
-        sort_column = getattr(self.model, sort_by, None)
-        if sort_column is not None:
-            if order.lower() == "asc":
-                stmt = stmt.order_by(sort_column.asc())
-            else:
-                stmt = stmt.order_by(sort_column.desc())
-
+        # Same (sort_by, id) order as the keyset pages, so cursors line up
+        stmt = stmt.order_by(*self.keyset_order(sort_by, order))
         stmt = stmt.limit(limit).offset(offset)
         return list(self.session.execute(stmt).scalars().all())
 
@@ -66,14 +62,57 @@ class PassingStatsRepository(BaseRepository[PassingStats]):
         offset: int = 0,
     ) -> list[PassingStats]:
         """Search for players by name with optional season filter."""
-        stmt = select(self.model).where(self.model.player_name.ilike(f"%{query}%"))
+        stmt = select(self.model).where(
+            self.model.name_normalized.like(name_pattern(query), escape="\\")
+        )
 
         if season is not None:
             stmt = stmt.where(self.model.season == season)
 
-        stmt = stmt.order_by(self.model.player_name.asc()).limit(limit).offset(offset)
+        stmt = stmt.order_by(*self.keyset_order("player_name", "asc"))
+        stmt = stmt.limit(limit).offset(offset)
         return list(self.session.execute(stmt).scalars().all())
 
+    def find_by_season_and_position_page(
+        self,
+        season: int,
+        position: str | None = None,
+        *,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+        sort_by: str = "yds",
+        order: str = "desc",
+    ) -> KeysetPage[PassingStats]:
+        """Keyset-paginated ``find_by_season_and_position``."""
+        stmt = select(self.model).where(self.model.season == season)
+
+        if position is not None:
+            stmt = stmt.where(self.model.pos == position)
+
+        return self.keyset_page(
+            stmt, sort_by=sort_by, order=order, cursor=cursor, limit=limit
+        )
+
+    def search_players_page(
+        self,
+        query: str,
+        season: int | None = None,
+        *,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+    ) -> KeysetPage[PassingStats]:
+        """Keyset-paginated ``search_players``: the page after/before ``cursor``."""
+        stmt = select(self.model).where(
+            self.model.name_normalized.like(name_pattern(query), escape="\\")
+        )
+
+        if season is not None:
+            stmt = stmt.where(self.model.season == season)
+
+        return self.keyset_page(
+            stmt, sort_by="player_name", order="asc", cursor=cursor, limit=limit
+        )
+
     def count_by_season(self, season: int, position: str | None = None) -> int:
         """Count total passing stats entries for a season and optional position."""
         from sqlalchemy import func
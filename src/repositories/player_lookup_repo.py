@@ -0,0 +1,208 @@
+"""
+A player's rows in every stat category, in one round trip.
+
+Each category's query becomes a branch of a single ``UNION ALL``. Branches
+must have matching columns, so each selects its table's columns cast to
+text, padded with NULLs to the widest table, and tagged with its branch
+number and the row's position in the branch's own ordering. The rows are
+regrouped by category in Python and turned back into entities against the
+column types. Branches keep their own ORDER BY and LIMIT, so every
+category is still paged on its own.
+
+The entities built here are detached copies of the rows, not tracked by
+the session, which is all the read paths need.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    Select,
+    String,
+    cast,
+    func,
+    inspect,
+    literal,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.orm import Session
+
+from src.core.names import name_pattern
+from src.core.pagination import Cursor, KeysetPage
+from src.entities.defense_stats import DefenseStats
+from src.entities.kicking_stats import KickingStats
+from src.entities.passing_stats import PassingStats
+from src.entities.punting_stats import PuntingStats
+from src.entities.receiving_stats import ReceivingStats
+from src.entities.return_stats import ReturnStats
+from src.entities.rushing_stats import RushingStats
+from src.entities.scoring_stats import ScoringStats
+from src.repositories.base_repo import BaseRepository
+
+PLAYER_CATEGORIES: dict[str, type[Any]] = {
+    "passing": PassingStats,
+    "rushing": RushingStats,
+    "receiving": ReceivingStats,
+    "defense": DefenseStats,
+    "kicking": KickingStats,
+    "punting": PuntingStats,
+    "returns": ReturnStats,
+    "scoring": ScoringStats,
+}
+
+# Passing search has always ignored the position filter, so a non-QB's
+# trick-play passes still show up under a position search
+UNFILTERED_BY_POSITION = frozenset({"passing"})
+
+# One branch of the union: the model's select (filtered, ordered, limited)
+# and the ORDER BY clauses it uses, to number its rows by
+Branch = tuple[Select[Any], Sequence[Any]]
+
+
+class PlayerLookupRepository:
+    def __init__(
+        self,
+        session: Session,
+        categories: Mapping[str, type[Any]] = PLAYER_CATEGORIES,
+    ) -> None:
+        self.session = session
+        self.repos: dict[str, BaseRepository[Any]] = {
+            name: BaseRepository(session, model) for name, model in categories.items()
+        }
+
+    def _search_query(
+        self,
+        name: str,
+        query: str,
+        season: int | None,
+        position: str | None,
+    ) -> Select[Any]:
+        model: Any = self.repos[name].model
+        stmt = select(model).where(
+            model.name_normalized.like(name_pattern(query), escape="\\")
+        )
+
+        if season is not None:
+            stmt = stmt.where(model.season == season)
+
+        if position is not None and name not in UNFILTERED_BY_POSITION:
+            stmt = stmt.where(model.pos == position)
+
+        return stmt
+
+    def search(
+        self,
+        query: str,
+        season: int | None = None,
+        position: str | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+    ) -> dict[str, list[Any]]:
+        """Rows per category whose player name matches, ordered by name."""
+        branches: dict[str, Branch] = {}
+        for name, repo in self.repos.items():
+            order_by = repo.keyset_order("player_name", "asc")
+            stmt = self._search_query(name, query, season, position)
+            branches[name] = (
+                stmt.order_by(*order_by).limit(limit).offset(offset),
+                order_by,
+            )
+        return self.fetch(branches)
+
+    def search_pages(
+        self,
+        query: str,
+        season: int | None = None,
+        position: str | None = None,
+        *,
+        cursors: Mapping[str, Cursor | None],
+        limit: int = 50,
+    ) -> dict[str, KeysetPage[Any]]:
+        """Keyset-paginated ``search``: each category's page after/before its cursor."""
+        branches: dict[str, Branch] = {}
+        for name, repo in self.repos.items():
+            cursor = cursors.get(name)
+            stmt = repo.keyset_select(
+                self._search_query(name, query, season, position),
+                sort_by="player_name",
+                order="asc",
+                cursor=cursor,
+                limit=limit,
+            )
+            backward = cursor is not None and cursor.backward
+            branches[name] = (
+                stmt,
+                repo.keyset_order("player_name", "asc", reverse=backward),
+            )
+        rows = self.fetch(branches)
+        return {
+            name: repo.keyset_result(
+                rows[name],
+                sort_by="player_name",
+                order="asc",
+                cursor=cursors.get(name),
+                limit=limit,
+            )
+            for name, repo in self.repos.items()
+        }
+
+    def for_player(
+        self, player_id: int, season: int | None = None
+    ) -> dict[str, list[Any]]:
+        """One player's rows per category (by ``player_id``), newest first."""
+        branches: dict[str, Branch] = {}
+        for name, repo in self.repos.items():
+            model: Any = repo.model
+            stmt = select(model).where(model.player_id == player_id)
+            if season is not None:
+                stmt = stmt.where(model.season == season)
+            order_by = repo.keyset_order("season", "desc")
+            branches[name] = (stmt.order_by(*order_by), order_by)
+        return self.fetch(branches)
+
+    def fetch(self, branches: Mapping[str, Branch]) -> dict[str, list[Any]]:
+        """Run every branch in one UNION ALL; rows per category in branch order."""
+        if not branches:
+            return {}
+        names = list(branches)
+        columns = {
+            name: [
+                (attr.key, attr.columns[0])
+                for attr in inspect(self.repos[name].model).column_attrs
+            ]
+            for name in names
+        }
+        width = max(len(cols) for cols in columns.values())
+
+        selects = []
+        for index, name in enumerate(names):
+            stmt, order_by = branches[name]
+            values = [cast(column, String) for _, column in columns[name]]
+            values += [cast(null(), String)] * (width - len(values))
+            branch = stmt.with_only_columns(
+                literal(index).label("branch"),
+                func.row_number().over(order_by=order_by).label("rn"),
+                *(value.label(f"c{i}") for i, value in enumerate(values)),
+            ).subquery()
+            selects.append(select(branch))
+        union = union_all(*selects)
+        union = union.order_by(union.selected_columns.branch, union.selected_columns.rn)
+
+        results: dict[str, list[Any]] = {name: [] for name in names}
+        for row in self.session.execute(union):
+            name = names[row.branch]
+            model = self.repos[name].model
+            results[name].append(
+                model(
+                    **{
+                        key: BaseRepository._coerce(column, row[2 + i])
+                        for i, (key, column) in enumerate(columns[name])
+                    }
+                )
+            )
+        return results
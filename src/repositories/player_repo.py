@@ -0,0 +1,85 @@
+"""Repository for the canonical players dimension."""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+from src.core.names import name_pattern
+from src.entities.player import Player
+from src.repositories.base_repo import BaseRepository
+
+
+class PlayerRepository(BaseRepository[Player]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=Player)
+
+    def get_by_pfr_id(self, pfr_id: str) -> Player | None:
+        stmt = select(self.model).where(self.model.pfr_id == pfr_id)
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def search(self, query: str, *, limit: int = 50) -> Sequence[Player]:
+        """Players whose (normalized) name contains ``query``, by name."""
+        stmt = (
+            select(self.model)
+            .where(self.model.name_normalized.like(name_pattern(query), escape="\\"))
+            .order_by(self.model.name_normalized, self.model.id)
+            .limit(limit)
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    def ids_for(self, pfr_ids: Sequence[str]) -> dict[str, int]:
+        stmt = select(self.model.pfr_id, self.model.id).where(
+            self.model.pfr_id.in_(sorted(set(pfr_ids)))
+        )
+        return {pfr_id: id_ for pfr_id, id_ in self.session.execute(stmt)}
+
+    def ensure(self, players: Mapping[str, str | None]) -> dict[str, int]:
+        """
+        The id of each PFR id in ``players`` (mapped to its name), inserting
+        the ones not seen before.
+
+        Known players cost one SELECT. New ones are inserted with ON CONFLICT
+        DO NOTHING, so concurrent ingests of the same player both succeed,
+        and are then read back.
+        """
+        if not players:
+            return {}
+        ids = self.ids_for(list(players))
+        missing = [pfr_id for pfr_id in players if pfr_id not in ids]
+        if missing:
+            dialect = self.session.get_bind().dialect.name
+            insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+            table: Any = self.model.__table__
+            self.session.execute(
+                insert(table).on_conflict_do_nothing(index_elements=["pfr_id"]),
+                [{"pfr_id": p, "player_name": players[p]} for p in missing],
+            )
+            ids |= self.ids_for(missing)
+        return ids
+
+    def with_player_ids(self, rows: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Rows (keyed by attribute name) with ``pfr_id`` swapped for ``player_id``.
+
+        Players are created as needed; a row without a PFR id gets a NULL
+        ``player_id``. Rows with no ``pfr_id`` key (team tables) pass
+        through unchanged.
+        """
+        players = {
+            row["pfr_id"]: row.get("player_name") for row in rows if row.get("pfr_id")
+        }
+        ids = self.ensure(players)
+        return [
+            {
+                **{k: v for k, v in row.items() if k != "pfr_id"},
+                "player_id": ids.get(row["pfr_id"]) if row["pfr_id"] else None,
+            }
+            if "pfr_id" in row
+            else row
+            for row in rows
+        ]
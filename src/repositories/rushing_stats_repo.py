@@ -3,6 +3,8 @@ from __future__ import annotations
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.core.names import name_pattern
+from src.core.pagination import Cursor, KeysetPage
 from src.entities.rushing_stats import RushingStats
 from src.repositories.base_repo import BaseRepository
 
@@ -21,7 +23,9 @@ class RushingStatsRepository(BaseRepository[RushingStats]):
         offset: int = 0,
     ) -> list[RushingStats]:
         """Search for players by name with optional filters."""
-        stmt = select(self.model).where(self.model.player_name.ilike(f"%{query}%"))
+        stmt = select(self.model).where(
+            self.model.name_normalized.like(name_pattern(query), escape="\\")
+        )
 
         if season is not None:
             stmt = stmt.where(self.model.season == season)
@@ -29,5 +33,30 @@ class RushingStatsRepository(BaseRepository[RushingStats]):
         if position is not None:
             stmt = stmt.where(self.model.pos == position)
 
-        stmt = stmt.order_by(self.model.player_name.asc()).limit(limit).offset(offset)
+        stmt = stmt.order_by(*self.keyset_order("player_name", "asc"))
+        stmt = stmt.limit(limit).offset(offset)
         return list(self.session.execute(stmt).scalars().all())
+
+    def search_players_page(
+        self,
+        query: str,
+        season: int | None = None,
+        position: str | None = None,
+        *,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+    ) -> KeysetPage[RushingStats]:
+        """Keyset-paginated ``search_players``: the page after/before ``cursor``."""
+        stmt = select(self.model).where(
+            self.model.name_normalized.like(name_pattern(query), escape="\\")
+        )
+
+        if season is not None:
+            stmt = stmt.where(self.model.season == season)
+
+        if position is not None:
+            stmt = stmt.where(self.model.pos == position)
+
+        return self.keyset_page(
+            stmt, sort_by="player_name", order="asc", cursor=cursor, limit=limit
+        )
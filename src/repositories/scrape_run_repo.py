@@ -0,0 +1,100 @@
+"""Repository for the scrape_runs ledger."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.entities.scrape_run import ScrapeRun
+from src.repositories.base_repo import BaseRepository
+
+
+class ScrapeRunRepository(BaseRepository[ScrapeRun]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=ScrapeRun)
+
+    def find_by_run_id(self, run_id: str) -> Sequence[ScrapeRun]:
+        stmt = select(ScrapeRun).where(ScrapeRun.run_id == run_id)
+        return self.session.execute(stmt).scalars().all()
+
+    @staticmethod
+    def _window(stmt: Any, since: datetime, stat_type: str | None) -> Any:
+        """``stmt`` limited to runs started since ``since`` (of one stat type)."""
+        stmt = stmt.where(ScrapeRun.started_at >= since)
+        if stat_type is not None:
+            stmt = stmt.where(ScrapeRun.stat_type == stat_type)
+        return stmt
+
+    def started_since(
+        self, since: datetime, *, stat_type: str | None = None
+    ) -> Sequence[ScrapeRun]:
+        """Runs started at or after ``since``, oldest first."""
+        stmt = self._window(select(ScrapeRun), since, stat_type)
+        return self.session.execute(stmt.order_by(ScrapeRun.started_at)).scalars().all()
+
+    def stage_percentiles(
+        self,
+        since: datetime,
+        stages: Sequence[str],
+        *,
+        stat_type: str | None = None,
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Per-stat-type percentiles of the runs started since ``since`` (Postgres).
+
+        One grouped query: ``runs``, ``rows_changed``, ``<stage>_p50`` and
+        ``<stage>_p95`` of each ``<stage>_seconds`` (``percentile_cont``),
+        plus ``bytes_p50`` and ``attempts_p95`` (``percentile_disc``, so
+        they stay whole numbers).
+        """
+        columns: list[Any] = [
+            func.count().label("runs"),
+            func.coalesce(func.sum(ScrapeRun.rows_changed), 0).label("rows_changed"),
+            func.percentile_disc(0.5)
+            .within_group(ScrapeRun.bytes_fetched)
+            .label("bytes_p50"),
+            func.percentile_disc(0.95)
+            .within_group(ScrapeRun.attempts)
+            .label("attempts_p95"),
+        ]
+        for stage in stages:
+            seconds = getattr(ScrapeRun, f"{stage}_seconds")
+            columns += [
+                func.percentile_cont(0.5).within_group(seconds).label(f"{stage}_p50"),
+                func.percentile_cont(0.95).within_group(seconds).label(f"{stage}_p95"),
+            ]
+        stmt = self._window(select(ScrapeRun.stat_type, *columns), since, stat_type)
+        rows = self.session.execute(stmt.group_by(ScrapeRun.stat_type)).mappings()
+        return {row["stat_type"]: dict(row) for row in rows}
+
+    def outcome_counts(
+        self, since: datetime, *, stat_type: str | None = None
+    ) -> dict[str, dict[str, int]]:
+        """Runs per stat type and outcome started since ``since``."""
+        stmt = self._window(
+            select(ScrapeRun.stat_type, ScrapeRun.outcome, func.count()),
+            since,
+            stat_type,
+        ).group_by(ScrapeRun.stat_type, ScrapeRun.outcome)
+        counts: dict[str, dict[str, int]] = {}
+        for name, outcome, count in self.session.execute(stmt):
+            counts.setdefault(name, {})[outcome] = count
+        return counts
+
+    def stored_urls(self, stat_type: str, season: int) -> set[str]:
+        """Pages of ``stat_type`` with a stored run for ``season``."""
+        stmt = (
+            select(ScrapeRun.url)
+            .where(
+                ScrapeRun.stat_type == stat_type,
+                ScrapeRun.season == season,
+                ScrapeRun.outcome == "stored",
+                ScrapeRun.url.is_not(None),
+            )
+            .distinct()
+        )
+        return {url for url in self.session.execute(stmt).scalars() if url}
@@ -0,0 +1,244 @@
+"""Repository for the shared scrape work queue.
+
+Tasks are keyed by (page URL, season), so stat types parsed from the same
+page share one task and one fetch. Leasing uses ``SELECT ... FOR UPDATE
+SKIP LOCKED`` so concurrent workers on Postgres never block on, or
+receive, the same task. Every state change is
+a conditional UPDATE (matching status and lease holder), which also keeps
+the queue correct on SQLite, where row locks are not available.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import ColumnElement, case, func, literal, or_, select, update
+from sqlalchemy.orm import Session
+
+from src.entities.scrape_task import ScrapeTask
+from src.repositories.base_repo import BaseRepository
+
+PENDING = "pending"
+LEASED = "leased"
+DONE = "done"
+FAILED = "failed"
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def join_stat_types(stat_types: Iterable[str]) -> str:
+    """The stored form of a task's stat types: distinct, sorted, comma-joined."""
+    return ",".join(sorted(set(stat_types)))
+
+
+class ScrapeTaskRepository(BaseRepository[ScrapeTask]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=ScrapeTask)
+
+    def find_by_unique_key(self, url: str, season: int) -> ScrapeTask | None:
+        stmt = select(ScrapeTask).where(
+            ScrapeTask.url == url, ScrapeTask.season == season
+        )
+        return self.session.execute(stmt).scalar_one_or_none()
+
+    def find_by_season(self, season: int) -> list[ScrapeTask]:
+        stmt = select(ScrapeTask).where(ScrapeTask.season == season)
+        return list(self.session.execute(stmt).scalars().all())
+
+    def enqueue(
+        self,
+        url: str,
+        season: int,
+        stat_types: Iterable[str],
+        *,
+        priority: int = 0,
+        max_attempts: int = 3,
+        commit: bool = True,
+    ) -> ScrapeTask:
+        """
+        Queue a scrape of a page for a season, parsed as ``stat_types``.
+
+        Finished tasks are re-queued for the requested stat types. A pending
+        task gains any new stat types and keeps the higher of its current
+        and the requested priority. A leased task is left alone unless new
+        stat types are requested: they are added, and ``complete`` re-queues
+        the task instead of finishing it.
+        """
+        now = _utcnow()
+        requested = set(stat_types)
+        task = self.find_by_unique_key(url, season)
+        if task is None:
+            task = ScrapeTask(
+                url=url,
+                season=season,
+                stat_types=join_stat_types(requested),
+                priority=priority,
+                status=PENDING,
+                attempts=0,
+                max_attempts=max_attempts,
+                created_at=now,
+                updated_at=now,
+            )
+            self.session.add(task)
+        elif task.status in (DONE, FAILED):
+            task.status = PENDING
+            task.stat_types = join_stat_types(requested)
+            task.priority = priority
+            task.attempts = 0
+            task.max_attempts = max_attempts
+            task.last_error = None
+            task.updated_at = now
+        elif not requested <= set(task.stat_type_names):
+            task.stat_types = join_stat_types(requested | set(task.stat_type_names))
+            task.updated_at = now
+        if task.status == PENDING and priority > task.priority:
+            task.priority = priority
+            task.updated_at = now
+
+        if commit:
+            self.session.commit()
+        return task
+
+    def lease(
+        self,
+        worker_id: str,
+        lease_seconds: float,
+        *,
+        limit: int = 1,
+        stat_types: list[str] | None = None,
+    ) -> list[ScrapeTask]:
+        """
+        Claim up to ``limit`` pending tasks, highest priority first.
+
+        With ``stat_types``, only tasks that parse at least one of them.
+        """
+        now = _utcnow()
+        stmt = select(ScrapeTask.id).where(ScrapeTask.status == PENDING)
+        if stat_types:
+            listed = literal(",") + ScrapeTask.stat_types + ","
+            stmt = stmt.where(
+                or_(*(listed.contains(f",{st},", autoescape=True) for st in stat_types))
+            )
+        stmt = (
+            stmt.order_by(ScrapeTask.priority.desc(), ScrapeTask.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        candidate_ids = list(self.session.execute(stmt).scalars().all())
+
+        leased_ids = []
+        for task_id in candidate_ids:
+            result = self.session.execute(
+                update(ScrapeTask)
+                .where(ScrapeTask.id == task_id, ScrapeTask.status == PENDING)
+                .values(
+                    status=LEASED,
+                    leased_by=worker_id,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    attempts=ScrapeTask.attempts + 1,
+                    updated_at=now,
+                )
+            )
+            if result.rowcount == 1:  # type: ignore[attr-defined]
+                leased_ids.append(task_id)
+        self.session.commit()
+
+        if not leased_ids:
+            return []
+        tasks = (
+            self.session.execute(
+                select(ScrapeTask).where(ScrapeTask.id.in_(leased_ids))
+            )
+            .scalars()
+            .all()
+        )
+        return sorted(tasks, key=lambda t: (-t.priority, t.id))
+
+    def heartbeat(self, task_id: int, worker_id: str, lease_seconds: float) -> bool:
+        """Extend a held lease; False means the lease was lost."""
+        now = _utcnow()
+        return self._transition(
+            task_id,
+            worker_id,
+            lease_expires_at=now + timedelta(seconds=lease_seconds),
+            updated_at=now,
+        )
+
+    def complete(
+        self, task_id: int, worker_id: str, *, stat_types: str | None = None
+    ) -> bool:
+        """
+        Mark a leased task done; False means the lease was lost.
+
+        ``stat_types`` is the stored list the worker ran: if stat types
+        were added while it ran, the task goes back to pending instead.
+        """
+        now = _utcnow()
+        status: object = DONE
+        if stat_types is not None:
+            status = case((ScrapeTask.stat_types == stat_types, DONE), else_=PENDING)
+        return self._transition(
+            task_id,
+            worker_id,
+            status=status,
+            leased_by=None,
+            lease_expires_at=None,
+            last_error=None,
+            completed_at=now,
+            updated_at=now,
+        )
+
+    def fail(self, task_id: int, worker_id: str, error: str) -> bool:
+        """Release a failed task for retry, or fail it once attempts run out."""
+        return self._transition(
+            task_id,
+            worker_id,
+            status=self._retry_status(),
+            leased_by=None,
+            lease_expires_at=None,
+            last_error=error[:2000],
+            updated_at=_utcnow(),
+        )
+
+    def requeue_expired(self) -> int:
+        """Release tasks whose lease expired (dead worker); returns the count."""
+        now = _utcnow()
+        result = self.session.execute(
+            update(ScrapeTask)
+            .where(ScrapeTask.status == LEASED, ScrapeTask.lease_expires_at < now)
+            .values(
+                status=self._retry_status(),
+                leased_by=None,
+                lease_expires_at=None,
+                last_error="lease expired",
+                updated_at=now,
+            )
+        )
+        self.session.commit()
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    def count_by_status(self) -> dict[str, int]:
+        stmt = select(ScrapeTask.status, func.count()).group_by(ScrapeTask.status)
+        return {status: count for status, count in self.session.execute(stmt).all()}
+
+    def _transition(self, task_id: int, worker_id: str, **values: object) -> bool:
+        result = self.session.execute(
+            update(ScrapeTask)
+            .where(
+                ScrapeTask.id == task_id,
+                ScrapeTask.status == LEASED,
+                ScrapeTask.leased_by == worker_id,
+            )
+            .values(**values)
+        )
+        self.session.commit()
+        return bool(result.rowcount == 1)  # type: ignore[attr-defined]
+
+    @staticmethod
+    def _retry_status() -> ColumnElement[str]:
+        return case(
+            (ScrapeTask.attempts >= ScrapeTask.max_attempts, FAILED), else_=PENDING
+        )
@@ -0,0 +1,128 @@
+"""Per-season partitions of the season-partitioned stat tables (Postgres)."""
+
+from __future__ import annotations
+
+import zlib
+from typing import Any
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from src.entities.partitioning import (
+    PARTITION_KEY,
+    default_partition,
+    is_season_partitioned,
+    season_partition,
+)
+
+
+class SeasonPartitionRepository:
+    """
+    Create, list, detach and attach the ``<table>_<season>`` partitions of a
+    table declared with ``season_partitioned``.
+
+    Every method is a no-op (or empty) on other dialects and for tables
+    that are not partitioned, so callers need not check.
+    """
+
+    def __init__(self, session: Session, model: type[Any]) -> None:
+        self.session = session
+        self.table = model.__table__
+        self.enabled = (
+            session.get_bind().dialect.name == "postgresql"
+            and is_season_partitioned(self.table)
+        )
+
+    def _quote(self, name: str) -> str:
+        return str(self.session.get_bind().dialect.identifier_preparer.quote(name))
+
+    def seasons(self) -> list[int]:
+        """Seasons that have their own partition."""
+        if not self.enabled:
+            return []
+        names = self.session.execute(
+            text(
+                "SELECT c.relname FROM pg_inherits i "
+                "JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = CAST(:parent AS regclass)"
+            ),
+            {"parent": self.table.name},
+        ).scalars()
+        prefix = f"{self.table.name}_"
+        return sorted(
+            int(name[len(prefix) :]) for name in names if name[len(prefix) :].isdigit()
+        )
+
+    def ensure(self, season: int) -> bool:
+        """
+        Give a season its own partition if it does not have one yet.
+
+        Runs in the caller's transaction, before it touches the table: rows of
+        the season that landed in the default partition are moved into a new
+        table, which is then attached. Only the first write of a season pays
+        for this. Returns True if the partition was created.
+        """
+        if not self.enabled:
+            return False
+        name = season_partition(self.table.name, season)
+        if self._exists(name):
+            return False
+        # Serialize concurrent writers of a new season on this table
+        self.session.execute(
+            text("SELECT pg_advisory_xact_lock(:key)"),
+            {"key": zlib.crc32(self.table.name.encode())},
+        )
+        if self._exists(name):
+            return False
+        parent = self._quote(self.table.name)
+        default = self._quote(default_partition(self.table.name))
+        partition = self._quote(name)
+        key = self._quote(PARTITION_KEY)
+        self.session.execute(text(f"CREATE TABLE {partition} (LIKE {parent})"))
+        self.session.execute(
+            text(
+                f"WITH moved AS (DELETE FROM {default} WHERE {key} = :season "
+                f"RETURNING *) INSERT INTO {partition} SELECT * FROM moved"
+            ),
+            {"season": season},
+        )
+        self.attach(name, season)
+        return True
+
+    def detach(self, season: int) -> str | None:
+        """
+        Detach a season's partition (caller commits); returns its table name.
+
+        The detached table keeps its rows and can be dropped, or reattached
+        with ``attach`` (e.g. after reloading a replacement table).
+        """
+        if not self.enabled:
+            return None
+        name = season_partition(self.table.name, season)
+        self.session.execute(
+            text(
+                f"ALTER TABLE {self._quote(self.table.name)} "
+                f"DETACH PARTITION {self._quote(name)}"
+            )
+        )
+        return name
+
+    def attach(self, table_name: str, season: int) -> None:
+        """Attach a table (same columns as the parent) as a season's partition."""
+        if not self.enabled:
+            return
+        self.session.execute(
+            text(
+                f"ALTER TABLE {self._quote(self.table.name)} "
+                f"ATTACH PARTITION {self._quote(table_name)} "
+                f"FOR VALUES IN ({int(season)})"
+            )
+        )
+
+    def _exists(self, name: str) -> bool:
+        return (
+            self.session.execute(
+                text("SELECT to_regclass(:name) IS NOT NULL"), {"name": name}
+            ).scalar()
+            is True
+        )
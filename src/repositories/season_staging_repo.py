@@ -0,0 +1,123 @@
+"""Temporary staging copies of stat tables for atomic season swaps."""
+
+from __future__ import annotations
+
+import uuid
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import (
+    Column,
+    MetaData,
+    Table,
+    case,
+    delete,
+    func,
+    insert,
+    or_,
+    select,
+)
+from sqlalchemy import inspect as sa_inspect
+from sqlalchemy.orm import Session
+
+
+class SeasonStagingRepository:
+    """
+    A session-private TEMPORARY copy of a stat table (same columns and
+    column defaults, no id or constraints) that a season is bulk-loaded
+    into, checked, and then swapped into the live table with delete +
+    insert-select.
+
+    Temporary tables are invisible to other connections, so loading never
+    blocks or is seen by readers. Call ``drop`` before the transaction ends.
+    """
+
+    def __init__(self, session: Session, model: type[Any]) -> None:
+        self.session = session
+        self.model = model
+        self.live: Table = model.__table__
+        mapper = sa_inspect(model)
+        self._column_by_attr = {
+            attr.key: attr.columns[0].name for attr in mapper.column_attrs
+        }
+        self.staging = Table(
+            f"{self.live.name}_staging_{uuid.uuid4().hex[:8]}",
+            MetaData(),
+            *(
+                # Keep Python-side defaults (e.g. name_normalized) for load
+                Column(c.name, c.type, default=c.default.arg if c.default else None)
+                for c in self.live.columns
+                if c.name != "id"
+            ),
+            prefixes=["TEMPORARY"],
+        )
+        self._columns = [c.name for c in self.staging.columns]
+
+    def create(self) -> None:
+        self.staging.create(self.session.connection())
+
+    def drop(self) -> None:
+        self.staging.drop(self.session.connection())
+
+    def load(self, rows: Sequence[dict[str, Any]]) -> int:
+        """Bulk-insert rows keyed by entity attribute name."""
+        if not rows:
+            return 0
+        by_column = [
+            {self._column_by_attr[k]: v for k, v in row.items() if k != "id"}
+            for row in rows
+        ]
+        self.session.execute(insert(self.staging), by_column)
+        return len(rows)
+
+    def staged_stats(
+        self,
+        season: int,
+        key: Sequence[str],
+        *,
+        fallbacks: Mapping[str, str] | None = None,
+    ) -> dict[str, int]:
+        """
+        Row count, distinct natural keys, and rows outside the season.
+
+        ``fallbacks`` maps a key attribute to the one a row is keyed by
+        when that attribute is NULL (e.g. ``player_id`` -> ``player_name``).
+        """
+        staging = self.staging.c
+        key_cols: list[Any] = []
+        for attr in key:
+            column = staging[self._column_by_attr[attr]]
+            key_cols.append(column)
+            if fallbacks and attr in fallbacks:
+                fallback = staging[self._column_by_attr[fallbacks[attr]]]
+                key_cols.append(case((column.is_(None), fallback)))
+        distinct = select(*key_cols).distinct().subquery()
+        return {
+            "rows": self._scalar(select(func.count()).select_from(self.staging)),
+            "distinct_keys": self._scalar(select(func.count()).select_from(distinct)),
+            "wrong_season": self._scalar(
+                select(func.count())
+                .select_from(self.staging)
+                .where(or_(staging.season.is_(None), staging.season != season))
+            ),
+        }
+
+    def live_count(self, season: int) -> int:
+        return self._scalar(
+            select(func.count())
+            .select_from(self.live)
+            .where(self.live.c.season == season)
+        )
+
+    def swap(self, season: int) -> int:
+        """Replace the live season with the staged rows; returns rows swapped in."""
+        self.session.execute(delete(self.live).where(self.live.c.season == season))
+        result = self.session.execute(
+            insert(self.live).from_select(
+                self._columns, select(*(self.staging.c[c] for c in self._columns))
+            )
+        )
+        return int(result.rowcount or 0)  # type: ignore[attr-defined]
+
+    def _scalar(self, stmt: Any) -> int:
+        return int(self.session.execute(stmt).scalar() or 0)
@@ -0,0 +1,54 @@
+"""Repository for the stat_changes log."""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.entities.stat_change import StatChange
+from src.repositories.base_repo import BaseRepository
+
+# Arbitrary application-wide key for pg_advisory_xact_lock
+_SEQUENCE_LOCK_KEY = 0x7374617463686E67
+
+
+class StatChangeRepository(BaseRepository[StatChange]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=StatChange)
+
+    def append(self, changes: Sequence[dict], *, commit: bool = True) -> int:
+        """
+        Log changes so that ids become visible in increasing order.
+
+        Sequence values are handed out at insert time but become visible at
+        commit, so two concurrent ingests could commit ids out of order and
+        a consumer that already advanced past the later id would miss the
+        earlier one. On Postgres, writers serialize on a transaction-scoped
+        advisory lock (held until commit) before drawing ids; SQLite
+        serializes writers already.
+        """
+        if not changes:
+            return 0
+        if self.session.get_bind().dialect.name == "postgresql":
+            self.session.execute(select(func.pg_advisory_xact_lock(_SEQUENCE_LOCK_KEY)))
+        return self.bulk_insert(changes, commit=commit)
+
+    def since(
+        self,
+        cursor: int,
+        *,
+        tables: Sequence[str] | None = None,
+        limit: int = 1000,
+    ) -> list[StatChange]:
+        """Changes logged after ``cursor``, oldest first."""
+        stmt = select(StatChange).where(StatChange.id > cursor)
+        if tables:
+            stmt = stmt.where(StatChange.table_name.in_(tables))
+        stmt = stmt.order_by(StatChange.id).limit(limit)
+        return list(self.session.execute(stmt).scalars())
+
+    def latest_cursor(self) -> int:
+        """Id of the newest change (0 when the log is empty)."""
+        return int(self.session.execute(select(func.max(StatChange.id))).scalar() or 0)
@@ -0,0 +1,78 @@
+"""Repository for scraped table fingerprints (change detection)."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.entities.scraped_table_fingerprint import ScrapedTableFingerprint
+from src.repositories.base_repo import BaseRepository
+
+
+class TableFingerprintRepository(BaseRepository[ScrapedTableFingerprint]):
+    def __init__(self, session: Session) -> None:
+        super().__init__(session=session, model=ScrapedTableFingerprint)
+
+    def find_for_url(
+        self, source_url: str, stat_type: str
+    ) -> dict[str, ScrapedTableFingerprint]:
+        """Stored fingerprints of a stat type's tables on a page, by table id."""
+        stmt = select(ScrapedTableFingerprint).where(
+            ScrapedTableFingerprint.source_url == source_url,
+            ScrapedTableFingerprint.stat_type == stat_type,
+        )
+        return {fp.table_id: fp for fp in self.session.execute(stmt).scalars()}
+
+    def unchanged(
+        self, source_url: str, stat_type: str, fingerprints: dict[str, str | None]
+    ) -> bool:
+        """True if every table is present and hashes as it did at the last ingest."""
+        if not fingerprints or None in fingerprints.values():
+            return False
+        stored = self.find_for_url(source_url, stat_type)
+        return all(
+            table_id in stored and stored[table_id].content_hash == content_hash
+            for table_id, content_hash in fingerprints.items()
+        )
+
+    def mark_checked(
+        self, source_url: str, stat_type: str, *, commit: bool = True
+    ) -> None:
+        now = datetime.now(UTC)
+        for fp in self.find_for_url(source_url, stat_type).values():
+            fp.last_checked_at = now
+        if commit:
+            self.session.commit()
+
+    def save(
+        self,
+        source_url: str,
+        stat_type: str,
+        fingerprints: dict[str, str | None],
+        *,
+        season: int | None = None,
+        rows_ingested: int | None = None,
+        commit: bool = True,
+    ) -> None:
+        """Record the fingerprints of a successful ingest (missing tables skipped)."""
+        now = datetime.now(UTC)
+        stored = self.find_for_url(source_url, stat_type)
+        for table_id, content_hash in fingerprints.items():
+            if content_hash is None:
+                continue
+            fp = stored.get(table_id)
+            if fp is None:
+                fp = ScrapedTableFingerprint(
+                    source_url=source_url, stat_type=stat_type, table_id=table_id
+                )
+                self.session.add(fp)
+            if fp.content_hash != content_hash:
+                fp.content_hash = content_hash
+                fp.last_changed_at = now
+            fp.season = season
+            fp.rows_ingested = rows_ingested
+            fp.last_checked_at = now
+        if commit:
+            self.session.commit()
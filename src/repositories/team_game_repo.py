@@ -6,6 +6,9 @@ season/week filtering, and upsert (create-or-skip) logic.
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
@@ -34,12 +37,20 @@ class TeamGameRepository(BaseRepository[TeamGame]):
         entity = TeamGame(**dto.model_dump())
         return self.create(entity, commit=commit)
 
-    def create_or_skip(self, dto: TeamGameCreate) -> TeamGame:
-        """Insert a game record, or return the existing one if duplicate."""
+    def create_or_skip(self, dto: TeamGameCreate, *, commit: bool = True) -> TeamGame:
+        """
+        Insert a game record, or return the existing one if duplicate.
+
+        Without ``commit`` the insert is flushed, so later lookups in the
+        same transaction see it.
+        """
         existing = self.find_by_unique_key(dto.team_abbr, dto.season, dto.week)
         if existing:
             return existing
-        return self.create_from_dto(dto)
+        game = self.create_from_dto(dto, commit=commit)
+        if not commit:
+            self.session.flush()
+        return game
 
     def find_by_season_and_week(
         self,
@@ -52,20 +63,37 @@ class TeamGameRepository(BaseRepository[TeamGame]):
         order: str = "asc",
     ) -> list[TeamGame]:
         """Find games for a season, optionally filtered by week."""
+        stmt = self._season_week_query(season, week, sort_by, order)
+        stmt = stmt.limit(limit).offset(offset)
+        return list(self.session.execute(stmt).scalars().all())
+
+    def find_by_season_and_week_with_total(
+        self,
+        season: int,
+        week: int | None = None,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = "week",
+        order: str = "asc",
+    ) -> tuple[Sequence[TeamGame], int]:
+        """``find_by_season_and_week`` plus the matching row count, in one query."""
+        return self.fetch_with_total(
+            self._season_week_query(season, week, sort_by, order),
+            limit=limit,
+            offset=offset,
+        )
+
+    def _season_week_query(
+        self, season: int, week: int | None, sort_by: str, order: str
+    ) -> Any:
         stmt = select(TeamGame).where(TeamGame.season == season)
 
         if week is not None:
             stmt = stmt.where(TeamGame.week == week)
 
-        sort_column = getattr(TeamGame, sort_by, None)
-        if sort_column is not None:
-            if order.lower() == "asc":
-                stmt = stmt.order_by(sort_column.asc())
-            else:
-                stmt = stmt.order_by(sort_column.desc())
-
-        stmt = stmt.limit(limit).offset(offset)
-        return list(self.session.execute(stmt).scalars().all())
+        # (sort_by, id) so pages are stable when sort values tie
+        return stmt.order_by(*self.keyset_order(sort_by, order))
 
     def count_by_season(self, season: int, week: int | None = None) -> int:
         """Count total games for a season and optional week."""
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+from typing import Any
+
 from sqlalchemy import select
 from sqlalchemy.orm import Session
 
+from src.core.pagination import Cursor, KeysetPage
 from src.entities.team_offense import TeamOffense
 from src.repositories.base_repo import BaseRepository
 
@@ -21,16 +25,7 @@ class TeamOffenseRepository(BaseRepository[TeamOffense]):
         order: str = "desc",
     ) -> list[TeamOffense]:
         """Find all team offense stats for a season with pagination and sorting."""
-        stmt = select(self.model).where(self.model.season == season)
-
-        # Apply sorting
-        sort_column = getattr(self.model, sort_by, None)
-        if sort_column is not None:
-            if order.lower() == "asc":
-                stmt = stmt.order_by(sort_column.asc())
-            else:
-                stmt = stmt.order_by(sort_column.desc())
-
+        stmt = self._season_query(season, sort_by, order)
         stmt = stmt.limit(limit).offset(offset)
         return list(self.session.execute(stmt).scalars().all())
 
@@ -41,6 +36,46 @@ class TeamOffenseRepository(BaseRepository[TeamOffense]):
         )
         return self.session.execute(stmt).scalar_one_or_none()
 
+    def _season_query(self, season: int, sort_by: str, order: str) -> Any:
+        # Same (sort_by, id) order as the keyset pages, so cursors line up
+        stmt = select(self.model).where(self.model.season == season)
+        return stmt.order_by(*self.keyset_order(sort_by, order))
+
+    def find_by_season_with_total(
+        self,
+        season: int,
+        *,
+        limit: int = 50,
+        offset: int = 0,
+        sort_by: str = "pf",
+        order: str = "desc",
+    ) -> tuple[Sequence[TeamOffense], int]:
+        """``find_by_season`` plus the season's row count, in one query."""
+        return self.fetch_with_total(
+            self._season_query(season, sort_by, order), limit=limit, offset=offset
+        )
+
+    def find_by_season_page(
+        self,
+        season: int,
+        *,
+        cursor: Cursor | None = None,
+        limit: int = 50,
+        sort_by: str = "pf",
+        order: str = "desc",
+        with_total: bool = False,
+    ) -> KeysetPage[TeamOffense]:
+        """Keyset-paginated ``find_by_season``: the page after/before ``cursor``."""
+        stmt = select(self.model).where(self.model.season == season)
+        return self.keyset_page(
+            stmt,
+            sort_by=sort_by,
+            order=order,
+            cursor=cursor,
+            limit=limit,
+            with_total=with_total,
+        )
+
     def count_by_season(self, season: int) -> int:
         """Count total teams for a season."""
         from sqlalchemy import func
@@ -0,0 +1,89 @@
+"""
+Wide team-season feature rows: every team table joined on (team, season).
+
+One statement covers all the tables. The team-seasons are the union of
+the ``(team_id, season)`` pairs stored in any of them for the requested
+seasons. Each table is LEFT JOINed onto that set by its indexed
+``(team_id, season)``, so a team missing from one table still gets a row,
+with NULL features for that table. Rows whose team the registry does not
+know (``team_id`` NULL, e.g. league totals) are left out.
+
+Each table's columns come out prefixed with its name in
+``FEATURE_TABLES`` (``offense_pf``, ``standings_win_pct``, ...), after
+the key columns ``season``, ``team_id``, ``team`` (abbreviation) and
+``team_name``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from typing import Any
+
+from sqlalchemy import Select, and_, inspect, select, union
+from sqlalchemy.orm import Session
+
+from src.entities.kicking import Kicking
+from src.entities.punting import Punting
+from src.entities.returns import TeamReturns
+from src.entities.standings import Standings
+from src.entities.team import Team
+from src.entities.team_defense import TeamDefense
+from src.entities.team_offense import TeamOffense
+
+FEATURE_TABLES: dict[str, type[Any]] = {
+    "offense": TeamOffense,
+    "defense": TeamDefense,
+    "standings": Standings,
+    "kicking": Kicking,
+    "punting": Punting,
+    "returns": TeamReturns,
+}
+
+# Columns that identify the row rather than describe the team-season
+_NOT_FEATURES = frozenset({"id", "row_hash", "season", "tm", "team_id"})
+
+
+class TeamSeasonFeatureRepository:
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    def _query(self, seasons: Sequence[int]) -> Select[Any]:
+        keys = union(
+            *(
+                select(model.team_id, model.season).where(
+                    model.season.in_(seasons), model.team_id.is_not(None)
+                )
+                for model in FEATURE_TABLES.values()
+            )
+        ).subquery("team_seasons")
+
+        columns: list[Any] = [
+            keys.c.season,
+            keys.c.team_id,
+            Team.abbr.label("team"),
+            Team.name.label("team_name"),
+        ]
+        stmt = select().select_from(keys).join(Team, Team.id == keys.c.team_id)
+        for prefix, model in FEATURE_TABLES.items():
+            columns += [
+                attr.columns[0].label(f"{prefix}_{attr.key}")
+                for attr in inspect(model).column_attrs
+                if attr.key not in _NOT_FEATURES
+            ]
+            stmt = stmt.outerjoin(
+                model,
+                and_(model.team_id == keys.c.team_id, model.season == keys.c.season),
+            )
+        return stmt.add_columns(*columns).order_by(keys.c.season, Team.abbr)
+
+    def features(
+        self, seasons: Sequence[int], *, batch_size: int = 500
+    ) -> Iterator[dict[str, Any]]:
+        """Flat feature rows of ``seasons``, by season then team, fetched in batches."""
+        if not seasons:
+            return
+        result = self.session.execute(
+            self._query(sorted(set(seasons))).execution_options(yield_per=batch_size)
+        )
+        for row in result.mappings():
+            yield dict(row)
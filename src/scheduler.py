@@ -0,0 +1,48 @@
+"""
+In-season scrape scheduler: queue only the pages that changed after each
+NFL game window.
+
+Usage:
+    python -m src.scheduler            # poll every SCHEDULER_POLL_SECONDS
+    python -m src.scheduler --once     # single pass (e.g. from cron)
+
+Queued units are executed by `python -m src.worker run`.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+
+from src.core.config import settings
+from src.services.in_season_service import schedule_in_season
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.scheduler", description=__doc__.splitlines()[1]
+    )
+    parser.add_argument("--once", action="store_true", help="Run one pass and exit")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    while True:
+        try:
+            print(json.dumps(schedule_in_season()), flush=True)
+        except Exception:
+            logging.exception("Scheduler pass failed")
+            if args.once:
+                return 1
+        if args.once or stop.wait(settings.SCHEDULER_POLL_SECONDS):
+            return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
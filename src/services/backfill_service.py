@@ -0,0 +1,287 @@
+"""
+Plan and run resumable multi-season backfills.
+
+A request such as ``1970-2024 x all stat types`` expands into one unit per
+distinct PFR page: stat types that share a page (e.g. ``kicking`` and
+``kicking_stats`` both come from ``kicking.htm``) are fetched once and
+parsed for each. Units run newest season first, so the most-used data
+lands earliest.
+
+Completed (url, stat type) pairs are checkpointed in a local SQLite ledger
+after their rows commit, so an interrupted backfill resumes exactly where
+it stopped and never re-fetches a finished page. Fetches run in the
+``backfill`` rate-limit class, so interactive scrapes in the same process
+take precedence at every page boundary.
+"""
+
+import logging
+import sqlite3
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime
+from pathlib import Path
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.rate_limit import ScrapePriority, scrape_priority
+from src.core.run_metrics import STAGES, RunMetrics, stage, track_run
+from src.core.scraper_utils import fetch_page, retry_with_backoff
+from src.services.parse_pipeline import BatchWriter, ParsedTable
+from src.services.scrape_run_service import save_run
+from src.services.stat_registry import (
+    StatType,
+    get_service,
+    page_url,
+    validate_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BackfillUnit:
+    """One PFR page and the stat types still to be parsed from it."""
+
+    url: str
+    season: int
+    stat_types: tuple[StatType, ...]
+
+
+class BackfillLedger:
+    """SQLite checkpoint of completed (url, stat type) backfill units."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS completed_units (
+                    url          TEXT NOT NULL,
+                    stat_type    TEXT NOT NULL,
+                    season       INTEGER NOT NULL,
+                    rows         INTEGER NOT NULL,
+                    completed_at TEXT NOT NULL,
+                    PRIMARY KEY (url, stat_type)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def completed(self) -> set[tuple[str, str]]:
+        """Return every checkpointed (url, stat type) pair."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT url, stat_type FROM completed_units")
+            return {(url, stat_type) for url, stat_type in rows}
+
+    def mark_completed(
+        self, url: str, stat_type: StatType, season: int, rows: int
+    ) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO completed_units "
+                "(url, stat_type, season, rows, completed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (url, str(stat_type), season, rows, datetime.now(UTC).isoformat()),
+            )
+
+    def reset(self) -> None:
+        """Forget all checkpoints (the next run starts from scratch)."""
+        with self._connect() as conn:
+            conn.execute("DELETE FROM completed_units")
+
+
+def plan_backfill(
+    stat_types: Iterable[StatType],
+    seasons: Iterable[int],
+    completed: set[tuple[str, str]] | None = None,
+) -> list[BackfillUnit]:
+    """
+    Expand seasons x stat types into distinct pages, newest season first.
+
+    Args:
+        stat_types: Stat types to backfill
+        seasons: Seasons to backfill
+        completed: Checkpointed (url, stat type) pairs to leave out
+
+    Returns:
+        One unit per page with at least one stat type still pending
+    """
+    completed = completed or set()
+    stat_types = [StatType(st) for st in stat_types]
+    by_url: dict[str, tuple[int, list[StatType]]] = {}
+    for season in sorted(set(seasons), reverse=True):
+        for stat_type in stat_types:
+            url = page_url(stat_type, season)
+            if (url, str(stat_type)) in completed:
+                continue
+            by_url.setdefault(url, (season, []))[1].append(stat_type)
+    return [
+        BackfillUnit(url, season, tuple(types))
+        for url, (season, types) in by_url.items()
+    ]
+
+
+def run_unit(unit: BackfillUnit, fetch: Callable[[str], str]) -> list[dict]:
+    """
+    Fetch one page and replace every pending stat type parsed from it.
+
+    Each stat type gets a ``scrape_runs`` row under one run id; the shared
+    page fetch and batched write are attributed to every one of them.
+
+    Returns:
+        One result dict per stat type (status stored or failed)
+    """
+    writer = BatchWriter(SessionLocal)
+    page = RunMetrics(
+        run_id=writer.scrape_run,
+        stat_type="",
+        season=unit.season,
+        url=unit.url,
+        backend=settings.SCRAPE_BACKEND,
+    )
+    runs: dict[StatType, RunMetrics] = {}
+    results: list[dict] = []
+    try:
+        with track_run(page), stage("fetch"):
+            page_source = retry_with_backoff(fetch, unit.url, url=unit.url)
+
+        for stat_type in unit.stat_types:
+            run = runs[stat_type] = _stat_run(page, stat_type)
+            try:
+                with track_run(run):
+                    with stage("parse"):
+                        rows = get_service(stat_type).parse_page(
+                            page_source, unit.season
+                        )
+                    with stage("validate"):
+                        rows = validate_rows(stat_type, rows)
+            except Exception as e:
+                logger.error("Failed to parse %s %d: %s", stat_type, unit.season, e)
+                results.append(
+                    {
+                        "stat_type": str(stat_type),
+                        "season": unit.season,
+                        "status": "failed",
+                        "error": str(e),
+                    }
+                )
+                continue
+            run.rows_in = len(rows)
+            with track_run(page), stage("write"):
+                results.extend(
+                    writer.add(ParsedTable.from_rows(str(stat_type), unit.season, rows))
+                )
+        with track_run(page), stage("write"):
+            results.extend(writer.flush())
+        return results
+    finally:
+        _record_runs(unit, page, runs, results)
+
+
+def _stat_run(page: RunMetrics, stat_type: StatType) -> RunMetrics:
+    return replace(
+        page,
+        stat_type=str(stat_type),
+        durations=dict.fromkeys(STAGES, 0.0),
+        total_seconds=0.0,
+    )
+
+
+def _record_runs(
+    unit: BackfillUnit,
+    page: RunMetrics,
+    runs: dict[StatType, RunMetrics],
+    results: list[dict],
+) -> None:
+    by_type = {r["stat_type"]: r for r in results}
+    for stat_type in unit.stat_types:
+        run = runs.get(stat_type) or _stat_run(page, stat_type)
+        for name in ("fetch", "rate_limit_wait", "write"):
+            run.durations[name] += page.durations[name]
+        run.total_seconds += page.total_seconds
+        run.attempts, run.bytes_fetched = page.attempts, page.bytes_fetched
+
+        result = by_type.get(str(stat_type))
+        if result is None:
+            run.outcome, run.error = "failed", run.error or page.error
+        else:
+            run.outcome, run.error = result["status"], result.get("error")
+            if result["status"] == "stored":
+                run.rows_changed = (
+                    result["inserted"] + result["updated"] + result["deleted"]
+                )
+        save_run(run)
+
+
+def backfill(
+    stat_types: Iterable[StatType],
+    seasons: Iterable[int],
+    *,
+    ledger: BackfillLedger | None = None,
+    fetch: Callable[[str], str] = fetch_page,
+) -> Iterator[dict]:
+    """
+    Run a backfill, skipping units already checkpointed in the ledger.
+
+    Args:
+        stat_types: Stat types to backfill
+        seasons: Seasons to backfill
+        ledger: Checkpoint ledger (defaults to BACKFILL_LEDGER_PATH)
+        fetch: Page fetcher (defaults to the configured scrape backend)
+
+    Yields:
+        One progress dict per page: per-stat-type results, pages done and
+        remaining, and an ETA extrapolated from this run's observed rate
+    """
+    ledger = ledger or BackfillLedger(settings.BACKFILL_LEDGER_PATH)
+    units = plan_backfill(stat_types, seasons, ledger.completed())
+    total = len(units)
+    started = time.monotonic()
+
+    for done, unit in enumerate(units, start=1):
+        try:
+            with scrape_priority(ScrapePriority.backfill):
+                results = run_unit(unit, fetch)
+        except Exception as e:
+            logger.error("Failed to fetch %s: %s", unit.url, e)
+            results = [
+                {
+                    "stat_type": str(st),
+                    "season": unit.season,
+                    "status": "failed",
+                    "error": str(e),
+                }
+                for st in unit.stat_types
+            ]
+
+        for result in results:
+            if result["status"] == "stored":
+                ledger.mark_completed(
+                    unit.url,
+                    StatType(result["stat_type"]),
+                    unit.season,
+                    result["rows"],
+                )
+
+        elapsed = time.monotonic() - started
+        remaining = total - done
+        yield {
+            "url": unit.url,
+            "season": unit.season,
+            "results": results,
+            "pages_done": done,
+            "pages_total": total,
+            "elapsed_seconds": round(elapsed, 1),
+            "eta_seconds": round(elapsed / done * remaining, 1),
+        }
@@ -0,0 +1,143 @@
+"""
+Cross-process cache invalidation driven by per-(table, season) data versions.
+
+Ingestion bumps ``data_versions`` in the same transaction as the rows it
+changes (see ``row_diff_service``). Each API process runs one
+``VersionWatcher`` thread that turns committed bumps into calls to the
+callbacks registered with ``subscribe`` — read caches evict their entries
+for that (table, season) there.
+
+- On Postgres the watcher ``LISTEN``s on the ``data_version`` channel, so
+  other nodes' ingests are seen as soon as they commit.
+- Everywhere it also re-reads the version table every
+  ``CACHE_INVALIDATION_POLL_SECONDS``. That is the only path on SQLite,
+  and on Postgres it covers notifications lost while reconnecting, so a
+  cached read is never stale for longer than the poll interval.
+"""
+
+import logging
+import select
+import threading
+from collections.abc import Callable
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import SessionLocal, engine
+from src.repositories.data_version_repo import (
+    DataVersionRepository,
+    version_listener,
+)
+
+logger = logging.getLogger(__name__)
+
+Invalidation = Callable[[str, int], None]
+
+_subscribers: list[Invalidation] = []
+_subscribers_lock = threading.Lock()
+
+
+def subscribe(callback: Invalidation) -> None:
+    """Call ``callback(table_name, season)`` whenever that season changes."""
+    with _subscribers_lock:
+        _subscribers.append(callback)
+
+
+def unsubscribe(callback: Invalidation) -> None:
+    with _subscribers_lock:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+
+def invalidate(table_name: str, season: int) -> None:
+    """Run every subscriber for a (table, season); one failing does not stop others."""
+    with _subscribers_lock:
+        callbacks = list(_subscribers)
+    for callback in callbacks:
+        try:
+            callback(table_name, season)
+        except Exception:
+            logger.exception("Cache invalidation callback failed")
+
+
+class VersionWatcher:
+    """Background thread that turns data version bumps into invalidations."""
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        poll_seconds: float | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.poll_seconds = poll_seconds or settings.CACHE_INVALIDATION_POLL_SECONDS
+        self._seen: dict[tuple[str, int], int] | None = None
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _observe(self, table_name: str, season: int, version: int) -> None:
+        assert self._seen is not None
+        key = (table_name, season)
+        if version > self._seen.get(key, 0):
+            self._seen[key] = version
+            invalidate(table_name, season)
+
+    def poll_once(self) -> None:
+        """Compare every stored version with the last seen ones."""
+        db = self.session_factory()
+        try:
+            current = DataVersionRepository(db).current()
+        finally:
+            db.close()
+        if self._seen is None:
+            # Nothing can be cached from before the watcher started
+            self._seen = current
+            return
+        for (table_name, season), version in current.items():
+            self._observe(table_name, season, version)
+
+    def handle_notification(self, payload: str) -> None:
+        """Apply a ``<table>:<season>:<version>`` NOTIFY payload."""
+        table_name, season, version = payload.rsplit(":", 2)
+        if self._seen is None:
+            self._seen = {}
+        self._observe(table_name, int(season), int(version))
+
+    def _listen(self) -> None:
+        with version_listener(engine) as dbapi_conn:
+            self.poll_once()  # resync anything missed while disconnected
+            while not self._stop.is_set():
+                # The select() timeout doubles as the safety-net poll interval
+                ready, _, _ = select.select([dbapi_conn], [], [], self.poll_seconds)
+                if not ready:
+                    self.poll_once()
+                    continue
+                dbapi_conn.poll()
+                while dbapi_conn.notifies:
+                    self.handle_notification(dbapi_conn.notifies.pop(0).payload)
+
+    def _run(self) -> None:
+        listen = engine.dialect.name == "postgresql"
+        while not self._stop.is_set():
+            try:
+                if listen:
+                    self._listen()
+                else:
+                    self.poll_once()
+            except Exception:
+                logger.warning("Data version watcher failed, retrying", exc_info=True)
+            self._stop.wait(self.poll_seconds)
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="data-version-watcher", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_seconds + 1)
+            self._thread = None
@@ -0,0 +1,177 @@
+"""
+Read-through cache around ``StatsRetrievalService``.
+
+Results are cached as JSON-ready values under ``(method, args)``, tagged
+with the (table, season) pairs the method reads so ingestion invalidates
+exactly what it changed:
+
+- ingest paths call ``cache_invalidation_service.invalidate`` after they
+  commit, which evicts this process's entries at once;
+- other processes evict when their ``VersionWatcher`` sees the data
+  version bump (within ``CACHE_INVALIDATION_POLL_SECONDS``).
+
+With ``SHARED_CACHE_DIR`` set, the host-wide ``SharedCache`` sits under
+the per-process cache, so workers on a host serve each other's results.
+
+Completed seasons are frozen (see ``nfl_calendar.is_season_complete``)
+and are kept for ``READ_CACHE_FROZEN_TTL_SECONDS``; the current season,
+and searches across all seasons, only for
+``READ_CACHE_CURRENT_TTL_SECONDS`` as a backstop.
+"""
+
+from collections.abc import Callable, Iterable
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from typing import Any
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.nfl_calendar import is_season_complete
+from src.core.read_cache import ReadCache, Tag
+from src.core.shared_cache import get_shared_cache
+from src.entities.base import Base
+from src.repositories.player_lookup_repo import PLAYER_CATEGORIES
+from src.repositories.team_season_repo import FEATURE_TABLES
+from src.services.stats_retrieval_service import StatsRetrievalService
+
+read_cache = ReadCache(
+    max_entries=settings.READ_CACHE_MAX_ENTRIES, shared=get_shared_cache()
+)
+
+_PLAYER_TABLES = tuple(model.__tablename__ for model in PLAYER_CATEGORIES.values())
+_FEATURE_TABLES = tuple(model.__tablename__ for model in FEATURE_TABLES.values())
+_HIDDEN_COLUMNS = frozenset({"row_hash", "name_normalized"})
+
+
+def to_jsonable(value: Any) -> Any:
+    """Entities (also inside dicts/lists) as plain JSON values, minus internals."""
+    if isinstance(value, Base):
+        return {
+            attr.key: to_jsonable(getattr(value, attr.key))
+            for attr in inspect(value).mapper.column_attrs
+            if attr.key not in _HIDDEN_COLUMNS
+        }
+    if isinstance(value, dict):
+        return {k: to_jsonable(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [to_jsonable(v) for v in value]
+    if isinstance(value, Decimal):
+        return float(value)
+    if isinstance(value, date | datetime):
+        return value.isoformat()
+    return value
+
+
+def ttl_for(season: int | None, today: date | None = None) -> float:
+    """Cache lifetime for results of a season (None = spans all seasons)."""
+    today = today or datetime.now(UTC).date()
+    if season is not None and is_season_complete(season, today):
+        return settings.READ_CACHE_FROZEN_TTL_SECONDS
+    return settings.READ_CACHE_CURRENT_TTL_SECONDS
+
+
+class CachedStatsRetrievalService:
+    """``StatsRetrievalService`` whose results are served from ``read_cache``."""
+
+    def __init__(self, session: Session, cache: ReadCache | None = None) -> None:
+        self.cache = cache or read_cache
+        # Page totals of completed seasons share the cache and its invalidation
+        self.service = StatsRetrievalService(session, totals=self.cache)
+
+    def _cached(
+        self,
+        method: str,
+        season: int | None,
+        tables: Iterable[str],
+        load: Callable[[], Any],
+        **args: Any,
+    ) -> Any:
+        key = (method, season, tuple(sorted(args.items())))
+        tags: list[Tag] = [(table, season) for table in tables]
+        if not settings.READ_CACHE_ENABLED:
+            return to_jsonable(load())
+        return self.cache.get_or_load(
+            key, lambda: to_jsonable(load()), ttl=ttl_for(season), tags=tags
+        )
+
+    def get_all_teams(self, season: int, **kwargs: Any) -> Any:
+        return self._cached(
+            "get_all_teams",
+            season,
+            ["team_offense"],
+            lambda: self.service.get_all_teams(season, **kwargs),
+            **kwargs,
+        )
+
+    def get_team_stats(self, team: str, season: int) -> Any:
+        return self._cached(
+            "get_team_stats",
+            season,
+            ["team_offense"],
+            lambda: self.service.get_team_stats(team, season),
+            team=team,
+        )
+
+    def get_player_stats(self, player_name: str, season: int) -> Any:
+        return self._cached(
+            "get_player_stats",
+            season,
+            _PLAYER_TABLES,
+            lambda: self.service.get_player_stats(player_name, season),
+            player_name=player_name,
+        )
+
+    def get_player(self, player_id: int, season: int | None = None) -> Any:
+        return self._cached(
+            "get_player",
+            season,
+            _PLAYER_TABLES,
+            lambda: self.service.get_player(player_id, season),
+            player_id=player_id,
+        )
+
+    def get_standings(self, season: int, **kwargs: Any) -> Any:
+        return self._cached(
+            "get_standings",
+            season,
+            ["standings"],
+            lambda: self.service.get_standings(season, **kwargs),
+            **kwargs,
+        )
+
+    def get_games(self, season: int, week: int | None = None, **kwargs: Any) -> Any:
+        return self._cached(
+            "get_games",
+            season,
+            ["team_games"],
+            lambda: self.service.get_games(season, week, **kwargs),
+            week=week,
+            **kwargs,
+        )
+
+    def get_team_season_features(self, season: int) -> Any:
+        return self._cached(
+            "get_team_season_features",
+            season,
+            _FEATURE_TABLES,
+            lambda: self.service.get_team_season_features(season),
+        )
+
+    def search_players(
+        self,
+        query: str,
+        season: int | None = None,
+        position: str | None = None,
+        **kwargs: Any,
+    ) -> Any:
+        return self._cached(
+            "search_players",
+            season,
+            _PLAYER_TABLES,
+            lambda: self.service.search_players(query, season, position, **kwargs),
+            query=query,
+            position=position,
+            **kwargs,
+        )
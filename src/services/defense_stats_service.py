@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.defense_stats_dto import DefenseStatsCreate
-from src.entities.defense_stats import DefenseStats
-from src.repositories.defense_stats_repo import DefenseStatsRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table, pfr_player_id
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/defense.htm"
 PFR_TABLE_ID = "defense"
@@ -46,9 +32,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -78,6 +63,9 @@ def get_dataframe(season: int) -> list[dict]:
         if "player_name" in row and row["player_name"]:
             row["player_name"] = row["player_name"].rstrip("*+")
 
+        # PFR's player id: the identity behind the name (players table)
+        row["pfr_id"] = pfr_player_id(player_cell)
+
         rk_cell = tr.find("th", {"data-stat": "ranker"})
         if rk_cell and rk_cell.text.strip():
             row["rk"] = clean_value(rk_cell.text.strip())
@@ -86,24 +74,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = DefenseStatsRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = DefenseStatsCreate(**row)
-            obj = DefenseStats(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
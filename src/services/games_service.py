@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.games_dto import GamesCreate
-from src.entities.games import Games
-from src.repositories.games_repo import GamesRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/games.htm"
 PFR_TABLE_ID = "games"
@@ -32,9 +18,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -89,24 +74,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = GamesRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = GamesCreate(**row)
-            obj = Games(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
@@ -0,0 +1,177 @@
+"""
+In-season incremental scrape scheduling keyed to the NFL calendar.
+
+After each game window only some pages can have changed:
+
+- Thursday, Saturday and Sunday games update scores and the standings,
+  so the next morning re-scrapes ``games`` and ``standings`` only.
+- The morning after Monday night closes the week: every season-aggregate
+  table (team, player, kicking, punting, returns, scoring) is re-scraped
+  once, instead of after every partial window.
+- In the postseason only ``games`` changes (PFR season pages cover the
+  regular season).
+
+Only the current season is ever scheduled; completed seasons are frozen.
+Units are enqueued on the shared ``scrape_tasks`` queue at in-season
+priority. Triggers coalesce: a table already pending or leased is not
+queued again, and a table is only re-queued if its last scrape finished
+before the latest trigger, so a scheduler that was down over several
+windows enqueues each table once.
+"""
+
+import logging
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, time, timedelta
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.nfl_calendar import (
+    MONDAY,
+    SATURDAY,
+    SUNDAY,
+    THURSDAY,
+    is_postseason,
+    is_regular_season,
+    is_season_complete,
+    kickoff,
+    season_for,
+)
+from src.core.rate_limit import ScrapePriority
+from src.entities.scrape_task import ScrapeTask
+from src.repositories.scrape_task_repo import DONE, FAILED, ScrapeTaskRepository
+from src.services.scrape_queue_service import QUEUE_PRIORITIES, pages
+from src.services.stat_registry import StatType, page_url
+
+logger = logging.getLogger(__name__)
+
+PARTIAL_WEEK_TABLES = frozenset({StatType.games, StatType.standings})
+WEEK_COMPLETE_TABLES = frozenset(StatType)
+POSTSEASON_TABLES = frozenset({StatType.games})
+
+
+@dataclass(frozen=True)
+class GameWindow:
+    name: str
+    weekday: int  # day the games are played
+    tables: frozenset[StatType]  # regular-season tables that change
+
+
+GAME_WINDOWS = (
+    GameWindow("thu", THURSDAY, PARTIAL_WEEK_TABLES),
+    GameWindow("sat", SATURDAY, PARTIAL_WEEK_TABLES),
+    GameWindow("sun", SUNDAY, PARTIAL_WEEK_TABLES),
+    # Fires on Tuesday even in weeks without a Monday game (e.g. week 18)
+    GameWindow("mon", MONDAY, WEEK_COMPLETE_TABLES),
+)
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands timezone-aware columns back naive
+    return value if value.tzinfo else value.replace(tzinfo=UTC)
+
+
+def window_triggers(now: datetime) -> list[tuple[GameWindow, date, datetime]]:
+    """
+    Game windows of the past week whose trigger time has passed.
+
+    Returns:
+        (window, game day, trigger time) tuples, oldest first
+    """
+    now = _as_utc(now)
+    triggers = []
+    for days_ago in range(8, -1, -1):
+        game_day = now.date() - timedelta(days=days_ago)
+        if not (is_regular_season(game_day) or is_postseason(game_day)):
+            continue
+        trigger = datetime.combine(
+            game_day + timedelta(days=1),
+            time(settings.SCHEDULER_TRIGGER_HOUR_UTC),
+            tzinfo=UTC,
+        )
+        if trigger > now:
+            continue
+        for window in GAME_WINDOWS:
+            if window.weekday == game_day.weekday():
+                triggers.append((window, game_day, trigger))
+    return triggers
+
+
+def due_tables(now: datetime) -> dict[StatType, datetime]:
+    """Latest trigger time per table, coalesced across the past week's windows."""
+    due: dict[StatType, datetime] = {}
+    for window, game_day, trigger in window_triggers(now):
+        tables = window.tables if is_regular_season(game_day) else POSTSEASON_TABLES
+        for stat_type in tables:
+            due[stat_type] = max(trigger, due.get(stat_type, trigger))
+    return due
+
+
+def needs_scrape(
+    task: ScrapeTask | None, stat_type: StatType, trigger: datetime
+) -> bool:
+    """
+    True unless the table is already queued or was scraped since the trigger.
+
+    ``task`` is the queue entry for the table's page, which other tables
+    parsed from the same page share.
+    """
+    if task is None or str(stat_type) not in task.stat_type_names:
+        return True
+    if task.status not in (DONE, FAILED):
+        return False  # pending or leased: coalesce into the queued scrape
+    finished = task.completed_at or task.updated_at
+    return _as_utc(finished) < trigger
+
+
+def schedule_in_season(now: datetime | None = None) -> dict:
+    """
+    Enqueue the current season's tables that changed since they were scraped.
+
+    Returns:
+        Summary with the season, enqueued stat types, and a skip reason
+        when nothing is in season
+    """
+    now = _as_utc(now or datetime.now(UTC))
+    season = season_for(now.date())
+    summary: dict = {"season": season, "enqueued": []}
+
+    if is_season_complete(season, now.date()):
+        return {**summary, "skipped": "season complete"}
+    if now.date() < kickoff(season):
+        return {**summary, "skipped": "before kickoff"}
+
+    due = due_tables(now)
+    if not due:
+        return summary
+
+    db = SessionLocal()
+    try:
+        repo = ScrapeTaskRepository(db)
+        existing = {t.url: t for t in repo.find_by_season(season)}
+        queued = [
+            stat_type
+            for stat_type, trigger in sorted(due.items())
+            if needs_scrape(
+                existing.get(page_url(stat_type, season)), stat_type, trigger
+            )
+        ]
+        for url, stat_types in pages(queued, season).items():
+            repo.enqueue(
+                url,
+                season,
+                stat_types,
+                priority=QUEUE_PRIORITIES[ScrapePriority.in_season],
+                max_attempts=settings.SCRAPE_TASK_MAX_ATTEMPTS,
+                commit=False,
+            )
+        db.commit()
+        summary["enqueued"] = [str(stat_type) for stat_type in queued]
+    finally:
+        db.close()
+
+    if summary["enqueued"]:
+        logger.info(
+            "Enqueued in-season scrapes",
+            extra={"season": season, "stat_types": summary["enqueued"]},
+        )
+    return summary
@@ -0,0 +1,196 @@
+"""
+Fetch-and-store for season-scoped stat pages, with change detection.
+
+Every table on a fetched page is fingerprinted (a hash of its normalized
+HTML fragment, see ``table_fingerprint``) before any parsing. When every
+fingerprint matches the last successful ingest of that URL, parsing,
+validation and DB writes are skipped and the scrape reports ``unchanged``
+— the common case when re-scraping finished seasons. Fingerprints are
+kept per stat type: stat types that parse the same page (``kicking`` and
+``kicking_stats``) each ingest it once. Changed pages are
+written row by row through ``row_diff_service``, so a mid-season stat
+correction touches (and logs) only the rows PFR changed.
+
+``SCRAPE_DISPATCH`` maps each stat type to its scrape coroutine (used by
+the API); ``scrape_page`` fetches a page once for every stat type parsed
+from it (used by the scrape task worker).
+"""
+
+import logging
+from collections.abc import Callable, Coroutine, Iterable
+from functools import partial
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.core.database import SessionLocal
+from src.core.run_metrics import stage
+from src.core.scraper_utils import fetch_page, retry_with_backoff, table_fingerprint
+from src.repositories.table_fingerprint_repo import TableFingerprintRepository
+from src.services.cache_invalidation_service import invalidate
+from src.services.row_diff_service import apply_row_diff, new_scrape_run
+from src.services.scrape_run_service import recorded_run
+from src.services.stat_registry import (
+    STAT_ENTITIES,
+    StatType,
+    get_service,
+    page_url,
+    table_ids,
+    validate_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def page_fingerprints(
+    stat_type: StatType | str, page_source: str
+) -> dict[str, str | None]:
+    """Fingerprint every table a stat type is parsed from."""
+    return {
+        table_id: table_fingerprint(page_source, table_id)
+        for table_id in table_ids(stat_type)
+    }
+
+
+def ingest_page(
+    db: Session,
+    stat_type: StatType | str,
+    url: str,
+    season: int,
+    page_source: str,
+    *,
+    force: bool = False,
+    scrape_run: str | None = None,
+) -> dict[str, Any]:
+    """
+    Parse and store a fetched page unless its tables are unchanged.
+
+    The caller commits (fingerprints are saved in the same transaction as
+    the rows, so a failed write never records a fingerprint).
+
+    Args:
+        db: Session to write through
+        stat_type: Stat type to parse from the page
+        url: URL the page was fetched from
+        season: Season the page covers
+        page_source: Raw page HTML
+        force: Parse and store even if the fingerprints match
+        scrape_run: Run id recorded on logged row changes (default: new)
+
+    Returns:
+        ``{"status": "stored", ...}`` with inserted/updated/deleted/unchanged
+        row counts, or an ``{"status": "unchanged", ...}`` report
+    """
+    stat_type = StatType(stat_type)
+    repo = TableFingerprintRepository(db)
+    fingerprints = page_fingerprints(stat_type, page_source)
+
+    if not force and repo.unchanged(url, stat_type, fingerprints):
+        repo.mark_checked(url, stat_type, commit=False)
+        logger.info("Tables unchanged, skipping ingest", extra={"url": url})
+        return {
+            "status": "unchanged",
+            "url": url,
+            "season": season,
+            "tables": list(fingerprints),
+        }
+
+    scrape_run = scrape_run or new_scrape_run()
+    with stage("parse"):
+        parsed = get_service(stat_type).parse_page(page_source, season)
+    with stage("validate"):
+        rows = validate_rows(stat_type, parsed)
+    with stage("write"):
+        counts = apply_row_diff(db, stat_type, season, rows, scrape_run=scrape_run)
+        repo.save(
+            url,
+            stat_type,
+            fingerprints,
+            season=season,
+            rows_ingested=len(rows),
+            commit=False,
+        )
+    return {
+        "status": "stored",
+        "stat_type": str(stat_type),
+        "season": season,
+        "rows": len(rows),
+        **counts,
+        "scrape_run": scrape_run,
+    }
+
+
+async def scrape_page(
+    url: str,
+    season: int,
+    stat_types: Iterable[StatType | str],
+    *,
+    force: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Fetch a page once and ingest it for each stat type parsed from it.
+
+    The page is always fetched from the site, never from the shared page
+    cache. Every stat type is recorded in the ``scrape_runs`` ledger; the
+    fetch is timed on the first one. A failing stat type raises and stops
+    the rest.
+
+    Returns:
+        One ``ingest_page`` result per stat type
+    """
+    page_source: str | None = None
+    results = []
+    for stat_type in stat_types:
+        with recorded_run(str(stat_type), season, url) as run:
+            if page_source is None:
+                # Scrapes exist to see the current page: skip the page cache,
+                # which only backfills read from
+                with stage("fetch"):
+                    page_source = retry_with_backoff(
+                        fetch_page, url, url=url, use_cache=False
+                    )
+
+            db = SessionLocal()
+            try:
+                result = ingest_page(
+                    db,
+                    stat_type,
+                    url,
+                    season,
+                    page_source,
+                    force=force,
+                    scrape_run=run.run_id,
+                )
+                with stage("write"):
+                    db.commit()
+            except Exception:
+                db.rollback()
+                raise
+            finally:
+                db.close()
+
+            run.outcome = result["status"]
+            if result["status"] == "stored":
+                run.rows_in = result["rows"]
+                run.rows_changed = (
+                    result["inserted"] + result["updated"] + result["deleted"]
+                )
+                if run.rows_changed:
+                    # Other processes evict when their watcher sees the version bump
+                    invalidate(STAT_ENTITIES[StatType(stat_type)].__tablename__, season)
+            results.append(result)
+    return results
+
+
+async def scrape_stat(stat_type: StatType | str, season: int, *, force: bool = False):
+    """Fetch a stat page for a season and ingest it (see ``scrape_page``)."""
+    (result,) = await scrape_page(
+        page_url(stat_type, season), season, [stat_type], force=force
+    )
+    return result
+
+
+# Handlers accept ``force=True`` to ingest even when fingerprints match
+SCRAPE_DISPATCH: dict[StatType, Callable[..., Coroutine[Any, Any, Any]]] = {
+    stat_type: partial(scrape_stat, stat_type) for stat_type in StatType
+}
@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.kicking_stats_dto import KickingStatsCreate
-from src.entities.kicking_stats import KickingStats
-from src.repositories.kicking_stats_repo import KickingStatsRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table, pfr_player_id
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/kicking.htm"
 PFR_TABLE_ID = "kicking"
@@ -51,9 +37,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -84,6 +69,9 @@ def get_dataframe(season: int) -> list[dict]:
         if "player_name" in row and row["player_name"]:
             row["player_name"] = row["player_name"].rstrip("*+")
 
+        # PFR's player id: the identity behind the name (players table)
+        row["pfr_id"] = pfr_player_id(player_cell)
+
         rk_cell = tr.find("th", {"data-stat": "ranker"})
         if rk_cell and rk_cell.text.strip():
             row["rk"] = clean_value(rk_cell.text.strip())
@@ -92,24 +80,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = KickingStatsRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = KickingStatsCreate(**row)
-            obj = KickingStats(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
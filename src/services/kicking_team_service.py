@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.kicking_dto import KickingCreate
-from src.entities.kicking import Kicking
-from src.repositories.kicking_repo import KickingRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/kicking.htm"
 PFR_TABLE_ID = "kicking"
@@ -47,9 +33,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -86,24 +71,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = KickingRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = KickingCreate(**row)
-            obj = Kicking(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
@@ -1,15 +1,19 @@
 """Service layer for odds business logic. NO SQL here."""
 
+import logging
 from datetime import UTC, datetime
 from typing import Any, cast
 
 import httpx
 from sqlalchemy.orm import Session
 
+from src.core import teams
 from src.core.config import settings
 from src.dtos.odds_dto import OddsCreate
 from src.repositories.odds_repo import OddsRepository
 
+logger = logging.getLogger(__name__)
+
 
 class OddsService:
     """
@@ -87,9 +91,13 @@ class OddsService:
             home_team = game.get("home_team", "")
             away_team = game.get("away_team", "")
 
-            # Convert full team names to abbreviations (simplified - would need mapping)
-            home_abbr = self._team_name_to_abbr(home_team)
-            away_abbr = self._team_name_to_abbr(away_team)
+            home = teams.lookup(home_team)
+            away = teams.lookup(away_team)
+            if home is None or away is None:
+                logger.warning(
+                    "Skipping odds for unknown team in %s at %s", away_team, home_team
+                )
+                continue
 
             # Parse bookmaker data
             for bookmaker in game.get("bookmakers", []):
@@ -129,8 +137,8 @@ class OddsService:
                     season=season,
                     week=week,
                     game_date=game_date,
-                    home_team=home_abbr,
-                    away_team=away_abbr,
+                    home_team=home.abbr,
+                    away_team=away.abbr,
                     sportsbook=sportsbook,
                     spread_home=spread_home,
                     spread_away=spread_away,
@@ -145,25 +153,6 @@ class OddsService:
 
         return odds_dtos
 
-    def _team_name_to_abbr(self, full_name: str) -> str:
-        """
-        Convert full team name to abbreviation.
-        TODO: Implement full mapping or load from database.
-        """
-        # Simplified mapping - should be more comprehensive
-        team_map = {
-            "Kansas City Chiefs": "KC",
-            "Baltimore Ravens": "BAL",
-            "San Francisco 49ers": "SF",
-            "Philadelphia Eagles": "PHI",
-            "Dallas Cowboys": "DAL",
-            "Buffalo Bills": "BUF",
-            "Miami Dolphins": "MIA",
-            "Detroit Lions": "DET",
-            # Add all 32 teams...
-        }
-        return team_map.get(full_name, full_name[:3].upper())
-
     async def fetch_and_store_current_odds(
         self, season: int, week: int, is_opening: bool = False, is_closing: bool = False
     ) -> list[int]:
@@ -205,7 +194,7 @@ class OddsService:
         Args:
             season: Season year
             week: Week number
-            team: Team abbreviation
+            team: Team name or abbreviation (any alias in ``src.core.teams``)
             sportsbook: Sportsbook name (default: consensus)
 
         Returns:
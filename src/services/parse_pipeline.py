@@ -0,0 +1,299 @@
+"""
+Multi-process parse stage for archive-driven backfills.
+
+Archived pages are grouped into ``PageTask``s (one page, every stat type
+parsed from it — e.g. ``kicking.htm`` feeds both ``kicking`` and
+``kicking_stats``) and fanned out to a process pool in chunks. Workers read
+and decompress pages straight from the archive, parse and DTO-validate the
+rows, and send back compact columnar ``ParsedTable``s, so neither raw HTML
+nor per-row dicts cross the process boundary.
+
+The parent owns the database: ``BatchWriter`` diffs several
+(stat type, season) tables per transaction against their stored row
+hashes and bulk-writes only the rows that changed.
+"""
+
+import logging
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.page_archive import ArchivedPage, PageArchive
+from src.services.cache_invalidation_service import invalidate
+from src.services.row_diff_service import apply_row_diff, new_scrape_run
+from src.services.season_swap_service import swap_season
+from src.services.stat_registry import (
+    STAT_ENTITIES,
+    StatType,
+    get_service,
+    page_url,
+    validate_rows,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PageTask:
+    """One archived page and the stat types to parse from it."""
+
+    page: ArchivedPage
+    season: int
+    stat_types: tuple[str, ...]
+
+
+@dataclass
+class ParsedTable:
+    """Validated rows for one (stat type, season), stored column-wise."""
+
+    stat_type: str
+    season: int
+    # One list of values per column, all the same length
+    columns: dict[str, list[Any]] = field(default_factory=dict)
+    error: str | None = None
+
+    def __len__(self) -> int:
+        return len(next(iter(self.columns.values()), ()))
+
+    def rows(self) -> list[dict]:
+        """Row dicts to write, rebuilt from the columns."""
+        names = tuple(self.columns)
+        return [dict(zip(names, v, strict=True)) for v in zip(*self.columns.values())]
+
+    @classmethod
+    def from_rows(cls, stat_type: str, season: int, rows: list[dict]) -> "ParsedTable":
+        names = dict.fromkeys(k for row in rows for k in row)
+        return cls(stat_type, season, {c: [row.get(c) for row in rows] for c in names})
+
+
+def plan_tasks(
+    archive: PageArchive,
+    stat_types: Iterable[StatType],
+    seasons: Iterable[int],
+) -> tuple[list[PageTask], list[tuple[StatType, int]]]:
+    """
+    Resolve (stat type, season) pairs to their latest archived pages.
+
+    Returns:
+        (tasks, missing): one task per distinct page, and the pairs whose
+        page has never been archived
+    """
+    by_url: dict[str, tuple[int, list[str]]] = {}
+    missing: list[tuple[StatType, int]] = []
+    for season in seasons:
+        for stat_type in stat_types:
+            url = page_url(stat_type, season)
+            by_url.setdefault(url, (season, []))[1].append(str(stat_type))
+
+    tasks: list[PageTask] = []
+    for url, (season, types) in by_url.items():
+        page = archive.latest(url)
+        if page is None:
+            missing.extend((StatType(st), season) for st in types)
+        else:
+            tasks.append(PageTask(page, season, tuple(types)))
+    return tasks, missing
+
+
+_worker_archives: dict[tuple[str, str], PageArchive] = {}
+
+
+def parse_chunk(root: str, codec: str, tasks: list[PageTask]) -> list[ParsedTable]:
+    """
+    Parse a chunk of archived pages (runs inside pool workers).
+
+    Parse or validation errors are returned per table rather than raised,
+    so one bad page does not discard the rest of its chunk.
+    """
+    key = (root, codec)
+    if key not in _worker_archives:
+        _worker_archives[key] = PageArchive(root, codec)
+    archive = _worker_archives[key]
+
+    results: list[ParsedTable] = []
+    for task in tasks:
+        try:
+            page_source = archive.read(task.page)
+        except Exception as e:
+            results.extend(
+                ParsedTable(st, task.season, error=str(e)) for st in task.stat_types
+            )
+            continue
+        for stat_type in task.stat_types:
+            try:
+                rows = get_service(stat_type).parse_page(page_source, task.season)
+                rows = validate_rows(stat_type, rows)
+            except Exception as e:
+                results.append(ParsedTable(stat_type, task.season, error=str(e)))
+                continue
+            results.append(ParsedTable.from_rows(stat_type, task.season, rows))
+    return results
+
+
+def parse_pages(
+    archive: PageArchive,
+    tasks: list[PageTask],
+    *,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> Iterator[ParsedTable]:
+    """
+    Parse archived pages across a process pool.
+
+    Args:
+        archive: Archive the tasks were planned against
+        tasks: Pages to parse (see ``plan_tasks``)
+        workers: Processes (None = PARSE_WORKERS or one per core, 0 = inline)
+        chunk_size: Pages per worker task (None = PARSE_CHUNK_SIZE)
+
+    Yields:
+        One ParsedTable per (stat type, season), in completion order
+    """
+    if workers is None:
+        workers = settings.PARSE_WORKERS
+    if workers is None:
+        workers = os.cpu_count() or 1
+    chunk_size = max(1, chunk_size or settings.PARSE_CHUNK_SIZE)
+    chunks = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    root = str(archive.root)
+
+    if workers == 0:
+        for chunk in chunks:
+            yield from parse_chunk(root, archive.codec, chunk)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(parse_chunk, root, archive.codec, chunk): chunk
+            for chunk in chunks
+        }
+        for future in as_completed(futures):
+            try:
+                yield from future.result()
+            except Exception as e:
+                logger.error("Parse worker failed: %s", e)
+                for task in futures[future]:
+                    for stat_type in task.stat_types:
+                        yield ParsedTable(stat_type, task.season, error=str(e))
+
+
+class BatchWriter:
+    """
+    Replace parsed (stat type, season) tables in batched transactions.
+
+    Tables are buffered until ``batch_rows`` rows are pending, then each is
+    diffed against its stored rows (see ``row_diff_service``) or, with
+    ``write_mode="swap"``, staged and swapped in (see
+    ``season_swap_service``) in a single transaction. If a batch fails it is
+    rolled back and retried table by table, so only the offending table is
+    reported as failed.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        batch_rows: int | None = None,
+        *,
+        scrape_run: str | None = None,
+        write_mode: str | None = None,
+    ) -> None:
+        self.session_factory = session_factory
+        self.batch_rows = batch_rows or settings.PARSE_WRITE_BATCH_ROWS
+        self.write_mode = write_mode or settings.PARSE_WRITE_MODE
+        if self.write_mode not in ("diff", "swap"):
+            raise ValueError(f"Unknown write mode: {self.write_mode!r}")
+        self.scrape_run = scrape_run or new_scrape_run()
+        self._pending: list[ParsedTable] = []
+        self._pending_rows = 0
+
+    def add(self, table: ParsedTable) -> list[dict]:
+        """Buffer a table; returns results for any batch this flushed."""
+        self._pending.append(table)
+        self._pending_rows += len(table)
+        if self._pending_rows >= self.batch_rows:
+            return self.flush()
+        return []
+
+    def flush(self) -> list[dict]:
+        """Write every buffered table and return one result per table."""
+        batch, self._pending, self._pending_rows = self._pending, [], 0
+        if not batch:
+            return []
+        try:
+            results = [
+                _stored(t, counts) for t, counts in zip(batch, self._write(batch))
+            ]
+            _invalidate_changed(results)
+            return results
+        except Exception:
+            logger.warning("Batch write failed, retrying per table", exc_info=True)
+
+        results = []
+        for table in batch:
+            try:
+                (counts,) = self._write([table])
+                results.append(_stored(table, counts))
+            except Exception as e:
+                logger.error(
+                    "Failed to store %s %d",
+                    table.stat_type,
+                    table.season,
+                    exc_info=True,
+                )
+                results.append(
+                    {
+                        "stat_type": table.stat_type,
+                        "season": table.season,
+                        "status": "failed",
+                        "error": str(e),
+                    }
+                )
+        _invalidate_changed(results)
+        return results
+
+    def _write(self, tables: list[ParsedTable]) -> list[dict[str, int]]:
+        write = swap_season if self.write_mode == "swap" else apply_row_diff
+        db = self.session_factory()
+        try:
+            counts = [
+                write(
+                    db,
+                    table.stat_type,
+                    table.season,
+                    table.rows(),
+                    scrape_run=self.scrape_run,
+                )
+                for table in tables
+            ]
+            db.commit()
+            return counts
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+
+def _invalidate_changed(results: list[dict]) -> None:
+    """Evict this process's cached reads of the committed, changed tables."""
+    for result in results:
+        if result["status"] == "stored" and (
+            result["inserted"] or result["updated"] or result["deleted"]
+        ):
+            table_name = STAT_ENTITIES[StatType(result["stat_type"])].__tablename__
+            invalidate(table_name, result["season"])
+
+
+def _stored(table: ParsedTable, counts: dict[str, int]) -> dict:
+    return {
+        "stat_type": table.stat_type,
+        "season": table.season,
+        "status": "stored",
+        "rows": len(table),
+        **counts,
+    }
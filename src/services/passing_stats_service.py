@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.passing_stats_dto import PassingStatsCreate
-from src.entities.passing_stats import PassingStats
-from src.repositories.passing_stats_repo import PassingStatsRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table, pfr_player_id
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/passing.htm"
 PFR_TABLE_ID = "passing"
@@ -54,9 +40,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -87,6 +72,9 @@ def get_dataframe(season: int) -> list[dict]:
         if "player_name" in row and row["player_name"]:
             row["player_name"] = row["player_name"].rstrip("*+")
 
+        # PFR's player id: the identity behind the name (players table)
+        row["pfr_id"] = pfr_player_id(player_cell)
+
         rk_cell = tr.find("th", {"data-stat": "ranker"})
         if rk_cell and rk_cell.text.strip():
             row["rk"] = clean_value(rk_cell.text.strip())
@@ -95,24 +83,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = PassingStatsRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = PassingStatsCreate(**row)
-            obj = PassingStats(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.punting_stats_dto import PuntingStatsCreate
-from src.entities.punting_stats import PuntingStats
-from src.repositories.punting_stats_repo import PuntingStatsRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table, pfr_player_id
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/punting.htm"
 PFR_TABLE_ID = "punting"
@@ -42,9 +28,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -74,6 +59,9 @@ def get_dataframe(season: int) -> list[dict]:
         if "player_name" in row and row["player_name"]:
             row["player_name"] = row["player_name"].rstrip("*+")
 
+        # PFR's player id: the identity behind the name (players table)
+        row["pfr_id"] = pfr_player_id(player_cell)
+
         rk_cell = tr.find("th", {"data-stat": "ranker"})
         if rk_cell and rk_cell.text.strip():
             row["rk"] = clean_value(rk_cell.text.strip())
@@ -82,24 +70,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = PuntingStatsRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = PuntingStatsCreate(**row)
-            obj = PuntingStats(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
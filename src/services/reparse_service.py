@@ -0,0 +1,74 @@
+"""
+Rebuild stat tables from the raw page archive, with no network access.
+
+Parsing runs in a process pool (see ``parse_pipeline``); each worker loads
+its pages from the archive itself so only compact parsed tables cross the
+process boundary. The parent process owns the database session and
+replaces whole (stat type, season) tables in batched transactions.
+"""
+
+import logging
+from collections.abc import Iterable, Iterator
+
+from src.core.database import SessionLocal
+from src.core.page_archive import get_archive
+from src.services.parse_pipeline import BatchWriter, parse_pages, plan_tasks
+from src.services.stat_registry import StatType
+
+logger = logging.getLogger(__name__)
+
+
+def reparse(
+    stat_types: Iterable[StatType],
+    seasons: Iterable[int],
+    *,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+    batch_rows: int | None = None,
+    write_mode: str | None = None,
+) -> Iterator[dict]:
+    """
+    Re-parse archived pages and rebuild the matching stat tables.
+
+    Args:
+        stat_types: Stat types to rebuild
+        seasons: Seasons to rebuild
+        workers: Parse processes (None = PARSE_WORKERS or one per core,
+            0 = parse inline)
+        chunk_size: Archived pages per worker task (None = PARSE_CHUNK_SIZE)
+        batch_rows: Rows per write transaction (None = PARSE_WRITE_BATCH_ROWS)
+        write_mode: "diff" or "swap" (None = PARSE_WRITE_MODE)
+
+    Yields:
+        One result dict per (stat type, season), in completion order
+
+    Raises:
+        RuntimeError: If PAGE_ARCHIVE_DIR is not configured
+    """
+    archive = get_archive()
+    if archive is None:
+        raise RuntimeError("PAGE_ARCHIVE_DIR is not configured")
+
+    tasks, missing = plan_tasks(
+        archive, [StatType(st) for st in stat_types], list(seasons)
+    )
+    for stat_type, season in missing:
+        yield {"stat_type": str(stat_type), "season": season, "status": "missing"}
+
+    writer = BatchWriter(SessionLocal, batch_rows, write_mode=write_mode)
+    for table in parse_pages(archive, tasks, workers=workers, chunk_size=chunk_size):
+        if table.error is not None:
+            yield _parse_failure(table.stat_type, table.season, table.error)
+            continue
+        yield from writer.add(table)
+    yield from writer.flush()
+
+
+def _parse_failure(stat_type: str, season: int, error: str) -> dict:
+    logger.error("Failed to parse archived %s %d: %s", stat_type, season, error)
+    return {
+        "stat_type": stat_type,
+        "season": season,
+        "status": "failed",
+        "error": error,
+    }
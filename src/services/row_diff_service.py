@@ -0,0 +1,273 @@
+"""
+Row-level diff ingestion for the season-scoped stat tables.
+
+Every stat row carries a ``row_hash`` of its ingested values. Ingesting a
+(stat type, season) loads the stored (natural key -> id, hash) map in one
+query, then writes only what differs:
+
+- keys not stored yet are inserted,
+- keys whose hash changed are updated in place (ids are kept),
+- stored keys missing from the page are deleted.
+
+Player rows are keyed by ``(player_id, season, tm)``, so two players who
+share a name stay apart. A row without a PFR id has no ``player_id`` and
+is keyed by its ``player_name`` instead. A stored row whose ``player_id``
+is still NULL (stored before players were tracked) is matched to the one
+incoming row with its name and gets that row's ``player_id``, even when
+nothing else changed; that is not logged as a change.
+
+Each write is appended to ``stat_changes`` with the old and new hash and
+the scrape run that caused it, so downstream consumers can pull changes
+after a cursor (see ``change_feed_service``) instead of reloading whole
+seasons, and the (table, season) data version is bumped so API processes
+drop cached reads of it (see ``cache_invalidation_service``).
+"""
+
+import hashlib
+import json
+import uuid
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import UniqueConstraint, inspect
+from sqlalchemy.orm import Session
+
+from src.repositories.base_repo import BaseRepository
+from src.repositories.data_version_repo import DataVersionRepository
+from src.repositories.player_repo import PlayerRepository
+from src.repositories.season_partition_repo import SeasonPartitionRepository
+from src.repositories.stat_change_repo import StatChangeRepository
+from src.services.stat_registry import STAT_ENTITIES, StatType
+
+# Surrogate ids resolved on write are not values of the row: hashing them
+# would make every stored row look changed when its id is first resolved
+_NOT_HASHED = frozenset({"id", "row_hash", "player_id"})
+
+# Key attributes that may be NULL, and what a row without one is keyed by
+# instead (the player tables' partial unique index on the name)
+KEY_FALLBACKS = {"player_id": "player_name"}
+
+# A row's natural key as (attribute, value) pairs, fallbacks applied
+RowKey = tuple[tuple[str, Any], ...]
+
+
+def new_scrape_run() -> str:
+    """Identifier recorded on every change written by one ingest run."""
+    return uuid.uuid4().hex
+
+
+def _canonical(value: dict[str, Any]) -> str:
+    return json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+
+
+def row_hash(row: dict[str, Any]) -> str:
+    """SHA-256 of a validated row's values (key order and id ignored)."""
+    payload = {k: v for k, v in row.items() if k not in _NOT_HASHED}
+    return hashlib.sha256(_canonical(payload).encode("utf-8")).hexdigest()
+
+
+def natural_key(stat_type: StatType | str) -> tuple[str, ...]:
+    """
+    Attribute names of the stat table's unique key, e.g. ("tm", "season").
+
+    Use ``row_key`` to key a row: it applies ``KEY_FALLBACKS``.
+    """
+    entity = STAT_ENTITIES[StatType(stat_type)]
+    mapper = inspect(entity)
+    table: Any = mapper.local_table
+    for constraint in table.constraints:
+        if isinstance(constraint, UniqueConstraint):
+            return tuple(
+                mapper.get_property_by_column(column).key
+                for column in constraint.columns
+            )
+    raise ValueError(f"{entity.__name__} has no unique key to diff on")
+
+
+def key_columns(key: Sequence[str]) -> tuple[str, ...]:
+    """The attributes ``row_key`` reads for ``key``: the key and its fallbacks."""
+    return (*key, *(KEY_FALLBACKS[attr] for attr in key if attr in KEY_FALLBACKS))
+
+
+def row_key(row: Mapping[str, Any], key: Sequence[str]) -> RowKey:
+    """``row``'s natural key, keyed by the fallback where a key value is NULL."""
+    pairs = []
+    for attr in key:
+        if row.get(attr) is None and attr in KEY_FALLBACKS:
+            attr = KEY_FALLBACKS[attr]
+        pairs.append((attr, row.get(attr)))
+    return tuple(pairs)
+
+
+def format_row_key(key: RowKey) -> str:
+    """The ``stat_changes.row_key`` form of a row key (canonical JSON)."""
+    return _canonical(dict(key))
+
+
+def stored_row_keys(
+    repo: BaseRepository[Any],
+    season: int,
+    key: Sequence[str],
+    rows: Sequence[dict[str, Any]],
+) -> tuple[dict[RowKey, tuple[int, str | None]], set[int]]:
+    """
+    A season's stored (row key -> id, hash) map, lined up with ``rows``.
+
+    A stored row keyed by a fallback (its ``player_id`` is NULL) is re-keyed
+    to the incoming row that has that fallback key, if exactly one does and
+    its own key is not stored yet, so it is matched instead of replaced.
+
+    Returns:
+        The map, and the ids of the re-keyed rows (whose ids need writing)
+    """
+    columns = key_columns(key)
+    stored = {
+        row_key(dict(zip(columns, values, strict=True)), key): found
+        for values, found in repo.row_hashes(season, columns).items()
+    }
+    nullable = {attr: None for attr in key if attr in KEY_FALLBACKS}
+    if not nullable:
+        return stored, set()
+
+    fallbacks = [row_key({**row, **nullable}, key) for row in rows]
+    counts = Counter(fallbacks)
+    rekeyed: set[int] = set()
+    for row, fallback in zip(rows, fallbacks, strict=True):
+        own = row_key(row, key)
+        if own == fallback or own in stored or counts[fallback] != 1:
+            continue
+        if fallback in stored:
+            stored[own] = stored.pop(fallback)
+            rekeyed.add(stored[own][0])
+    return stored, rekeyed
+
+
+@dataclass
+class RowDiff:
+    inserts: list[dict[str, Any]] = field(default_factory=list)
+    updates: list[dict[str, Any]] = field(default_factory=list)
+    deletes: list[int] = field(default_factory=list)
+    changes: list[dict[str, Any]] = field(default_factory=list)
+    unchanged: int = 0
+
+    def summary(self) -> dict[str, int]:
+        return {
+            "inserted": len(self.inserts),
+            "updated": len(self.updates),
+            "deleted": len(self.deletes),
+            "unchanged": self.unchanged,
+        }
+
+
+def diff_rows(
+    stored: dict[RowKey, tuple[int, str | None]],
+    rows: Sequence[dict[str, Any]],
+    key: Sequence[str],
+    *,
+    table_name: str,
+    season: int,
+    scrape_run: str,
+    rekeyed: set[int] | frozenset[int] = frozenset(),
+) -> RowDiff:
+    """
+    Compare incoming rows with the stored (row key -> id, hash) map.
+
+    Stored rows in ``rekeyed`` (see ``stored_row_keys``) are rewritten even
+    when unchanged, to store their resolved ids; that is not logged.
+
+    Raises:
+        ValueError: If two incoming rows share a natural key
+    """
+    now = datetime.now(UTC)
+    diff = RowDiff()
+    seen: set[RowKey] = set()
+
+    def log(rk: RowKey, old: str | None, new: str | None) -> None:
+        diff.changes.append(
+            {
+                "table_name": table_name,
+                "season": season,
+                "row_key": format_row_key(rk),
+                "old_hash": old,
+                "new_hash": new,
+                "scrape_run": scrape_run,
+                "changed_at": now,
+            }
+        )
+
+    for row in rows:
+        rk = row_key(row, key)
+        if rk in seen:
+            raise ValueError(f"Duplicate {table_name} key {dict(rk)}")
+        seen.add(rk)
+
+        new_hash = row_hash(row)
+        if rk not in stored:
+            diff.inserts.append({**row, "row_hash": new_hash})
+            log(rk, None, new_hash)
+            continue
+        row_id, old_hash = stored[rk]
+        if old_hash == new_hash:
+            diff.unchanged += 1
+            if row_id in rekeyed:
+                diff.updates.append({**row, "id": row_id, "row_hash": new_hash})
+            continue
+        diff.updates.append({**row, "id": row_id, "row_hash": new_hash})
+        log(rk, old_hash, new_hash)
+
+    for rk, (row_id, old_hash) in stored.items():
+        if rk not in seen:
+            diff.deletes.append(row_id)
+            log(rk, old_hash, None)
+    return diff
+
+
+def apply_row_diff(
+    db: Session,
+    stat_type: StatType | str,
+    season: int,
+    rows: Sequence[dict[str, Any]],
+    *,
+    scrape_run: str,
+) -> dict[str, int]:
+    """
+    Write only the changed rows of a (stat type, season) table (caller commits).
+
+    Args:
+        db: Session to write through
+        stat_type: Stat type the rows belong to
+        season: Season being replaced
+        rows: Validated rows keyed by attribute name (see ``validate_rows``)
+            whose ``pfr_id`` is resolved to a ``player_id`` on player tables
+        scrape_run: Run id recorded on the logged changes
+
+    Returns:
+        Counts of inserted, updated, deleted and unchanged rows
+    """
+    stat_type = StatType(stat_type)
+    entity = STAT_ENTITIES[stat_type]
+    SeasonPartitionRepository(db, entity).ensure(season)
+    repo: BaseRepository[Any] = BaseRepository(db, entity)
+    key = natural_key(stat_type)
+    rows = PlayerRepository(db).with_player_ids(rows)
+    stored, rekeyed = stored_row_keys(repo, season, key, rows)
+
+    diff = diff_rows(
+        stored,
+        rows,
+        key,
+        table_name=entity.__tablename__,
+        season=season,
+        scrape_run=scrape_run,
+        rekeyed=rekeyed,
+    )
+    repo.delete_by_ids(diff.deletes, commit=False)
+    repo.bulk_update(diff.updates, commit=False)
+    repo.bulk_insert(diff.inserts, commit=False)
+    StatChangeRepository(db).append(diff.changes, commit=False)
+    if diff.changes:
+        DataVersionRepository(db).bump(entity.__tablename__, season, commit=False)
+    return diff.summary()
@@ -0,0 +1,216 @@
+"""
+Shared scrape work queue: enqueue (stat type, season) scrapes and run a
+worker that leases them and ingests them through ``ingest_service``.
+
+Scrapes are queued per page: stat types parsed from the same PFR page and
+season share one task, which fetches the page once and ingests it for
+each of them (``scrape_page``).
+
+Several scraper nodes can run ``python -m src.worker run`` against the same
+database. Each holds at most one lease at a time and renews it from a
+heartbeat thread while the scrape runs; if a node dies, its lease expires
+and the next worker to poll re-queues the task.
+
+Task priorities are plain integers (higher leases first). The bands in
+``QUEUE_PRIORITIES`` also decide which rate-limit class a task's fetches
+run in, so queued interactive work is not starved by backfill pages.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+from collections.abc import Iterable
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.rate_limit import ScrapePriority, scrape_priority
+from src.entities.scrape_task import ScrapeTask
+from src.repositories.scrape_task_repo import ScrapeTaskRepository
+from src.services.ingest_service import scrape_page
+from src.services.stat_registry import StatType, page_url
+
+logger = logging.getLogger(__name__)
+
+
+QUEUE_PRIORITIES: dict[ScrapePriority, int] = {
+    ScrapePriority.interactive: 100,
+    ScrapePriority.in_season: 50,
+    ScrapePriority.backfill: 0,
+}
+
+
+def priority_class(priority: int) -> ScrapePriority:
+    """Map a task priority to the rate-limit class its fetches run in."""
+    for cls, floor in QUEUE_PRIORITIES.items():
+        if priority >= floor:
+            return cls
+    return ScrapePriority.backfill
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def pages(stat_types: Iterable[StatType], season: int) -> dict[str, list[str]]:
+    """Group stat types by the page they are parsed from for a season."""
+    by_url: dict[str, list[str]] = {}
+    for stat_type in stat_types:
+        by_url.setdefault(page_url(stat_type, season), []).append(str(stat_type))
+    return by_url
+
+
+def enqueue(
+    stat_types: Iterable[StatType],
+    seasons: Iterable[int],
+    *,
+    priority: int = 0,
+) -> int:
+    """Queue every (stat type, season) pair; returns the number of page tasks."""
+    db = SessionLocal()
+    try:
+        repo = ScrapeTaskRepository(db)
+        count = 0
+        for season in seasons:
+            for url, types in pages(stat_types, season).items():
+                repo.enqueue(
+                    url,
+                    season,
+                    types,
+                    priority=priority,
+                    max_attempts=settings.SCRAPE_TASK_MAX_ATTEMPTS,
+                    commit=False,
+                )
+                count += 1
+        db.commit()
+        return count
+    finally:
+        db.close()
+
+
+def queue_status() -> dict[str, int]:
+    db = SessionLocal()
+    try:
+        return ScrapeTaskRepository(db).count_by_status()
+    finally:
+        db.close()
+
+
+class _Heartbeat(threading.Thread):
+    """Renews a task lease until stopped (uses its own session)."""
+
+    def __init__(self, task_id: int, worker_id: str) -> None:
+        super().__init__(daemon=True, name=f"heartbeat-{task_id}")
+        self.task_id = task_id
+        self.worker_id = worker_id
+        self.stopped = threading.Event()
+
+    def run(self) -> None:
+        while not self.stopped.wait(settings.SCRAPE_TASK_HEARTBEAT_SECONDS):
+            db = SessionLocal()
+            try:
+                if not ScrapeTaskRepository(db).heartbeat(
+                    self.task_id, self.worker_id, settings.SCRAPE_TASK_LEASE_SECONDS
+                ):
+                    logger.warning("Lost lease on scrape task %d", self.task_id)
+                    return
+            except Exception:
+                logger.warning("Heartbeat failed", exc_info=True)
+            finally:
+                db.close()
+
+    def stop(self) -> None:
+        self.stopped.set()
+        self.join()
+
+
+def run_task(task: ScrapeTask, worker_id: str) -> dict:
+    """Fetch one leased task's page, ingest it per stat type, record the outcome."""
+    result = {
+        "task_id": task.id,
+        "url": task.url,
+        "season": task.season,
+        "stat_types": task.stat_type_names,
+    }
+    heartbeat = _Heartbeat(task.id, worker_id)
+    heartbeat.start()
+    try:
+        with scrape_priority(priority_class(task.priority)):
+            asyncio.run(scrape_page(task.url, task.season, task.stat_type_names))
+        error = None
+    except Exception as e:
+        logger.error("Scrape task %d failed: %s", task.id, e, exc_info=True)
+        error = str(e) or type(e).__name__
+    finally:
+        heartbeat.stop()
+
+    db = SessionLocal()
+    try:
+        repo = ScrapeTaskRepository(db)
+        if error is None:
+            recorded = repo.complete(task.id, worker_id, stat_types=task.stat_types)
+            result["status"] = "done"
+        else:
+            recorded = repo.fail(task.id, worker_id, error)
+            result.update(status="failed", error=error)
+    finally:
+        db.close()
+
+    if not recorded:
+        # Lease expired mid-scrape and another worker may have taken the task
+        logger.warning("Outcome of scrape task %d not recorded (lease lost)", task.id)
+        result["status"] = "lease_lost"
+    return result
+
+
+def work(
+    worker_id: str | None = None,
+    *,
+    max_tasks: int | None = None,
+    exit_when_idle: bool = False,
+    stop: threading.Event | None = None,
+    stat_types: list[str] | None = None,
+) -> int:
+    """
+    Lease and run tasks one at a time until stopped.
+
+    Args:
+        worker_id: Lease holder name (defaults to host:pid)
+        max_tasks: Stop after running this many tasks
+        exit_when_idle: Stop as soon as no task can be leased
+        stop: Event that ends the loop between tasks
+        stat_types: Only lease tasks that parse one of these stat types
+
+    Returns:
+        Number of tasks run
+    """
+    worker_id = worker_id or default_worker_id()
+    stop = stop or threading.Event()
+    ran = 0
+    logger.info("Scrape worker %s started", worker_id)
+
+    while not stop.is_set() and (max_tasks is None or ran < max_tasks):
+        db = SessionLocal()
+        try:
+            repo = ScrapeTaskRepository(db)
+            requeued = repo.requeue_expired()
+            if requeued:
+                logger.info("Re-queued %d expired scrape task(s)", requeued)
+            tasks = repo.lease(
+                worker_id, settings.SCRAPE_TASK_LEASE_SECONDS, stat_types=stat_types
+            )
+        finally:
+            db.close()
+
+        if not tasks:
+            if exit_when_idle:
+                break
+            stop.wait(settings.SCRAPE_TASK_POLL_SECONDS)
+            continue
+
+        result = run_task(tasks[0], worker_id)
+        logger.info("Scrape task finished", extra=result)
+        ran += 1
+
+    return ran
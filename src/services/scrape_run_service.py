@@ -0,0 +1,169 @@
+"""
+Durable scrape run ledger and its latency summary.
+
+``recorded_run`` wraps one scrape: it tracks stage timings through
+``run_metrics`` while the scrape runs and writes a ``scrape_runs`` row
+when it finishes, whether it stored, found nothing changed, or failed.
+``summary`` reports p50/p95 per stage and stat type over a time window,
+so regressions in fetch, parse or write time show up per table.
+"""
+
+import logging
+import math
+from collections import Counter, defaultdict
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from src.core.config import settings
+from src.core.database import SessionLocal
+from src.core.run_metrics import STAGES, RunMetrics, track_run
+from src.entities.scrape_run import ScrapeRun
+from src.repositories.scrape_run_repo import ScrapeRunRepository
+from src.services.row_diff_service import new_scrape_run
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_STAGES = (*STAGES, "total")
+
+
+def save_run(run: RunMetrics) -> None:
+    """Write a finished run to the ledger; a ledger failure never fails a scrape."""
+    seconds = run.stage_seconds()
+    db = SessionLocal()
+    try:
+        ScrapeRunRepository(db).create(
+            ScrapeRun(
+                run_id=run.run_id,
+                stat_type=run.stat_type,
+                season=run.season,
+                url=run.url,
+                backend=run.backend,
+                attempts=run.attempts,
+                fetch_seconds=seconds["fetch"],
+                rate_limit_wait_seconds=seconds["rate_limit_wait"],
+                parse_seconds=seconds["parse"],
+                validate_seconds=seconds["validate"],
+                write_seconds=seconds["write"],
+                total_seconds=run.total_seconds,
+                bytes_fetched=run.bytes_fetched,
+                rows_in=run.rows_in,
+                rows_changed=run.rows_changed,
+                outcome=run.outcome or "failed",
+                error=run.error,
+                started_at=run.started_at,
+            )
+        )
+    except Exception:
+        db.rollback()
+        logger.warning("Failed to record scrape run %s", run.run_id, exc_info=True)
+    finally:
+        db.close()
+
+
+@contextmanager
+def recorded_run(
+    stat_type: str,
+    season: int | None = None,
+    url: str | None = None,
+    *,
+    run_id: str | None = None,
+) -> Iterator[RunMetrics]:
+    """
+    Track a scrape and record it in ``scrape_runs`` when the block exits.
+
+    The caller sets ``outcome`` (and rows) on the yielded run; an exception
+    records it as failed and propagates.
+    """
+    run = RunMetrics(
+        run_id=run_id or new_scrape_run(),
+        stat_type=str(stat_type),
+        season=season,
+        url=url,
+        backend=settings.SCRAPE_BACKEND,
+    )
+    try:
+        with track_run(run):
+            yield run
+    finally:
+        save_run(run)
+
+
+def _percentile(values: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of a non-empty sequence."""
+    ordered = sorted(values)
+    rank = max(1, math.ceil(q / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def _stage_value(run: ScrapeRun, stage: str) -> float:
+    return float(getattr(run, f"{stage}_seconds"))
+
+
+def summarize(runs: Sequence[ScrapeRun]) -> dict[str, Any]:
+    """Per-stat-type run counts, outcomes and p50/p95 stage durations."""
+    by_type: dict[str, list[ScrapeRun]] = defaultdict(list)
+    for run in runs:
+        by_type[run.stat_type].append(run)
+
+    result: dict[str, Any] = {}
+    for stat_type, group in sorted(by_type.items()):
+        stages = {}
+        for stage in SUMMARY_STAGES:
+            values = [_stage_value(r, stage) for r in group]
+            stages[stage] = {
+                "p50": round(_percentile(values, 50), 3),
+                "p95": round(_percentile(values, 95), 3),
+            }
+        result[stat_type] = {
+            "runs": len(group),
+            "outcomes": dict(Counter(r.outcome for r in group)),
+            "stages": stages,
+            "bytes_p50": _percentile([r.bytes_fetched or 0 for r in group], 50),
+            "rows_changed": sum(r.rows_changed or 0 for r in group),
+            "attempts_p95": _percentile([r.attempts or 0 for r in group], 95),
+        }
+    return result
+
+
+def summarize_in_db(
+    repo: ScrapeRunRepository, since: datetime, stat_type: str | None = None
+) -> dict[str, Any]:
+    """``summarize``'s result, with the percentiles computed by Postgres."""
+    outcomes = repo.outcome_counts(since, stat_type=stat_type)
+    percentiles = repo.stage_percentiles(since, SUMMARY_STAGES, stat_type=stat_type)
+
+    result: dict[str, Any] = {}
+    for name, row in sorted(percentiles.items()):
+        result[name] = {
+            "runs": row["runs"],
+            "outcomes": outcomes.get(name, {}),
+            "stages": {
+                stage: {
+                    "p50": round(row[f"{stage}_p50"], 3),
+                    "p95": round(row[f"{stage}_p95"], 3),
+                }
+                for stage in SUMMARY_STAGES
+            },
+            "bytes_p50": row["bytes_p50"],
+            "rows_changed": int(row["rows_changed"]),
+            "attempts_p95": row["attempts_p95"],
+        }
+    return result
+
+
+def summary(days: float = 7, stat_type: str | None = None) -> dict[str, Any]:
+    """Per-stat-type summary of the runs started in the last ``days`` days."""
+    since = datetime.now(UTC) - timedelta(days=days)
+    db = SessionLocal()
+    try:
+        repo = ScrapeRunRepository(db)
+        if db.get_bind().dialect.name == "postgresql":
+            stat_types = summarize_in_db(repo, since, stat_type)
+        else:
+            # SQLite has no ordered-set aggregates: load the window instead
+            stat_types = summarize(repo.started_since(since, stat_type=stat_type))
+        return {"since": since.isoformat(), "stat_types": stat_types}
+    finally:
+        db.close()
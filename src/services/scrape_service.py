@@ -1,22 +1,32 @@
+import asyncio
 import base64
 import logging
 import time
+from collections.abc import AsyncIterator, Iterable
 from datetime import datetime
 from io import StringIO
 
 import numpy as np
 import pandas as pd
 from selenium.webdriver.common.by import By
+from sqlalchemy.orm import Session
 
 from src.core.config import settings
 from src.core.database import SessionLocal
+from src.core.rate_limit import ScrapePriority, host_rate_limiter, scrape_priority
+from src.core.run_metrics import record_bytes, stage
 from src.core.scraper_utils import (
     create_chrome_driver,
     retry_with_backoff,
     strip_url_hash,
 )
 from src.dtos.team_game_dto import TeamGameCreate
+from src.entities.team_game import TeamGame
+from src.repositories.data_version_repo import DataVersionRepository
+from src.repositories.scrape_run_repo import ScrapeRunRepository
 from src.repositories.team_game_repo import TeamGameRepository
+from src.services.cache_invalidation_service import invalidate
+from src.services.scrape_run_service import recorded_run
 
 logger = logging.getLogger(__name__)
 
@@ -69,7 +79,89 @@ def clean_value(v):
     return v
 
 
-def parse_xlsx_to_games(excel_bytes: bytes, team: str):
+# Output field -> candidate source columns (first one present wins).
+GAMELOG_COLUMNS: dict[str, tuple[str, ...]] = {
+    "week": ("Week", "Week_"),
+    "day": ("Day", "Day_"),
+    "date": ("Date", "Date_"),
+    "time": ("Unnamed: 3_level_1",),
+    "result": ("Unnamed: 5_level_1",),
+    "opponent": ("Opp", "Opp_"),
+    "team_score": ("Tm", "Tm_"),
+    "opp_score": ("Opp.1", "Opp.1_"),
+    "tot_yards_for": ("TotYd", "TotYd_"),
+    "tot_yards_against": ("TotYd.1", "TotYd.1_"),
+    "pass_yards": ("PassY", "PassY_"),
+    "rush_yards": ("RushY", "RushY_"),
+    "turnovers": ("TO", "TO_"),
+}
+
+GAMELOG_INT_FIELDS = (
+    "week",
+    "team_score",
+    "opp_score",
+    "tot_yards_for",
+    "tot_yards_against",
+    "pass_yards",
+    "rush_yards",
+    "turnovers",
+)
+
+
+def _resolve_column(df: pd.DataFrame, candidates: tuple[str, ...]) -> pd.Series:
+    """Return the first matching column (first occurrence if names repeat)."""
+    columns = list(df.columns)
+    for name in candidates:
+        if name in columns:
+            return df.iloc[:, columns.index(name)]
+    return pd.Series(None, index=df.index, dtype=object)
+
+
+def games_from_frame(
+    df: pd.DataFrame, team: str, season: int | None = None
+) -> list[dict]:
+    """
+    Convert a flattened PFR schedule DataFrame into gamelog dicts.
+
+    Column resolution happens once per frame and all casts run on whole
+    columns; no per-row Python work is done apart from emitting records.
+
+    Args:
+        df: Schedule table with flattened column names
+        team: Team abbreviation the schedule belongs to
+        season: Season year; when given, dates are parsed into ``game_date``
+
+    Returns:
+        List of game dicts with pure-Python values (NaN -> None)
+    """
+    out = pd.DataFrame(
+        {field: _resolve_column(df, cols) for field, cols in GAMELOG_COLUMNS.items()},
+        index=df.index,
+    )
+
+    for field in GAMELOG_INT_FIELDS:
+        numeric = pd.to_numeric(out[field], errors="coerce")
+        out[field] = np.trunc(numeric).astype("Int64")
+
+    if season is not None:
+        dates = pd.to_datetime(
+            out["date"].astype("string") + f" {season}",
+            format="%B %d %Y",
+            errors="coerce",
+        )
+        out["game_date"] = dates.dt.date.where(dates.notna(), None)
+
+    out.insert(0, "team", team.upper())
+    out.insert(7, "location", "")  # '@' marks away if needed
+
+    out = out.astype(object).where(out.notna(), None)
+    records: list[dict] = out.to_dict("records")
+    return records
+
+
+def parse_xlsx_to_games(
+    excel_bytes: bytes, team: str, season: int | None = None
+) -> list[dict]:
     # Convert bytes → string
     html_str = excel_bytes.decode("utf-8")
 
@@ -84,38 +176,7 @@ def parse_xlsx_to_games(excel_bytes: bytes, team: str):
 
     logger.debug("Cleaned columns: %s", df.columns.tolist())
 
-    games = []
-    for _, row in df.iterrows():
-        raw_week = row.get("Week", row.get("Week_", None))
-        if raw_week is None or pd.isna(raw_week):
-            week_val = None
-        else:
-            try:
-                week_val = int(raw_week)
-            except (TypeError, ValueError):
-                week_val = None
-
-        game = {
-            "team": team.upper(),
-            "week": week_val,
-            "day": row.get("Day", row.get("Day_", None)),
-            "date": row.get("Date", row.get("Date_", None)),
-            "time": row.get("Unnamed: 3_level_1"),
-            "result": row.get("Unnamed: 5_level_1"),
-            "opponent": row.get("Opp", row.get("Opp_", None)),
-            "location": "",  # '@' marks away if needed
-            "team_score": row.get("Tm", row.get("Tm_", None)),
-            "opp_score": row.get("Opp.1", row.get("Opp.1_", None)),
-            "tot_yards_for": row.get("TotYd", row.get("TotYd_", None)),
-            "tot_yards_against": row.get("TotYd.1", row.get("TotYd.1_", None)),
-            "pass_yards": row.get("PassY", row.get("PassY_", None)),
-            "rush_yards": row.get("RushY", row.get("RushY_", None)),
-            "turnovers": row.get("TO", row.get("TO_", None)),
-        }
-        cleaned_game = {k: clean_value(v) for k, v in game.items()}
-        games.append(cleaned_game)
-
-    return games
+    return games_from_frame(df, team, season)
 
 
 def extract_excel_bytes_from_dlink(driver):
@@ -139,10 +200,12 @@ def extract_excel_bytes_from_dlink(driver):
 
 def map_scraped_to_model(scraped: dict, season: int) -> TeamGameCreate:
     # ---- DATE PARSING ----
-    date_val = None
+    # Dates are pre-parsed column-wise by games_from_frame when the season is
+    # known; fall back to parsing the raw "Month Day" string otherwise.
+    date_val = scraped.get("game_date")
     raw_date = scraped.get("date")
 
-    if raw_date:
+    if date_val is None and raw_date:
         try:
             date_val = datetime.strptime(f"{raw_date} {season}", "%B %d %Y").date()
         except (TypeError, ValueError):
@@ -197,8 +260,43 @@ def map_scraped_to_model(scraped: dict, season: int) -> TeamGameCreate:
     )
 
 
-async def download_team_gamelog(team: str, year: int):
-    url = f"https://www.pro-football-reference.com/teams/{team.lower()}/{year}.htm"
+PFR_TEAM_URL_TEMPLATE = "https://www.pro-football-reference.com/teams/{team}/{year}.htm"
+
+# PFR franchise codes (stable across relocations/renames) used in team URLs.
+PFR_TEAM_CODES = [
+    "crd", "atl", "rav", "buf", "car", "chi", "cin", "cle",
+    "dal", "den", "det", "gnb", "htx", "clt", "jax", "kan",
+    "rai", "sdg", "ram", "mia", "min", "nwe", "nor", "nyg",
+    "nyj", "phi", "pit", "sfo", "sea", "tam", "oti", "was",
+]  # fmt: skip
+
+# Franchises that did not exist for every season PFR covers.
+FRANCHISE_FIRST_SEASON = {
+    "sea": 1976,
+    "tam": 1976,
+    "car": 1995,
+    "jax": 1995,
+    "rav": 1996,
+    "htx": 2002,
+}
+CLEVELAND_SUSPENDED_SEASONS = range(1996, 1999)
+
+
+def teams_for_season(year: int) -> list[str]:
+    """Return the PFR franchise codes that played in a given season."""
+    teams = []
+    for team in PFR_TEAM_CODES:
+        if year < FRANCHISE_FIRST_SEASON.get(team, 0):
+            continue
+        if team == "cle" and year in CLEVELAND_SUSPENDED_SEASONS:
+            continue
+        teams.append(team)
+    return teams
+
+
+def _download_with_driver(driver, team: str, year: int) -> list[dict]:
+    """Drive an existing Chrome session through the schedule Excel export."""
+    url = PFR_TEAM_URL_TEMPLATE.format(team=team.lower(), year=year)
 
     # Strip hash fragments to avoid 403 errors
     clean_url = strip_url_hash(url)
@@ -206,8 +304,7 @@ async def download_team_gamelog(team: str, year: int):
         logger.info(f"Stripped hash fragment from URL: {url} -> {clean_url}")
         url = clean_url
 
-    driver = create_chrome_driver(headless=True)
-
+    host_rate_limiter.acquire(url)
     driver.get(url)
     time.sleep(settings.SCRAPE_PAGE_LOAD_WAIT)
 
@@ -234,36 +331,237 @@ async def download_team_gamelog(team: str, year: int):
 
     # Extract Excel bytes from injected <a id="dlink">
     excel_bytes = extract_excel_bytes_from_dlink(driver)
+    record_bytes(len(excel_bytes))
     logger.debug("First 200 bytes of Excel data: %s", excel_bytes[:200])
 
-    driver.quit()
-
     # Parse direct bytes into Python objects
-    return parse_xlsx_to_games(excel_bytes, team)
+    return parse_xlsx_to_games(excel_bytes, team, year)
 
 
-async def scrape_and_store(team: str, year: int):
-    db = SessionLocal()
+async def download_team_gamelog(team: str, year: int):
+    driver = create_chrome_driver(headless=True)
+    try:
+        return _download_with_driver(driver, team, year)
+    finally:
+        driver.quit()
 
-    url = f"https://www.pro-football-reference.com/teams/{team.lower()}/{year}.htm"
 
+def store_team_games(db: Session, scraped_games: list[dict], year: int) -> list:
+    """
+    Map scraped gamelog rows to DTOs and insert them, skipping duplicates.
+
+    The games and the ``team_games`` data version bump commit together, so
+    a team-season is either fully written or not at all. The bump
+    invalidates cached reads of the season here and, through the version
+    watcher, elsewhere.
+    """
+    repo = TeamGameRepository(db)
+    saved = []
+    for game in scraped_games:
+        model_obj = map_scraped_to_model(game, year)
+        saved_obj = repo.create_or_skip(model_obj, commit=False)
+        saved.append(saved_obj)
+    if saved:
+        DataVersionRepository(db).bump(TeamGame.__tablename__, year, commit=False)
+        db.commit()
+        invalidate(TeamGame.__tablename__, year)
+    return saved
+
+
+async def scrape_and_store(team: str, year: int) -> dict:
+    """
+    Scrape one team-season on its own driver and store it.
+
+    Runs the same recorded path as the batch (``_scrape_and_store_with_driver``)
+    on a worker thread, so the scrape lands in the ``scrape_runs`` ledger and
+    a later batch resume skips the team-season.
+    """
+
+    def scrape() -> int:
+        driver = create_chrome_driver(headless=True)
+        try:
+            return _scrape_and_store_with_driver(driver, team, year)
+        finally:
+            driver.quit()
+
+    count = await asyncio.to_thread(scrape)
+    logger.info("Successfully scraped and stored %d games for %s %d", count, team, year)
+    return {"team": team, "season": year, "status": "stored", "games": count}
+
+
+def _scrape_and_store_with_driver(driver, team: str, year: int) -> int:
+    """Fetch one team-season on a pooled driver and persist it immediately."""
+    url = PFR_TEAM_URL_TEMPLATE.format(team=team.lower(), year=year)
+
+    with recorded_run("team_gamelog", year, url) as run:
+        # The Excel export is parsed inside the download, so parse time is
+        # part of the fetch stage for gamelogs
+        with stage("fetch"):
+            scraped_games = retry_with_backoff(
+                _download_with_driver, driver, team, year, url=url
+            )
+
+        db = SessionLocal()
+        try:
+            with stage("write"):
+                saved = store_team_games(db, scraped_games, year)
+        finally:
+            db.close()
+
+        run.outcome = "stored"
+        run.rows_in = len(scraped_games)
+        return len(saved)
+
+
+def _completed_teams(year: int, teams: Iterable[str]) -> set[str]:
+    """
+    The ``teams`` whose gamelog for ``year`` has a stored run in the ledger.
+
+    The run is recorded only after the team-season's write commits, so a
+    scrape interrupted mid-write is not counted as done.
+    """
+    db = SessionLocal()
     try:
-        # Use retry logic with exponential backoff
-        scraped_games = await retry_with_backoff(
-            download_team_gamelog, team, year, url=url
+        stored = ScrapeRunRepository(db).stored_urls("team_gamelog", year)
+    finally:
+        db.close()
+    return {
+        team
+        for team in teams
+        if PFR_TEAM_URL_TEMPLATE.format(team=team.lower(), year=year) in stored
+    }
+
+
+async def scrape_all_teams(
+    years: Iterable[int],
+    *,
+    teams: list[str] | None = None,
+    workers: int | None = None,
+    resume: bool = True,
+    priority: ScrapePriority | str = ScrapePriority.interactive,
+) -> AsyncIterator[dict]:
+    """
+    Scrape gamelogs for every team across one or more seasons.
+
+    Team-seasons are fanned out to a small pool of long-lived Chrome drivers
+    (``SCRAPE_GAMELOG_WORKERS``); every page load goes through the shared
+    host rate limiter, so adding workers overlaps browser work without
+    exceeding the politeness budget. Each team-season is persisted as soon
+    as it finishes. With ``resume`` enabled, team-seasons with a stored run
+    in the ``scrape_runs`` ledger are skipped, so an interrupted batch can
+    simply be re-run.
+
+    Args:
+        years: Season years to scrape
+        teams: PFR franchise codes (defaults to every team active that season)
+        workers: Number of concurrent drivers (defaults to settings)
+        resume: Skip team-seasons that are already stored
+        priority: Rate-limit class the page loads are queued in
+
+    Yields:
+        One progress event dict per team-season, in completion order
+    """
+    queue: asyncio.Queue[tuple[str, int]] = asyncio.Queue()
+    events: asyncio.Queue[dict | None] = asyncio.Queue()
+    skipped: list[dict] = []
+
+    for year in years:
+        season_teams = teams if teams is not None else teams_for_season(year)
+        done = (
+            await asyncio.to_thread(_completed_teams, year, season_teams)
+            if resume
+            else set()
         )
-        repo = TeamGameRepository(db)
-        saved = []
+        for team in season_teams:
+            if team in done:
+                skipped.append({"team": team, "season": year, "status": "skipped"})
+            else:
+                queue.put_nowait((team, year))
 
-        for game in scraped_games:
-            model_obj = map_scraped_to_model(game, year)
-            saved_obj = repo.create_or_skip(model_obj)
-            saved.append(saved_obj)
+    total = len(skipped) + queue.qsize()
+    completed = 0
 
-        logger.info(
-            f"Successfully scraped and stored {len(saved)} games for {team} {year}"
-        )
-        return saved
+    def progress(event: dict) -> dict:
+        nonlocal completed
+        completed += 1
+        return {**event, "completed": completed, "total": total}
+
+    for event in skipped:
+        yield progress(event)
+
+    pending = queue.qsize()
+    if pending == 0:
+        return
 
+    pool_size = max(1, min(workers or settings.SCRAPE_GAMELOG_WORKERS, pending))
+
+    async def worker() -> None:
+        try:
+            driver = await asyncio.to_thread(create_chrome_driver, headless=True)
+        except Exception:
+            logger.error(
+                "Could not start Chrome driver for gamelog worker", exc_info=True
+            )
+            await events.put(None)
+            return
+
+        try:
+            while True:
+                try:
+                    team, year = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started = time.monotonic()
+                try:
+                    count = await asyncio.to_thread(
+                        _scrape_and_store_with_driver, driver, team, year
+                    )
+                    event = {
+                        "team": team,
+                        "season": year,
+                        "status": "stored",
+                        "games": count,
+                    }
+                except Exception as e:
+                    logger.error(
+                        "Gamelog scrape failed for %s %d", team, year, exc_info=True
+                    )
+                    event = {
+                        "team": team,
+                        "season": year,
+                        "status": "failed",
+                        "error": str(e),
+                    }
+                event["duration_seconds"] = round(time.monotonic() - started, 2)
+                await events.put(event)
+        finally:
+            await asyncio.to_thread(driver.quit)
+            await events.put(None)
+
+    # Tasks copy the context they are created in, priority included
+    with scrape_priority(priority):
+        tasks = [asyncio.create_task(worker()) for _ in range(pool_size)]
+    try:
+        finished = 0
+        while finished < pool_size:
+            item = await events.get()
+            if item is None:
+                finished += 1
+                continue
+            yield progress(item)
+
+        # Only reachable if every driver failed to start
+        while not queue.empty():
+            team, year = queue.get_nowait()
+            yield progress(
+                {
+                    "team": team,
+                    "season": year,
+                    "status": "failed",
+                    "error": "no Chrome driver available",
+                }
+            )
     finally:
-        db.close()
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
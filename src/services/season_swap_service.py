@@ -0,0 +1,142 @@
+"""
+Stage-validate-swap writes for whole (stat type, season) reloads.
+
+The default write path (``row_diff_service``) updates live rows in place.
+For bulk reloads (archive reparses, backfills) the ``swap`` write mode
+instead:
+
+1. bulk-loads the season into a TEMPORARY staging copy of the table,
+2. validates it: every row landed, natural keys are unique, every row is
+   in the season, and the row count has not collapsed relative to the
+   live season (``SWAP_MIN_ROW_RATIO``, guards against truncated pages),
+3. replaces the live season with one ``DELETE`` + ``INSERT ... SELECT``
+   as the last statements of the transaction.
+
+Nothing touches the live table until validation passes, a failed check
+rolls back with the live season intact, and live rows are locked only
+for the swap statements. Readers never block on the load (MVCC) and never
+see a partly replaced season. Changes are still logged to
+``stat_changes`` and the data version is bumped, as in diff mode; swapped
+rows get new ids.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.repositories.base_repo import BaseRepository
+from src.repositories.data_version_repo import DataVersionRepository
+from src.repositories.player_repo import PlayerRepository
+from src.repositories.season_partition_repo import SeasonPartitionRepository
+from src.repositories.season_staging_repo import SeasonStagingRepository
+from src.repositories.stat_change_repo import StatChangeRepository
+from src.services.row_diff_service import (
+    KEY_FALLBACKS,
+    diff_rows,
+    natural_key,
+    row_hash,
+    stored_row_keys,
+)
+from src.services.stat_registry import STAT_ENTITIES, StatType
+
+logger = logging.getLogger(__name__)
+
+
+def check_staged(
+    stats: dict[str, int],
+    *,
+    expected_rows: int,
+    live_rows: int,
+    min_ratio: float,
+) -> None:
+    """
+    Raise if a staged season is not safe to swap in.
+
+    Raises:
+        ValueError: Describing the first failed check
+    """
+    if stats["rows"] != expected_rows:
+        raise ValueError(f"Staged {stats['rows']} rows, expected {expected_rows}")
+    if stats["distinct_keys"] != stats["rows"]:
+        raise ValueError(
+            f"{stats['rows'] - stats['distinct_keys']} duplicate natural key(s)"
+        )
+    if stats["wrong_season"]:
+        raise ValueError(f"{stats['wrong_season']} row(s) outside the season")
+    if live_rows and stats["rows"] < live_rows * min_ratio:
+        raise ValueError(
+            f"Staged {stats['rows']} rows would replace {live_rows} "
+            f"(below SWAP_MIN_ROW_RATIO={min_ratio})"
+        )
+
+
+def swap_season(
+    db: Session,
+    stat_type: StatType | str,
+    season: int,
+    rows: Sequence[dict[str, Any]],
+    *,
+    scrape_run: str,
+    min_ratio: float | None = None,
+) -> dict[str, int]:
+    """
+    Replace a (stat type, season) through a validated staging copy (caller commits).
+
+    Args:
+        db: Session to write through
+        stat_type: Stat type the rows belong to
+        season: Season being replaced
+        rows: Validated rows keyed by attribute name (see ``validate_rows``)
+            whose ``pfr_id`` is resolved to a ``player_id`` on player tables
+        scrape_run: Run id recorded on the logged changes
+        min_ratio: Minimum staged/live row ratio (None = SWAP_MIN_ROW_RATIO)
+
+    Returns:
+        Counts of inserted, updated, deleted and unchanged rows
+
+    Raises:
+        ValueError: If the staged season fails validation (nothing written)
+    """
+    stat_type = StatType(stat_type)
+    entity = STAT_ENTITIES[stat_type]
+    key = natural_key(stat_type)
+    rows = PlayerRepository(db).with_player_ids(rows)
+    hashed = [{**row, "row_hash": row_hash(row)} for row in rows]
+
+    SeasonPartitionRepository(db, entity).ensure(season)
+    staging = SeasonStagingRepository(db, entity)
+    staging.create()
+    staging.load(hashed)
+    check_staged(
+        staging.staged_stats(season, key, fallbacks=KEY_FALLBACKS),
+        expected_rows=len(hashed),
+        live_rows=staging.live_count(season),
+        min_ratio=settings.SWAP_MIN_ROW_RATIO if min_ratio is None else min_ratio,
+    )
+
+    # Everything below touches the live table; keep it short
+    repo: BaseRepository[Any] = BaseRepository(db, entity)
+    stored, _ = stored_row_keys(repo, season, key, rows)
+    diff = diff_rows(
+        stored,
+        rows,
+        key,
+        table_name=entity.__tablename__,
+        season=season,
+        scrape_run=scrape_run,
+    )
+    staging.swap(season)
+    staging.drop()
+    StatChangeRepository(db).append(diff.changes, commit=False)
+    if diff.changes:
+        DataVersionRepository(db).bump(entity.__tablename__, season, commit=False)
+    logger.info(
+        "Swapped in %s %d",
+        stat_type,
+        season,
+        extra={"stat_type": str(stat_type), "season": season, **diff.summary()},
+    )
+    return diff.summary()
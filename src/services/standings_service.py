@@ -1,18 +1,8 @@
 import logging
 
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.standings_dto import StandingsCreate
-from src.entities.standings import Standings
-from src.repositories.standings_repo import StandingsRepository
+
+from src.core.scraper_utils import clean_value, find_pfr_table
 
 logger = logging.getLogger(__name__)
 
@@ -66,10 +56,8 @@ def _parse_table(table: Tag, season: int) -> list[dict]:
     return rows
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
-
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     all_rows = []
     for table_id in PFR_TABLE_IDS:
         table = find_pfr_table(page_source, table_id)
@@ -83,24 +71,3 @@ def get_dataframe(season: int) -> list[dict]:
         raise Exception(f"Could not find any standings tables for season {season}")
 
     return all_rows
-
-
-async def scrape_and_store(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        parsed = get_dataframe(season)
-        repo = StandingsRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = StandingsCreate(**row)
-            obj = Standings(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-        return saved
-
-    finally:
-        db.close()
@@ -0,0 +1,179 @@
+"""
+Registry of season-scoped PFR stat scrapers.
+
+Every stat service module exposes the same surface:
+
+- ``PFR_URL_TEMPLATE`` (formatted with ``season``)
+- ``PFR_TABLE_ID`` or ``PFR_TABLE_IDS``
+- ``parse_page(page_source, season) -> list[dict]``
+
+so tooling that works on stat types generically (offline re-parse,
+backfills, the work queue) can look modules up here instead of importing
+each service by hand. ``STAT_ENTITIES`` and ``STAT_DTOS`` map each stat
+type to the entity its rows are stored in and the DTO that validates them.
+Modules only parse: every write goes through ``ingest_service.ingest_page``.
+"""
+
+from enum import StrEnum
+from types import ModuleType
+
+from pydantic import BaseModel
+from sqlalchemy import inspect
+
+from src.dtos.defense_stats_dto import DefenseStatsCreate
+from src.dtos.games_dto import GamesCreate
+from src.dtos.kicking_dto import KickingCreate
+from src.dtos.kicking_stats_dto import KickingStatsCreate
+from src.dtos.passing_stats_dto import PassingStatsCreate
+from src.dtos.punting_dto import PuntingCreate
+from src.dtos.punting_stats_dto import PuntingStatsCreate
+from src.dtos.receiving_stats_dto import ReceivingStatsCreate
+from src.dtos.return_stats_dto import ReturnStatsCreate
+from src.dtos.returns_dto import TeamReturnsCreate
+from src.dtos.rushing_stats_dto import RushingStatsCreate
+from src.dtos.scoring_stats_dto import ScoringStatsCreate
+from src.dtos.standings_dto import StandingsCreate
+from src.dtos.team_defense_dto import TeamDefenseCreate
+from src.dtos.team_offense_dto import TeamOffenseCreate
+from src.entities.base import Base
+from src.entities.defense_stats import DefenseStats
+from src.entities.games import Games
+from src.entities.kicking import Kicking
+from src.entities.kicking_stats import KickingStats
+from src.entities.passing_stats import PassingStats
+from src.entities.punting import Punting
+from src.entities.punting_stats import PuntingStats
+from src.entities.receiving_stats import ReceivingStats
+from src.entities.return_stats import ReturnStats
+from src.entities.returns import TeamReturns
+from src.entities.rushing_stats import RushingStats
+from src.entities.scoring_stats import ScoringStats
+from src.entities.standings import Standings
+from src.entities.team_defense import TeamDefense
+from src.entities.team_offense import TeamOffense
+from src.services import (
+    defense_stats_service,
+    games_service,
+    kicking_stats_service,
+    kicking_team_service,
+    passing_stats_service,
+    punting_stats_service,
+    punting_team_service,
+    receiving_stats_service,
+    return_stats_service,
+    returns_team_service,
+    rushing_stats_service,
+    scoring_stats_service,
+    standings_service,
+    team_defense_service,
+    team_offense_service,
+)
+
+
+class StatType(StrEnum):
+    team_offense = "team_offense"
+    team_defense = "team_defense"
+    standings = "standings"
+    games = "games"
+    kicking = "kicking"
+    punting = "punting"
+    returns = "returns"
+    passing_stats = "passing_stats"
+    rushing_stats = "rushing_stats"
+    receiving_stats = "receiving_stats"
+    defense_stats = "defense_stats"
+    kicking_stats = "kicking_stats"
+    punting_stats = "punting_stats"
+    return_stats = "return_stats"
+    scoring_stats = "scoring_stats"
+
+
+STAT_SERVICES: dict[StatType, ModuleType] = {
+    StatType.team_offense: team_offense_service,
+    StatType.team_defense: team_defense_service,
+    StatType.standings: standings_service,
+    StatType.games: games_service,
+    StatType.kicking: kicking_team_service,
+    StatType.punting: punting_team_service,
+    StatType.returns: returns_team_service,
+    StatType.passing_stats: passing_stats_service,
+    StatType.rushing_stats: rushing_stats_service,
+    StatType.receiving_stats: receiving_stats_service,
+    StatType.defense_stats: defense_stats_service,
+    StatType.kicking_stats: kicking_stats_service,
+    StatType.punting_stats: punting_stats_service,
+    StatType.return_stats: return_stats_service,
+    StatType.scoring_stats: scoring_stats_service,
+}
+
+STAT_ENTITIES: dict[StatType, type[Base]] = {
+    StatType.team_offense: TeamOffense,
+    StatType.team_defense: TeamDefense,
+    StatType.standings: Standings,
+    StatType.games: Games,
+    StatType.kicking: Kicking,
+    StatType.punting: Punting,
+    StatType.returns: TeamReturns,
+    StatType.passing_stats: PassingStats,
+    StatType.rushing_stats: RushingStats,
+    StatType.receiving_stats: ReceivingStats,
+    StatType.defense_stats: DefenseStats,
+    StatType.kicking_stats: KickingStats,
+    StatType.punting_stats: PuntingStats,
+    StatType.return_stats: ReturnStats,
+    StatType.scoring_stats: ScoringStats,
+}
+
+STAT_DTOS: dict[StatType, type[BaseModel]] = {
+    StatType.team_offense: TeamOffenseCreate,
+    StatType.team_defense: TeamDefenseCreate,
+    StatType.standings: StandingsCreate,
+    StatType.games: GamesCreate,
+    StatType.kicking: KickingCreate,
+    StatType.punting: PuntingCreate,
+    StatType.returns: TeamReturnsCreate,
+    StatType.passing_stats: PassingStatsCreate,
+    StatType.rushing_stats: RushingStatsCreate,
+    StatType.receiving_stats: ReceivingStatsCreate,
+    StatType.defense_stats: DefenseStatsCreate,
+    StatType.kicking_stats: KickingStatsCreate,
+    StatType.punting_stats: PuntingStatsCreate,
+    StatType.return_stats: ReturnStatsCreate,
+    StatType.scoring_stats: ScoringStatsCreate,
+}
+
+
+def get_service(stat_type: StatType | str) -> ModuleType:
+    """Return the service module for a stat type."""
+    return STAT_SERVICES[StatType(stat_type)]
+
+
+def page_url(stat_type: StatType | str, season: int) -> str:
+    """Return the PFR page URL a stat type is scraped from for a season."""
+    return str(get_service(stat_type).PFR_URL_TEMPLATE.format(season=season))
+
+
+def table_ids(stat_type: StatType | str) -> list[str]:
+    """Return the PFR table id(s) a stat type is parsed from."""
+    module = get_service(stat_type)
+    return list(getattr(module, "PFR_TABLE_IDS", [module.PFR_TABLE_ID]))
+
+
+def validate_rows(stat_type: StatType | str, rows: list[dict]) -> list[dict]:
+    """
+    Validate parsed rows through the stat type's DTO.
+
+    Returns plain dicts keyed by entity attribute name (DTO fields follow
+    column names, which differ for e.g. ``Standings.losses`` -> ``l``),
+    ready for a bulk insert.
+    """
+    stat_type = StatType(stat_type)
+    dto_cls = STAT_DTOS[stat_type]
+    mapper = inspect(STAT_ENTITIES[stat_type])
+    attr_by_column = {
+        column.key: attr.key for attr in mapper.column_attrs for column in attr.columns
+    }
+    return [
+        {attr_by_column.get(k, k): v for k, v in dto_cls(**row).model_dump().items()}
+        for row in rows
+    ]
@@ -2,27 +2,116 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Sequence
+from datetime import UTC, datetime
+from typing import Any, TypeVar
+
 from sqlalchemy.orm import Session
 
-from src.repositories.passing_stats_repo import PassingStatsRepository
-from src.repositories.receiving_stats_repo import ReceivingStatsRepository
-from src.repositories.rushing_stats_repo import RushingStatsRepository
+from src.core.config import settings
+from src.core.nfl_calendar import is_season_complete
+from src.core.pagination import (
+    Cursor,
+    KeysetPage,
+    decode_cursors,
+    encode_cursors,
+)
+from src.core.read_cache import ReadCache
+from src.repositories.base_repo import BaseRepository
+from src.repositories.player_lookup_repo import PlayerLookupRepository
+from src.repositories.player_repo import PlayerRepository
 from src.repositories.standings_repo import StandingsRepository
 from src.repositories.team_game_repo import TeamGameRepository
 from src.repositories.team_offense_repo import TeamOffenseRepository
+from src.repositories.team_season_repo import TeamSeasonFeatureRepository
+
+P = TypeVar("P")
+
+
+def _offset_cursors(
+    repo: BaseRepository[Any],
+    rows: Sequence[Any],
+    *,
+    sort_by: str,
+    order: str,
+    offset: int,
+    limit: int,
+) -> tuple[str | None, str | None]:
+    """Cursors to continue an offset page with keyset pages (next, prev)."""
+    next_cursor = (
+        repo.cursor_for(rows[-1], sort_by, order).encode()
+        if rows and len(rows) == limit
+        else None
+    )
+    prev_cursor = (
+        repo.cursor_for(rows[0], sort_by, order, backward=True).encode()
+        if rows and offset > 0
+        else None
+    )
+    return next_cursor, prev_cursor
 
 
 class StatsRetrievalService:
-    """Service for retrieving NFL statistics with pagination and sorting support."""
+    """
+    Service for retrieving NFL statistics with pagination and sorting support.
+
+    Listings page by ``offset`` or, for deep or concurrently-updated
+    listings, by ``cursor``: every listing response carries
+    ``next_cursor``/``prev_cursor`` tokens, and passing one back returns
+    the adjacent page via an index-backed ``(sort value, id)`` comparison
+    instead of skipping rows (``offset`` is then ignored).
 
-    def __init__(self, session: Session):
+    Pages come back with their listing's ``total`` from the same query
+    (``include_total=False`` skips counting). Totals of completed seasons
+    are kept in ``totals`` when given, so later pages only fetch rows.
+    """
+
+    def __init__(self, session: Session, totals: ReadCache | None = None):
         self.session = session
+        self.totals = totals
         self.team_offense_repo = TeamOffenseRepository(session)
-        self.passing_stats_repo = PassingStatsRepository(session)
-        self.rushing_stats_repo = RushingStatsRepository(session)
-        self.receiving_stats_repo = ReceivingStatsRepository(session)
         self.standings_repo = StandingsRepository(session)
         self.team_game_repo = TeamGameRepository(session)
+        self.player_lookup_repo = PlayerLookupRepository(session)
+        self.player_repo = PlayerRepository(session)
+        self.team_season_repo = TeamSeasonFeatureRepository(session)
+
+    def _page(
+        self,
+        table: str,
+        season: int,
+        fetch: Callable[[bool], tuple[P, int | None]],
+        *,
+        include_total: bool,
+        filters: tuple[Any, ...] = (),
+    ) -> tuple[P, int | None]:
+        """
+        Run ``fetch(counted)`` for a page and, if wanted, its listing's total.
+
+        A completed season's total is cached (tagged with ``table``, so an
+        ingest of that season evicts it); on a hit only the rows are
+        fetched, on a miss the counted query fills the cache.
+        """
+        if not include_total:
+            return fetch(False)
+        frozen = is_season_complete(season, datetime.now(UTC).date())
+        if self.totals is None or not settings.READ_CACHE_ENABLED or not frozen:
+            return fetch(True)
+
+        fetched: list[P] = []
+
+        def load() -> int | None:
+            page, total = fetch(True)
+            fetched.append(page)
+            return total
+
+        total = self.totals.get_or_load(
+            ("total", table, season, *filters),
+            load,
+            ttl=settings.READ_CACHE_FROZEN_TTL_SECONDS,
+            tags=[(table, season)],
+        )
+        return (fetched[0] if fetched else fetch(False)[0]), total
 
     def get_all_teams(
         self,
@@ -32,6 +121,8 @@ class StatsRetrievalService:
         limit: int = 50,
         sort_by: str = "pf",
         order: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         """
         Get all teams for a given season with pagination.
@@ -42,20 +133,72 @@ class StatsRetrievalService:
             limit: Maximum number of records to return (default: 50, max: 200)
             sort_by: Field to sort by (default: "pf" for points for)
             order: Sort order "asc" or "desc" (default: "desc")
+            cursor: next/prev cursor from a previous page (replaces offset)
+            include_total: Count the season's rows (default: True)
 
         Returns:
-            Dictionary with 'data' list and 'total' count
+            Dictionary with 'data' list, 'total' count (None when not
+            included) and next/prev cursors
+
+        Raises:
+            ValueError: If the cursor is malformed or for another sort order
         """
         # Enforce max limit
         limit = min(limit, 200)
 
-        teams = self.team_offense_repo.find_by_season(
-            season=season, limit=limit, offset=offset, sort_by=sort_by, order=order
-        )
-
-        total = self.team_offense_repo.count_by_season(season)
+        repo = self.team_offense_repo
+        teams: Sequence[Any]
+        if cursor is not None:
+            position = Cursor.decode(cursor)
+
+            def fetch_keyset(counted: bool) -> tuple[KeysetPage[Any], int | None]:
+                page = repo.find_by_season_page(
+                    season=season,
+                    cursor=position,
+                    limit=limit,
+                    sort_by=sort_by,
+                    order=order,
+                    with_total=counted,
+                )
+                return page, page.total
+
+            page, total = self._page(
+                "team_offense", season, fetch_keyset, include_total=include_total
+            )
+            teams, next_cursor, prev_cursor = (
+                page.items,
+                page.next_token(),
+                page.prev_token(),
+            )
+        else:
+
+            def fetch_offset(counted: bool) -> tuple[Sequence[Any], int | None]:
+                args: dict[str, Any] = {
+                    "season": season,
+                    "limit": limit,
+                    "offset": offset,
+                    "sort_by": sort_by,
+                    "order": order,
+                }
+                if counted:
+                    return repo.find_by_season_with_total(**args)
+                return repo.find_by_season(**args), None
+
+            teams, total = self._page(
+                "team_offense", season, fetch_offset, include_total=include_total
+            )
+            next_cursor, prev_cursor = _offset_cursors(
+                repo, teams, sort_by=sort_by, order=order, offset=offset, limit=limit
+            )
 
-        return {"data": teams, "total": total, "offset": offset, "limit": limit}
+        return {
+            "data": teams,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
 
     def get_team_stats(self, team: str, season: int) -> dict | None:
         """
@@ -122,18 +265,33 @@ class StatsRetrievalService:
             season: The season year
 
         Returns:
-            Dictionary with player stats from all categories
+            Dictionary with player stats from all categories (one query)
         """
-        passing = self.passing_stats_repo.find_by_player(player_name, season)
-        rushing = self.rushing_stats_repo.search_players(player_name, season)
-        receiving = self.receiving_stats_repo.search_players(player_name, season)
-
         return {
             "player_name": player_name,
             "season": season,
-            "passing": passing,
-            "rushing": rushing,
-            "receiving": receiving,
+            **self.player_lookup_repo.search(player_name, season),
+        }
+
+    def get_player(self, player_id: int, season: int | None = None) -> dict | None:
+        """
+        Get every stat row of one player (by id), across categories.
+
+        Args:
+            player_id: The player's id in the players table
+            season: Optional season filter
+
+        Returns:
+            Dictionary with the player and their rows per category (newest
+            season first), or None if there is no such player
+        """
+        player = self.player_repo.get_by_id(player_id)
+        if player is None:
+            return None
+        return {
+            "player": player,
+            "season": season,
+            **self.player_lookup_repo.for_player(player_id, season),
         }
 
     def get_standings(
@@ -144,6 +302,8 @@ class StatsRetrievalService:
         limit: int = 50,
         sort_by: str = "win_pct",
         order: str = "desc",
+        cursor: str | None = None,
+        include_total: bool = True,
     ) -> dict:
         """
         Get standings for a given season with pagination.
@@ -154,20 +314,77 @@ class StatsRetrievalService:
             limit: Maximum number of records to return (default: 50, max: 200)
             sort_by: Field to sort by (default: "win_pct")
             order: Sort order "asc" or "desc" (default: "desc")
+            cursor: next/prev cursor from a previous page (replaces offset)
+            include_total: Count the season's rows (default: True)
 
         Returns:
-            Dictionary with 'data' list and 'total' count
+            Dictionary with 'data' list, 'total' count (None when not
+            included) and next/prev cursors
+
+        Raises:
+            ValueError: If the cursor is malformed or for another sort order
         """
         # Enforce max limit
         limit = min(limit, 200)
 
-        standings = self.standings_repo.find_by_season(
-            season=season, limit=limit, offset=offset, sort_by=sort_by, order=order
-        )
-
-        total = self.standings_repo.count_by_season(season)
+        repo = self.standings_repo
+        standings: Sequence[Any]
+        if cursor is not None:
+            position = Cursor.decode(cursor)
+
+            def fetch_keyset(counted: bool) -> tuple[KeysetPage[Any], int | None]:
+                page = repo.find_by_season_page(
+                    season=season,
+                    cursor=position,
+                    limit=limit,
+                    sort_by=sort_by,
+                    order=order,
+                    with_total=counted,
+                )
+                return page, page.total
+
+            page, total = self._page(
+                "standings", season, fetch_keyset, include_total=include_total
+            )
+            standings, next_cursor, prev_cursor = (
+                page.items,
+                page.next_token(),
+                page.prev_token(),
+            )
+        else:
+
+            def fetch_offset(counted: bool) -> tuple[Sequence[Any], int | None]:
+                args: dict[str, Any] = {
+                    "season": season,
+                    "limit": limit,
+                    "offset": offset,
+                    "sort_by": sort_by,
+                    "order": order,
+                }
+                if counted:
+                    return repo.find_by_season_with_total(**args)
+                return repo.find_by_season(**args), None
+
+            standings, total = self._page(
+                "standings", season, fetch_offset, include_total=include_total
+            )
+            next_cursor, prev_cursor = _offset_cursors(
+                repo,
+                standings,
+                sort_by=sort_by,
+                order=order,
+                offset=offset,
+                limit=limit,
+            )
 
-        return {"data": standings, "total": total, "offset": offset, "limit": limit}
+        return {
+            "data": standings,
+            "total": total,
+            "offset": offset,
+            "limit": limit,
+            "next_cursor": next_cursor,
+            "prev_cursor": prev_cursor,
+        }
 
     def get_games(
         self,
@@ -178,6 +395,7 @@ class StatsRetrievalService:
         limit: int = 50,
         sort_by: str = "week",
         order: str = "asc",
+        include_total: bool = True,
     ) -> dict:
         """
         Get games for a season, optionally filtered by week.
@@ -189,24 +407,38 @@ class StatsRetrievalService:
             limit: Maximum number of records to return (default: 50, max: 200)
             sort_by: Field to sort by (default: "week")
             order: Sort order "asc" or "desc" (default: "asc")
+            include_total: Count the matching rows (default: True)
 
         Returns:
-            Dictionary with 'data' list and 'total' count
+            Dictionary with 'data' list and 'total' count (None when not
+            included)
         """
         # Enforce max limit
         limit = min(limit, 200)
 
-        games = self.team_game_repo.find_by_season_and_week(
-            season=season,
-            week=week,
-            limit=limit,
-            offset=offset,
-            sort_by=sort_by,
-            order=order,
+        repo = self.team_game_repo
+
+        def fetch(counted: bool) -> tuple[Sequence[Any], int | None]:
+            args: dict[str, Any] = {
+                "season": season,
+                "week": week,
+                "limit": limit,
+                "offset": offset,
+                "sort_by": sort_by,
+                "order": order,
+            }
+            if counted:
+                return repo.find_by_season_and_week_with_total(**args)
+            return repo.find_by_season_and_week(**args), None
+
+        games, total = self._page(
+            "team_games",
+            season,
+            fetch,
+            include_total=include_total,
+            filters=(week,),
         )
 
-        total = self.team_game_repo.count_by_season(season, week)
-
         return {
             "data": games,
             "total": total,
@@ -215,6 +447,20 @@ class StatsRetrievalService:
             "week": week,
         }
 
+    def get_team_season_features(self, season: int) -> list[dict[str, Any]]:
+        """
+        Every team's wide feature row for a season, from one joined query.
+
+        Args:
+            season: Season year
+
+        Returns:
+            Flat rows by team: ``season``, ``team_id``, ``team``,
+            ``team_name``, then each team table's columns prefixed with its
+            name (``offense_pf``, ``standings_win_pct``, ...)
+        """
+        return list(self.team_season_repo.features([season]))
+
     def search_players(
         self,
         query: str,
@@ -223,40 +469,70 @@ class StatsRetrievalService:
         *,
         offset: int = 0,
         limit: int = 50,
+        cursor: str | None = None,
     ) -> dict:
         """
         Search for players across all stat categories.
 
+        Every category comes from one UNION ALL query but is paged on its
+        own; one cursor token carries the position in each, and a category
+        with no more rows comes back empty until the others are exhausted
+        too. Passing rows are not filtered by position.
+
         Args:
             query: Player name search query (case-insensitive partial match)
             season: Optional season filter
             position: Optional position filter
             offset: Number of records to skip (default: 0)
             limit: Maximum number of records to return (default: 50, max: 200)
+            cursor: next/prev cursor from a previous page (replaces offset)
 
         Returns:
-            Dictionary with results from all stat categories
+            Dictionary with results from all stat categories and next/prev
+            cursors
+
+        Raises:
+            ValueError: If the cursor is malformed
         """
         # Enforce max limit
         limit = min(limit, 200)
 
-        passing = self.passing_stats_repo.search_players(
-            query=query, season=season, limit=limit, offset=offset
-        )
-
-        rushing = self.rushing_stats_repo.search_players(
-            query=query, season=season, position=position, limit=limit, offset=offset
-        )
-
-        receiving = self.receiving_stats_repo.search_players(
-            query=query, season=season, position=position, limit=limit, offset=offset
-        )
+        lookup = self.player_lookup_repo
+        if cursor is not None:
+            pages = lookup.search_pages(
+                query, season, position, cursors=decode_cursors(cursor), limit=limit
+            )
+            results: dict[str, list[Any]] = {
+                name: page.items for name, page in pages.items()
+            }
+            next_positions = {name: page.next_cursor for name, page in pages.items()}
+            prev_positions = {name: page.prev_cursor for name, page in pages.items()}
+            has_next = any(page.has_next for page in pages.values())
+            has_prev = any(page.has_prev for page in pages.values())
+        else:
+            results = lookup.search(query, season, position, limit=limit, offset=offset)
+            next_positions = {
+                name: lookup.repos[name].cursor_for(rows[-1], "player_name", "asc")
+                if rows
+                else None
+                for name, rows in results.items()
+            }
+            prev_positions = {
+                name: lookup.repos[name].cursor_for(
+                    rows[0], "player_name", "asc", backward=True
+                )
+                if rows
+                else None
+                for name, rows in results.items()
+            }
+            has_next = any(len(rows) == limit for rows in results.values())
+            has_prev = offset > 0
 
         return {
             "query": query,
             "season": season,
             "position": position,
-            "passing": passing,
-            "rushing": rushing,
-            "receiving": receiving,
+            **results,
+            "next_cursor": encode_cursors(next_positions) if has_next else None,
+            "prev_cursor": encode_cursors(prev_positions) if has_prev else None,
         }
@@ -1,20 +1,6 @@
-import logging
-
 from bs4 import Tag
-from sqlalchemy.orm import Session
-
-from src.core.database import SessionLocal
-from src.core.scraper_utils import (
-    clean_value,
-    fetch_page_with_selenium,
-    find_pfr_table,
-    retry_with_backoff,
-)
-from src.dtos.team_offense_dto import TeamOffenseCreate
-from src.entities.team_offense import TeamOffense
-from src.repositories.team_offense_repo import TeamOffenseRepository
 
-logger = logging.getLogger(__name__)
+from src.core.scraper_utils import clean_value, find_pfr_table
 
 PFR_URL_TEMPLATE = "https://www.pro-football-reference.com/years/{season}/"
 PFR_TABLE_ID = "team_stats"
@@ -50,9 +36,8 @@ COLUMN_MAP = {
 }
 
 
-def get_dataframe(season: int) -> list[dict]:
-    url = PFR_URL_TEMPLATE.format(season=season)
-    page_source = retry_with_backoff(fetch_page_with_selenium, url, url=url)
+def parse_page(page_source: str, season: int) -> list[dict]:
+    """Parse stat rows for a season out of a raw PFR page."""
     table = find_pfr_table(page_source, PFR_TABLE_ID)
 
     if table is None:
@@ -83,39 +68,3 @@ def get_dataframe(season: int) -> list[dict]:
         rows.append(row)
 
     return rows
-
-
-async def scrape_and_store_team_offense(season: int):
-    db: Session = SessionLocal()
-
-    try:
-        logger.info("Fetching team offense data for season %d", season)
-        parsed = get_dataframe(season)
-        logger.info("Parsed %d team offense records for season %d", len(parsed), season)
-
-        repo = TeamOffenseRepository(db)
-
-        saved = []
-        for row in parsed:
-            dto = TeamOffenseCreate(**row)
-            obj = TeamOffense(**dto.model_dump())
-            saved_obj = repo.create(obj, commit=False)
-            saved.append(saved_obj)
-
-        db.commit()
-
-        logger.info(
-            "Successfully saved %d team offense records for season %d",
-            len(saved),
-            season,
-        )
-        return saved
-
-    except Exception:
-        logger.error(
-            "Failed to scrape team offense for season %d", season, exc_info=True
-        )
-        raise
-
-    finally:
-        db.close()
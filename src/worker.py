@@ -0,0 +1,106 @@
+"""
+Scrape work queue CLI: enqueue scrapes and run scraper workers.
+
+Usage:
+    python -m src.worker enqueue all --seasons 2000-2024 --priority backfill
+    python -m src.worker enqueue games --seasons 2025 --priority interactive
+    python -m src.worker run                 # poll forever (one per container)
+    python -m src.worker run --exit-when-idle
+    python -m src.worker status
+
+Any number of workers may run against the same database; tasks are one
+per (page, season) and leased with SELECT ... FOR UPDATE SKIP LOCKED, so
+no page is scraped twice concurrently, and a page that feeds several stat
+types is fetched once for all of them.
+"""
+
+import argparse
+import json
+import logging
+import signal
+import sys
+import threading
+
+from src.core.rate_limit import ScrapePriority
+from src.reparse import parse_seasons, parse_stat_types
+from src.services.scrape_queue_service import (
+    QUEUE_PRIORITIES,
+    enqueue,
+    queue_status,
+    work,
+)
+
+
+def parse_priority(value: str) -> int:
+    """Accept a priority class name (interactive, in_season, backfill) or int."""
+    if value in ScrapePriority.__members__:
+        return QUEUE_PRIORITIES[ScrapePriority(value)]
+    try:
+        return int(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(
+            f"Invalid priority {value!r}: use an int or {', '.join(ScrapePriority)}"
+        ) from e
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.worker", description=__doc__.splitlines()[1]
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    enqueue_cmd = commands.add_parser("enqueue", help="Queue scrapes")
+    enqueue_cmd.add_argument("stat_types", nargs="+", help='Stat types, or "all"')
+    enqueue_cmd.add_argument("--seasons", type=parse_seasons, required=True)
+    enqueue_cmd.add_argument(
+        "--priority",
+        type=parse_priority,
+        default=QUEUE_PRIORITIES[ScrapePriority.backfill],
+        help="Class name or int; higher runs first (default: backfill)",
+    )
+
+    run_cmd = commands.add_parser("run", help="Lease and run queued scrapes")
+    run_cmd.add_argument("--worker-id", default=None, help="Default: host:pid")
+    run_cmd.add_argument("--max-tasks", type=int, default=None)
+    run_cmd.add_argument("--exit-when-idle", action="store_true")
+    run_cmd.add_argument(
+        "--stat-types", nargs="+", default=None, help="Only lease these stat types"
+    )
+
+    commands.add_parser("status", help="Print task counts by status")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+
+    if args.command == "enqueue":
+        count = enqueue(
+            parse_stat_types(args.stat_types), args.seasons, priority=args.priority
+        )
+        logging.info("Queued %d scrape task(s)", count)
+        return 0
+
+    if args.command == "status":
+        print(json.dumps(queue_status()))
+        return 0
+
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+    stat_types = (
+        [str(st) for st in parse_stat_types(args.stat_types)]
+        if args.stat_types
+        else None
+    )
+    ran = work(
+        args.worker_id,
+        max_tasks=args.max_tasks,
+        exit_when_idle=args.exit_when_idle,
+        stop=stop,
+        stat_types=stat_types,
+    )
+    logging.info("Worker ran %d task(s)", ran)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
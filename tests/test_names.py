@@ -0,0 +1,24 @@
+"""Tests for src/core/names.py (player name normalization)."""
+
+import pytest
+
+from src.core.names import name_pattern, normalize_name
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Patrick Mahomes", "patrick mahomes"),
+        ("José  Núñez", "jose nunez"),
+        ("Ka'imi Fairbairn", "ka'imi fairbairn"),
+        (" Amon-Ra St. Brown ", "amon-ra st. brown"),
+        (None, None),
+    ],
+)
+def test_normalize_name(name, expected):
+    assert normalize_name(name) == expected
+
+
+def test_pattern_normalizes_and_escapes_wildcards():
+    assert name_pattern("Núñez") == "%nunez%"
+    assert name_pattern("100%_") == "%100\\%\\_%"
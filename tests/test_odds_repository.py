@@ -193,6 +193,14 @@ class TestOddsRepository:
         odds = OddsRepository.get_by_team(db_session, "BAL", season=2024, week=1)
         assert len(odds) == 1
 
+    def test_get_by_team_matches_any_alias(self, db_session, sample_odds_dto):
+        """Teams are matched on their registry id, not the stored spelling."""
+        OddsRepository.create(db_session, sample_odds_dto)
+
+        assert len(OddsRepository.get_by_team(db_session, "Kansas City Chiefs")) == 1
+        assert len(OddsRepository.get_by_team(db_session, "RAV")) == 1
+        assert OddsRepository.get_by_team(db_session, "Unknown Team") == []
+
     def test_bulk_create(self, db_session):
         """Test bulk insert of odds records."""
         dtos = [
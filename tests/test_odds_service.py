@@ -125,12 +125,24 @@ class TestOddsService:
         with pytest.raises(ValueError, match="ODDS_API_KEY not configured"):
             await odds_service.fetch_odds_from_api()
 
-    def test_team_name_to_abbr(self, odds_service):
-        """Test team name abbreviation conversion."""
-        assert odds_service._team_name_to_abbr("Kansas City Chiefs") == "KC"
-        assert odds_service._team_name_to_abbr("Baltimore Ravens") == "BAL"
-        # Unknown team should return first 3 chars uppercase
-        assert odds_service._team_name_to_abbr("Unknown Team") == "UNK"
+    def test_parse_resolves_teams_through_registry(
+        self, odds_service, sample_api_response
+    ):
+        """Full names from the API are stored as registry abbreviations."""
+        sample_api_response[0]["home_team"] = "Washington Commanders"
+        sample_api_response[0]["away_team"] = "San Francisco 49ers"
+
+        dtos = odds_service.parse_api_response_to_dtos(sample_api_response, 2024, 1)
+
+        assert (dtos[0].home_team, dtos[0].away_team) == ("WAS", "SF")
+
+    def test_parse_skips_unknown_team(self, odds_service, sample_api_response):
+        """Games with a team the registry does not know are not stored."""
+        sample_api_response[0]["away_team"] = "Unknown Team"
+
+        assert (
+            odds_service.parse_api_response_to_dtos(sample_api_response, 2024, 1) == []
+        )
 
     @pytest.mark.asyncio
     async def test_fetch_and_store_current_odds(
@@ -0,0 +1,287 @@
+"""
+Unit tests for the raw page archive and the offline reparse path.
+
+Tests cover:
+- PageArchive: content-addressed storage, dedupe, latest-by-URL lookup
+- archive_page: disabled by default, never raises
+- reparse: rebuilding a stat table purely from archived pages
+- parse_pipeline: shared-page planning, columnar results, batched writes
+"""
+
+from datetime import UTC, datetime
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import delete, select, update
+
+from src.core import page_archive
+from src.core.config import settings
+from src.core.page_archive import PageArchive, archive_page
+from src.entities.player import Player
+from src.entities.rushing_stats import RushingStats
+from src.entities.stat_change import StatChange
+from src.entities.team_offense import TeamOffense
+from src.reparse import main, parse_stat_types
+from src.services.parse_pipeline import (
+    BatchWriter,
+    ParsedTable,
+    parse_pages,
+    plan_tasks,
+)
+from src.services.reparse_service import reparse
+from src.services.stat_registry import StatType, page_url
+
+RUSHING_HTML = """
+<html><body><table id="rushing"><tbody>
+<tr><th data-stat="ranker">1</th>
+<td data-stat="player" data-append-csv="AlleJo02">Josh Allen*</td>
+<td data-stat="team">BUF</td><td data-stat="rush_yds">524</td></tr>
+</tbody></table></body></html>
+"""
+
+TEAM_STATS_HTML = """
+<html><body>
+<!-- <table id="team_stats"><tbody>
+<tr><td data-stat="team">Kansas City Chiefs</td><td data-stat="g">17</td>
+<td data-stat="points">{points}</td></tr>
+</tbody></table> -->
+</body></html>
+"""
+
+
+class TestPageArchive:
+    @pytest.fixture
+    def archive(self, tmp_path):
+        return PageArchive(tmp_path)
+
+    def test_put_and_read_latest_roundtrip(self, archive):
+        archive.put("https://pfr/a", "<html>a</html>")
+        assert archive.read_latest("https://pfr/a") == "<html>a</html>"
+
+    def test_identical_bodies_stored_once(self, archive, tmp_path):
+        h1 = archive.put("https://pfr/a", "<html>same</html>")
+        h2 = archive.put("https://pfr/b", "<html>same</html>")
+
+        assert h1 == h2
+        assert len(list((tmp_path / "objects").rglob("*.gz"))) == 1
+
+    def test_latest_returns_most_recent_fetch(self, archive):
+        archive.put("https://pfr/a", "old", datetime(2024, 1, 1, tzinfo=UTC))
+        archive.put("https://pfr/a", "new", datetime(2024, 2, 1, tzinfo=UTC))
+
+        page = archive.latest("https://pfr/a")
+        assert page is not None
+        assert page.size == 3
+        assert archive.read(page) == "new"
+
+    def test_unknown_url_returns_none(self, archive):
+        assert archive.latest("https://pfr/missing") is None
+        assert archive.read_latest("https://pfr/missing") is None
+
+    def test_unknown_codec_rejected(self, tmp_path):
+        with pytest.raises(ValueError):
+            PageArchive(tmp_path, codec="lz4")
+
+    def test_archive_page_disabled_without_dir(self):
+        with patch.object(settings, "PAGE_ARCHIVE_DIR", ""):
+            assert archive_page("https://pfr/a", "<html/>") is None
+
+    def test_archive_page_swallows_errors(self, tmp_path):
+        with patch.object(settings, "PAGE_ARCHIVE_DIR", str(tmp_path)):
+            with patch.object(PageArchive, "put", side_effect=OSError("disk full")):
+                assert archive_page("https://pfr/a", "<html/>") is None
+
+
+class TestReparse:
+    @pytest.fixture(autouse=True)
+    def archive_dir(self, tmp_path):
+        page_archive._archives.clear()
+        with patch.object(settings, "PAGE_ARCHIVE_DIR", str(tmp_path)):
+            yield
+        page_archive._archives.clear()
+
+    @pytest.fixture
+    def session_local(self, db_session):
+        with patch("src.services.reparse_service.SessionLocal") as mock:
+            mock.return_value = db_session
+            yield mock
+
+    def test_rebuilds_table_from_archive(self, db_session, session_local):
+        url = page_url(StatType.team_offense, 2023)
+        archive_page(url, TEAM_STATS_HTML.format(points=450))
+
+        results = list(reparse([StatType.team_offense], [2023], workers=0))
+
+        (result,) = results
+        assert (result["stat_type"], result["status"], result["rows"]) == (
+            "team_offense",
+            "stored",
+            1,
+        )
+        row = db_session.execute(select(TeamOffense)).scalar_one()
+        assert row.pf == 450
+
+    def test_replaces_existing_season_rows(self, db_session, session_local):
+        url = page_url(StatType.team_offense, 2023)
+        archive_page(url, TEAM_STATS_HTML.format(points=450))
+        list(reparse([StatType.team_offense], [2023], workers=0))
+
+        archive_page(url, TEAM_STATS_HTML.format(points=455))
+        list(reparse([StatType.team_offense], [2023], workers=0))
+
+        rows = db_session.execute(select(TeamOffense)).scalars().all()
+        assert [r.pf for r in rows] == [455]
+
+    def test_missing_page_reported(self, session_local):
+        results = list(reparse([StatType.team_offense], [1999], workers=0))
+        assert results[0]["status"] == "missing"
+
+    def test_parses_in_process_pool(self, db_session, session_local):
+        for season, points in [(2022, 400), (2023, 450), (2024, 500)]:
+            url = page_url(StatType.team_offense, season)
+            archive_page(url, TEAM_STATS_HTML.format(points=points))
+
+        results = list(
+            reparse(
+                [StatType.team_offense], [2022, 2023, 2024], workers=2, chunk_size=1
+            )
+        )
+
+        assert sorted(r["season"] for r in results if r["status"] == "stored") == [
+            2022,
+            2023,
+            2024,
+        ]
+        rows = db_session.execute(select(TeamOffense)).scalars().all()
+        assert sorted(r.pf for r in rows) == [400, 450, 500]
+
+    def test_players_group_fills_player_ids(self, db_session, session_local):
+        archive_page(page_url(StatType.rushing_stats, 2023), RUSHING_HTML)
+        list(reparse([StatType.rushing_stats], [2023], workers=0))
+        # A row stored before player ids were parsed
+        db_session.execute(update(RushingStats).values(player_id=None))
+        db_session.execute(delete(StatChange))
+        db_session.commit()
+
+        assert main(["players", "--seasons", "2023", "--workers", "0"]) == 0
+
+        row = db_session.execute(select(RushingStats)).scalar_one()
+        assert db_session.get(Player, row.player_id).pfr_id == "AlleJo02"
+        assert db_session.execute(select(StatChange)).first() is None
+
+    def test_requires_archive_dir(self):
+        with patch.object(settings, "PAGE_ARCHIVE_DIR", ""):
+            with pytest.raises(RuntimeError):
+                list(reparse([StatType.team_offense], [2023], workers=0))
+
+
+class TestParsePipeline:
+    @pytest.fixture
+    def archive(self, tmp_path):
+        return PageArchive(tmp_path)
+
+    def test_stat_types_sharing_a_page_become_one_task(self, archive):
+        for season in (2022, 2023):
+            archive.put(page_url(StatType.kicking, season), "<html/>")
+
+        tasks, missing = plan_tasks(
+            archive,
+            [StatType.kicking, StatType.kicking_stats, StatType.punting],
+            [2022, 2023],
+        )
+
+        assert [(t.season, t.stat_types) for t in tasks] == [
+            (2022, ("kicking", "kicking_stats")),
+            (2023, ("kicking", "kicking_stats")),
+        ]
+        assert missing == [(StatType.punting, 2022), (StatType.punting, 2023)]
+
+    def test_parsed_table_is_columnar(self):
+        table = ParsedTable.from_rows(
+            "team_offense", 2023, [{"tm": "KC", "pf": 450}, {"tm": "BUF"}]
+        )
+
+        assert table.columns == {"tm": ["KC", "BUF"], "pf": [450, None]}
+        assert len(table) == 2
+        assert table.rows() == [{"tm": "KC", "pf": 450}, {"tm": "BUF", "pf": None}]
+
+    def test_parse_errors_reported_per_table(self, archive):
+        archive.put(page_url(StatType.team_offense, 2023), "<html>no tables</html>")
+        tasks, _ = plan_tasks(archive, [StatType.team_offense], [2023])
+
+        (table,) = parse_pages(archive, tasks, workers=0)
+
+        assert table.error is not None
+        assert len(table) == 0
+
+    def test_batch_writer_isolates_failing_table(self, db_session):
+        writer = BatchWriter(lambda: db_session, batch_rows=100)
+        good = ParsedTable.from_rows(
+            "team_offense", 2023, [{"tm": "KC", "season": 2023, "pf": 450}]
+        )
+        duplicate = ParsedTable.from_rows(
+            "team_offense", 2022, [{"tm": "KC", "season": 2022}] * 2
+        )
+
+        assert writer.add(good) == []
+        assert writer.add(duplicate) == []
+        results = writer.flush()
+
+        assert [r["status"] for r in results] == ["stored", "failed"]
+        row = db_session.execute(select(TeamOffense)).scalar_one()
+        assert (row.season, row.pf) == (2023, 450)
+
+    def test_batch_writer_flushes_at_row_threshold(self, db_session):
+        writer = BatchWriter(lambda: db_session, batch_rows=2)
+        table = ParsedTable.from_rows(
+            "team_offense", 2023, [{"tm": t, "season": 2023} for t in ("KC", "BUF")]
+        )
+
+        (result,) = writer.add(table)
+        assert (result["status"], result["rows"], result["inserted"]) == (
+            "stored",
+            2,
+            2,
+        )
+        assert writer.flush() == []
+
+    def test_batch_writer_swap_mode(self, db_session):
+        writer = BatchWriter(lambda: db_session, batch_rows=100, write_mode="swap")
+        for pf in (450, 451):
+            writer.add(
+                ParsedTable.from_rows(
+                    "team_offense", 2023, [{"tm": "KC", "season": 2023, "pf": pf}]
+                )
+            )
+            (result,) = writer.flush()
+
+        assert (result["status"], result["updated"]) == ("stored", 1)
+        row = db_session.execute(select(TeamOffense)).scalar_one()
+        assert row.pf == 451
+
+    def test_batch_writer_invalidates_changed_tables(self, db_session):
+        writer = BatchWriter(lambda: db_session, batch_rows=100)
+        table = ParsedTable.from_rows(
+            "team_offense", 2023, [{"tm": "KC", "season": 2023, "pf": 450}]
+        )
+
+        with patch("src.services.parse_pipeline.invalidate") as invalidate:
+            writer.add(table)
+            writer.flush()
+            writer.add(table)
+            writer.flush()  # unchanged: nothing to invalidate
+
+        invalidate.assert_called_once_with("team_offense", 2023)
+
+
+class TestReparseCli:
+    def test_players_expands_to_player_stat_tables(self):
+        stat_types = parse_stat_types(["players"])
+
+        assert StatType.rushing_stats in stat_types
+        assert StatType.team_offense not in stat_types
+        assert len(stat_types) == 8
+
+    def test_unknown_stat_type_exits(self):
+        with pytest.raises(SystemExit):
+            parse_stat_types(["nope"])
@@ -0,0 +1,169 @@
+"""Tests for the HTTP read routes over StatsRetrievalService."""
+
+import json
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from src.core.database import get_db
+from src.entities.base import Base
+from src.entities.player import Player
+from src.entities.rushing_stats import RushingStats
+from src.entities.standings import Standings
+from src.entities.team_game import TeamGame
+from src.entities.team_offense import TeamOffense
+from src.main import app
+from src.services.cached_stats_service import read_cache
+
+
+@pytest.fixture
+def client():
+    # Handlers run on the threadpool, so share one connection across threads
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    db_session = Session()
+    db_session.add_all(
+        [
+            TeamOffense(season=2023, tm="KAN", pf=450, ypp=Decimal("5.6")),
+            TeamOffense(season=2023, tm="BUF", pf=400),
+            Standings(season=2023, tm="KAN", w=11, losses=6),
+            TeamGame(team_abbr="KAN", season=2023, week=1, game_date=date(2023, 9, 7)),
+            Player(id=1, pfr_id="PachIs00", player_name="Isiah Pacheco"),
+            RushingStats(
+                season=2023, player_name="Isiah Pacheco", tm="KAN", player_id=1
+            ),
+        ]
+    )
+    db_session.commit()
+    db_session.close()
+
+    def get_test_db():
+        with Session() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = get_test_db
+    read_cache.clear()
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+    read_cache.clear()
+    engine.dispose()
+
+
+class TestReadRoutes:
+    def test_teams_paged_and_sorted(self, client):
+        body = client.get("/teams/2023", params={"order": "asc", "limit": 1}).json()
+
+        assert body["total"] == 2
+        assert [t["tm"] for t in body["data"]] == ["BUF"]
+        assert "row_hash" not in body["data"][0]
+
+    def test_team_stats(self, client):
+        body = client.get("/teams/2023/KAN").json()
+
+        assert (body["team"], body["points_for"], body["yards_per_play"]) == (
+            "KAN",
+            450,
+            5.6,
+        )
+
+    def test_unknown_team_is_404(self, client):
+        assert client.get("/teams/2023/XXX").status_code == 404
+
+    def test_player_search(self, client):
+        body = client.get("/players/search", params={"q": "pach"}).json()
+
+        assert [r["player_name"] for r in body["rushing"]] == ["Isiah Pacheco"]
+        assert body["passing"] == []
+
+    def test_player_by_id(self, client):
+        body = client.get("/players/1").json()
+
+        assert body["player"]["pfr_id"] == "PachIs00"
+        assert [r["tm"] for r in body["rushing"]] == ["KAN"]
+        assert body["passing"] == []
+
+    def test_unknown_player_is_404(self, client):
+        assert client.get("/players/999").status_code == 404
+
+    def test_standings(self, client):
+        (row,) = client.get("/standings/2023").json()["data"]
+
+        assert (row["tm"], row["w"], row["losses"]) == ("KAN", 11, 6)
+
+    def test_games(self, client):
+        body = client.get("/games/2023", params={"week": 1}).json()
+
+        assert body["week"] == 1
+        assert body["data"][0]["game_date"] == "2023-09-07"
+
+    def test_repeated_reads_served_from_cache(self, client):
+        client.get("/standings/2023")
+        client.get("/standings/2023")
+
+        assert read_cache.stats()["hits"] >= 1
+
+    def test_limit_validated(self, client):
+        assert client.get("/teams/2023", params={"limit": 500}).status_code == 422
+
+    def test_cursor_pages_follow_on(self, client):
+        first = client.get("/teams/2023", params={"limit": 1}).json()
+        second = client.get(
+            "/teams/2023", params={"limit": 1, "cursor": first["next_cursor"]}
+        ).json()
+
+        assert [t["tm"] for t in first["data"] + second["data"]] == ["KAN", "BUF"]
+        assert second["next_cursor"] is None
+        assert second["prev_cursor"] is not None
+
+    def test_invalid_cursor_is_400(self, client):
+        response = client.get("/teams/2023", params={"cursor": "garbage!"})
+
+        assert response.status_code == 400
+
+    def test_team_season_features_streamed_as_ndjson(self, client):
+        response = client.get("/features/team-season", params={"seasons": "2022-2023"})
+
+        assert response.headers["content-type"] == "application/x-ndjson"
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [(r["season"], r["team"]) for r in rows] == [(2023, "BUF"), (2023, "KC")]
+        kc = rows[1]
+        assert (kc["offense_pf"], kc["offense_ypp"], kc["standings_w"]) == (
+            450,
+            5.6,
+            11,
+        )
+        assert rows[0]["standings_w"] is None
+
+    def test_team_season_features_cached_per_season(self, client):
+        client.get("/features/team-season", params={"seasons": "2023"})
+        hits = read_cache.stats()["hits"]
+
+        client.get("/features/team-season", params={"seasons": "2022,2023"})
+
+        assert read_cache.stats()["hits"] == hits + 1
+
+    def test_changes_read_through_request_session(self, client):
+        body = client.get("/changes", params={"tables": "team_offense"}).json()
+
+        assert body == {"changes": [], "cursor": 0, "has_more": False}
+
+    def test_unknown_change_table_is_400(self, client):
+        response = client.get("/changes", params={"tables": "nope"})
+
+        assert response.status_code == 400
+
+    @pytest.mark.parametrize("seasons", ["20x3", "2023-2020", "1800-2023"])
+    def test_invalid_feature_seasons_are_400(self, client, seasons):
+        response = client.get("/features/team-season", params={"seasons": seasons})
+
+        assert response.status_code == 400
@@ -0,0 +1,138 @@
+"""Tests for src/core/read_cache.py (ReadCache)."""
+
+import threading
+import time
+
+import pytest
+
+from src.core.read_cache import ReadCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return ReadCache(max_entries=3, clock=clock)
+
+
+def loader(value, calls):
+    def load():
+        calls.append(value)
+        return value
+
+    return load
+
+
+class TestReadThrough:
+    def test_hit_after_miss(self, cache):
+        calls = []
+
+        assert cache.get_or_load("k", loader(1, calls), ttl=10) == 1
+        assert cache.get_or_load("k", loader(2, calls), ttl=10) == 1
+        assert calls == [1]
+        assert cache.stats()["hits"] == 1
+
+    def test_expired_entry_reloaded(self, cache, clock):
+        calls = []
+        cache.get_or_load("k", loader(1, calls), ttl=10)
+
+        clock.now = 11
+        assert cache.get_or_load("k", loader(2, calls), ttl=10) == 2
+
+    def test_lru_eviction(self, cache):
+        calls = []
+        for key in "abc":
+            cache.get_or_load(key, loader(key, calls), ttl=10)
+        cache.get_or_load("a", loader("a", calls), ttl=10)  # a is now newest
+
+        cache.get_or_load("d", loader("d", calls), ttl=10)
+
+        assert cache.stats()["evictions"] == 1
+        cache.get_or_load("b", loader("b2", calls), ttl=10)
+        assert calls[-1] == "b2"
+
+    def test_loader_errors_not_cached(self, cache):
+        def fail():
+            raise RuntimeError("db down")
+
+        with pytest.raises(RuntimeError):
+            cache.get_or_load("k", fail, ttl=10)
+        assert cache.get_or_load("k", lambda: 1, ttl=10) == 1
+
+
+class TestSingleFlight:
+    def test_concurrent_misses_load_once(self):
+        cache = ReadCache()
+        calls = []
+        started = threading.Event()
+
+        def slow():
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            return "value"
+
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(cache.get_or_load("k", slow, ttl=10))
+            )
+            for _ in range(8)
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert calls == [1]
+        assert results == ["value"] * 8
+        assert cache.stats()["coalesced"] == 7
+
+
+class TestInvalidate:
+    def test_evicts_tagged_season_only(self, cache):
+        calls = []
+        cache.get_or_load("2022", loader(1, calls), ttl=10, tags=[("standings", 2022)])
+        cache.get_or_load("2023", loader(2, calls), ttl=10, tags=[("standings", 2023)])
+
+        cache.invalidate("standings", 2023)
+
+        assert cache.stats()["entries"] == 1
+        assert cache.get_or_load("2022", loader(3, calls), ttl=10) == 1
+
+    def test_all_season_entries_evicted_by_any_season(self, cache):
+        cache.get_or_load("all", lambda: 1, ttl=10, tags=[("passing_stats", None)])
+
+        cache.invalidate("passing_stats", 2023)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_none_evicts_every_season(self, cache):
+        cache.get_or_load("2023", lambda: 1, ttl=10, tags=[("standings", 2023)])
+
+        cache.invalidate("standings", None)
+
+        assert cache.stats()["entries"] == 0
+
+    def test_load_overlapping_invalidation_not_stored(self, cache):
+        def load_then_write():
+            cache.invalidate("standings", 2023)  # a write commits mid-load
+            return "stale"
+
+        value = cache.get_or_load(
+            "k", load_then_write, ttl=10, tags=[("standings", 2023)]
+        )
+
+        assert value == "stale"
+        assert cache.get_or_load("k", lambda: "fresh", ttl=10) == "fresh"
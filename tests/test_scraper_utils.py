@@ -4,19 +4,93 @@ Unit tests for scraper utility functions.
 Tests retry logic, URL processing, user-agent rotation, and error handling.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.core.config import settings
+from src.core.rate_limit import HostRateLimiter, ScrapePriority, scrape_priority
+from src.core.run_metrics import RunMetrics, stage, track_run
 from src.core.scraper_utils import (
     get_random_proxy,
     get_random_user_agent,
     retry_with_backoff,
     strip_url_hash,
+    table_fingerprint,
 )
 
 
+class TestHostRateLimiter:
+    """Test per-host request spacing and priority-class sharing."""
+
+    def test_first_request_does_not_wait(self):
+        limiter = HostRateLimiter(min_interval=10)
+        assert limiter.acquire("https://example.com/a") < 0.05
+
+    def test_same_host_requests_are_spaced(self):
+        limiter = HostRateLimiter(min_interval=0.2)
+        limiter.acquire("https://example.com/a")
+        wait = limiter.acquire("https://example.com/b")
+        assert 0.15 < wait < 0.5
+
+    def test_hosts_are_limited_independently(self):
+        limiter = HostRateLimiter(min_interval=10)
+        limiter.acquire("https://example.com/a")
+        assert limiter.acquire("https://other.com/a") < 0.05
+
+    def test_interactive_preempts_queued_backfill(self):
+        limiter = HostRateLimiter(
+            min_interval=0.02, weights={"interactive": 3, "backfill": 1}
+        )
+        limiter.acquire("https://example.com/warmup", ScrapePriority.backfill)
+        grants: list[str] = []
+        lock = threading.Lock()
+
+        def fetch(priority):
+            limiter.acquire("https://example.com/page", priority)
+            with lock:
+                grants.append(priority)
+
+        threads = [
+            threading.Thread(target=fetch, args=(p,))
+            for p in [ScrapePriority.backfill] * 6 + [ScrapePriority.interactive] * 6
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(timeout=5)
+
+        assert len(grants) == 12
+        assert grants[:3] == [ScrapePriority.interactive] * 3
+        # Weighted sharing, not strict priority: backfill still progresses
+        assert ScrapePriority.backfill in grants[:6]
+
+    def test_priority_taken_from_context(self):
+        limiter = HostRateLimiter(min_interval=0)
+        with scrape_priority(ScrapePriority.backfill):
+            limiter.acquire("https://example.com/a")
+        limiter.acquire("https://example.com/b")
+
+        stats = limiter.stats()
+        assert stats["backfill"]["requests"] == 1
+        assert stats["interactive"]["requests"] == 1
+        assert stats["in_season"]["requests"] == 0
+
+    def test_waits_for_shared_slot(self):
+        claims: list[tuple[str, float]] = []
+
+        def reserve(host, interval):
+            claims.append((host, interval))
+            return 0.1
+
+        limiter = HostRateLimiter(min_interval=0, reserve=reserve)
+        wait = limiter.acquire("https://example.com/a")
+
+        assert claims == [("example.com", 0)]
+        assert 0.08 < wait < 0.5
+
+
 class TestStripUrlHash:
     """Tests for URL hash fragment stripping."""
 
@@ -279,3 +353,73 @@ class TestConfigurationSettings:
         assert hasattr(settings, "SCRAPE_PROXY_LIST")
         assert isinstance(settings.SCRAPE_USE_PROXY, bool)
         assert isinstance(settings.SCRAPE_PROXY_LIST, list)
+
+
+class TestTableFingerprint:
+    """Test HTML fragment hashing used for change detection."""
+
+    PAGE = '<div><table class="stats" id="passing"><tr><td>1</td></tr></table></div>'
+
+    def test_same_table_same_hash(self):
+        assert table_fingerprint(self.PAGE, "passing") == table_fingerprint(
+            "<p>other chrome</p>" + self.PAGE, "passing"
+        )
+
+    def test_whitespace_is_normalized(self):
+        reindented = self.PAGE.replace("<tr>", "\n  <tr>\n    ")
+        assert table_fingerprint(reindented, "passing") == table_fingerprint(
+            self.PAGE, "passing"
+        )
+
+    def test_content_change_changes_hash(self):
+        changed = self.PAGE.replace("<td>1</td>", "<td>2</td>")
+        assert table_fingerprint(changed, "passing") != table_fingerprint(
+            self.PAGE, "passing"
+        )
+
+    def test_commented_table_is_found(self):
+        assert table_fingerprint(f"<!-- {self.PAGE} -->", "passing") is not None
+
+    def test_missing_table_returns_none(self):
+        assert table_fingerprint(self.PAGE, "rushing") is None
+
+
+class TestRunMetrics:
+    """Test stage timing collected through the current scrape run."""
+
+    def test_stages_accumulate(self):
+        run = RunMetrics(run_id="r", stat_type="games")
+        with track_run(run):
+            with stage("parse"):
+                pass
+            with stage("parse"):
+                pass
+        assert run.durations["parse"] >= 0
+        assert run.total_seconds >= run.durations["parse"]
+
+    def test_noop_outside_a_run(self):
+        with stage("parse"):
+            pass  # must not raise
+
+    def test_limiter_wait_is_reported_and_excluded_from_fetch(self):
+        limiter = HostRateLimiter(min_interval=0.1)
+        limiter.acquire("https://example.com/a")
+        run = RunMetrics(run_id="r", stat_type="games")
+        with track_run(run), stage("fetch"):
+            limiter.acquire("https://example.com/b")
+
+        assert run.durations["rate_limit_wait"] > 0.05
+        assert run.stage_seconds()["fetch"] < run.durations["fetch"]
+
+    def test_retry_counts_attempts(self):
+        func = MagicMock(side_effect=[ValueError("x"), "ok"])
+        run = RunMetrics(run_id="r", stat_type="games")
+        with track_run(run):
+            retry_with_backoff(func, max_retries=2, retry_delays=[0])
+        assert run.attempts == 2
+
+    def test_failure_sets_outcome(self):
+        run = RunMetrics(run_id="r", stat_type="games")
+        with pytest.raises(ValueError), track_run(run):
+            raise ValueError("boom")
+        assert (run.outcome, run.error) == ("failed", "boom")
@@ -0,0 +1,197 @@
+"""Tests for src/core/shared_cache.py (SharedCache)."""
+
+import sqlite3
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from src.core import shared_cache
+from src.core.config import settings
+from src.core.read_cache import ReadCache
+from src.core.shared_cache import SharedCache, get_shared_cache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(tmp_path, clock):
+    return SharedCache(tmp_path, max_bytes=100, touch_interval=0, clock=clock)
+
+
+class TestGetSet:
+    def test_round_trip_and_ttl(self, cache, clock):
+        assert cache.set("k", b"value", ttl=10)
+
+        assert cache.get_with_ttl("k") == (b"value", 10)
+        clock.now += 11
+        assert cache.get("k") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_visible_to_another_instance(self, tmp_path):
+        SharedCache(tmp_path).set("k", b"value", ttl=10)
+
+        assert SharedCache(tmp_path).get("k") == b"value"
+
+    def test_overwrite_keeps_byte_count(self, cache):
+        cache.set("k", b"x" * 40, ttl=10)
+        cache.set("k", b"x" * 30, ttl=10)
+
+        assert cache.stats()["bytes"] == 30
+        assert cache.stats()["entries"] == 1
+
+    def test_oversized_value_not_stored(self, cache):
+        assert not cache.set("k", b"x" * 101, ttl=10)
+
+
+class TestEviction:
+    def test_least_recently_used_evicted(self, cache, clock):
+        for key in "abc":
+            clock.now += 1
+            cache.set(key, b"x" * 30, ttl=100)
+        clock.now += 1
+        cache.get("a")  # a is now newest
+
+        clock.now += 1
+        cache.set("d", b"x" * 30, ttl=100)
+
+        assert cache.get("b") is None
+        assert cache.get("a") == b"x" * 30
+        assert cache.stats()["bytes"] <= 100
+
+    def test_expired_entries_evicted_first(self, cache, clock):
+        cache.set("short", b"x" * 40, ttl=1)
+        clock.now += 1
+        cache.set("long", b"x" * 40, ttl=100)
+        clock.now += 5
+
+        cache.set("new", b"x" * 40, ttl=100)
+
+        assert cache.get("long") is not None
+        assert cache.stats()["evictions"] == 1
+
+
+class TestInvalidate:
+    def test_matches_read_cache_semantics(self, cache):
+        cache.set("2022", b"1", ttl=10, tags=[("standings", 2022)])
+        cache.set("2023", b"2", ttl=10, tags=[("standings", 2023)])
+        cache.set("all", b"3", ttl=10, tags=[("standings", None)])
+
+        cache.invalidate("standings", 2023)
+
+        assert cache.get("2022") == b"1"
+        assert cache.get("2023") is None
+        assert cache.get("all") is None
+
+        cache.invalidate("standings", None)
+        assert cache.get("2022") is None
+
+    def test_write_after_invalidation_rejected(self, cache):
+        generations = cache.generations(["standings"])
+        cache.invalidate("standings", 2023)  # a write commits mid-load
+
+        assert not cache.set(
+            "k", b"stale", ttl=10, tags=[("standings", 2023)], generations=generations
+        )
+        assert cache.get("k") is None
+
+
+class TestFailures:
+    def test_sqlite_errors_degrade_to_miss(self, cache):
+        with patch.object(cache, "_connect", side_effect=sqlite3.OperationalError):
+            assert cache.get("k") is None
+            assert not cache.set("k", b"v", ttl=10)
+
+        assert cache.stats()["errors"] == 2
+
+    def test_disabled_without_dir(self, monkeypatch):
+        monkeypatch.setattr(settings, "SHARED_CACHE_DIR", "")
+
+        assert get_shared_cache() is None
+
+
+class TestUnderReadCache:
+    def test_sibling_process_served_from_shared_tier(self, tmp_path):
+        workers = [ReadCache(shared=SharedCache(tmp_path)) for _ in range(2)]
+        calls = []
+
+        def load():
+            calls.append(1)
+            return {"tm": "KAN"}
+
+        tags = [("team_offense", 2022)]
+        assert workers[0].get_or_load("k", load, ttl=10, tags=tags) == {"tm": "KAN"}
+        assert workers[1].get_or_load("k", load, ttl=10, tags=tags) == {"tm": "KAN"}
+
+        assert calls == [1]
+        assert workers[1].stats()["shared_hits"] == 1
+
+    def test_invalidation_reaches_shared_tier(self, tmp_path):
+        workers = [ReadCache(shared=SharedCache(tmp_path)) for _ in range(2)]
+        tags = [("team_offense", 2022)]
+        workers[0].get_or_load("k", lambda: 1, ttl=10, tags=tags)
+
+        workers[0].invalidate("team_offense", 2022)
+
+        assert workers[1].get_or_load("k", lambda: 2, ttl=10, tags=tags) == 2
+
+    def test_threads_share_one_file(self, tmp_path):
+        cache = SharedCache(tmp_path)
+
+        def write(i):
+            cache.set(f"k{i}", b"v", ttl=10)
+
+        threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert cache.stats()["entries"] == 8
+        assert cache.stats()["errors"] == 0
+
+
+def test_fetch_page_served_from_shared_cache(tmp_path, monkeypatch):
+    from src.core import scraper_utils
+
+    monkeypatch.setattr(settings, "SHARED_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(shared_cache, "_caches", {})
+    with patch.object(
+        scraper_utils, "fetch_page_with_selenium", return_value="<html/>"
+    ) as fetch:
+        monkeypatch.setattr(settings, "SCRAPE_BACKEND", "selenium")
+        assert scraper_utils.fetch_page("https://example.com/a") == "<html/>"
+        assert scraper_utils.fetch_page("https://example.com/a") == "<html/>"
+
+    assert fetch.call_count == 1
+
+
+def test_fetch_page_without_cache_goes_to_network(tmp_path, monkeypatch):
+    from src.core import scraper_utils
+
+    monkeypatch.setattr(settings, "SHARED_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(shared_cache, "_caches", {})
+    monkeypatch.setattr(settings, "SCRAPE_BACKEND", "selenium")
+    with patch.object(
+        scraper_utils, "fetch_page_with_selenium", side_effect=["old", "new"]
+    ) as fetch:
+        assert scraper_utils.fetch_page("https://example.com/a") == "old"
+        assert scraper_utils.fetch_page("https://example.com/a", use_cache=False) == (
+            "new"
+        )
+        # The forced fetch refreshed the cached copy
+        assert scraper_utils.fetch_page("https://example.com/a") == "new"
+
+    assert fetch.call_count == 2
@@ -1,11 +1,15 @@
 """Unit tests for StatsRetrievalService."""
 
+from datetime import date
 from decimal import Decimal
-from unittest.mock import Mock
+from unittest.mock import MagicMock, Mock
 
 import pytest
+from sqlalchemy import event
 
+from src.core.read_cache import ReadCache
 from src.entities.passing_stats import PassingStats
+from src.entities.rushing_stats import RushingStats
 from src.entities.standings import Standings
 from src.entities.team_offense import TeamOffense
 from src.services.stats_retrieval_service import StatsRetrievalService
@@ -26,11 +30,9 @@ class TestStatsRetrievalService:
 
         # Mock all repositories
         service.team_offense_repo = Mock()
-        service.passing_stats_repo = Mock()
-        service.rushing_stats_repo = Mock()
-        service.receiving_stats_repo = Mock()
         service.standings_repo = Mock()
         service.team_game_repo = Mock()
+        service.player_lookup_repo = MagicMock()
 
         return service
 
@@ -42,8 +44,10 @@ class TestStatsRetrievalService:
             TeamOffense(id=1, season=2023, tm="Team A", pf=400),
             TeamOffense(id=2, season=2023, tm="Team B", pf=350),
         ]
-        service.team_offense_repo.find_by_season.return_value = mock_teams
-        service.team_offense_repo.count_by_season.return_value = 32
+        service.team_offense_repo.find_by_season_with_total.return_value = (
+            mock_teams,
+            32,
+        )
 
         # Act
         result = service.get_all_teams(season=2023, offset=0, limit=50)
@@ -53,43 +57,40 @@ class TestStatsRetrievalService:
         assert result["total"] == 32
         assert result["offset"] == 0
         assert result["limit"] == 50
-        service.team_offense_repo.find_by_season.assert_called_once_with(
+        service.team_offense_repo.find_by_season_with_total.assert_called_once_with(
             season=2023, limit=50, offset=0, sort_by="pf", order="desc"
         )
 
     def test_get_all_teams_enforces_max_limit(self, service):
         """Test that get_all_teams enforces maximum limit of 200."""
         # Arrange
-        service.team_offense_repo.find_by_season.return_value = []
-        service.team_offense_repo.count_by_season.return_value = 0
+        service.team_offense_repo.find_by_season_with_total.return_value = ([], 0)
 
         # Act
         result = service.get_all_teams(season=2023, limit=500)
 
         # Assert
-        service.team_offense_repo.find_by_season.assert_called_once()
-        call_args = service.team_offense_repo.find_by_season.call_args
+        service.team_offense_repo.find_by_season_with_total.assert_called_once()
+        call_args = service.team_offense_repo.find_by_season_with_total.call_args
         assert call_args.kwargs["limit"] == 200
 
     def test_get_all_teams_with_custom_sort(self, service):
         """Test that get_all_teams respects custom sorting parameters."""
         # Arrange
-        service.team_offense_repo.find_by_season.return_value = []
-        service.team_offense_repo.count_by_season.return_value = 0
+        service.team_offense_repo.find_by_season_with_total.return_value = ([], 0)
 
         # Act
         service.get_all_teams(season=2023, sort_by="yds", order="asc")
 
         # Assert
-        service.team_offense_repo.find_by_season.assert_called_once_with(
+        service.team_offense_repo.find_by_season_with_total.assert_called_once_with(
             season=2023, limit=50, offset=0, sort_by="yds", order="asc"
         )
 
     def test_get_all_teams_empty_result(self, service):
         """Test that get_all_teams returns empty list when no data exists."""
         # Arrange
-        service.team_offense_repo.find_by_season.return_value = []
-        service.team_offense_repo.count_by_season.return_value = 0
+        service.team_offense_repo.find_by_season_with_total.return_value = ([], 0)
 
         # Act
         result = service.get_all_teams(season=2025)
@@ -161,12 +162,11 @@ class TestStatsRetrievalService:
         """Test that get_player_stats returns stats from all categories."""
         # Arrange
         mock_passing = [PassingStats(id=1, player_name="Patrick Mahomes")]
-        mock_rushing = []
-        mock_receiving = []
-
-        service.passing_stats_repo.find_by_player.return_value = mock_passing
-        service.rushing_stats_repo.search_players.return_value = mock_rushing
-        service.receiving_stats_repo.search_players.return_value = mock_receiving
+        service.player_lookup_repo.search.return_value = {
+            "passing": mock_passing,
+            "rushing": [],
+            "receiving": [],
+        }
 
         # Act
         result = service.get_player_stats("Mahomes", 2023)
@@ -175,15 +175,18 @@ class TestStatsRetrievalService:
         assert result["player_name"] == "Mahomes"
         assert result["season"] == 2023
         assert result["passing"] == mock_passing
-        assert result["rushing"] == mock_rushing
-        assert result["receiving"] == mock_receiving
+        assert result["rushing"] == []
+        assert result["receiving"] == []
+        service.player_lookup_repo.search.assert_called_once_with("Mahomes", 2023)
 
     def test_get_player_stats_empty_results(self, service):
         """Test that get_player_stats handles no results gracefully."""
         # Arrange
-        service.passing_stats_repo.find_by_player.return_value = []
-        service.rushing_stats_repo.search_players.return_value = []
-        service.receiving_stats_repo.search_players.return_value = []
+        service.player_lookup_repo.search.return_value = {
+            "passing": [],
+            "rushing": [],
+            "receiving": [],
+        }
 
         # Act
         result = service.get_player_stats("Unknown", 2023)
@@ -201,8 +204,10 @@ class TestStatsRetrievalService:
             Standings(id=1, season=2023, tm="Team A", w=12, losses=5),
             Standings(id=2, season=2023, tm="Team B", w=10, losses=7),
         ]
-        service.standings_repo.find_by_season.return_value = mock_standings
-        service.standings_repo.count_by_season.return_value = 32
+        service.standings_repo.find_by_season_with_total.return_value = (
+            mock_standings,
+            32,
+        )
 
         # Act
         result = service.get_standings(season=2023)
@@ -216,8 +221,7 @@ class TestStatsRetrievalService:
     def test_get_standings_empty_result(self, service):
         """Test that get_standings returns empty list when no data."""
         # Arrange
-        service.standings_repo.find_by_season.return_value = []
-        service.standings_repo.count_by_season.return_value = 0
+        service.standings_repo.find_by_season_with_total.return_value = ([], 0)
 
         # Act
         result = service.get_standings(season=2025)
@@ -231,8 +235,10 @@ class TestStatsRetrievalService:
         """Test that get_games returns all games when week is not specified."""
         # Arrange
         mock_games = [Mock(), Mock(), Mock()]
-        service.team_game_repo.find_by_season_and_week.return_value = mock_games
-        service.team_game_repo.count_by_season.return_value = 256
+        service.team_game_repo.find_by_season_and_week_with_total.return_value = (
+            mock_games,
+            256,
+        )
 
         # Act
         result = service.get_games(season=2023)
@@ -246,23 +252,24 @@ class TestStatsRetrievalService:
         """Test that get_games filters by week when specified."""
         # Arrange
         mock_games = [Mock(), Mock()]
-        service.team_game_repo.find_by_season_and_week.return_value = mock_games
-        service.team_game_repo.count_by_season.return_value = 16
+        service.team_game_repo.find_by_season_and_week_with_total.return_value = (
+            mock_games,
+            16,
+        )
 
         # Act
         result = service.get_games(season=2023, week=10)
 
         # Assert
-        service.team_game_repo.find_by_season_and_week.assert_called_once()
-        call_args = service.team_game_repo.find_by_season_and_week.call_args
+        service.team_game_repo.find_by_season_and_week_with_total.assert_called_once()
+        call_args = service.team_game_repo.find_by_season_and_week_with_total.call_args
         assert call_args.kwargs["week"] == 10
         assert result["week"] == 10
 
     def test_get_games_empty_result(self, service):
         """Test that get_games returns empty list when no games found."""
         # Arrange
-        service.team_game_repo.find_by_season_and_week.return_value = []
-        service.team_game_repo.count_by_season.return_value = 0
+        service.team_game_repo.find_by_season_and_week_with_total.return_value = ([], 0)
 
         # Act
         result = service.get_games(season=2025, week=99)
@@ -279,9 +286,11 @@ class TestStatsRetrievalService:
         mock_rushing = [Mock()]
         mock_receiving = [Mock()]
 
-        service.passing_stats_repo.search_players.return_value = mock_passing
-        service.rushing_stats_repo.search_players.return_value = mock_rushing
-        service.receiving_stats_repo.search_players.return_value = mock_receiving
+        service.player_lookup_repo.search.return_value = {
+            "passing": mock_passing,
+            "rushing": mock_rushing,
+            "receiving": mock_receiving,
+        }
 
         # Act
         result = service.search_players(query="Smith")
@@ -295,9 +304,7 @@ class TestStatsRetrievalService:
     def test_search_players_with_filters(self, service):
         """Test that search_players respects season and position filters."""
         # Arrange
-        service.passing_stats_repo.search_players.return_value = []
-        service.rushing_stats_repo.search_players.return_value = []
-        service.receiving_stats_repo.search_players.return_value = []
+        service.player_lookup_repo.search.return_value = {"rushing": []}
 
         # Act
         result = service.search_players(query="Jones", season=2023, position="RB")
@@ -305,32 +312,30 @@ class TestStatsRetrievalService:
         # Assert
         assert result["season"] == 2023
         assert result["position"] == "RB"
-        service.rushing_stats_repo.search_players.assert_called_once()
-        call_args = service.rushing_stats_repo.search_players.call_args
-        assert call_args.kwargs["season"] == 2023
-        assert call_args.kwargs["position"] == "RB"
+        service.player_lookup_repo.search.assert_called_once()
+        call_args = service.player_lookup_repo.search.call_args
+        assert call_args.args == ("Jones", 2023, "RB")
 
     def test_search_players_enforces_max_limit(self, service):
         """Test that search_players enforces maximum limit of 200."""
         # Arrange
-        service.passing_stats_repo.search_players.return_value = []
-        service.rushing_stats_repo.search_players.return_value = []
-        service.receiving_stats_repo.search_players.return_value = []
+        service.player_lookup_repo.search.return_value = {"passing": []}
 
         # Act
-        result = service.search_players(query="Test", limit=500)
+        service.search_players(query="Test", limit=500)
 
         # Assert
-        service.passing_stats_repo.search_players.assert_called_once()
-        call_args = service.passing_stats_repo.search_players.call_args
+        call_args = service.player_lookup_repo.search.call_args
         assert call_args.kwargs["limit"] == 200
 
     def test_search_players_empty_results(self, service):
         """Test that search_players returns empty lists when no matches."""
         # Arrange
-        service.passing_stats_repo.search_players.return_value = []
-        service.rushing_stats_repo.search_players.return_value = []
-        service.receiving_stats_repo.search_players.return_value = []
+        service.player_lookup_repo.search.return_value = {
+            "passing": [],
+            "rushing": [],
+            "receiving": [],
+        }
 
         # Act
         result = service.search_players(query="NonExistentPlayer")
@@ -339,3 +344,134 @@ class TestStatsRetrievalService:
         assert result["passing"] == []
         assert result["rushing"] == []
         assert result["receiving"] == []
+        assert result["next_cursor"] is None
+
+
+class TestCursorPagination:
+    """Cursor paging through StatsRetrievalService on an in-memory database."""
+
+    @pytest.fixture
+    def service(self, db_session):
+        for name in ["Allen", "Allison", "Ball", "Baller", "Callaway"]:
+            db_session.add(PassingStats(season=2023, player_name=name, tm="KAN"))
+        db_session.add(RushingStats(season=2023, player_name="Allgeier", tm="ATL"))
+        for pf, tm in [(450, "KAN"), (400, "BUF"), (400, "MIA")]:
+            db_session.add(TeamOffense(season=2023, tm=tm, pf=pf))
+        db_session.commit()
+        return StatsRetrievalService(db_session)
+
+    def test_offset_page_hands_off_to_cursor(self, service):
+        first = service.get_all_teams(2023, limit=2)
+        second = service.get_all_teams(2023, limit=2, cursor=first["next_cursor"])
+
+        teams = [t.tm for t in first["data"] + second["data"]]
+        assert sorted(teams) == ["BUF", "KAN", "MIA"]
+        assert len(set(teams)) == 3
+        assert second["next_cursor"] is None
+        assert second["total"] == 3
+
+    def test_prev_cursor_returns_previous_page(self, service):
+        first = service.get_all_teams(2023, limit=2)
+        second = service.get_all_teams(2023, limit=2, cursor=first["next_cursor"])
+
+        back = service.get_all_teams(2023, limit=2, cursor=second["prev_cursor"])
+
+        assert [t.id for t in back["data"]] == [t.id for t in first["data"]]
+        assert back["prev_cursor"] is None
+
+    def test_search_pages_all_categories_with_one_cursor(self, service):
+        first = service.search_players("all", limit=2)
+        second = service.search_players("all", limit=2, cursor=first["next_cursor"])
+
+        assert [p.player_name for p in first["passing"]] == ["Allen", "Allison"]
+        assert [p.player_name for p in second["passing"]] == ["Ball", "Baller"]
+        # rushing ran out on the first page and stays empty
+        assert [r.player_name for r in first["rushing"]] == ["Allgeier"]
+        assert second["rushing"] == []
+        third = service.search_players("all", limit=2, cursor=second["next_cursor"])
+        assert [p.player_name for p in third["passing"]] == ["Callaway"]
+        assert third["next_cursor"] is None
+
+        back = service.search_players("all", limit=2, cursor=second["prev_cursor"])
+        assert [r.player_name for r in back["rushing"]] == ["Allgeier"]
+        assert [p.player_name for p in back["passing"]] == ["Allen", "Allison"]
+
+    def test_cursor_for_other_sort_rejected(self, service):
+        first = service.get_all_teams(2023, limit=1)
+
+        with pytest.raises(ValueError):
+            service.get_all_teams(2023, sort_by="yds", cursor=first["next_cursor"])
+
+
+class TestPageTotals:
+    """Page and total in one query; totals of completed seasons cached."""
+
+    @pytest.fixture
+    def statements(self, db_session):
+        executed = []
+
+        def record(conn, cursor, statement, *args):
+            executed.append(statement)
+
+        event.listen(db_session.bind, "before_cursor_execute", record)
+        yield executed
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+    @pytest.fixture
+    def service(self, db_session):
+        for season in (2022, date.today().year + 1):
+            for pf, tm in [(450, "KAN"), (400, "BUF"), (380, "MIA")]:
+                db_session.add(TeamOffense(season=season, tm=tm, pf=pf))
+        db_session.commit()
+        return StatsRetrievalService(db_session, totals=ReadCache())
+
+    def test_one_query_per_page(self, service, statements):
+        result = service.get_all_teams(2022, limit=2)
+
+        assert result["total"] == 3
+        assert len(statements) == 1
+        assert "OVER ()" in statements[0]
+
+    def test_frozen_season_total_cached_across_pages(self, service, statements):
+        first = service.get_all_teams(2022, limit=2)
+        statements.clear()
+
+        second = service.get_all_teams(2022, limit=2, offset=2)
+
+        assert (first["total"], second["total"]) == (3, 3)
+        assert len(statements) == 1
+        assert "count" not in statements[0].lower()
+
+    def test_current_season_total_not_cached(self, service):
+        season = date.today().year + 1
+        service.get_all_teams(season, limit=2)
+        service.get_all_teams(season, limit=2, offset=2)
+
+        assert service.totals.stats()["entries"] == 0
+
+    def test_include_total_false_skips_count(self, service, statements):
+        result = service.get_all_teams(2022, limit=2, include_total=False)
+
+        assert result["total"] is None
+        assert "count" not in statements[0].lower()
+
+    def test_cursor_page_total_in_same_query(self, service, statements):
+        first = service.get_all_teams(2022, limit=2, include_total=False)
+        statements.clear()
+
+        second = service.get_all_teams(
+            2022, limit=2, cursor=first["next_cursor"], include_total=True
+        )
+
+        assert second["total"] == 3
+        assert [t.tm for t in second["data"]] == ["MIA"]
+        assert len(statements) == 1
+
+    def test_ingest_invalidates_cached_total(self, service, db_session):
+        service.get_all_teams(2022, limit=2)
+        db_session.add(TeamOffense(season=2022, tm="NYJ", pf=300))
+        db_session.commit()
+
+        service.totals.invalidate("team_offense", 2022)
+
+        assert service.get_all_teams(2022, limit=2, offset=2)["total"] == 4
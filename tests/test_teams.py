@@ -0,0 +1,42 @@
+"""Tests for src/core/teams.py (canonical team registry)."""
+
+import pytest
+
+from src.core.teams import ALIASES, FRANCHISES, alias_rows, lookup, team_id
+
+
+@pytest.mark.parametrize(
+    ("spelling", "abbr"),
+    [
+        ("Kansas City Chiefs", "KC"),
+        ("KAN", "KC"),
+        ("kc", "KC"),
+        ("Oakland Raiders", "LV"),
+        ("LVR", "LV"),
+        ("San Diego Chargers*", "LAC"),
+        ("Houston Oilers", "TEN"),
+        ("  Washington   Football Team+ ", "WAS"),
+        ("htx", "HOU"),
+    ],
+)
+def test_lookup_resolves_aliases(spelling, abbr):
+    franchise = lookup(spelling)
+    assert franchise is not None
+    assert franchise.abbr == abbr
+
+
+@pytest.mark.parametrize("spelling", ["2TM", "League Total", "Avg Team", "", None])
+def test_non_teams_resolve_to_none(spelling):
+    assert lookup(spelling) is None
+    assert team_id(spelling) is None
+
+
+def test_every_franchise_has_a_stable_unique_id():
+    assert [f.id for f in FRANCHISES] == list(range(1, 33))
+    assert len({f.abbr for f in FRANCHISES}) == 32
+
+
+def test_alias_rows_cover_every_spelling():
+    rows = alias_rows()
+    assert len(rows) == len(ALIASES)
+    assert {"alias": "oakland raiders", "team_id": team_id("LV")} in rows
@@ -7,6 +7,7 @@ Tests cover:
 - list: Paginated listing with limit/offset
 - update: Merge and commit changes
 - delete: Remove entity from session
+- fetch_with_total: One page plus the total count in a single query
 
 All tests use an in-memory SQLite database with a simple test entity.
 
@@ -15,7 +16,7 @@ Run with:
 """
 
 import pytest
-from sqlalchemy import Integer, String, create_engine, event
+from sqlalchemy import Integer, String, create_engine, event, select
 from sqlalchemy.orm import Mapped, mapped_column, sessionmaker
 
 from src.entities.base import Base
@@ -195,3 +196,43 @@ class TestBaseRepositoryDelete:
         # Rollback should restore
         session.rollback()
         assert repo.get_by_id(entity_id) is not None
+
+
+class TestBaseRepositoryFetchWithTotal:
+    """Tests for BaseRepository.fetch_with_total()."""
+
+    @pytest.fixture
+    def statements(self, session):
+        executed = []
+        event.listen(
+            session.bind,
+            "before_cursor_execute",
+            lambda conn, cursor, statement, *args: executed.append(statement),
+        )
+        return executed
+
+    def test_page_and_total_in_one_query(self, repo, statements):
+        """The total counts every match, not just the page, in one roundtrip."""
+        for i in range(5):
+            repo.create(FakeEntity(name=f"item_{i}"))
+        statements.clear()
+
+        stmt = select(FakeEntity).order_by(FakeEntity.id)
+        rows, total = repo.fetch_with_total(stmt, limit=2, offset=2)
+
+        assert [r.name for r in rows] == ["item_2", "item_3"]
+        assert total == 5
+        assert len(statements) == 1
+
+    def test_page_past_the_end_still_counts(self, repo):
+        """With no rows to carry the window count, it falls back to count()."""
+        for i in range(3):
+            repo.create(FakeEntity(name=f"item_{i}"))
+
+        rows, total = repo.fetch_with_total(select(FakeEntity), limit=2, offset=10)
+
+        assert rows == []
+        assert total == 3
+
+    def test_empty(self, repo):
+        assert repo.fetch_with_total(select(FakeEntity), limit=2, offset=0) == ([], 0)
@@ -0,0 +1,32 @@
+"""
+Unit tests for host_rate_slot_repo.py (HostRateSlotRepository)
+
+Tests cover:
+- reserve: first claim is immediate, later claims are spaced per host
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_host_rate_slot_repo.py -v
+"""
+
+from src.entities.host_rate_slot import HostRateSlot
+from src.repositories.host_rate_slot_repo import HostRateSlotRepository
+
+
+class TestReserve:
+    def test_claims_are_spaced_by_interval(self, db_session):
+        repo = HostRateSlotRepository(db_session)
+
+        first = repo.reserve("example.com", 10)
+        second = repo.reserve("example.com", 10)
+        third = repo.reserve("example.com", 10)
+
+        assert first == 0
+        assert 9 < second <= 10
+        assert 19 < third <= 20
+
+    def test_hosts_are_independent(self, db_session):
+        repo = HostRateSlotRepository(db_session)
+        repo.reserve("example.com", 10)
+
+        assert repo.reserve("other.com", 10) == 0
+        assert db_session.query(HostRateSlot).count() == 2
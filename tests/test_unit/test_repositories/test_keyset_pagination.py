@@ -0,0 +1,168 @@
+"""
+Unit tests for keyset pagination on BaseRepository (keyset_page).
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_keyset_pagination.py -v
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from src.core.pagination import Cursor, decode_cursors, encode_cursors
+from src.entities.passing_stats import PassingStats
+from src.entities.team_offense import TeamOffense
+from src.repositories.passing_stats_repo import PassingStatsRepository
+from src.repositories.team_offense_repo import TeamOffenseRepository
+
+# Ties on yds and NULLs exercise the id tiebreak and NULLS LAST handling
+YARDS = [5000, 4000, 4000, None, 3000, 4000, None, 2000]
+
+
+@pytest.fixture
+def repo(db_session):
+    for i, yds in enumerate(YARDS):
+        db_session.add(
+            PassingStats(season=2023, player_name=f"Player {i}", tm="KAN", yds=yds)
+        )
+    db_session.add(PassingStats(season=2022, player_name="Other", yds=9999))
+    db_session.commit()
+    return PassingStatsRepository(db_session)
+
+
+def walk(repo, order, limit=3):
+    """Every page forward from the start, then back again from the end."""
+    page = repo.find_by_season_and_position_page(2023, limit=limit, order=order)
+    pages = [page]
+    while page.has_next:
+        page = repo.find_by_season_and_position_page(
+            2023, cursor=page.next_cursor, limit=limit, order=order
+        )
+        pages.append(page)
+    forward = [row.id for p in pages for row in p.items]
+
+    backward = []
+    while page.has_prev:
+        page = repo.find_by_season_and_position_page(
+            2023, cursor=page.prev_cursor, limit=limit, order=order
+        )
+        backward = [row.id for row in page.items] + backward
+    return forward, backward, pages
+
+
+class TestKeysetPage:
+    @pytest.mark.parametrize("order", ["desc", "asc"])
+    def test_pages_match_offset_order(self, repo, order):
+        everything = [
+            row.id
+            for row in repo.find_by_season_and_position(2023, limit=100, order=order)
+        ]
+
+        forward, backward, pages = walk(repo, order)
+
+        assert forward == everything
+        assert len(set(forward)) == len(YARDS)
+        # Walking back from the last page yields everything before it
+        assert backward == everything[: -len(pages[-1].items)]
+
+    def test_nulls_sort_last_in_both_directions(self, repo):
+        for order in ("asc", "desc"):
+            rows = repo.find_by_season_and_position(2023, limit=100, order=order)
+            assert [r.yds for r in rows][-2:] == [None, None]
+
+    def test_first_and_last_page_flags(self, repo):
+        forward, _, pages = walk(repo, "desc")
+
+        assert not pages[0].has_prev
+        assert pages[0].has_next
+        assert not pages[-1].has_next
+        assert pages[-1].has_prev
+
+    def test_rows_inserted_before_cursor_do_not_shift_pages(self, repo, db_session):
+        first = repo.find_by_season_and_position_page(2023, limit=3)
+        db_session.add(PassingStats(season=2023, player_name="New", yds=6000))
+        db_session.commit()
+
+        second = repo.find_by_season_and_position_page(
+            2023, cursor=first.next_cursor, limit=3
+        )
+
+        assert {r.id for r in first.items}.isdisjoint(r.id for r in second.items)
+        assert second.items[0].yds == 4000
+
+    def test_empty_page_points_back_at_its_cursor(self, repo):
+        _, _, pages = walk(repo, "desc", limit=4)  # exactly two full pages
+        empty = repo.find_by_season_and_position_page(
+            2023, cursor=pages[-1].next_cursor, limit=4
+        )
+
+        assert empty.items == []
+        back = repo.find_by_season_and_position_page(
+            2023, cursor=empty.prev_cursor, limit=4
+        )
+        assert [r.id for r in back.items] == [r.id for r in pages[-1].items]
+        assert not back.has_next
+
+    def test_total_counts_whole_listing_not_rows_past_cursor(self, db_session):
+        for pf, tm in enumerate(["A", "B", "C", "D", "E"]):
+            db_session.add(TeamOffense(season=2023, tm=tm, pf=pf))
+        db_session.commit()
+        repo = TeamOffenseRepository(db_session)
+
+        first = repo.find_by_season_page(2023, limit=2)
+        second = repo.find_by_season_page(
+            2023, cursor=first.next_cursor, limit=2, with_total=True
+        )
+
+        assert first.total is None
+        assert second.total == 5
+        assert [t.tm for t in second.items] == ["C", "B"]
+
+    def test_cursor_for_other_sort_rejected(self, repo):
+        page = repo.find_by_season_and_position_page(2023, limit=3)
+
+        with pytest.raises(ValueError, match="sort_by"):
+            repo.find_by_season_and_position_page(
+                2023, cursor=page.next_cursor, limit=3, sort_by="td"
+            )
+
+    def test_unknown_sort_falls_back_to_id(self, repo):
+        page = repo.find_by_season_and_position_page(
+            2023, limit=3, sort_by="not_a_column", order="asc"
+        )
+
+        assert page.next_cursor.sort_by == "id"
+        assert [r.id for r in page.items] == sorted(r.id for r in page.items)
+
+    def test_decimal_sort_values_survive_the_token(self, db_session):
+        for tm, ypp in [("A", "6.1"), ("B", "5.9"), ("C", "5.9"), ("D", "5.2")]:
+            db_session.add(TeamOffense(season=2023, tm=tm, ypp=Decimal(ypp)))
+        db_session.commit()
+        repo = TeamOffenseRepository(db_session)
+
+        first = repo.find_by_season_page(2023, limit=2, sort_by="ypp")
+        cursor = Cursor.decode(first.next_token())
+        second = repo.find_by_season_page(2023, cursor=cursor, sort_by="ypp")
+
+        # ypp ties are broken by id, in the same (descending) direction
+        assert [t.tm for t in first.items + second.items] == ["A", "C", "B", "D"]
+
+
+class TestCursorTokens:
+    def test_round_trip(self):
+        cursor = Cursor("yds", "desc", Decimal("4.5"), 7, backward=True)
+
+        decoded = Cursor.decode(cursor.encode())
+
+        assert decoded.value == "4.5"  # coerced back by the repository
+        assert (decoded.id, decoded.backward) == (7, True)
+
+    def test_combined_cursors(self):
+        cursors = {"passing": Cursor("player_name", "asc", "A", 1), "rushing": None}
+
+        assert decode_cursors(encode_cursors(cursors)) == cursors
+
+    @pytest.mark.parametrize("token", ["garbage!", "e30", "WzFd"])
+    def test_malformed_tokens_rejected(self, token):
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            Cursor.decode(token)
@@ -0,0 +1,117 @@
+"""
+Unit tests for PlayerLookupRepository (every category in one UNION ALL).
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_player_lookup_repo.py -v
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from src.entities.kicking_stats import KickingStats
+from src.entities.passing_stats import PassingStats
+from src.entities.rushing_stats import RushingStats
+from src.repositories.player_lookup_repo import (
+    PLAYER_CATEGORIES,
+    PlayerLookupRepository,
+)
+
+
+@pytest.fixture
+def statements(db_session):
+    executed = []
+
+    def record(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_session.bind, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def repo(db_session):
+    db_session.add_all(
+        [
+            PassingStats(
+                season=2023,
+                player_name="Josh Allen",
+                tm="BUF",
+                pos="QB",
+                yds=4306,
+                cmp_pct=Decimal("66.5"),
+            ),
+            PassingStats(season=2022, player_name="Josh Allen", tm="BUF", yds=4283),
+            RushingStats(season=2023, player_name="Josh Allen", pos="QB", yds=524),
+            RushingStats(season=2023, player_name="Josh Jacobs", pos="RB", yds=805),
+            KickingStats(season=2023, player_name="Tyler Bass", tm="BUF"),
+        ]
+    )
+    db_session.commit()
+    return PlayerLookupRepository(db_session)
+
+
+class TestSearch:
+    def test_every_category_in_one_statement(self, repo, statements):
+        found = repo.search("josh", 2023)
+
+        assert len(statements) == 1
+        assert "UNION ALL" in statements[0]
+        assert set(found) == set(PLAYER_CATEGORIES)
+        assert [p.yds for p in found["passing"]] == [4306]
+        assert [r.player_name for r in found["rushing"]] == [
+            "Josh Allen",
+            "Josh Jacobs",
+        ]
+        assert found["kicking"] == []
+
+    def test_values_come_back_as_column_types(self, repo):
+        passing = repo.search("Allen", 2023)["passing"][0]
+
+        assert isinstance(passing, PassingStats)
+        assert passing.cmp_pct == Decimal("66.5")
+        assert (passing.season, passing.yds, passing.tm) == (2023, 4306, "BUF")
+        assert passing.td is None
+
+    def test_position_filter_skips_passing(self, repo):
+        found = repo.search("josh", 2023, "RB")
+
+        assert [r.player_name for r in found["rushing"]] == ["Josh Jacobs"]
+        assert [p.player_name for p in found["passing"]] == ["Josh Allen"]
+
+    def test_limit_and_offset_apply_per_category(self, repo):
+        found = repo.search("josh", limit=1, offset=1)
+
+        assert [p.season for p in found["passing"]] == [2022]
+        assert [r.player_name for r in found["rushing"]] == ["Josh Jacobs"]
+
+
+class TestSearchPages:
+    def test_pages_follow_each_category_cursor(self, repo, statements):
+        first = repo.search_pages("josh", 2023, cursors={}, limit=1)
+        second = repo.search_pages(
+            "josh",
+            2023,
+            cursors={name: page.next_cursor for name, page in first.items()},
+            limit=1,
+        )
+
+        assert len(statements) == 2
+        assert [r.player_name for r in first["rushing"].items] == ["Josh Allen"]
+        assert first["rushing"].has_next
+        assert [r.player_name for r in second["rushing"].items] == ["Josh Jacobs"]
+        assert not second["rushing"].has_next
+        assert second["passing"].items == []
+
+    def test_backward_page_keeps_ascending_order(self, repo):
+        last = repo.search_pages("josh", 2023, cursors={}, limit=5)["rushing"]
+        cursor = last.next_cursor.flipped()
+
+        back = repo.search_pages("josh", 2023, cursors={"rushing": cursor}, limit=5)
+
+        assert [r.player_name for r in back["rushing"].items] == [
+            "Josh Allen",
+            "Josh Jacobs",
+        ]
@@ -0,0 +1,57 @@
+"""
+Unit tests for player search on the normalized name column.
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_player_name_search.py -v
+"""
+
+from src.entities.passing_stats import PassingStats
+from src.entities.rushing_stats import RushingStats
+from src.repositories.passing_stats_repo import PassingStatsRepository
+from src.repositories.player_lookup_repo import PlayerLookupRepository
+from src.repositories.rushing_stats_repo import RushingStatsRepository
+from src.repositories.season_staging_repo import SeasonStagingRepository
+
+
+class TestNormalizedColumn:
+    def test_filled_on_orm_insert(self, db_session):
+        row = PassingStats(season=2023, player_name="José Núñez", tm="KAN")
+        db_session.add(row)
+        db_session.commit()
+
+        assert row.name_normalized == "jose nunez"
+
+    def test_filled_on_bulk_insert(self, db_session):
+        repo = RushingStatsRepository(db_session)
+        repo.bulk_insert([{"season": 2023, "player_name": "Zoë Ball", "tm": "X"}])
+
+        assert repo.list()[0].name_normalized == "zoe ball"
+
+    def test_filled_through_season_staging(self, db_session):
+        staging = SeasonStagingRepository(db_session, RushingStats)
+        staging.create()
+        staging.load([{"season": 2023, "player_name": "Renée Lo", "tm": "X"}])
+        staging.swap(2023)
+        staging.drop()
+        db_session.commit()
+
+        assert RushingStatsRepository(db_session).list()[0].name_normalized == (
+            "renee lo"
+        )
+
+
+class TestSearch:
+    def test_accents_and_case_ignored(self, db_session):
+        db_session.add(PassingStats(season=2023, player_name="José Núñez", tm="KAN"))
+        db_session.commit()
+        repo = PassingStatsRepository(db_session)
+
+        assert [p.player_name for p in repo.search_players("NUNEZ")] == ["José Núñez"]
+        assert len(repo.find_by_player("josé", 2023)) == 1
+
+    def test_wildcards_in_query_are_literal(self, db_session):
+        db_session.add(RushingStats(season=2023, player_name="Bo Jackson", tm="LAR"))
+        db_session.commit()
+
+        assert RushingStatsRepository(db_session).search_players("b_") == []
+        assert PlayerLookupRepository(db_session).search("%")["rushing"] == []
@@ -0,0 +1,70 @@
+"""
+Unit tests for PlayerRepository (the canonical players dimension).
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_player_repo.py -v
+"""
+
+from sqlalchemy import event
+
+from src.entities.player import Player
+from src.repositories.player_repo import PlayerRepository
+
+
+class TestEnsure:
+    def test_new_players_inserted_once(self, db_session):
+        repo = PlayerRepository(db_session)
+
+        first = repo.ensure({"MahoPa00": "Patrick Mahomes", "KelcTr00": "Travis Kelce"})
+        again = repo.ensure({"MahoPa00": "Patrick Mahomes"})
+
+        assert again == {"MahoPa00": first["MahoPa00"]}
+        assert len(repo.list()) == 2
+        assert repo.get_by_pfr_id("KelcTr00").name_normalized == "travis kelce"
+
+    def test_known_players_cost_one_select(self, db_session):
+        repo = PlayerRepository(db_session)
+        repo.ensure({"MahoPa00": "Patrick Mahomes"})
+        executed = []
+
+        def record(conn, cursor, statement, *args):
+            executed.append(statement)
+
+        event.listen(db_session.bind, "before_cursor_execute", record)
+        repo.ensure({"MahoPa00": "Patrick Mahomes"})
+        event.remove(db_session.bind, "before_cursor_execute", record)
+
+        assert len(executed) == 1
+
+    def test_empty(self, db_session):
+        assert PlayerRepository(db_session).ensure({}) == {}
+
+
+class TestWithPlayerIds:
+    def test_pfr_id_swapped_for_player_id(self, db_session):
+        repo = PlayerRepository(db_session)
+        rows = [
+            {"player_name": "Josh Allen", "tm": "BUF", "pfr_id": "AlleJo02"},
+            {"player_name": "Josh Allen", "tm": "JAX", "pfr_id": "AlleJo00"},
+            {"player_name": "Unlinked", "tm": "BUF", "pfr_id": None},
+        ]
+
+        resolved = repo.with_player_ids(rows)
+
+        assert all("pfr_id" not in row for row in resolved)
+        qb, linebacker, unlinked = (row["player_id"] for row in resolved)
+        assert qb != linebacker
+        assert unlinked is None
+        assert db_session.get(Player, qb).pfr_id == "AlleJo02"
+
+    def test_rows_without_pfr_id_key_pass_through(self, db_session):
+        rows = [{"tm": "BUF", "season": 2023}]
+
+        assert PlayerRepository(db_session).with_player_ids(rows) == rows
+
+
+def test_search_by_normalized_name(db_session):
+    repo = PlayerRepository(db_session)
+    repo.ensure({"NunePe00": "Pedro Núñez", "MahoPa00": "Patrick Mahomes"})
+
+    assert [p.pfr_id for p in repo.search("nunez")] == ["NunePe00"]
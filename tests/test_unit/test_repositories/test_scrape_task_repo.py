@@ -0,0 +1,196 @@
+"""
+Unit tests for scrape_task_repo.py (ScrapeTaskRepository)
+
+Tests cover:
+- enqueue: one task per page, re-queue of finished tasks, priority bumps
+- lease: priority order, no double leasing, stat type filter
+- heartbeat / complete / fail: only the lease holder can transition
+- requeue_expired: dead workers' tasks go back to pending (or fail)
+
+The Postgres test runs several worker processes against TEST_POSTGRES_URL
+and is skipped when that variable is unset.
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_scrape_task_repo.py -v
+"""
+
+import multiprocessing
+import os
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.entities.base import Base
+from src.entities.scrape_task import ScrapeTask
+from src.repositories.scrape_task_repo import ScrapeTaskRepository
+
+PAGE = "https://www.pro-football-reference.com/years/{season}/{page}.htm"
+KICKING = PAGE.format(season=2023, page="kicking")
+
+
+def enqueue(repo, season=2023, **kwargs):
+    url = PAGE.format(season=season, page="passing")
+    return repo.enqueue(url, season, ["passing_stats"], **kwargs)
+
+
+@pytest.fixture
+def repo(db_session):
+    return ScrapeTaskRepository(db_session)
+
+
+class TestEnqueue:
+    def test_enqueue_creates_pending_task(self, repo):
+        task = enqueue(repo, priority=5)
+        assert (task.status, task.priority, task.attempts) == ("pending", 5, 0)
+
+    def test_enqueue_is_idempotent(self, repo):
+        first = enqueue(repo)
+        second = enqueue(repo)
+        assert first.id == second.id
+
+    def test_stat_types_sharing_a_page_share_a_task(self, repo):
+        first = repo.enqueue(KICKING, 2023, ["kicking_stats"])
+        second = repo.enqueue(KICKING, 2023, ["kicking"])
+
+        assert first.id == second.id
+        assert second.stat_type_names == ["kicking", "kicking_stats"]
+
+    def test_enqueue_raises_pending_priority(self, repo):
+        enqueue(repo, priority=1)
+        assert enqueue(repo, priority=9).priority == 9
+        assert enqueue(repo, priority=3).priority == 9
+
+    def test_enqueue_requeues_finished_task(self, repo):
+        task = enqueue(repo)
+        repo.lease("w1", 60)
+        repo.complete(task.id, "w1")
+
+        task = enqueue(repo)
+        assert (task.status, task.attempts) == ("pending", 0)
+
+    def test_enqueue_leaves_leased_task_alone(self, repo):
+        enqueue(repo)
+        repo.lease("w1", 60)
+        assert enqueue(repo).status == "leased"
+
+    def test_stat_type_added_while_leased_requeues_on_complete(self, repo):
+        task = repo.enqueue(KICKING, 2023, ["kicking"])
+        (leased,) = repo.lease("w1", 60)
+        ran = leased.stat_types
+        repo.enqueue(KICKING, 2023, ["kicking_stats"])
+
+        assert repo.complete(task.id, "w1", stat_types=ran)
+        task = repo.get_by_id(task.id)
+        assert (task.status, task.stat_types) == ("pending", "kicking,kicking_stats")
+
+
+class TestLease:
+    def test_highest_priority_first(self, repo):
+        enqueue(repo, 2021, priority=0)
+        enqueue(repo, 2022, priority=10)
+        enqueue(repo, 2023, priority=5)
+
+        tasks = repo.lease("w1", 60, limit=2)
+
+        assert [t.season for t in tasks] == [2022, 2023]
+        assert all(t.status == "leased" and t.leased_by == "w1" for t in tasks)
+        assert all(t.attempts == 1 for t in tasks)
+
+    def test_leased_task_not_handed_out_twice(self, repo):
+        enqueue(repo)
+        assert len(repo.lease("w1", 60)) == 1
+        assert repo.lease("w2", 60) == []
+
+    def test_stat_type_filter(self, repo):
+        enqueue(repo)
+        repo.enqueue(KICKING, 2023, ["kicking", "kicking_stats"])
+
+        (task,) = repo.lease("w1", 60, limit=5, stat_types=["kicking"])
+        assert task.url == KICKING
+        # "kicking" matches whole names only
+        assert repo.lease("w1", 60, stat_types=["stats"]) == []
+
+
+class TestTransitions:
+    def test_only_holder_can_heartbeat_or_complete(self, repo):
+        task = enqueue(repo)
+        repo.lease("w1", 60)
+
+        assert not repo.heartbeat(task.id, "w2", 60)
+        assert not repo.complete(task.id, "w2")
+        assert repo.heartbeat(task.id, "w1", 60)
+        assert repo.complete(task.id, "w1")
+        assert repo.get_by_id(task.id).status == "done"
+
+    def test_fail_requeues_until_attempts_exhausted(self, repo):
+        task = enqueue(repo, max_attempts=2)
+
+        repo.lease("w1", 60)
+        repo.fail(task.id, "w1", "timeout")
+        assert repo.get_by_id(task.id).status == "pending"
+
+        repo.lease("w1", 60)
+        repo.fail(task.id, "w1", "timeout again")
+        task = repo.get_by_id(task.id)
+        assert (task.status, task.last_error) == ("failed", "timeout again")
+
+    def test_requeue_expired_leases(self, repo, db_session):
+        task = enqueue(repo)
+        repo.lease("dead-worker", 60)
+        db_session.get(ScrapeTask, task.id).lease_expires_at = datetime.now(
+            UTC
+        ) - timedelta(seconds=1)
+        db_session.commit()
+
+        assert repo.requeue_expired() == 1
+        assert repo.get_by_id(task.id).status == "pending"
+        assert not repo.complete(task.id, "dead-worker")
+        assert [t.id for t in repo.lease("w2", 60)] == [task.id]
+
+
+def _lease_until_empty(url: str, worker_id: str, results) -> None:
+    engine = create_engine(url)
+    session = sessionmaker(bind=engine)()
+    repo = ScrapeTaskRepository(session)
+    leased = []
+    while tasks := repo.lease(worker_id, 60, limit=2):
+        for task in tasks:
+            leased.append(task.id)
+            repo.complete(task.id, worker_id)
+    results.put(leased)
+    engine.dispose()
+
+
+@pytest.mark.integration
+@pytest.mark.skipif(
+    not os.environ.get("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL not set"
+)
+def test_concurrent_workers_never_share_a_task_postgres():
+    url = os.environ["TEST_POSTGRES_URL"]
+    engine = create_engine(url)
+    ScrapeTask.__table__.drop(engine, checkfirst=True)
+    Base.metadata.create_all(engine, tables=[ScrapeTask.__table__])
+    with sessionmaker(bind=engine)() as session:
+        repo = ScrapeTaskRepository(session)
+        for season in range(1970, 2025):
+            for page in ("passing", "rushing", "games"):
+                url = PAGE.format(season=season, page=page)
+                repo.enqueue(url, season, [page], commit=False)
+        session.commit()
+
+    ctx = multiprocessing.get_context("spawn")
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(target=_lease_until_empty, args=(url, f"w{i}", results))
+        for i in range(6)
+    ]
+    for p in workers:
+        p.start()
+    leased = [task_id for _ in workers for task_id in results.get(timeout=60)]
+    for p in workers:
+        p.join()
+
+    assert len(leased) == len(set(leased)) == 55 * 3
+    ScrapeTask.__table__.drop(engine)
@@ -0,0 +1,106 @@
+"""
+Unit tests for season partitioning of the player stat tables.
+
+Tests cover:
+- DDL: Postgres gets PARTITION BY LIST (season) and PRIMARY KEY (id, season);
+  SQLite and non-partitioned tables are unchanged
+- SeasonPartitionRepository is a no-op on SQLite
+- apply_row_diff creates a season's partition and moves default rows into it
+
+The Postgres test runs against TEST_POSTGRES_URL and is skipped when that
+variable is unset.
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_season_partition_repo.py -v
+"""
+
+import os
+
+import pytest
+from sqlalchemy import create_engine, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.schema import CreateTable
+
+from src.entities.base import Base
+from src.entities.partitioning import is_season_partitioned
+from src.entities.passing_stats import PassingStats
+from src.entities.team_offense import TeamOffense
+from src.repositories.season_partition_repo import SeasonPartitionRepository
+from src.services.row_diff_service import apply_row_diff
+from src.services.stat_registry import StatType
+
+
+def ddl(model, dialect):
+    return str(CreateTable(model.__table__).compile(dialect=dialect))
+
+
+class TestPartitionedDDL:
+    def test_player_tables_partitioned(self):
+        assert is_season_partitioned(PassingStats.__table__)
+        assert not is_season_partitioned(TeamOffense.__table__)
+
+    def test_postgres_primary_key_includes_season(self):
+        create = ddl(PassingStats, postgresql.dialect())
+
+        assert "PRIMARY KEY (id, season)" in create
+        assert create.rstrip().endswith("PARTITION BY LIST (season)")
+
+    def test_sqlite_table_unchanged(self):
+        create = ddl(PassingStats, sqlite.dialect())
+
+        assert "PRIMARY KEY (id)" in create
+        assert "PARTITION" not in create
+
+    def test_unpartitioned_postgres_table_unchanged(self):
+        assert "PRIMARY KEY (id)" in ddl(TeamOffense, postgresql.dialect())
+
+
+class TestSqliteNoop:
+    def test_repository_disabled(self, db_session):
+        repo = SeasonPartitionRepository(db_session, PassingStats)
+
+        assert repo.enabled is False
+        assert repo.ensure(2023) is False
+        assert repo.seasons() == []
+        assert repo.detach(2023) is None
+
+
+@pytest.mark.skipif(
+    not os.environ.get("TEST_POSTGRES_URL"), reason="TEST_POSTGRES_URL not set"
+)
+def test_first_write_creates_partition_postgres():
+    engine = create_engine(os.environ["TEST_POSTGRES_URL"])
+    tables = [PassingStats.__table__]
+    Base.metadata.drop_all(engine, tables=tables, checkfirst=True)
+    Base.metadata.create_all(engine, tables=tables)
+    try:
+        with sessionmaker(bind=engine)() as session:
+            # A legacy write before the partition exists lands in the default
+            session.add(PassingStats(season=2023, player_name="A", tm="KAN"))
+            session.commit()
+
+            apply_row_diff(
+                session,
+                StatType.passing_stats,
+                2023,
+                [{"season": 2023, "player_name": "B", "tm": "KAN"}],
+                scrape_run="run",
+            )
+            session.commit()
+
+            repo = SeasonPartitionRepository(session, PassingStats)
+            assert repo.seasons() == [2023]
+            names = session.execute(
+                text("SELECT player_name FROM passing_stats_2023")
+            ).scalars()
+            assert list(names) == ["B"]
+            assert session.execute(
+                select(PassingStats.player_name)
+            ).scalars().all() == ["B"]
+            default = session.execute(
+                text("SELECT count(*) FROM passing_stats_default")
+            ).scalar()
+            assert default == 0
+    finally:
+        Base.metadata.drop_all(engine, tables=tables)
@@ -0,0 +1,96 @@
+"""
+Unit tests for TeamSeasonFeatureRepository (team tables joined per team-season).
+
+Run with:
+    pytest tests/test_unit/test_repositories/test_team_season_repo.py -v
+"""
+
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import event
+
+from src.entities.kicking import Kicking
+from src.entities.standings import Standings
+from src.entities.team_defense import TeamDefense
+from src.entities.team_offense import TeamOffense
+from src.repositories.team_season_repo import TeamSeasonFeatureRepository
+
+
+@pytest.fixture
+def statements(db_session):
+    executed = []
+
+    def record(conn, cursor, statement, *args):
+        executed.append(statement)
+
+    event.listen(db_session.bind, "before_cursor_execute", record)
+    yield executed
+    event.remove(db_session.bind, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def repo(db_session):
+    db_session.add_all(
+        [
+            TeamOffense(season=2023, tm="Kansas City Chiefs", pf=371),
+            TeamOffense(season=2023, tm="Buffalo Bills", pf=451),
+            TeamOffense(season=2023, tm="Avg Team", pf=365),
+            TeamDefense(season=2023, tm="Kansas City Chiefs", pa=294),
+            Standings(
+                season=2023, tm="Kansas City Chiefs*", w=11, win_pct=Decimal("0.647")
+            ),
+            Kicking(season=2022, tm="Kansas City Chiefs", fgm=37),
+        ]
+    )
+    db_session.commit()
+    return TeamSeasonFeatureRepository(db_session)
+
+
+def test_tables_joined_on_team_and_season(repo):
+    kc, buf = sorted(repo.features([2023]), key=lambda r: r["team"] != "KC")
+
+    assert (kc["team"], kc["team_name"]) == ("KC", "Kansas City Chiefs")
+    assert (kc["offense_pf"], kc["defense_pa"], kc["standings_w"]) == (371, 294, 11)
+    assert kc["standings_win_pct"] == Decimal("0.647")
+    assert kc["kicking_fgm"] is None  # other season
+    assert (buf["offense_pf"], buf["defense_pa"]) == (451, None)
+
+
+def test_columns_prefixed_without_row_internals(repo):
+    (row, *_) = repo.features([2023])
+
+    assert {"season", "team_id", "offense_g", "punting_pnt", "returns_apyd"} <= set(row)
+    assert not {
+        "offense_tm",
+        "offense_id",
+        "offense_row_hash",
+        "offense_team_id",
+    } & set(row)
+
+
+def test_team_seasons_from_any_table(repo):
+    rows = list(repo.features([2022, 2023]))
+
+    assert [(r["season"], r["team"]) for r in rows] == [
+        (2022, "KC"),
+        (2023, "BUF"),
+        (2023, "KC"),
+    ]
+    assert rows[0]["kicking_fgm"] == 37
+    assert rows[0]["offense_pf"] is None
+
+
+def test_rows_without_a_team_left_out(repo):
+    assert "Avg Team" not in {r["team_name"] for r in repo.features([2023])}
+
+
+def test_one_statement_for_every_table(repo, statements):
+    list(repo.features([2021, 2022, 2023]))
+
+    assert len(statements) == 1
+
+
+def test_no_seasons(repo, statements):
+    assert list(repo.features([])) == []
+    assert statements == []
@@ -0,0 +1,123 @@
+"""
+Unit tests for the season backfill planner and checkpoint ledger.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy import select
+
+from src.core.config import settings
+from src.entities.scrape_run import ScrapeRun
+from src.entities.team_offense import TeamOffense
+from src.services.backfill_service import BackfillLedger, backfill, plan_backfill
+from src.services.stat_registry import StatType, page_url
+
+TEAM_STATS_HTML = """
+<html><body><table id="team_stats"><tbody>
+<tr><td data-stat="team">Kansas City Chiefs</td><td data-stat="g">17</td>
+<td data-stat="points">450</td></tr>
+</tbody></table></body></html>
+"""
+
+
+@pytest.fixture
+def ledger(tmp_path):
+    return BackfillLedger(tmp_path / "ledger.sqlite3")
+
+
+@pytest.fixture(autouse=True)
+def session_local(db_session):
+    with (
+        patch("src.services.backfill_service.SessionLocal") as mock,
+        patch("src.services.scrape_run_service.SessionLocal", mock),
+        patch.object(settings, "SCRAPE_MAX_RETRIES", 1),
+    ):
+        mock.return_value = db_session
+        yield mock
+
+
+class TestPlanBackfill:
+    def test_shared_pages_fetched_once(self):
+        units = plan_backfill(
+            [StatType.kicking, StatType.kicking_stats, StatType.passing_stats],
+            [2023],
+        )
+
+        assert [(u.url, u.stat_types) for u in units] == [
+            (
+                page_url(StatType.kicking, 2023),
+                (StatType.kicking, StatType.kicking_stats),
+            ),
+            (page_url(StatType.passing_stats, 2023), (StatType.passing_stats,)),
+        ]
+
+    def test_newest_season_first(self):
+        units = plan_backfill([StatType.passing_stats], [2021, 2023, 2022])
+        assert [u.season for u in units] == [2023, 2022, 2021]
+
+    def test_completed_units_left_out(self):
+        url = page_url(StatType.kicking, 2023)
+        units = plan_backfill(
+            [StatType.kicking, StatType.kicking_stats],
+            [2023],
+            completed={(url, "kicking")},
+        )
+        assert [u.stat_types for u in units] == [(StatType.kicking_stats,)]
+
+
+class TestBackfill:
+    def test_stores_and_checkpoints(self, db_session, ledger):
+        fetch = MagicMock(return_value=TEAM_STATS_HTML)
+
+        progress = list(
+            backfill([StatType.team_offense], [2023], ledger=ledger, fetch=fetch)
+        )
+
+        (result,) = progress[0]["results"]
+        assert (result["status"], result["rows"], result["inserted"]) == (
+            "stored",
+            1,
+            1,
+        )
+        assert progress[0]["pages_done"] == progress[0]["pages_total"] == 1
+        assert progress[0]["eta_seconds"] == 0
+        assert ledger.completed() == {
+            (page_url(StatType.team_offense, 2023), "team_offense")
+        }
+        assert db_session.execute(select(TeamOffense)).scalar_one().pf == 450
+        run = db_session.execute(select(ScrapeRun)).scalar_one()
+        assert (run.stat_type, run.outcome, run.rows_changed) == (
+            "team_offense",
+            "stored",
+            1,
+        )
+        assert run.attempts == 1
+
+    def test_resume_skips_completed_pages(self, ledger):
+        fetch = MagicMock(return_value=TEAM_STATS_HTML)
+        list(backfill([StatType.team_offense], [2023], ledger=ledger, fetch=fetch))
+
+        progress = list(
+            backfill([StatType.team_offense], [2022, 2023], ledger=ledger, fetch=fetch)
+        )
+
+        assert [p["season"] for p in progress] == [2022]
+        assert fetch.call_count == 2
+
+    def test_failed_fetch_not_checkpointed(self, db_session, ledger):
+        fetch = MagicMock(side_effect=RuntimeError("blocked"))
+
+        (progress,) = backfill(
+            [StatType.team_offense], [2023], ledger=ledger, fetch=fetch
+        )
+
+        assert progress["results"][0]["status"] == "failed"
+        assert ledger.completed() == set()
+        run = db_session.execute(select(ScrapeRun)).scalar_one()
+        assert (run.outcome, run.error) == ("failed", "blocked")
+
+    def test_reset_clears_checkpoints(self, ledger):
+        ledger.mark_completed("https://pfr/a", StatType.games, 2023, 10)
+        ledger.reset()
+        assert ledger.completed() == set()
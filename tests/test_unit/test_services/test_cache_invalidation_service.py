@@ -0,0 +1,160 @@
+"""
+Unit tests for data-version bumps and cache invalidation delivery.
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.entities.base import Base
+from src.repositories.data_version_repo import (
+    DataVersionRepository,
+    version_listener,
+)
+from src.services import cache_invalidation_service
+from src.services.cache_invalidation_service import VersionWatcher
+from src.services.row_diff_service import apply_row_diff
+from src.services.stat_registry import StatType
+
+
+def ingest(db, pf, season=2023):
+    apply_row_diff(
+        db,
+        StatType.team_offense,
+        season,
+        [{"tm": "KC", "season": season, "pf": pf}],
+        scrape_run="run",
+    )
+    db.commit()
+
+
+@pytest.fixture
+def invalidated():
+    calls: list[tuple[str, int]] = []
+
+    def record(table_name, season):
+        calls.append((table_name, season))
+
+    cache_invalidation_service.subscribe(record)
+    yield calls
+    cache_invalidation_service.unsubscribe(record)
+
+
+class TestDataVersionRepository:
+    def test_bump_increments_per_table_season(self, db_session):
+        repo = DataVersionRepository(db_session)
+
+        assert repo.bump("team_offense", 2023) == 1
+        assert repo.bump("team_offense", 2023) == 2
+        assert repo.bump("team_offense", 2022) == 1
+        assert repo.current() == {("team_offense", 2023): 2, ("team_offense", 2022): 1}
+
+    def test_ingest_bumps_only_on_change(self, db_session):
+        ingest(db_session, 450)
+        ingest(db_session, 450)
+        ingest(db_session, 451)
+
+        assert DataVersionRepository(db_session).current() == {
+            ("team_offense", 2023): 2
+        }
+
+
+class TestVersionListener:
+    def test_listener_is_detached_from_pool_and_unlistens(self):
+        engine = MagicMock()
+        conn = engine.raw_connection.return_value
+        dbapi_conn = conn.driver_connection
+        cursor = dbapi_conn.cursor.return_value.__enter__.return_value
+        detached_before_autocommit = []
+        conn.detach.side_effect = lambda: detached_before_autocommit.append(
+            dbapi_conn.autocommit is not True
+        )
+
+        with version_listener(engine) as listening:
+            assert listening is dbapi_conn
+            assert dbapi_conn.autocommit is True
+
+        assert detached_before_autocommit == [True]
+        statements = [c.args[0] for c in cursor.execute.call_args_list]
+        assert statements == ["LISTEN data_version", "UNLISTEN *"]
+        conn.close.assert_called_once()
+
+    def test_listener_closed_when_unlisten_fails(self):
+        engine = MagicMock()
+        conn = engine.raw_connection.return_value
+        cursor = conn.driver_connection.cursor.return_value.__enter__.return_value
+
+        with pytest.raises(RuntimeError), version_listener(engine):
+            cursor.execute.side_effect = RuntimeError("connection lost")
+            raise RuntimeError("connection lost")
+
+        conn.close.assert_called_once()
+
+
+class TestVersionWatcher:
+    def test_first_poll_is_baseline(self, db_session, invalidated):
+        ingest(db_session, 450)
+
+        VersionWatcher(lambda: db_session).poll_once()
+
+        assert invalidated == []
+
+    def test_poll_invalidates_changed_seasons(self, db_session, invalidated):
+        watcher = VersionWatcher(lambda: db_session)
+        ingest(db_session, 450, season=2022)
+        watcher.poll_once()
+
+        ingest(db_session, 451, season=2022)
+        ingest(db_session, 300, season=2023)
+        watcher.poll_once()
+        watcher.poll_once()
+
+        assert sorted(invalidated) == [("team_offense", 2022), ("team_offense", 2023)]
+
+    def test_notification_invalidates_once(self, db_session, invalidated):
+        watcher = VersionWatcher(lambda: db_session)
+        watcher.poll_once()
+
+        watcher.handle_notification("team_offense:2023:1")
+        watcher.handle_notification("team_offense:2023:1")  # redelivered
+        watcher.poll_once()  # poll after ingest already seen via NOTIFY
+
+        assert invalidated == [("team_offense", 2023)]
+
+    def test_failing_subscriber_does_not_block_others(self, invalidated):
+        def broken(table_name, season):
+            raise RuntimeError("boom")
+
+        cache_invalidation_service.subscribe(broken)
+        try:
+            cache_invalidation_service.invalidate("standings", 2023)
+        finally:
+            cache_invalidation_service.unsubscribe(broken)
+
+        assert invalidated == [("standings", 2023)]
+
+    def test_background_thread_sees_other_process_ingest(self, tmp_path):
+        engine = create_engine(f"sqlite:///{tmp_path / 'versions.db'}")
+        Base.metadata.create_all(engine)
+        session_factory = sessionmaker(bind=engine)
+        seen = threading.Event()
+
+        def on_change(table_name, season):
+            seen.set()
+
+        watcher = VersionWatcher(session_factory, poll_seconds=0.05)
+        cache_invalidation_service.subscribe(on_change)
+        watcher.start()
+        try:
+            time.sleep(0.2)  # let the first (baseline) poll run
+            with session_factory() as db:
+                ingest(db, 450)
+            assert seen.wait(2)
+        finally:
+            watcher.stop()
+            cache_invalidation_service.unsubscribe(on_change)
+            engine.dispose()
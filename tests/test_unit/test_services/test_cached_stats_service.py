@@ -0,0 +1,97 @@
+"""
+Unit tests for the read-through cache around StatsRetrievalService.
+"""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config import settings
+from src.core.read_cache import ReadCache
+from src.entities.team_offense import TeamOffense
+from src.services import cached_stats_service
+from src.services.cached_stats_service import CachedStatsRetrievalService, ttl_for
+from src.services.row_diff_service import apply_row_diff
+from src.services.stat_registry import StatType
+
+
+@pytest.fixture
+def service(db_session):
+    db_session.add(TeamOffense(season=2022, tm="KAN", pf=496))
+    db_session.commit()
+    return CachedStatsRetrievalService(db_session, cache=ReadCache())
+
+
+class TestTtl:
+    def test_completed_season_is_frozen(self):
+        assert ttl_for(2022, today=date(2024, 5, 1)) == (
+            settings.READ_CACHE_FROZEN_TTL_SECONDS
+        )
+
+    def test_current_season_and_all_seasons_short(self):
+        short = settings.READ_CACHE_CURRENT_TTL_SECONDS
+        assert ttl_for(2024, today=date(2024, 12, 1)) == short
+        assert ttl_for(None) == short
+
+
+class TestCachedStatsRetrieval:
+    def test_results_are_jsonable_and_cached(self, service):
+        with patch.object(
+            service.service,
+            "get_all_teams",
+            wraps=service.service.get_all_teams,
+        ) as spy:
+            first = service.get_all_teams(2022, limit=10)
+            second = service.get_all_teams(2022, limit=10)
+
+        assert spy.call_count == 1
+        assert first == second
+        assert first["data"][0]["tm"] == "KAN"
+        assert "row_hash" not in first["data"][0]
+
+    def test_args_are_part_of_the_key(self, service):
+        with patch.object(
+            service.service,
+            "get_all_teams",
+            wraps=service.service.get_all_teams,
+        ) as spy:
+            service.get_all_teams(2022, limit=10)
+            service.get_all_teams(2022, limit=20)
+
+        assert spy.call_count == 2
+
+    def test_frozen_season_total_shares_the_cache(self, service):
+        service.get_all_teams(2022, limit=10)
+        service.cache.invalidate("team_offense", 2022)
+
+        assert service.cache.stats()["entries"] == 0
+
+    def test_ingest_invalidates_changed_season(self, service, db_session):
+        assert service.get_team_stats("KAN", 2022)["points_for"] == 496
+
+        apply_row_diff(
+            db_session,
+            StatType.team_offense,
+            2022,
+            [{"tm": "KAN", "season": 2022, "pf": 500}],
+            scrape_run="run",
+        )
+        db_session.commit()
+        service.cache.invalidate("team_offense", 2022)  # what ingestion calls
+
+        assert service.get_team_stats("KAN", 2022)["points_for"] == 500
+
+    def test_disabled_cache_always_loads(self, service, monkeypatch):
+        monkeypatch.setattr(settings, "READ_CACHE_ENABLED", False)
+
+        service.get_all_teams(2022)
+        service.get_all_teams(2022)
+
+        assert service.cache.stats()["misses"] == 0
+
+    def test_module_cache_is_shared_default(self, db_session):
+        assert (
+            CachedStatsRetrievalService(db_session).cache
+            is cached_stats_service.read_cache
+        )
@@ -0,0 +1,105 @@
+"""
+Unit tests for the cursor-based change feed over stat_changes.
+"""
+
+import pytest
+
+from src.services.change_feed_service import changes_since
+from src.services.row_diff_service import apply_row_diff
+from src.services.stat_registry import StatType, validate_rows
+
+
+def rows(**points):
+    return [{"tm": tm, "season": 2023, "pf": pf} for tm, pf in points.items()]
+
+
+def ingest(db_session, season_rows, run="run", stat_type=StatType.team_offense):
+    apply_row_diff(db_session, stat_type, 2023, season_rows, scrape_run=run)
+    db_session.commit()
+
+
+class TestChangesSince:
+    def test_logs_each_change_with_hashes_and_run(self, db_session):
+        ingest(db_session, rows(KC=450, BUF=400), run="first")
+        ingest(db_session, rows(KC=451), run="second")
+
+        changes = changes_since(db_session)["changes"]
+
+        assert [(c["change"], c["key"]["tm"], c["scrape_run"]) for c in changes] == [
+            ("inserted", "KC", "first"),
+            ("inserted", "BUF", "first"),
+            ("updated", "KC", "second"),
+            ("deleted", "BUF", "second"),
+        ]
+        assert changes[2]["old_hash"] == changes[0]["new_hash"]
+        assert changes[3]["new_hash"] is None
+
+    def test_unchanged_ingest_logs_nothing(self, db_session):
+        ingest(db_session, rows(KC=450))
+        cursor = changes_since(db_session)["cursor"]
+
+        ingest(db_session, rows(KC=450))
+
+        assert changes_since(db_session, cursor) == {
+            "changes": [],
+            "cursor": cursor,
+            "has_more": False,
+        }
+
+    def test_pages_through_cursor(self, db_session):
+        ingest(db_session, rows(KC=450, BUF=400, MIA=350))
+
+        first = changes_since(db_session, limit=2)
+        rest = changes_since(db_session, first["cursor"], limit=2)
+
+        assert len(first["changes"]) == 2
+        assert first["has_more"] is True
+        assert [c["key"]["tm"] for c in rest["changes"]] == ["MIA"]
+        assert rest["has_more"] is False
+
+    def test_filters_by_table(self, db_session):
+        ingest(db_session, rows(KC=450))
+        ingest(
+            db_session, [{"tm": "KC", "season": 2023, "w": 11}], stat_type="standings"
+        )
+
+        page = changes_since(db_session, tables=["standings"])
+
+        assert [c["table"] for c in page["changes"]] == ["standings"]
+
+    def test_unknown_table_rejected(self, db_session):
+        with pytest.raises(ValueError, match="nope"):
+            changes_since(db_session, tables=["nope"])
+
+    def test_payloads_carry_current_values(self, db_session):
+        ingest(db_session, rows(KC=450, BUF=400))
+        ingest(db_session, rows(KC=451))
+
+        changes = changes_since(db_session, payloads=True)["changes"]
+
+        assert changes[0]["payload"]["pf"] == 451  # latest state shows through
+        assert changes[0]["payload"]["tm"] == "KC"
+        assert "id" not in changes[0]["payload"]
+        assert changes[-1]["change"] == "deleted"
+        assert changes[-1]["payload"] is None
+
+    def test_player_payloads_found_by_player_id_or_name(self, db_session):
+        players = [
+            {"season": 2023, "player_name": "A", "tm": "X", "pfr_id": pfr_id}
+            for pfr_id in ("AaaaA00", "AaaaA01", None)
+        ]
+        rushing = validate_rows(StatType.rushing_stats, players)
+        ingest(db_session, rushing, stat_type=StatType.rushing_stats)
+
+        changes = changes_since(db_session, payloads=True)["changes"]
+
+        keys = [c["key"] for c in changes]
+        assert [k.get("player_id") is None for k in keys] == [False, False, True]
+        assert keys[2]["player_name"] == "A"
+        assert [c["payload"]["player_id"] for c in changes][2] is None
+        assert len({c["payload"]["player_id"] for c in changes[:2]}) == 2
+
+    def test_payloads_omitted_by_default(self, db_session):
+        ingest(db_session, rows(KC=450))
+
+        assert "payload" not in changes_since(db_session)["changes"][0]
@@ -0,0 +1,112 @@
+"""
+Unit tests for the NFL calendar and the in-season incremental scheduler.
+"""
+
+from datetime import UTC, date, datetime
+from unittest.mock import patch
+
+import pytest
+
+from src.core.nfl_calendar import (
+    is_season_complete,
+    kickoff,
+    regular_season_end,
+    season_for,
+    super_bowl,
+)
+from src.repositories.scrape_task_repo import ScrapeTaskRepository
+from src.services.in_season_service import due_tables, schedule_in_season
+from src.services.stat_registry import StatType
+
+
+def utc(*args):
+    return datetime(*args, tzinfo=UTC)
+
+
+class TestNflCalendar:
+    @pytest.mark.parametrize(
+        "season, opener, finale_tuesday, final",
+        [
+            (2023, date(2023, 9, 7), date(2024, 1, 9), date(2024, 2, 11)),
+            (2024, date(2024, 9, 5), date(2025, 1, 7), date(2025, 2, 9)),
+            (2020, date(2020, 9, 10), date(2021, 1, 5), date(2021, 2, 7)),
+        ],
+    )
+    def test_key_dates(self, season, opener, finale_tuesday, final):
+        assert kickoff(season) == opener
+        assert regular_season_end(season) == finale_tuesday
+        assert super_bowl(season) == final
+
+    def test_january_belongs_to_prior_season(self):
+        assert season_for(date(2025, 1, 12)) == 2024
+        assert season_for(date(2025, 9, 1)) == 2025
+
+    def test_season_complete_after_super_bowl(self):
+        assert not is_season_complete(2024, date(2025, 2, 9))
+        assert is_season_complete(2024, date(2025, 2, 10))
+
+
+class TestDueTables:
+    def test_partial_week_refreshes_scores_only(self):
+        # Monday morning after week 1 Sunday (2024 kicked off Thu Sep 5)
+        due = due_tables(utc(2024, 9, 9, 12))
+        assert set(due) == {StatType.games, StatType.standings}
+
+    def test_week_complete_refreshes_everything(self):
+        due = due_tables(utc(2024, 9, 10, 12))
+        assert set(due) == set(StatType)
+        assert due[StatType.passing_stats] == utc(2024, 9, 10, 10)
+
+    def test_trigger_waits_for_configured_hour(self):
+        assert StatType.passing_stats not in due_tables(utc(2024, 9, 10, 9))
+
+    def test_postseason_refreshes_games_only(self):
+        assert set(due_tables(utc(2025, 1, 20, 12))) == {StatType.games}
+
+
+class TestScheduleInSeason:
+    @pytest.fixture(autouse=True)
+    def session_local(self, db_session):
+        with patch("src.services.in_season_service.SessionLocal") as mock:
+            mock.return_value = db_session
+            yield mock
+
+    def test_enqueues_changed_tables_at_in_season_priority(self, db_session):
+        summary = schedule_in_season(utc(2024, 9, 9, 12))
+
+        assert summary == {"season": 2024, "enqueued": ["games", "standings"]}
+        tasks = ScrapeTaskRepository(db_session).find_by_season(2024)
+        assert {t.priority for t in tasks} == {50}
+
+    def test_overlapping_triggers_coalesce(self):
+        schedule_in_season(utc(2024, 9, 9, 12))
+        summary = schedule_in_season(utc(2024, 9, 10, 12))
+
+        # games/standings are still pending, so only the weekly tables are new
+        assert set(summary["enqueued"]) == set(StatType) - {
+            StatType.games,
+            StatType.standings,
+        }
+        assert schedule_in_season(utc(2024, 9, 10, 13))["enqueued"] == []
+
+    def test_requeues_only_tables_scraped_before_trigger(self, db_session):
+        repo = ScrapeTaskRepository(db_session)
+        schedule_in_season(utc(2024, 9, 10, 12))
+        while tasks := repo.lease("w1", 60, limit=20):
+            for task in tasks:
+                repo.complete(task.id, "w1")
+        for task in repo.find_by_season(2024):
+            task.completed_at = utc(2024, 9, 10, 13)
+        db_session.commit()
+
+        # Thursday night game of week 2: only scores changed since the scrape
+        summary = schedule_in_season(utc(2024, 9, 13, 12))
+        assert summary["enqueued"] == ["games", "standings"]
+
+    def test_completed_season_skipped(self):
+        summary = schedule_in_season(utc(2025, 2, 20, 12))
+        assert summary == {"season": 2024, "enqueued": [], "skipped": "season complete"}
+
+    def test_offseason_skipped(self):
+        summary = schedule_in_season(utc(2025, 7, 1, 12))
+        assert summary["skipped"] == "before kickoff"
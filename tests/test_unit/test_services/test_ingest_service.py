@@ -0,0 +1,179 @@
+"""
+Unit tests for fingerprint-based change detection on scrape ingest.
+"""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy import func, select
+
+from src.entities.kicking import Kicking
+from src.entities.kicking_stats import KickingStats
+from src.entities.scrape_run import ScrapeRun
+from src.entities.scraped_table_fingerprint import ScrapedTableFingerprint
+from src.entities.team_offense import TeamOffense
+from src.repositories.table_fingerprint_repo import TableFingerprintRepository
+from src.services import ingest_service, scrape_run_service, team_offense_service
+from src.services.ingest_service import ingest_page, page_fingerprints
+from src.services.stat_registry import StatType
+
+URL = "https://www.pro-football-reference.com/years/2023/"
+
+TEAM_STATS_HTML = """
+<html><body><table class="stats" id="team_stats"><tbody>
+<tr><td data-stat="team">Kansas City Chiefs</td><td data-stat="g">17</td>
+<td data-stat="points">{points}</td></tr>
+</tbody></table></body></html>
+"""
+
+
+KICKING_URL = "https://www.pro-football-reference.com/years/2023/kicking.htm"
+
+KICKING_HTML = """
+<html><body><table class="stats" id="kicking"><tbody>
+<tr><th data-stat="ranker">1</th>
+<td data-stat="player" data-append-csv="ButkHa00">Harrison Butker</td>
+<td data-stat="team">KAN</td><td data-stat="fgm">33</td></tr>
+</tbody></table></body></html>
+"""
+
+
+def page(points=450):
+    return TEAM_STATS_HTML.format(points=points)
+
+
+def row_count(db_session):
+    return db_session.execute(select(func.count()).select_from(TeamOffense)).scalar()
+
+
+def ingest(db_session, source, **kwargs):
+    result = ingest_page(db_session, StatType.team_offense, URL, 2023, source, **kwargs)
+    db_session.commit()
+    return result
+
+
+class TestPageFingerprints:
+    def test_fingerprints_every_table(self):
+        fingerprints = page_fingerprints(StatType.team_offense, page())
+        assert list(fingerprints) == ["team_stats"]
+        assert fingerprints["team_stats"] is not None
+
+    def test_missing_table_is_none(self):
+        fingerprints = page_fingerprints(StatType.team_offense, "<html></html>")
+        assert fingerprints == {"team_stats": None}
+
+
+class TestIngestPage:
+    def test_first_ingest_stores_rows_and_fingerprint(self, db_session):
+        result = ingest(db_session, page())
+
+        assert (result["status"], result["inserted"]) == ("stored", 1)
+        stored = TableFingerprintRepository(db_session).find_for_url(
+            URL, StatType.team_offense
+        )
+        assert stored["team_stats"].rows_ingested == 1
+        assert stored["team_stats"].season == 2023
+
+    def test_unchanged_page_skips_parse_and_write(self, db_session):
+        ingest(db_session, page())
+
+        with patch.object(team_offense_service, "parse_page") as parse:
+            result = ingest(db_session, page())
+
+        parse.assert_not_called()
+        assert result["status"] == "unchanged"
+        assert result["tables"] == ["team_stats"]
+        assert row_count(db_session) == 1
+
+    def test_changed_table_is_reingested(self, db_session):
+        ingest(db_session, page())
+
+        result = ingest(db_session, page(points=451))
+
+        assert (result["updated"], result["inserted"]) == (1, 0)
+        assert db_session.execute(select(TeamOffense)).scalar_one().pf == 451
+        fps = db_session.execute(select(ScrapedTableFingerprint)).scalars().all()
+        assert len(fps) == 1
+
+    def test_force_reingests_unchanged_page(self, db_session):
+        ingest(db_session, page())
+
+        result = ingest(db_session, page(), force=True)
+
+        assert result["status"] == "stored"
+        assert result["unchanged"] == 1
+
+    def test_failed_parse_records_no_fingerprint(self, db_session):
+        with (
+            patch.object(team_offense_service, "parse_page", side_effect=ValueError),
+            pytest.raises(ValueError),
+        ):
+            ingest(db_session, page())
+
+        repo = TableFingerprintRepository(db_session)
+        assert repo.find_for_url(URL, StatType.team_offense) == {}
+
+    def test_stat_types_sharing_a_page_each_ingest_it(self, db_session):
+        for stat_type in (StatType.kicking, StatType.kicking_stats):
+            result = ingest_page(db_session, stat_type, KICKING_URL, 2023, KICKING_HTML)
+            db_session.commit()
+            assert result["status"] == "stored"
+
+        assert db_session.execute(select(Kicking)).scalar_one().tm == "KAN"
+        kicker = db_session.execute(select(KickingStats)).scalar_one()
+        assert kicker.player_name == "Harrison Butker"
+
+        again = ingest_page(
+            db_session, StatType.kicking_stats, KICKING_URL, 2023, KICKING_HTML
+        )
+        assert again["status"] == "unchanged"
+
+
+class TestScrapeStat:
+    async def test_reports_unchanged_on_second_scrape(self, db_session):
+        with (
+            patch.object(ingest_service, "SessionLocal", return_value=db_session),
+            patch.object(ingest_service, "fetch_page", return_value=page()),
+            patch.object(db_session, "close"),
+        ):
+            first = await ingest_service.SCRAPE_DISPATCH[StatType.team_offense](2023)
+            second = await ingest_service.SCRAPE_DISPATCH[StatType.team_offense](2023)
+
+        assert first["inserted"] == 1
+        assert second["status"] == "unchanged"
+        assert second["url"] == URL
+
+    async def test_records_each_scrape_in_ledger(self, db_session):
+        with (
+            patch.object(ingest_service, "SessionLocal", return_value=db_session),
+            patch.object(scrape_run_service, "SessionLocal", return_value=db_session),
+            patch.object(ingest_service, "fetch_page", return_value=page()),
+            patch.object(db_session, "close"),
+        ):
+            first = await ingest_service.SCRAPE_DISPATCH[StatType.team_offense](2023)
+            await ingest_service.SCRAPE_DISPATCH[StatType.team_offense](2023)
+
+        runs = db_session.execute(select(ScrapeRun).order_by(ScrapeRun.id)).scalars()
+        stored, unchanged = runs.all()
+        assert stored.run_id == first["scrape_run"]
+        assert (stored.outcome, stored.rows_in, stored.rows_changed) == ("stored", 1, 1)
+        assert stored.attempts == 1
+        assert unchanged.outcome == "unchanged"
+
+
+class TestScrapePage:
+    async def test_fetches_once_for_every_stat_type(self, db_session):
+        with (
+            patch.object(ingest_service, "SessionLocal", return_value=db_session),
+            patch.object(
+                ingest_service, "fetch_page", return_value=KICKING_HTML
+            ) as fetch,
+            patch.object(db_session, "close"),
+        ):
+            results = await ingest_service.scrape_page(
+                KICKING_URL, 2023, [StatType.kicking, StatType.kicking_stats]
+            )
+
+        fetch.assert_called_once_with(KICKING_URL, use_cache=False)
+        assert [r["stat_type"] for r in results] == ["kicking", "kicking_stats"]
+        assert all(r["inserted"] == 1 for r in results)
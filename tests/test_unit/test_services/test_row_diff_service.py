@@ -0,0 +1,273 @@
+"""
+Unit tests for row-level diff ingestion and the stat_changes log.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from src.core.teams import team_id
+from src.entities.player import Player
+from src.entities.rushing_stats import RushingStats
+from src.entities.stat_change import StatChange
+from src.entities.team_offense import TeamOffense
+from src.services import rushing_stats_service
+from src.services.row_diff_service import (
+    apply_row_diff,
+    natural_key,
+    row_hash,
+    row_key,
+)
+from src.services.stat_registry import StatType, validate_rows
+
+RUSHING_PAGE = """
+<html><body><table id="rushing"><tbody>
+<tr><th data-stat="ranker">1</th>
+<td data-stat="player" data-append-csv="AlleJo02">Josh Allen*</td>
+<td data-stat="team">BUF</td><td data-stat="rush_yds">524</td></tr>
+<tr><th data-stat="ranker">2</th>
+<td data-stat="player" data-append-csv="AlleJo00">Josh Allen</td>
+<td data-stat="team">JAX</td><td data-stat="rush_yds">3</td></tr>
+</tbody></table></body></html>
+"""
+
+
+def rows(**points):
+    return [{"tm": tm, "season": 2023, "pf": pf} for tm, pf in points.items()]
+
+
+def ingest(db_session, season_rows, run="run"):
+    counts = apply_row_diff(
+        db_session, StatType.team_offense, 2023, season_rows, scrape_run=run
+    )
+    db_session.commit()
+    return counts
+
+
+def stored(db_session):
+    return {
+        r.tm: (r.id, r.pf) for r in db_session.execute(select(TeamOffense)).scalars()
+    }
+
+
+class TestRowHash:
+    def test_ignores_key_order_and_id(self):
+        assert row_hash({"tm": "KC", "pf": 1}) == row_hash(
+            {"pf": 1, "tm": "KC", "id": 7}
+        )
+
+    def test_value_change_changes_hash(self):
+        assert row_hash({"tm": "KC", "pf": 1}) != row_hash({"tm": "KC", "pf": 2})
+
+
+class TestNaturalKey:
+    def test_team_table(self):
+        assert natural_key(StatType.team_offense) == ("tm", "season")
+
+    def test_player_table(self):
+        assert natural_key(StatType.passing_stats) == ("player_id", "season", "tm")
+
+    def test_row_without_player_id_keyed_by_name(self):
+        key = natural_key(StatType.passing_stats)
+        row = {"player_id": None, "player_name": "Josh Allen", "season": 2023}
+
+        assert row_key({**row, "player_id": 7}, key)[0] == ("player_id", 7)
+        assert row_key(row, key)[0] == ("player_name", "Josh Allen")
+
+
+class TestApplyRowDiff:
+    def test_first_ingest_inserts_everything(self, db_session):
+        counts = ingest(db_session, rows(KC=450, BUF=400))
+
+        assert counts == {"inserted": 2, "updated": 0, "deleted": 0, "unchanged": 0}
+        assert all(
+            r.row_hash for r in db_session.execute(select(TeamOffense)).scalars()
+        )
+
+    def test_only_changed_rows_are_written(self, db_session):
+        ingest(db_session, rows(KC=450, BUF=400))
+        before = stored(db_session)
+
+        counts = ingest(db_session, rows(KC=451, BUF=400))
+
+        assert counts == {"inserted": 0, "updated": 1, "deleted": 0, "unchanged": 1}
+        after = stored(db_session)
+        assert after["KC"] == (before["KC"][0], 451)  # updated in place
+        assert after["BUF"] == before["BUF"]
+
+    def test_missing_rows_are_deleted(self, db_session):
+        ingest(db_session, rows(KC=450, BUF=400))
+
+        counts = ingest(db_session, rows(KC=450))
+
+        assert counts["deleted"] == 1
+        assert set(stored(db_session)) == {"KC"}
+
+    def test_other_seasons_untouched(self, db_session):
+        apply_row_diff(
+            db_session,
+            StatType.team_offense,
+            2022,
+            [{"tm": "KC", "season": 2022, "pf": 300}],
+            scrape_run="old",
+        )
+        ingest(db_session, rows(BUF=400))
+
+        assert len(stored(db_session)) == 2
+
+    def test_duplicate_keys_rejected(self, db_session):
+        with pytest.raises(ValueError, match="Duplicate"):
+            ingest(db_session, rows(KC=450) * 2)
+
+
+SAME_NAME_PAGE = """
+<html><body><table id="rushing"><tbody>
+<tr><th data-stat="ranker">1</th>
+<td data-stat="player" data-append-csv="SmitJo00">John Smith</td>
+<td data-stat="team">NYJ</td><td data-stat="rush_yds">40</td></tr>
+<tr><th data-stat="ranker">2</th>
+<td data-stat="player" data-append-csv="SmitJo01">John Smith</td>
+<td data-stat="team">NYJ</td><td data-stat="rush_yds">12</td></tr>
+</tbody></table></body></html>
+"""
+
+
+class TestPlayerIds:
+    def ingest_page(self, db_session, page=RUSHING_PAGE):
+        parsed = rushing_stats_service.parse_page(page, 2023)
+        counts = apply_row_diff(
+            db_session,
+            StatType.rushing_stats,
+            2023,
+            validate_rows(StatType.rushing_stats, parsed),
+            scrape_run="run",
+        )
+        db_session.commit()
+        return counts
+
+    def test_parsed_pfr_ids_become_player_foreign_keys(self, db_session):
+        self.ingest_page(db_session)
+
+        players = {p.pfr_id: p.id for p in db_session.execute(select(Player)).scalars()}
+        by_team = {
+            r.tm: r.player_id
+            for r in db_session.execute(select(RushingStats)).scalars()
+        }
+        # Same name, two people
+        assert by_team == {"BUF": players["AlleJo02"], "JAX": players["AlleJo00"]}
+
+    def test_reingest_reuses_players(self, db_session):
+        self.ingest_page(db_session)
+
+        counts = self.ingest_page(db_session)
+
+        assert counts["unchanged"] == 2
+        assert len(db_session.execute(select(Player)).all()) == 2
+
+    def test_missing_player_ids_fill_without_logging_changes(self, db_session):
+        # Rows stored before players were tracked
+        parsed = rushing_stats_service.parse_page(RUSHING_PAGE, 2023)
+        legacy = [{**row, "pfr_id": None} for row in parsed]
+        apply_row_diff(
+            db_session,
+            StatType.rushing_stats,
+            2023,
+            validate_rows(StatType.rushing_stats, legacy),
+            scrape_run="old",
+        )
+        db_session.commit()
+
+        counts = self.ingest_page(db_session)
+
+        assert counts["unchanged"] == 2
+        changes = db_session.execute(select(StatChange)).scalars().all()
+        assert {c.scrape_run for c in changes} == {"old"}
+        assert None not in {
+            r.player_id for r in db_session.execute(select(RushingStats)).scalars()
+        }
+
+    def test_same_name_same_team_kept_apart(self, db_session):
+        counts = self.ingest_page(db_session, SAME_NAME_PAGE)
+
+        assert counts["inserted"] == 2
+        players = {p.pfr_id: p.id for p in db_session.execute(select(Player)).scalars()}
+        yards = {
+            r.player_id: r.yds
+            for r in db_session.execute(select(RushingStats)).scalars()
+        }
+        assert yards == {players["SmitJo00"]: 40, players["SmitJo01"]: 12}
+        assert self.ingest_page(db_session, SAME_NAME_PAGE)["unchanged"] == 2
+
+    def test_same_name_rows_replace_an_ambiguous_legacy_row(self, db_session):
+        parsed = rushing_stats_service.parse_page(SAME_NAME_PAGE, 2023)
+        apply_row_diff(
+            db_session,
+            StatType.rushing_stats,
+            2023,
+            validate_rows(StatType.rushing_stats, [{**parsed[0], "pfr_id": None}]),
+            scrape_run="old",
+        )
+        db_session.commit()
+
+        counts = self.ingest_page(db_session, SAME_NAME_PAGE)
+
+        # Which John Smith the stored row was is unknown: it is replaced
+        assert (counts["inserted"], counts["deleted"]) == (2, 1)
+        assert None not in {
+            r.player_id for r in db_session.execute(select(RushingStats)).scalars()
+        }
+
+    def test_rows_without_pfr_id_keyed_by_name(self, db_session):
+        parsed = rushing_stats_service.parse_page(SAME_NAME_PAGE, 2023)
+        legacy = [{**parsed[0], "pfr_id": None}]
+
+        def ingest_legacy(rows):
+            counts = apply_row_diff(
+                db_session,
+                StatType.rushing_stats,
+                2023,
+                validate_rows(StatType.rushing_stats, rows),
+                scrape_run="run",
+            )
+            db_session.commit()
+            return counts
+
+        ingest_legacy(legacy)
+        assert ingest_legacy(legacy)["unchanged"] == 1
+        with pytest.raises(ValueError, match="Duplicate"):
+            ingest_legacy(legacy * 2)
+
+    def test_renamed_player_updated_in_place(self, db_session):
+        self.ingest_page(db_session, SAME_NAME_PAGE)
+        (before,) = db_session.execute(
+            select(RushingStats.id).where(RushingStats.yds == 40)
+        ).one()
+
+        counts = self.ingest_page(
+            db_session,
+            SAME_NAME_PAGE.replace("John Smith</td>", "Johnny Smith</td>", 1),
+        )
+
+        assert (counts["updated"], counts["inserted"]) == (1, 0)
+        renamed = db_session.get(RushingStats, before)
+        db_session.refresh(renamed)
+        assert (renamed.player_name, renamed.name_normalized) == (
+            "Johnny Smith",
+            "johnny smith",
+        )
+
+
+class TestTeamIds:
+    def test_team_names_resolve_to_team_ids(self, db_session):
+        ingest(db_session, rows(**{"Kansas City Chiefs": 450, "Avg Team": 350}))
+
+        by_team = {
+            r.tm: r.team_id for r in db_session.execute(select(TeamOffense)).scalars()
+        }
+        assert by_team == {"Kansas City Chiefs": team_id("KC"), "Avg Team": None}
+
+    def test_team_ids_do_not_change_row_hashes(self, db_session):
+        ingest(db_session, rows(**{"Kansas City Chiefs": 450}))
+
+        counts = ingest(db_session, rows(**{"Kansas City Chiefs": 450}))
+
+        assert counts["unchanged"] == 1
@@ -0,0 +1,104 @@
+"""
+Unit tests for the scrape work queue worker.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from src.core.config import settings
+from src.core.rate_limit import ScrapePriority, current_priority
+from src.repositories.scrape_task_repo import ScrapeTaskRepository
+from src.services import scrape_queue_service
+from src.services.stat_registry import StatType, page_url
+
+
+@pytest.fixture(autouse=True)
+def session_local(db_session):
+    with patch("src.services.scrape_queue_service.SessionLocal") as mock:
+        mock.return_value = db_session
+        yield mock
+
+
+@pytest.fixture
+def scrape_page():
+    async def scrape(url, season, stat_types):
+        if "games" in stat_types:
+            raise RuntimeError("blocked")
+        return []
+
+    with patch(
+        "src.services.scrape_queue_service.scrape_page", side_effect=scrape
+    ) as mock:
+        yield mock
+
+
+def test_enqueue_one_task_per_page(db_session):
+    count = scrape_queue_service.enqueue(
+        [StatType.passing_stats, StatType.games], [2022, 2023]
+    )
+    assert count == 4
+    assert scrape_queue_service.queue_status() == {"pending": 4}
+
+
+def test_stat_types_sharing_a_page_are_fetched_once(db_session, scrape_page):
+    count = scrape_queue_service.enqueue(
+        [StatType.kicking, StatType.kicking_stats], [2023]
+    )
+
+    assert count == 1
+    assert scrape_queue_service.work("w1", exit_when_idle=True) == 1
+    scrape_page.assert_called_once_with(
+        page_url(StatType.kicking, 2023), 2023, ["kicking", "kicking_stats"]
+    )
+
+
+def test_worker_dispatches_and_records_outcome(db_session, scrape_page):
+    with patch.object(settings, "SCRAPE_TASK_MAX_ATTEMPTS", 1):
+        scrape_queue_service.enqueue([StatType.passing_stats], [2023], priority=1)
+        scrape_queue_service.enqueue([StatType.games], [2023])
+
+    ran = scrape_queue_service.work("w1", exit_when_idle=True)
+
+    assert ran == 2
+    assert scrape_page.call_count == 2
+    repo = ScrapeTaskRepository(db_session)
+    passing = page_url(StatType.passing_stats, 2023)
+    assert repo.find_by_unique_key(passing, 2023).status == "done"
+    failed = repo.find_by_unique_key(page_url(StatType.games, 2023), 2023)
+    assert (failed.status, failed.last_error) == ("failed", "blocked")
+
+
+def test_worker_stops_after_max_tasks(scrape_page):
+    scrape_queue_service.enqueue([StatType.passing_stats], [2021, 2022, 2023])
+    assert scrape_queue_service.work("w1", max_tasks=2) == 2
+    assert scrape_queue_service.queue_status() == {"done": 2, "pending": 1}
+
+
+def test_failed_task_retried_while_attempts_remain(scrape_page):
+    scrape_queue_service.enqueue([StatType.games], [2023])
+
+    assert scrape_queue_service.work("w1", exit_when_idle=True) == 3
+    assert scrape_page.call_count == 3
+    assert scrape_queue_service.queue_status() == {"failed": 1}
+
+
+def test_priority_bands_map_to_rate_limit_classes():
+    assert scrape_queue_service.priority_class(100) == ScrapePriority.interactive
+    assert scrape_queue_service.priority_class(60) == ScrapePriority.in_season
+    assert scrape_queue_service.priority_class(0) == ScrapePriority.backfill
+    assert scrape_queue_service.priority_class(-5) == ScrapePriority.backfill
+
+
+def test_task_fetches_run_in_its_priority_class(scrape_page):
+    seen = []
+
+    async def scrape(*args):
+        seen.append(current_priority())
+
+    scrape_page.side_effect = scrape
+    scrape_queue_service.enqueue([StatType.passing_stats], [2023], priority=50)
+
+    scrape_queue_service.work("w1", exit_when_idle=True)
+
+    assert seen == [ScrapePriority.in_season]
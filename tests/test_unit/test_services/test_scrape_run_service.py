@@ -0,0 +1,144 @@
+"""
+Unit tests for the scrape run ledger and its stage-latency summary.
+"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import MagicMock, patch
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.core.run_metrics import stage
+from src.entities.scrape_run import ScrapeRun
+from src.repositories.scrape_run_repo import ScrapeRunRepository
+from src.services import scrape_run_service
+from src.services.scrape_run_service import (
+    SUMMARY_STAGES,
+    recorded_run,
+    summarize,
+    summarize_in_db,
+    summary,
+)
+
+
+@pytest.fixture(autouse=True)
+def session_local(db_session):
+    with patch.object(scrape_run_service, "SessionLocal", return_value=db_session):
+        yield
+
+
+def make_run(stat_type="passing_stats", fetch=1.0, outcome="stored", **kwargs):
+    return ScrapeRun(
+        run_id=kwargs.pop("run_id", f"{stat_type}-{fetch}"),
+        stat_type=stat_type,
+        fetch_seconds=fetch,
+        rate_limit_wait_seconds=0.0,
+        parse_seconds=0.1,
+        validate_seconds=0.0,
+        write_seconds=0.2,
+        total_seconds=fetch + 0.3,
+        bytes_fetched=1000,
+        outcome=outcome,
+        started_at=datetime.now(UTC),
+        **kwargs,
+    )
+
+
+class TestRecordedRun:
+    def test_records_stages_and_outcome(self, db_session):
+        with recorded_run("standings", 2023, "https://example.com") as run:
+            with stage("parse"):
+                pass
+            run.outcome = "unchanged"
+
+        (saved,) = ScrapeRunRepository(db_session).find_by_run_id(run.run_id)
+        assert (saved.stat_type, saved.season, saved.outcome) == (
+            "standings",
+            2023,
+            "unchanged",
+        )
+        assert saved.parse_seconds >= 0
+        assert saved.total_seconds >= saved.parse_seconds
+
+    def test_records_failure_and_reraises(self, db_session):
+        with pytest.raises(ValueError), recorded_run("games", 2023) as run:
+            raise ValueError("no table")
+
+        (saved,) = ScrapeRunRepository(db_session).find_by_run_id(run.run_id)
+        assert (saved.outcome, saved.error) == ("failed", "no table")
+
+    def test_ledger_failure_does_not_fail_scrape(self, db_session):
+        with patch.object(ScrapeRunRepository, "create", side_effect=RuntimeError):
+            with recorded_run("games", 2023) as run:
+                run.outcome = "stored"
+
+
+class TestSummary:
+    def test_percentiles_per_stage_and_stat_type(self):
+        runs = [make_run(fetch=float(f)) for f in range(1, 21)]
+        runs.append(make_run("standings", fetch=5.0, outcome="failed"))
+
+        result = summarize(runs)
+
+        passing = result["passing_stats"]
+        assert passing["runs"] == 20
+        assert passing["stages"]["fetch"] == {"p50": 10.0, "p95": 19.0}
+        assert passing["stages"]["write"] == {"p50": 0.2, "p95": 0.2}
+        assert result["standings"]["outcomes"] == {"failed": 1}
+
+    def test_summary_reads_window(self, db_session):
+        db_session.add_all([make_run(fetch=1.0), make_run("games", fetch=2.0)])
+        db_session.commit()
+
+        result = summary(days=1, stat_type="games")
+
+        assert list(result["stat_types"]) == ["games"]
+
+    def test_percentiles_computed_in_one_grouped_query(self):
+        repo = ScrapeRunRepository(MagicMock())
+
+        repo.stage_percentiles(datetime.now(UTC), ["fetch"])
+
+        (stmt,) = repo.session.execute.call_args.args
+        sql = str(stmt.compile(dialect=postgresql.dialect()))
+        assert "percentile_cont(" in sql
+        assert "WITHIN GROUP (ORDER BY scrape_runs.fetch_seconds)" in sql
+        assert "GROUP BY scrape_runs.stat_type" in sql
+
+    def test_outcome_counts_per_stat_type(self, db_session):
+        db_session.add_all(
+            [
+                make_run(fetch=1.0),
+                make_run(fetch=2.0, outcome="unchanged"),
+                make_run("games", fetch=3.0, outcome="failed"),
+            ]
+        )
+        db_session.commit()
+        since = datetime.now(UTC) - timedelta(days=1)
+
+        counts = ScrapeRunRepository(db_session).outcome_counts(since)
+
+        assert counts == {
+            "passing_stats": {"stored": 1, "unchanged": 1},
+            "games": {"failed": 1},
+        }
+
+    def test_database_summary_matches_python_shape(self, db_session):
+        runs = [make_run(fetch=1.0)]
+        db_session.add_all(runs)
+        db_session.commit()
+        row = {f"{stage}_p{q}": 0.5 for stage in SUMMARY_STAGES for q in (50, 95)}
+        row.update(runs=1, rows_changed=0, bytes_p50=1000, attempts_p95=0)
+        repo = ScrapeRunRepository(db_session)
+        since = datetime.now(UTC) - timedelta(days=1)
+
+        with patch.object(
+            repo, "stage_percentiles", return_value={"passing_stats": row}
+        ):
+            in_db = summarize_in_db(repo, since)
+
+        in_python = summarize(runs)
+        assert in_db.keys() == in_python.keys()
+        assert in_db["passing_stats"].keys() == in_python["passing_stats"].keys()
+        assert in_db["passing_stats"]["outcomes"] == {"stored": 1}
+        assert in_db["passing_stats"]["stages"]["fetch"] == {"p50": 0.5, "p95": 0.5}
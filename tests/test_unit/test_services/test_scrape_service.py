@@ -6,21 +6,37 @@ Tests cover:
 - flatten_pfr_columns: MultiIndex column flattening
 - parse_xlsx_to_games: HTML table parsing into game dicts
 - map_scraped_to_model: Game dict -> TeamGameCreate DTO mapping
+- teams_for_season / scrape_all_teams: Batch gamelog scheduling and resume
 
 Run with:
     pytest tests/test_unit/test_services/test_scrape_service.py -v
 """
 
 from datetime import date
+from unittest.mock import MagicMock, patch
 
 import numpy as np
 import pandas as pd
+import pytest
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
+from src.core.rate_limit import ScrapePriority, current_priority
 from src.dtos.team_game_dto import TeamGameCreate
+from src.entities.base import Base
+from src.entities.team_game import TeamGame
+from src.repositories.data_version_repo import DataVersionRepository
+from src.services import scrape_run_service, scrape_service
 from src.services.scrape_service import (
     clean_value,
     flatten_pfr_columns,
+    games_from_frame,
     map_scraped_to_model,
+    scrape_all_teams,
+    scrape_and_store,
+    store_team_games,
+    teams_for_season,
 )
 
 
@@ -224,3 +240,208 @@ class TestMapScrapedToModel:
         dto = map_scraped_to_model(scraped, 2023)
 
         assert dto.week == 0
+
+
+class TestGamesFromFrame:
+    """Tests for the vectorized schedule-frame parser."""
+
+    def _frame(self):
+        return pd.DataFrame(
+            {
+                "Week": [1, 2, "Bye"],
+                "Day": ["Sun", "Mon", None],
+                "Date": ["September 10", "September 18", None],
+                "Unnamed: 5_level_1": ["W", "L", None],
+                "Opp": ["DET", "BUF", None],
+                "Tm": [27.0, 17.0, np.nan],
+                "Opp.1": [20.0, 24.0, np.nan],
+                "TO_": [1.0, 2.0, np.nan],
+            }
+        )
+
+    def test_columns_resolved_and_cast(self):
+        games = games_from_frame(self._frame(), "kan")
+
+        assert games[0]["team"] == "KAN"
+        assert games[0]["week"] == 1
+        assert isinstance(games[0]["team_score"], int)
+        assert games[0]["opp_score"] == 20
+        assert games[1]["turnovers"] == 2  # resolved via fallback "TO_"
+        assert games[0]["tot_yards_for"] is None  # column absent
+
+    def test_non_numeric_week_and_nan_become_none(self):
+        games = games_from_frame(self._frame(), "kan")
+
+        assert games[2]["week"] is None
+        assert games[2]["team_score"] is None
+        assert games[2]["day"] is None
+
+    def test_dates_parsed_with_season(self):
+        games = games_from_frame(self._frame(), "kan", 2023)
+
+        assert games[0]["game_date"] == date(2023, 9, 10)
+        assert games[2]["game_date"] is None
+        assert map_scraped_to_model(games[1], 2023).game_date == date(2023, 9, 18)
+
+    def test_duplicate_column_names_use_first(self):
+        df = pd.DataFrame([["DET", "x"]], columns=["Opp", "Opp"])
+        assert games_from_frame(df, "kan")[0]["opponent"] == "DET"
+
+
+class TestTeamsForSeason:
+    """Tests for the per-season franchise list."""
+
+    def test_modern_season_has_32_teams(self):
+        assert len(teams_for_season(2023)) == 32
+
+    def test_expansion_teams_excluded_before_first_season(self):
+        teams = teams_for_season(1990)
+        assert "htx" not in teams
+        assert "rav" not in teams
+        assert "jax" not in teams
+
+    def test_cleveland_absent_during_suspension(self):
+        assert "cle" not in teams_for_season(1997)
+        assert "cle" in teams_for_season(1999)
+
+
+class TestStoreTeamGames:
+    def test_repeated_week_in_one_write_is_skipped(self, db_session):
+        games = [
+            {"team": "KAN", "week": 0, "result": None, "opponent": None},
+            {"team": "KAN", "week": 0, "result": None, "opponent": None},
+            {"team": "KAN", "week": 1, "result": "W", "opponent": "DET"},
+        ]
+        db_session.autoflush = False  # as configured on SessionLocal
+
+        store_team_games(db_session, games, 2023)
+
+        stored = db_session.scalar(select(func.count()).select_from(TeamGame))
+        assert stored == 2
+
+
+@pytest.fixture
+def session_factory():
+    # Team-seasons are scraped on worker threads, so share one connection
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield sessionmaker(bind=engine)
+    engine.dispose()
+
+
+class TestScrapeAllTeams:
+    """Tests for the batch gamelog scheduler (drivers and DB mocked)."""
+
+    async def _collect(self, gen):
+        return [event async for event in gen]
+
+    @patch("src.services.scrape_service._completed_teams", return_value=set())
+    @patch("src.services.scrape_service._scrape_and_store_with_driver")
+    @patch("src.services.scrape_service.create_chrome_driver")
+    async def test_one_event_per_team_and_drivers_pooled(
+        self, mock_driver, mock_store, mock_done
+    ):
+        mock_driver.return_value = MagicMock()
+        mock_store.return_value = 17
+
+        events = await self._collect(
+            scrape_all_teams([2023], teams=["kan", "det", "buf"], workers=2)
+        )
+
+        assert sorted(e["team"] for e in events) == ["buf", "det", "kan"]
+        assert all(e["status"] == "stored" for e in events)
+        assert [e["completed"] for e in events] == [1, 2, 3]
+        assert all(e["total"] == 3 for e in events)
+        assert mock_driver.call_count == 2
+        assert mock_driver.return_value.quit.call_count == 2
+
+    @patch("src.services.scrape_service._completed_teams", return_value={"kan"})
+    @patch("src.services.scrape_service._scrape_and_store_with_driver")
+    @patch("src.services.scrape_service.create_chrome_driver")
+    async def test_resume_skips_stored_teams(self, mock_driver, mock_store, _):
+        mock_store.return_value = 17
+
+        events = await self._collect(scrape_all_teams([2023], teams=["kan", "det"]))
+
+        by_team = {e["team"]: e["status"] for e in events}
+        assert by_team == {"kan": "skipped", "det": "stored"}
+        mock_store.assert_called_once()
+
+    @patch("src.services.scrape_service._completed_teams", return_value=set())
+    @patch("src.services.scrape_service._scrape_and_store_with_driver")
+    @patch("src.services.scrape_service.create_chrome_driver")
+    async def test_page_loads_run_in_requested_priority(
+        self, mock_driver, mock_store, _
+    ):
+        seen = []
+        mock_store.side_effect = lambda *args: seen.append(current_priority()) or 17
+
+        await self._collect(
+            scrape_all_teams([2023], teams=["kan", "det"], priority="backfill")
+        )
+
+        assert seen == [ScrapePriority.backfill] * 2
+        assert current_priority() == ScrapePriority.interactive
+
+    @patch("src.services.scrape_service._completed_teams", return_value=set())
+    @patch("src.services.scrape_service._scrape_and_store_with_driver")
+    @patch("src.services.scrape_service.create_chrome_driver")
+    async def test_failure_is_reported_and_batch_continues(
+        self, mock_driver, mock_store, _
+    ):
+        mock_store.side_effect = [RuntimeError("403"), 17]
+
+        events = await self._collect(
+            scrape_all_teams([2023], teams=["kan", "det"], workers=1)
+        )
+
+        statuses = sorted(e["status"] for e in events)
+        assert statuses == ["failed", "stored"]
+
+    async def test_resume_retries_team_whose_write_did_not_commit(
+        self, session_factory
+    ):
+        games = [
+            {"team": "KAN", "week": week, "result": "W", "opponent": "DET"}
+            for week in (1, 2)
+        ]
+        with (
+            patch.object(scrape_service, "SessionLocal", session_factory),
+            patch.object(scrape_run_service, "SessionLocal", session_factory),
+            patch.object(scrape_service, "_download_with_driver", return_value=games),
+            patch.object(scrape_service, "create_chrome_driver"),
+        ):
+            # The write fails after the games are added, before the commit
+            with patch.object(
+                DataVersionRepository, "bump", side_effect=RuntimeError("lost")
+            ):
+                interrupted = await self._collect(
+                    scrape_all_teams([2023], teams=["kan"])
+                )
+            resumed = await self._collect(scrape_all_teams([2023], teams=["kan"]))
+            rerun = await self._collect(scrape_all_teams([2023], teams=["kan"]))
+
+        assert [e["status"] for e in interrupted] == ["failed"]
+        assert [e["status"] for e in resumed] == ["stored"]
+        assert [e["status"] for e in rerun] == ["skipped"]
+        with session_factory() as db:
+            assert db.scalar(select(func.count()).select_from(TeamGame)) == 2
+
+    async def test_single_team_scrape_is_recorded_for_resume(self, session_factory):
+        games = [{"team": "KAN", "week": 1, "result": "W", "opponent": "DET"}]
+        with (
+            patch.object(scrape_service, "SessionLocal", session_factory),
+            patch.object(scrape_run_service, "SessionLocal", session_factory),
+            patch.object(scrape_service, "_download_with_driver", return_value=games),
+            patch.object(scrape_service, "create_chrome_driver") as driver,
+        ):
+            result = await scrape_and_store("kan", 2023)
+            batch = await self._collect(scrape_all_teams([2023], teams=["kan"]))
+
+        assert result == {"team": "kan", "season": 2023, "status": "stored", "games": 1}
+        assert [e["status"] for e in batch] == ["skipped"]
+        driver.return_value.quit.assert_called_once()
@@ -0,0 +1,162 @@
+"""
+Unit tests for staged, validated season swaps.
+"""
+
+import pytest
+from sqlalchemy import select
+
+from src.core.teams import team_id
+from src.entities.data_version import DataVersion
+from src.entities.player import Player
+from src.entities.rushing_stats import RushingStats
+from src.entities.stat_change import StatChange
+from src.entities.team_offense import TeamOffense
+from src.services.season_swap_service import check_staged, swap_season
+from src.services.stat_registry import StatType
+
+
+def rows(season=2023, **points):
+    return [{"tm": tm, "season": season, "pf": pf} for tm, pf in points.items()]
+
+
+def swap(db_session, season_rows, season=2023, **kwargs):
+    counts = swap_season(
+        db_session,
+        StatType.team_offense,
+        season,
+        season_rows,
+        scrape_run="run",
+        **kwargs,
+    )
+    db_session.commit()
+    return counts
+
+
+def stored(db_session, season=2023):
+    return {
+        r.tm: r.pf
+        for r in db_session.execute(
+            select(TeamOffense).where(TeamOffense.season == season)
+        ).scalars()
+    }
+
+
+class TestCheckStaged:
+    def stats(self, rows=10, distinct_keys=10, wrong_season=0):
+        return {
+            "rows": rows,
+            "distinct_keys": distinct_keys,
+            "wrong_season": wrong_season,
+        }
+
+    def test_accepts_valid_season(self):
+        check_staged(self.stats(), expected_rows=10, live_rows=12, min_ratio=0.5)
+
+    def test_rejects_missing_rows(self):
+        with pytest.raises(ValueError, match="expected 11"):
+            check_staged(self.stats(), expected_rows=11, live_rows=0, min_ratio=0.5)
+
+    def test_rejects_duplicate_keys(self):
+        with pytest.raises(ValueError, match="duplicate"):
+            check_staged(
+                self.stats(distinct_keys=9),
+                expected_rows=10,
+                live_rows=0,
+                min_ratio=0.5,
+            )
+
+    def test_rejects_shrunk_season(self):
+        with pytest.raises(ValueError, match="SWAP_MIN_ROW_RATIO"):
+            check_staged(self.stats(), expected_rows=10, live_rows=32, min_ratio=0.5)
+
+
+class TestSwapSeason:
+    def test_replaces_season_and_logs_changes(self, db_session):
+        swap(db_session, rows(KC=450, BUF=400, MIA=380))
+
+        counts = swap(db_session, rows(KC=451, BUF=400, DET=390))
+
+        assert counts == {"inserted": 1, "updated": 1, "deleted": 1, "unchanged": 1}
+        assert stored(db_session) == {"KC": 451, "BUF": 400, "DET": 390}
+        assert all(
+            r.row_hash for r in db_session.execute(select(TeamOffense)).scalars()
+        )
+        assert db_session.query(StatChange).count() == 3 + 3
+        version = db_session.get(DataVersion, ("team_offense", 2023))
+        assert version.version == 2
+
+    def test_other_seasons_untouched(self, db_session):
+        swap(db_session, rows(season=2022, KC=300), season=2022)
+
+        swap(db_session, rows(BUF=400))
+
+        assert stored(db_session, 2022) == {"KC": 300}
+
+    def test_duplicate_keys_leave_live_season_intact(self, db_session):
+        swap(db_session, rows(KC=450))
+
+        with pytest.raises(ValueError, match="duplicate"):
+            swap(db_session, rows(KC=451) * 2)
+        db_session.rollback()
+
+        assert stored(db_session) == {"KC": 450}
+
+    def test_rows_outside_season_rejected(self, db_session):
+        with pytest.raises(ValueError, match="outside the season"):
+            swap(db_session, rows(season=2022, KC=450))
+
+    def test_shrinking_season_rejected(self, db_session):
+        swap(db_session, rows(KC=1, BUF=2, MIA=3, DET=4))
+
+        with pytest.raises(ValueError, match="SWAP_MIN_ROW_RATIO"):
+            swap(db_session, rows(KC=1))
+        db_session.rollback()
+        assert len(stored(db_session)) == 4
+
+        swap(db_session, rows(KC=1), min_ratio=0)
+        assert stored(db_session) == {"KC": 1}
+
+    def test_player_rows_get_player_ids(self, db_session):
+        swap_season(
+            db_session,
+            StatType.rushing_stats,
+            2023,
+            [{"season": 2023, "player_name": "A", "tm": "X", "pfr_id": "AaaaA00"}],
+            scrape_run="run",
+        )
+        db_session.commit()
+
+        (player,) = db_session.execute(select(Player)).scalars()
+        (row,) = db_session.execute(select(RushingStats)).scalars()
+        assert row.player_id == player.id
+
+    def test_same_name_players_swap_in_apart(self, db_session):
+        people = [
+            {"season": 2023, "player_name": "A", "tm": "X", "pfr_id": pfr_id}
+            for pfr_id in ("AaaaA00", "AaaaA01")
+        ]
+        nameless = [
+            {"season": 2023, "player_name": name, "tm": "X", "pfr_id": None}
+            for name in ("B", "C")
+        ]
+
+        counts = swap_season(
+            db_session,
+            StatType.rushing_stats,
+            2023,
+            people + nameless,
+            scrape_run="run",
+        )
+        db_session.commit()
+
+        assert counts["inserted"] == 4
+        ids = {r.player_id for r in db_session.execute(select(RushingStats)).scalars()}
+        assert len(ids - {None}) == 2
+
+    def test_staged_rows_get_team_ids(self, db_session):
+        swap(db_session, rows(KAN=450, SFO=400))
+
+        by_team = {
+            r.tm: r.team_id for r in db_session.execute(select(TeamOffense)).scalars()
+        }
+        assert by_team == {"KAN": team_id("KC"), "SFO": team_id("SF")}
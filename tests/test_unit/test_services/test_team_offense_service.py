@@ -2,22 +2,17 @@
 Unit tests for team_offense_service.py
 
 Tests cover:
-- get_dataframe: Mock Selenium + BeautifulSoup parsing via retry_with_backoff
-- scrape_and_store_team_offense: Verify repo.create is called for each record
+- parse_page: BeautifulSoup parsing of the team_stats table
+
+Storing parsed rows is covered by test_ingest_service.py.
 
 Run with:
     pytest tests/test_unit/test_services/test_team_offense_service.py -v
 """
 
-import asyncio
-from unittest.mock import MagicMock, patch
-
 import pytest
 
-from src.services.team_offense_service import (
-    get_dataframe,
-    scrape_and_store_team_offense,
-)
+from src.services.team_offense_service import parse_page
 
 # ---- Sample HTML for mocking PFR responses ----
 SAMPLE_PFR_HTML = """
@@ -93,21 +88,12 @@ SAMPLE_PFR_HTML = """
 """
 
 
-class TestGetDataframe:
-    """Tests for get_dataframe with mocked Selenium."""
+class TestParsePage:
+    """Tests for parse_page on raw PFR HTML."""
 
-    @patch("src.services.team_offense_service.find_pfr_table")
-    @patch("src.services.team_offense_service.retry_with_backoff")
-    def test_returns_parsed_rows(self, mock_retry, mock_find_table):
+    def test_returns_parsed_rows(self):
         """Should return a list of dicts with mapped column names."""
-        from bs4 import BeautifulSoup
-
-        soup = BeautifulSoup(SAMPLE_PFR_HTML, "lxml")
-        table = soup.find("table", {"id": "team_stats"})
-        mock_retry.return_value = SAMPLE_PFR_HTML
-        mock_find_table.return_value = table
-
-        result = get_dataframe(2023)
+        result = parse_page(SAMPLE_PFR_HTML, 2023)
 
         assert isinstance(result, list)
         assert len(result) == 2
@@ -116,123 +102,7 @@ class TestGetDataframe:
         assert result[0]["g"] == "17"
         assert result[0]["pf"] == "450"
 
-    @patch("src.services.team_offense_service.find_pfr_table")
-    @patch("src.services.team_offense_service.retry_with_backoff")
-    def test_raises_on_missing_table(self, mock_retry, mock_find_table):
+    def test_raises_on_missing_table(self):
         """Should raise Exception when team_stats table is not found."""
-        mock_retry.return_value = "<html><body></body></html>"
-        mock_find_table.return_value = None
-
         with pytest.raises(Exception, match="Could not find team_stats table"):
-            get_dataframe(2023)
-
-
-class TestScrapeAndStoreTeamOffense:
-    """Tests for scrape_and_store_team_offense end-to-end with mocks."""
-
-    @pytest.mark.asyncio
-    @patch("src.services.team_offense_service.SessionLocal")
-    @patch("src.services.team_offense_service.get_dataframe")
-    def test_calls_repo_create_for_each_record(self, mock_get_df, mock_session_local):
-        """Should call repo.create for each parsed record."""
-        mock_get_df.return_value = [
-            {
-                "season": 2023,
-                "tm": "KAN",
-                "g": 17,
-                "pf": 450,
-                "yds": 6200,
-                "ply": 1050,
-                "ypp": "5.9",
-                "turnovers": 12,
-                "fl": 5,
-                "firstd_total": 350,
-                "cmp": 380,
-                "att_pass": 580,
-                "yds_pass": 4800,
-                "td_pass": 35,
-                "ints": 10,
-                "nypa": "7.2",
-                "firstd_pass": 200,
-                "att_rush": 420,
-                "yds_rush": 1400,
-                "td_rush": 15,
-                "ypa": "4.5",
-                "firstd_rush": 100,
-                "pen": 95,
-                "yds_pen": 800,
-                "firstpy": 50,
-                "sc_pct": "42.5",
-                "to_pct": "10.2",
-                "opea": "125.5",
-            },
-            {
-                "season": 2023,
-                "tm": "SFO",
-                "g": 17,
-                "pf": 420,
-                "yds": 5900,
-                "ply": 1020,
-                "ypp": "5.8",
-                "turnovers": 14,
-                "fl": 6,
-                "firstd_total": 330,
-                "cmp": 360,
-                "att_pass": 560,
-                "yds_pass": 4500,
-                "td_pass": 30,
-                "ints": 12,
-                "nypa": "6.8",
-                "firstd_pass": 190,
-                "att_rush": 400,
-                "yds_rush": 1400,
-                "td_rush": 12,
-                "ypa": "4.3",
-                "firstd_rush": 90,
-                "pen": 100,
-                "yds_pen": 850,
-                "firstpy": 45,
-                "sc_pct": "40.0",
-                "to_pct": "11.5",
-                "opea": "118.0",
-            },
-        ]
-
-        mock_session = MagicMock()
-        mock_session_local.return_value = mock_session
-
-        result = asyncio.get_event_loop().run_until_complete(
-            scrape_and_store_team_offense(2023)
-        )
-
-        assert mock_session.commit.called
-        assert len(result) == 2
-
-    @pytest.mark.asyncio
-    @patch("src.services.team_offense_service.SessionLocal")
-    @patch("src.services.team_offense_service.get_dataframe")
-    def test_session_closed_on_success(self, mock_get_df, mock_session_local):
-        """Session should be closed after successful scrape."""
-        mock_get_df.return_value = []
-        mock_session = MagicMock()
-        mock_session_local.return_value = mock_session
-
-        asyncio.get_event_loop().run_until_complete(scrape_and_store_team_offense(2023))
-
-        assert mock_session.close.called
-
-    @pytest.mark.asyncio
-    @patch("src.services.team_offense_service.SessionLocal")
-    @patch("src.services.team_offense_service.get_dataframe")
-    def test_session_closed_on_failure(self, mock_get_df, mock_session_local):
-        """Session should be closed even when scraping fails."""
-        mock_get_df.side_effect = Exception("Network error")
-        mock_session = MagicMock()
-        mock_session_local.return_value = mock_session
-
-        with pytest.raises(Exception, match="Network error"):
-            asyncio.get_event_loop().run_until_complete(
-                scrape_and_store_team_offense(2023)
-            )
-
-        assert mock_session.close.called
+            parse_page("<html><body></body></html>", 2023)